@@ -1,8 +1,15 @@
+import gc
+import math
+import sys
 import time
-from typing                                                                           import Callable, List, Optional
-from statistics                                                                       import mean, median, stdev
+import tracemalloc
+from array                                                                            import array
+from itertools                                                                        import repeat
+from typing                                                                           import Callable, List, Optional, Tuple
+from statistics                                                                       import mean, median
 from osbot_utils.utils.Env                                                            import in_github_action
 from osbot_utils.helpers.performance.schemas.Schema__Performance_Measure__Measurement import Schema__Performance_Measure__Measurement
+from osbot_utils.helpers.performance.schemas.Schema__Performance_Measure__Memory      import Schema__Performance_Measure__Memory
 from osbot_utils.helpers.performance.schemas.Schema__Performance_Measure__Result      import Schema__Performance_Measure__Result
 from osbot_utils.type_safe.Type_Safe                                                  import Type_Safe
 
@@ -10,11 +17,16 @@ MEASURE__INVOCATION__LOOPS          = [1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144, 2
 MEASURE__INVOCATION__LOOPS__QUICK   = [1, 2, 3, 5, 8]                                             # Quick mode for slow functions (19 total invocations)
 MEASURE__INVOCATION__LOOPS__FAST    = [1, 2, 3, 5, 8, 13, 21, 34]                                   # Fast mode - balanced (87 total invocations)
 MEASURE__INVOCATION__LOOPS__ONLY__3 = [1, 2]                                                        # only run 3 times: 1 + 2
+MEASURE__MEMORY__INVOCATIONS        = 10                                                            # calls made (after the timed ones) in the traced memory pass
+MEASURE__BATCH__CALIBRATION_RUNS    = 5                                                             # empty batch loops timed to calibrate the baseline (the fastest one is used)
 
 class Performance_Measure__Session(Type_Safe):
-    result        : Schema__Performance_Measure__Result = None                                   # Current measurement result
-    assert_enabled: bool                               = True
-    padding       : int                                = 30
+    result             : Schema__Performance_Measure__Result = None                              # Current measurement result
+    assert_enabled     : bool                                = True
+    padding            : int                                 = 30
+    measure_memory     : bool                                = False                             # Also capture memory, GC and object counts (in a separate pass, since tracemalloc slows down the calls)
+    memory_invocations : int                                 = MEASURE__MEMORY__INVOCATIONS
+    batch_size         : int                                 = 0                                 # When > 1, each sample is the per-call time of a block of batch_size calls (for sub-microsecond targets)
 
     def calculate_raw_score(self, times: List[int]) -> int:                                     # Calculate raw performance score
         if len(times) < 3:                                                                      # Need at least 3 values for stability
@@ -40,28 +52,55 @@ class Performance_Measure__Session(Type_Safe):
         else:
             return int(round(raw_score / 100000) * 100000)                                      # Above 100µs: nearest 100000ns
 
-    def calculate_metrics(self, times: List[int]) -> Schema__Performance_Measure__Measurement:   # Calculate statistical metrics
+    def calculate_stddev(self, times, total=None) -> float:                                    # sample standard deviation (the sum of squares of ints is exact, and statistics.stdev uses much slower Fractions)
+        count = len(times)
+        if count < 2:
+            return 0
+        if total is None:
+            total = sum(times)
+        squares = sum(time_taken * time_taken for time_taken in times)
+        return math.sqrt((count * squares - total * total) / (count * (count - 1)))
+
+    def calculate_metrics(self, times: List[int]) -> Schema__Performance_Measure__Measurement:   # Calculate statistical metrics (times can also be an array('q'))
         if not times:
             raise ValueError("Cannot calculate metrics from empty time list")
-        raw_score = self.calculate_raw_score   (times)
+        sorted_times = sorted(times)                                                            # one sort, for min, max, median and the raw score
+        count        = len(sorted_times)
+        total        = sum(sorted_times)
+        middle       = count // 2
+        if count % 2:
+            median_time = sorted_times[middle]
+        else:
+            median_time = (sorted_times[middle - 1] + sorted_times[middle]) / 2
+        stddev_time = self.calculate_stddev(sorted_times, total)
+        raw_score = self.calculate_raw_score   (sorted_times)
         score     = self.calculate_stable_score(raw_score)
         return Schema__Performance_Measure__Measurement(
-            avg_time    = int(mean(times))                                                  ,
-            min_time    = min(times)                                                        ,
-            max_time    = max(times)                                                        ,
-            median_time = int(median(times))                                                ,
-            stddev_time = stdev(times) if len(times) > 1 else 0                             ,
-            raw_times   = times                                                             ,
-            sample_size = len(times)                                                        ,
+            avg_time    = int(total / count)                                                ,
+            min_time    = sorted_times[0]                                                   ,
+            max_time    = sorted_times[-1]                                                  ,
+            median_time = int(median_time)                                                  ,
+            stddev_time = stddev_time                                                       ,
+            raw_times   = list(times)                                                       ,
+            sample_size = count                                                             ,
             raw_score   = raw_score                                                         ,
             score       = score                                                             )
 
     def measure(self, target : Callable                    ,                                    # Perform measurements
                       loops  : Optional[List[int]] = None  ) -> 'Performance_Measure__Session':
-        name           = target.__name__
-        measurements   = {}
-        all_times      = []                                                                     # Collect all times for final score
+        loops_times = self.measure__times(target, loops)
+        self.measure__from_times(target.__name__, loops_times)
+        if self.measure_memory:
+            self.result.memory = self.measure__memory(target)
+        return self
+
+    def measure__times(self, target : Callable                    ,                             # Time the invocations, returning the (loop_size, times) pairs
+                             loops  : Optional[List[int]] = None
+                        ) -> List[Tuple[int, List[int]]]:
         measure_loops  = loops if loops is not None else MEASURE__INVOCATION__LOOPS             # Use custom loops or default
+        if self.batch_size > 1:
+            return self.measure__times__batched(target, measure_loops)
+        loops_times    = []
 
         for loop_size in measure_loops:                                                         # Measure each loop size
             loop_times = []
@@ -71,8 +110,51 @@ class Performance_Measure__Session(Type_Safe):
                 end        = time.perf_counter_ns()
                 time_taken = end - start
                 loop_times.append(time_taken)
-                all_times.append(time_taken)                                                    # Add to overall collection
 
+            loops_times.append((loop_size, loop_times))
+
+        return loops_times
+
+    def measure__times__batched(self, target : Callable ,                                      # Time blocks of batch_size calls (two timer reads per block), minus the cost of the empty loop
+                                      loops  : List[int]
+                                 ) -> List[Tuple[int, array]]:
+        batch_size  = self.batch_size
+        baseline_ns = self.measure__baseline(batch_size)
+        timer       = time.perf_counter_ns
+        loops_times = []
+
+        for loop_size in loops:                                                                 # loop_size blocks, each one giving a per-call sample
+            loop_times = array('q', [0]) * loop_size
+            for index in range(loop_size):
+                start = timer()
+                for _ in repeat(None, batch_size):
+                    target()
+                duration          = timer() - start - baseline_ns
+                loop_times[index] = max(0, duration) // batch_size
+            loops_times.append((loop_size, loop_times))
+
+        return loops_times
+
+    def measure__baseline(self, batch_size: int) -> int:                                       # Time of an empty batch loop (including the timer reads)
+        timer       = time.perf_counter_ns
+        baseline_ns = None
+        for _ in range(MEASURE__BATCH__CALIBRATION_RUNS):
+            start = timer()
+            for _ in repeat(None, batch_size):
+                pass
+            duration = timer() - start
+            if baseline_ns is None or duration < baseline_ns:
+                baseline_ns = duration
+        return baseline_ns
+
+    def measure__from_times(self, name        : str                   ,                         # Calculate the result from already measured times (for example in a worker process)
+                                  loops_times : List[Tuple[int, List[int]]]
+                             ) -> 'Performance_Measure__Session':
+        measurements   = {}
+        all_times      = []                                                                     # Collect all times for final score
+
+        for loop_size, loop_times in loops_times:
+            all_times.extend(loop_times)                                                        # Add to overall collection
             measurements[loop_size] = self.calculate_metrics(loop_times)                        # Store metrics for this loop size
 
         raw_score   = self.calculate_raw_score  (all_times)
@@ -86,6 +168,45 @@ class Performance_Measure__Session(Type_Safe):
 
         return self
 
+    def measure__memory(self, target : Callable) -> Schema__Performance_Measure__Memory:       # Memory used by the target (per call), with tracemalloc and the GC stats
+        invocations = max(1, self.memory_invocations)
+        was_tracing = tracemalloc.is_tracing()
+        if was_tracing is False:
+            tracemalloc.start()
+        try:
+            gc.collect()                                                                        # so that the collections counted are the ones caused by the target
+            collections_before = self.gc_collections()
+            objects_before     = len(gc.get_objects())
+            blocks_before      = sys.getallocatedblocks()
+            memory_before, _   = tracemalloc.get_traced_memory()
+            peak_bytes         = 0
+
+            for _ in range(invocations):
+                if hasattr(tracemalloc, 'reset_peak'):                                          # python 3.9+ (before that the peak is the one of the whole pass)
+                    tracemalloc.reset_peak()
+                call_before, _ = tracemalloc.get_traced_memory()
+                target()
+                _, call_peak   = tracemalloc.get_traced_memory()
+                peak_bytes     = max(peak_bytes, call_peak - call_before)
+
+            memory_after, _    = tracemalloc.get_traced_memory()
+            blocks_after       = sys.getallocatedblocks()
+            collections_after  = self.gc_collections()
+            objects_after      = len(gc.get_objects())
+        finally:
+            if was_tracing is False:
+                tracemalloc.stop()
+
+        return Schema__Performance_Measure__Memory(invocations      = invocations                                         ,
+                                                   peak_bytes       = peak_bytes                                          ,
+                                                   allocated_bytes  = (memory_after  - memory_before ) // invocations     ,
+                                                   allocated_blocks = (blocks_after  - blocks_before ) // invocations     ,
+                                                   gc_objects       = (objects_after - objects_before) // invocations     ,
+                                                   gc_collections   = collections_after - collections_before              )
+
+    def gc_collections(self) -> int:                                                            # Total GC collections so far (all generations)
+        return sum(stats.get('collections', 0) for stats in gc.get_stats())
+
     def measure__quick(self,
                        target : Callable
                       ) -> 'Performance_Measure__Session':
@@ -165,14 +286,14 @@ class Performance_Measure__Session(Type_Safe):
         # Collect all raw times
         all_times = []
         for measurement in m.values():
-            all_times.extend(measurement.raw_times)
+            all_times.extend(int(raw_time) for raw_time in measurement.raw_times)                # plain ints (Safe_Int / float is not supported)
 
         total_samples = len(all_times)
         min_time      = min(all_times)
         max_time      = max(all_times)
         avg_time      = int(mean(all_times))
         med_time      = int(median(all_times))
-        std_time      = stdev(all_times) if len(all_times) > 1 else 0
+        std_time      = self.calculate_stddev(all_times)
 
         # Build histogram
         bin_size   = (max_time - min_time) / bins if max_time > min_time else 1
@@ -185,7 +306,7 @@ class Performance_Measure__Session(Type_Safe):
         max_count = max(bin_counts) if bin_counts else 1
 
         # Find which bin the score falls into
-        score_bin = min(int((r.raw_score - min_time) / bin_size), bins - 1) if max_time > min_time else 0
+        score_bin = min(int((int(r.raw_score) - min_time) / bin_size), bins - 1) if max_time > min_time else 0
 
         # Print report
         print()
@@ -205,6 +326,13 @@ class Performance_Measure__Session(Type_Safe):
         print()
         print(f"  {'Variance':<12} : {max_time / min_time:.1f}x   (max/min ratio)")
         print()
+        if r.memory:
+            print(f"  {'Peak Memory':<12} : {r.memory.peak_bytes:>12,} bytes   (per call)")
+            print(f"  {'Allocated':<12} : {r.memory.allocated_bytes:>12,} bytes   (net per call)")
+            print(f"  {'Blocks':<12} : {r.memory.allocated_blocks:>12,}   (net per call)")
+            print(f"  {'GC Objects':<12} : {r.memory.gc_objects:>12,}   (net per call)")
+            print(f"  {'GC Runs':<12} : {r.memory.gc_collections:>12,}   (in {r.memory.invocations} calls)")
+            print()
         print(f"  Distribution:                              {'count':>6}  {'%':>6}")
         print()
 
@@ -23,10 +23,12 @@ from osbot_utils.helpers.performance.benchmark.schemas.Schema__Perf__Evolution
 from osbot_utils.helpers.performance.benchmark.schemas.Schema__Perf__Statistics                           import Schema__Perf__Statistics
 from osbot_utils.helpers.performance.benchmark.schemas.enums.Enum__Comparison__Status                     import Enum__Comparison__Status
 from osbot_utils.helpers.performance.benchmark.schemas.enums.Enum__Benchmark__Trend                       import Enum__Benchmark__Trend
+from osbot_utils.helpers.performance.benchmark.Perf_Benchmark__Significance                               import Perf_Benchmark__Significance
 
 
 class Perf_Benchmark__Diff(Type_Safe):                                           # Multi-session comparison
-    sessions : List__Benchmark_Sessions                                          # Loaded sessions
+    sessions     : List__Benchmark_Sessions                                      # Loaded sessions
+    significance : Perf_Benchmark__Significance                                  # Used when both results have enough run_scores
 
 
     # ═══════════════════════════════════════════════════════════════════════════════
@@ -86,6 +88,40 @@ class Perf_Benchmark__Diff(Type_Safe):
             return Enum__Benchmark__Trend.REGRESSION
         return Enum__Benchmark__Trend.UNCHANGED
 
+    def compare_results(self                                             ,       # Compare one benchmark's results
+                        benchmark_id   : str                             ,
+                        result_a       : Schema__Perf__Benchmark__Result ,
+                        result_b       : Schema__Perf__Benchmark__Result ,
+                        use_raw_scores : bool = False                            # Compare raw_score instead of final_score
+                   ) -> Schema__Perf__Benchmark__Comparison:
+        if use_raw_scores:
+            score_a = int(result_a.raw_score)
+            score_b = int(result_b.raw_score)
+        else:
+            score_a = int(result_a.final_score)
+            score_b = int(result_b.final_score)
+
+        if score_a > 0:
+            change_pct = ((score_a - score_b) / score_a) * 100
+        else:
+            change_pct = 0.0
+
+        if self.significance.can_compare(result_a.run_scores, result_b.run_scores):   # Trend and change from the repeated runs (so that noise is reported as UNCHANGED)
+            significance = self.significance.compare(result_a.run_scores, result_b.run_scores)
+            change_pct   = float(significance.change_percent)                    # change of the medians (the bucketed scores can hide or exaggerate it)
+            trend        = significance.trend
+        else:                                                                    # Older sessions only have the scores
+            significance = None
+            trend        = self.calculate_trend(change_pct)
+
+        return Schema__Perf__Benchmark__Comparison(benchmark_id   = benchmark_id             ,
+                                                   name           = result_b.name            ,
+                                                   score_a        = Safe_UInt(score_a)       ,
+                                                   score_b        = Safe_UInt(score_b)       ,
+                                                   change_percent = Safe_Float(change_pct)   ,
+                                                   trend          = trend                    ,
+                                                   significance   = significance             )
+
 
     # ═══════════════════════════════════════════════════════════════════════════════
     # Comparison Methods
@@ -115,21 +151,7 @@ class Perf_Benchmark__Diff(Type_Safe):
             if result_a is None or result_b is None:
                 continue
 
-            score_a = int(result_a.final_score)
-            score_b = int(result_b.final_score)
-
-            if score_a > 0:
-                change_pct = ((score_a - score_b) / score_a) * 100
-            else:
-                change_pct = 0.0
-
-            comparison = Schema__Perf__Benchmark__Comparison(benchmark_id   = benchmark_id             ,
-                                                             name           = result_b.name            ,
-                                                             score_a        = Safe_UInt(score_a)       ,
-                                                             score_b        = Safe_UInt(score_b)       ,
-                                                             change_percent = Safe_Float(change_pct)   ,
-                                                             trend          = self.calculate_trend(change_pct))
-            comparisons.append(comparison)
+            comparisons.append(self.compare_results(benchmark_id, result_a, result_b))
 
         if len(comparisons) == 0:
             return Schema__Perf__Comparison__Two(status = Enum__Comparison__Status.ERROR_NO_COMMON_BENCHMARKS,
@@ -164,10 +186,12 @@ class Perf_Benchmark__Diff(Type_Safe):
         evolutions = List__Benchmark_Evolutions()
 
         for benchmark_id in sorted(all_ids):
-            scores = List__Scores()
-            name   = ''
-            first  = None
-            last   = None
+            scores       = List__Scores()
+            name         = ''
+            first        = None
+            last         = None
+            first_result = None
+            last_result  = None
 
             for session in self.sessions:
                 result = session.results.get(benchmark_id)
@@ -177,8 +201,10 @@ class Perf_Benchmark__Diff(Type_Safe):
                     score = int(result.final_score)
                     scores.append(Safe_UInt(score))
                     if first is None:
-                        first = score
-                    last = score
+                        first        = score
+                        first_result = result
+                    last        = score
+                    last_result = result
                 else:
                     scores.append(Safe_UInt(0))
 
@@ -187,13 +213,20 @@ class Perf_Benchmark__Diff(Type_Safe):
             else:
                 change_pct = 0.0
 
+            if first_result is not last_result and self.significance.can_compare(first_result.run_scores, last_result.run_scores):
+                significance = self.significance.compare(first_result.run_scores, last_result.run_scores)
+                change_pct   = float(significance.change_percent)
+                trend        = significance.trend
+            else:
+                trend = self.calculate_trend(change_pct)
+
             evolution = Schema__Perf__Benchmark__Evolution(benchmark_id   = benchmark_id                  ,
                                                            name           = name or benchmark_id          ,
                                                            scores         = scores                        ,
                                                            first_score    = Safe_UInt(first or 0)         ,
                                                            last_score     = Safe_UInt(last or 0)          ,
                                                            change_percent = Safe_Float(change_pct)        ,
-                                                           trend          = self.calculate_trend(change_pct))
+                                                           trend          = trend                         )
             evolutions.append(evolution)
 
         return Schema__Perf__Evolution(status        = Enum__Comparison__Status.SUCCESS     ,
@@ -220,22 +253,15 @@ class Perf_Benchmark__Diff(Type_Safe):
 
         for benchmark_id in all_ids:
             first_score = int(first_session.results[benchmark_id].final_score)
-            last_score  = int(last_session.results[benchmark_id].final_score)
 
             if first_score > 0:
-                change_pct = ((first_score - last_score) / first_score) * 100
-                name       = last_session.results[benchmark_id].name
-
-                comparison = Schema__Perf__Benchmark__Comparison(benchmark_id   = benchmark_id                  ,
-                                                                 name           = name                          ,
-                                                                 score_a        = Safe_UInt(first_score)        ,
-                                                                 score_b        = Safe_UInt(last_score)         ,
-                                                                 change_percent = Safe_Float(change_pct)        ,
-                                                                 trend          = self.calculate_trend(change_pct))
+                comparison = self.compare_results(benchmark_id                         ,
+                                                  first_session.results[benchmark_id]  ,
+                                                  last_session .results[benchmark_id]  )
 
-                if change_pct > 0:
+                if comparison.trend in (Enum__Benchmark__Trend.IMPROVEMENT, Enum__Benchmark__Trend.STRONG_IMPROVEMENT):
                     improvements.append(comparison)
-                elif change_pct < 0:
+                elif comparison.trend in (Enum__Benchmark__Trend.REGRESSION, Enum__Benchmark__Trend.STRONG_REGRESSION):
                     regressions.append(comparison)
 
         avg_improvement = 0.0
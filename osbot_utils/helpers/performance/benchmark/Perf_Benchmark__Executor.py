@@ -0,0 +1,147 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Perf_Benchmark__Executor - Execution engine for Perf_Benchmark__Timing
+# Runs benchmarks in-process or in isolated (forked) worker processes, with
+# warm-up, GC control, calibrated loops and optional CPU pinning
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import gc
+import multiprocessing
+import os
+import time
+from typing                                                                                               import Callable, List, Optional, Tuple
+from osbot_utils.type_safe.Type_Safe                                                                      import Type_Safe
+from osbot_utils.helpers.performance.Performance_Measure__Session                                         import Performance_Measure__Session as Perf
+from osbot_utils.helpers.performance.Performance_Measure__Session                                         import MEASURE__INVOCATION__LOOPS, MEASURE__INVOCATION__LOOPS__QUICK
+from osbot_utils.helpers.performance.Performance_Measure__Session                                         import MEASURE__INVOCATION__LOOPS__FAST, MEASURE__INVOCATION__LOOPS__ONLY__3
+from osbot_utils.helpers.performance.benchmark.schemas.timing.Schema__Perf_Benchmark__Timing__Config      import Schema__Perf_Benchmark__Timing__Config
+from osbot_utils.helpers.performance.schemas.Schema__Performance_Measure__Memory                          import Schema__Performance_Measure__Memory
+
+EXECUTOR__CALIBRATION_CALLS = 3                                                  # Timed calls used to estimate the cost of one invocation
+EXECUTOR__START_METHOD      = 'fork'                                             # Workers inherit the targets (lambdas and closures can't be pickled)
+
+_worker_state = None                                                             # (executor, targets, cpu_queue) inherited by the forked workers
+
+
+def perf_benchmark__executor__worker(index: int) -> Tuple[int, Tuple[str, list, Optional[dict]]]:    # Runs in the worker process
+    executor, targets, cpu_queue = _worker_state
+    cpu = None
+    if cpu_queue is not None:                                                    # Take a free CPU (and give it back at the end) so that concurrent workers never share one
+        cpu = cpu_queue.get()
+        os.sched_setaffinity(0, {cpu})
+    try:
+        return index, executor.measure__times(targets[index])
+    finally:
+        if cpu is not None:
+            cpu_queue.put(cpu)
+
+
+class Perf_Benchmark__Executor(Type_Safe):                                       # Benchmark execution engine
+    config : Schema__Perf_Benchmark__Timing__Config                              # Configuration
+
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Loops
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def loops(self, target: Callable) -> List[int]:                              # Loop schedule for the target
+        if self.config.calibrate_budget_ns:
+            return self.loops__calibrated(target)
+        if self.config.measure_only_3:
+            return MEASURE__INVOCATION__LOOPS__ONLY__3
+        if self.config.measure_quick:
+            return MEASURE__INVOCATION__LOOPS__QUICK
+        if self.config.measure_fast:
+            return MEASURE__INVOCATION__LOOPS__FAST
+        return MEASURE__INVOCATION__LOOPS
+
+    def loops__calibrated(self, target: Callable) -> List[int]:                  # Longest Fibonacci prefix that fits in the time budget (at least 3 invocations)
+        estimate_ns = None
+        for _ in range(EXECUTOR__CALIBRATION_CALLS):
+            start       = time.perf_counter_ns()
+            target()
+            duration_ns = time.perf_counter_ns() - start
+            if estimate_ns is None or duration_ns < estimate_ns:
+                estimate_ns = duration_ns
+        estimate_ns = max(1, estimate_ns) * max(1, self.config.batch_size)      # each sample is a block of batch_size calls
+
+        loops       = []
+        invocations = 0
+        for loop_size in MEASURE__INVOCATION__LOOPS:
+            if len(loops) >= 2 and (invocations + loop_size) * estimate_ns > self.config.calibrate_budget_ns:
+                break
+            loops.append(loop_size)
+            invocations += loop_size
+        return loops
+
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Measuring
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def measure(self, target: Callable) -> Perf:                                 # Measure in-process
+        return self.session(*self.measure__times(target))
+
+    def measure__times(self, target: Callable) -> Tuple[str, list, Optional[dict]]:  # (name, loops_times, memory json) - plain data, so that it can be sent back from a worker
+        for _ in range(self.config.warmup_invocations):
+            target()
+        loops      = self.loops(target)
+        gc_enabled = gc.isenabled()
+        if self.config.gc_disabled:
+            gc.collect()
+            gc.disable()
+        try:
+            loops_times = Perf(batch_size=self.config.batch_size).measure__times(target, loops=loops)
+        finally:
+            if self.config.gc_disabled and gc_enabled:
+                gc.enable()
+        memory = None
+        if self.config.measure_memory:                                           # after the timings, since tracemalloc slows down the calls
+            memory = Perf().measure__memory(target).json()
+        return target.__name__, loops_times, memory
+
+    def session(self, name: str, loops_times: list, memory: Optional[dict] = None) -> Perf:  # Session from the data returned by measure__times
+        session = Perf(assert_enabled=True).measure__from_times(name, loops_times)
+        if memory is not None:
+            session.result.memory = Schema__Performance_Measure__Memory.from_json(memory)
+        return session
+
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Running
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def can_fork(self) -> bool:
+        return EXECUTOR__START_METHOD in multiprocessing.get_all_start_methods()
+
+    def can_pin_cpus(self) -> bool:
+        return hasattr(os, 'sched_setaffinity')
+
+    def cpus(self) -> List[int]:                                                 # CPUs this process is allowed to run on
+        if hasattr(os, 'sched_getaffinity'):
+            return sorted(os.sched_getaffinity(0))
+        return list(range(os.cpu_count() or 1))
+
+    def run(self, targets: List[Callable]) -> List[Perf]:                        # One session per target (in the same order)
+        if self.config.workers <= 1 or len(targets) < 2 or self.can_fork() is False:
+            return [self.measure(target) for target in targets]
+        return [self.session(*measured) for measured in self.run__workers(targets)]
+
+    def run__workers(self, targets: List[Callable]) -> List[Tuple[str, list, Optional[dict]]]:
+        global _worker_state
+        context   = multiprocessing.get_context(EXECUTOR__START_METHOD)
+        workers   = min(self.config.workers, len(targets))
+        cpu_queue = None
+        if self.config.pin_cpus and self.can_pin_cpus():
+            cpus      = self.cpus()
+            workers   = min(workers, len(cpus))
+            cpu_queue = context.Queue()
+            for cpu in cpus[:workers]:
+                cpu_queue.put(cpu)
+
+        _worker_state = (self, targets, cpu_queue)
+        try:
+            with context.Pool(processes=workers, maxtasksperchild=1) as pool:    # A fresh process per benchmark (no state shared between them)
+                results = dict(pool.imap_unordered(perf_benchmark__executor__worker, range(len(targets))))
+        finally:
+            _worker_state = None
+        return [results[index] for index in range(len(targets))]
@@ -19,6 +19,10 @@ from osbot_utils.helpers.performance.benchmark.schemas.timing.Schema__Perf_Bench
 from osbot_utils.helpers.performance.benchmark.schemas.collections.Dict__Benchmark_Results                    import Dict__Benchmark_Results
 from osbot_utils.helpers.performance.benchmark.schemas.enums.Enum__Hypothesis__Status                         import Enum__Hypothesis__Status
 from osbot_utils.helpers.performance.benchmark.schemas.benchmark.Schema__Perf__Benchmark__Result              import Schema__Perf__Benchmark__Result
+from osbot_utils.helpers.performance.benchmark.schemas.benchmark.Schema__Perf__Benchmark__Comparison          import Schema__Perf__Benchmark__Comparison
+from osbot_utils.helpers.performance.benchmark.schemas.collections.List__Benchmark_Comparisons                import List__Benchmark_Comparisons
+from osbot_utils.helpers.performance.benchmark.Perf_Benchmark__Significance                                   import Perf_Benchmark__Significance
+from osbot_utils.helpers.performance.benchmark.Perf_Benchmark__Diff                                           import Perf_Benchmark__Diff
 
 
 class Perf_Benchmark__Hypothesis(Type_Safe):                                     # Hypothesis tester
@@ -28,6 +32,7 @@ class Perf_Benchmark__Hypothesis(Type_Safe):
     before_results     : Dict__Benchmark_Results                                 # Baseline measurements
     after_results      : Dict__Benchmark_Results                                 # Optimized measurements
     comments           : Safe_Str__Benchmark__Description                        # Optional notes
+    significance       : Perf_Benchmark__Significance                            # Tells real changes from noise (using the run_scores)
 
 
     # ═══════════════════════════════════════════════════════════════════════════════
@@ -98,6 +103,7 @@ class Perf_Benchmark__Hypothesis(Type_Safe):
             raise ValueError('Must run after benchmarks first')
 
         improvements = []
+        comparisons  = List__Benchmark_Comparisons()
 
         for benchmark_id in self.before_results.keys():
             if benchmark_id not in self.after_results:
@@ -109,6 +115,10 @@ class Perf_Benchmark__Hypothesis(Type_Safe):
                 improvement = (before_score - after_score) / before_score
                 improvements.append(improvement)
 
+            comparisons.append(self.compare(benchmark_id))
+
+        significances = [comparison.significance for comparison in comparisons if comparison.significance is not None]
+
         if len(improvements) == 0:
             actual_improvement = 0.0
             status = Enum__Hypothesis__Status.INCONCLUSIVE
@@ -126,14 +136,25 @@ class Perf_Benchmark__Hypothesis(Type_Safe):
             else:
                 status = Enum__Hypothesis__Status.INCONCLUSIVE
 
+            if significances and not any(significance.significant for significance in significances):
+                status = Enum__Hypothesis__Status.INCONCLUSIVE                   # all changes are within the noise
+
         return Schema__Perf__Hypothesis__Result(description        = self.description                       ,
                                                 target_improvement = self.target_improvement                ,
                                                 actual_improvement = Safe_Float(actual_improvement)         ,
                                                 before_results     = self.before_results                    ,
                                                 after_results      = self.after_results                     ,
+                                                comparisons        = comparisons                            ,
                                                 status             = status                                 ,
                                                 comments           = self.comments                          )
 
+    def compare(self, benchmark_id: str) -> Schema__Perf__Benchmark__Comparison:  # Before vs after (with significance when there are enough run_scores)
+        diff = Perf_Benchmark__Diff(significance=self.significance)
+        return diff.compare_results(benchmark_id                               ,
+                                    self.before_results[benchmark_id]          ,
+                                    self.after_results [benchmark_id]          ,
+                                    use_raw_scores = self.config.use_raw_scores)
+
     def get_scores(self, benchmark_id: str) -> tuple:                            # Get before/after scores based on config
         before = self.before_results[benchmark_id]
         after  = self.after_results[benchmark_id]
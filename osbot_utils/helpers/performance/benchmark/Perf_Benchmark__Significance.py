@@ -0,0 +1,140 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Perf_Benchmark__Significance - Statistical regression detection
+# Compares the scores of repeated runs (not the individual calls, which are not
+# independent samples) so that noise is not reported as a trend: Mann-Whitney U
+# test (significance), Cliff's delta (effect size), a bootstrap confidence
+# interval of the change of the median, and a minimum change that is worth reporting
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import math
+import random
+from statistics                                                                                           import median
+from typing                                                                                               import List, Tuple
+from osbot_utils.type_safe.Type_Safe                                                                      import Type_Safe
+from osbot_utils.helpers.performance.benchmark.schemas.benchmark.Schema__Perf__Benchmark__Significance    import Schema__Perf__Benchmark__Significance
+from osbot_utils.helpers.performance.benchmark.schemas.enums.Enum__Benchmark__Trend                       import Enum__Benchmark__Trend
+
+SIGNIFICANCE__ALPHA             = 0.05                                           # Max p-value of a significant change
+SIGNIFICANCE__CONFIDENCE        = 0.95                                           # Bootstrap confidence interval
+SIGNIFICANCE__BOOTSTRAP_SAMPLES = 200                                            # Resamples per comparison (each one sorts both samples)
+SIGNIFICANCE__NEGLIGIBLE_EFFECT = 0.147                                          # |Cliff's delta| below this is negligible (Romano et al.)
+SIGNIFICANCE__MIN_CHANGE        = 5.0                                            # Smaller % changes are reported as UNCHANGED (even when significant)
+SIGNIFICANCE__STRONG_CHANGE     = 10                                             # Same % threshold as Perf_Benchmark__Diff.calculate_trend
+SIGNIFICANCE__MIN_SAMPLES       = 4                                              # Runs needed on each side (with 3, p can't be below alpha)
+
+
+class Perf_Benchmark__Significance(Type_Safe):                                   # Significance tester
+    alpha             : float = SIGNIFICANCE__ALPHA
+    confidence        : float = SIGNIFICANCE__CONFIDENCE
+    bootstrap_samples : int   = SIGNIFICANCE__BOOTSTRAP_SAMPLES
+    negligible_effect : float = SIGNIFICANCE__NEGLIGIBLE_EFFECT
+    min_change        : float = SIGNIFICANCE__MIN_CHANGE
+    seed              : int   = 0                                                # Fixed seed, so that the same data always gives the same result
+
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Comparison
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def can_compare(self, times_a : List[int], times_b : List[int]) -> bool:     # Enough runs on both sides
+        return len(times_a) >= SIGNIFICANCE__MIN_SAMPLES and len(times_b) >= SIGNIFICANCE__MIN_SAMPLES
+
+    def compare(self, times_a : List[int] ,                                      # Before (one score per run)
+                      times_b : List[int]                                        # After
+                 ) -> Schema__Perf__Benchmark__Significance:
+        times_a  = list(times_a)
+        times_b  = list(times_b)
+        median_a = median(times_a) if times_a else 0
+        median_b = median(times_b) if times_b else 0
+        change   = self.change_percent(median_a, median_b)
+        result   = Schema__Perf__Benchmark__Significance(sample_size_a  = len(times_a)                          ,
+                                                         sample_size_b  = len(times_b)                          ,
+                                                         median_a       = int(median_a)                         ,
+                                                         median_b       = int(median_b)                         ,
+                                                         change_percent = change                                ,
+                                                         p_value        = 1.0                                   ,
+                                                         trend          = Enum__Benchmark__Trend.UNCHANGED      )
+        if self.can_compare(times_a, times_b) is False:
+            return result
+
+        u_statistic, p_value = self.mann_whitney_u(times_a, times_b)
+        effect_size          = self.cliffs_delta(u_statistic, len(times_a), len(times_b))
+        ci_low, ci_high      = self.bootstrap_ci(times_a, times_b)
+        significant          = (p_value                 <  self.alpha             and
+                                abs(effect_size)        >= self.negligible_effect and
+                                abs(change)             >= self.min_change        and  # a real, but tiny, change is not worth reporting
+                                (ci_low > 0 or ci_high < 0)                        )   # the interval must not contain "no change"
+
+        result.u_statistic = u_statistic
+        result.p_value     = p_value
+        result.effect_size = effect_size
+        result.ci_low      = ci_low
+        result.ci_high     = ci_high
+        result.significant = significant
+        result.trend       = self.trend(significant, effect_size, change)
+        return result
+
+    def change_percent(self, value_a: float, value_b: float) -> float:          # Positive = faster (same sign as Perf_Benchmark__Diff)
+        if value_a > 0:
+            return ((value_a - value_b) / value_a) * 100
+        return 0.0
+
+    def trend(self, significant: bool, effect_size: float, change_percent: float) -> Enum__Benchmark__Trend:
+        if significant is False:
+            return Enum__Benchmark__Trend.UNCHANGED
+        strong = abs(change_percent) > SIGNIFICANCE__STRONG_CHANGE
+        if effect_size > 0:
+            return Enum__Benchmark__Trend.STRONG_IMPROVEMENT if strong else Enum__Benchmark__Trend.IMPROVEMENT
+        return Enum__Benchmark__Trend.STRONG_REGRESSION if strong else Enum__Benchmark__Trend.REGRESSION
+
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Statistics
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def mann_whitney_u(self, times_a: List[int], times_b: List[int]) -> Tuple[float, float]:  # (U of times_a, two-sided p-value)
+        n_a, n_b  = len(times_a), len(times_b)
+        n         = n_a + n_b
+        combined  = sorted([(value, 0) for value in times_a] + [(value, 1) for value in times_b])
+        rank_sum  = 0.0                                                          # Sum of the ranks of times_a
+        ties_sum  = 0                                                            # Sum of (t³ - t) over the groups of tied values
+        index     = 0
+        while index < n:
+            end = index
+            while end + 1 < n and combined[end + 1][0] == combined[index][0]:
+                end += 1
+            ties      = end - index + 1
+            rank      = (index + end) / 2 + 1                                    # Average rank of the tied values
+            rank_sum += rank * sum(1 for position in range(index, end + 1) if combined[position][1] == 0)
+            ties_sum += ties ** 3 - ties
+            index     = end + 1
+
+        u_statistic = rank_sum - n_a * (n_a + 1) / 2
+        mean_u      = n_a * n_b / 2
+        variance    = n_a * n_b / 12 * ((n + 1) - ties_sum / (n * (n - 1)))
+        if variance <= 0:                                                        # All values are the same
+            return u_statistic, 1.0
+        z_score = max(0.0, abs(u_statistic - mean_u) - 0.5) / math.sqrt(variance)   # With continuity correction
+        return u_statistic, math.erfc(z_score / math.sqrt(2))
+
+    def cliffs_delta(self, u_statistic: float, n_a: int, n_b: int) -> float:   # P(a > b) - P(a < b), i.e. positive when times_b is faster
+        if n_a == 0 or n_b == 0:
+            return 0.0
+        return 2 * u_statistic / (n_a * n_b) - 1
+
+    def bootstrap_ci(self, times_a: List[int], times_b: List[int]) -> Tuple[float, float]:   # Confidence interval of the median's change_percent
+        rng     = random.Random(self.seed)
+        n_a     = len(times_a)
+        n_b     = len(times_b)
+        changes = []
+        for _ in range(self.bootstrap_samples):
+            median_a = median(rng.choices(times_a, k=n_a))
+            median_b = median(rng.choices(times_b, k=n_b))
+            changes.append(self.change_percent(median_a, median_b))
+        if not changes:
+            return 0.0, 0.0
+        changes.sort()
+        tail    = (1 - self.confidence) / 2
+        low     = changes[int(tail * (len(changes) - 1))]
+        high    = changes[int(math.ceil((1 - tail) * (len(changes) - 1)))]
+        return low, high
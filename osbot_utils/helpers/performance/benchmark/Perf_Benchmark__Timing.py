@@ -3,12 +3,13 @@
 # Wraps Performance_Measure__Session with result capture and reporting
 # ═══════════════════════════════════════════════════════════════════════════════
 
-from typing                                                                                               import Callable, Optional, Tuple
+from typing                                                                                               import Callable, List, Optional, Tuple
 from osbot_utils.type_safe.Type_Safe                                                                      import Type_Safe
 from osbot_utils.type_safe.primitives.core.Safe_Str                                                       import Safe_Str
 from osbot_utils.type_safe.primitives.core.Safe_UInt                                                      import Safe_UInt
 from osbot_utils.helpers.performance.Performance_Measure__Session                                         import Performance_Measure__Session as Perf
 from osbot_utils.helpers.performance.benchmark.schemas.timing.Schema__Perf_Benchmark__Timing__Config      import Schema__Perf_Benchmark__Timing__Config
+from osbot_utils.helpers.performance.benchmark.Perf_Benchmark__Executor                                   import Perf_Benchmark__Executor
 from osbot_utils.helpers.performance.benchmark.Perf_Benchmark__Timing__Reporter                           import Perf_Benchmark__Timing__Reporter
 from osbot_utils.helpers.performance.benchmark.schemas.collections.Dict__Benchmark_Results                import Dict__Benchmark_Results
 from osbot_utils.helpers.performance.benchmark.schemas.collections.Dict__Benchmark_Sessions               import Dict__Benchmark_Sessions
@@ -32,6 +33,7 @@ class Perf_Benchmark__Timing(Type_Safe):
     config   : Schema__Perf_Benchmark__Timing__Config                                    # Configuration
     results  : Dict__Benchmark_Results                                           # Lightweight summaries
     sessions : Dict__Benchmark_Sessions                                          # Full measurement data
+    queued   : list                                                              # (benchmark_id, target, assert_less_than) waiting for run_queued
 
 
     # ═══════════════════════════════════════════════════════════════════════════════
@@ -71,26 +73,46 @@ class Perf_Benchmark__Timing(Type_Safe):
                   assert_less_than: Optional[Safe_UInt] = None                   # Optional threshold
              ) -> Schema__Perf__Benchmark__Result:
 
-        session = Perf(assert_enabled=True)                                      # Fresh session per benchmark
-        if self.config.measure_only_3:
-            session.measure__only_3(target)
-        elif self.config.measure_quick:
-            session.measure__quick(target)
-        elif self.config.measure_fast:
-            session.measure__fast(target)
-        else:
-            session.measure(target)
+        sessions = [self.executor().measure(target) for _ in range(self.runs())] # Fresh session per run
+        return self.benchmark__result(benchmark_id, sessions, assert_less_than)
 
+    def queue(self                                              ,                # Add benchmark to be measured by run_queued
+              benchmark_id    : Safe_Str__Benchmark_Id      ,                    # Benchmark identifier
+              target          : Callable                    ,                    # Function to measure
+              assert_less_than: Optional[Safe_UInt] = None                       # Optional threshold
+         ) -> 'Perf_Benchmark__Timing':
+        self.queued.append((benchmark_id, target, assert_less_than))
+        return self
+
+    def run_queued(self) -> List[Schema__Perf__Benchmark__Result]:               # Run queued benchmarks (in parallel when config.workers > 1)
+        queued      = list(self.queued)
+        self.queued = []
+        targets     = [target for _, target, _ in queued]
+        runs        = [self.executor().run(targets) for _ in range(self.runs())] # Round-robin, so that drift (CPU frequency, other load) affects all benchmarks alike
+        return [self.benchmark__result(benchmark_id, [run[position] for run in runs], assert_less_than)
+                for position, (benchmark_id, _, assert_less_than) in enumerate(queued)]
+
+    def benchmark__result(self                                  ,                # Store the sessions' result
+                          benchmark_id    : Safe_Str__Benchmark_Id ,
+                          sessions        : List[Perf]             ,             # One per run
+                          assert_less_than: Optional[Safe_UInt] = None
+                     ) -> Schema__Perf__Benchmark__Result:
+        session     = self.session__merge(sessions)
         perf_result = session.result
 
         section, index, name = self.parse_benchmark_id(benchmark_id)
+        run_scores           = []
+        if len(sessions) > 1:                                                    # One sample per run (the calls of a run are not independent samples)
+            run_scores = [int(run.result.raw_score) for run in sessions]
 
         result = Schema__Perf__Benchmark__Result(benchmark_id = benchmark_id                               ,
                                                  section      = section                                    ,
                                                  index        = index                                      ,
                                                  name         = name                                       ,
                                                  final_score  = Safe_UInt(int(perf_result.final_score))    ,
-                                                 raw_score    = Safe_UInt(int(perf_result.raw_score  ))    )
+                                                 raw_score    = Safe_UInt(int(perf_result.raw_score  ))    ,
+                                                 run_scores   = run_scores                                 ,
+                                                 memory       = perf_result.memory                         )
 
         self.results[benchmark_id]  = result                                     # Store summary
         self.sessions[benchmark_id] = session                                    # Store full session
@@ -106,6 +128,9 @@ class Perf_Benchmark__Timing(Type_Safe):
     # Reporter Access
     # ═══════════════════════════════════════════════════════════════════════════════
 
+    def executor(self) -> Perf_Benchmark__Executor:                              # Create execution engine
+        return Perf_Benchmark__Executor(config=self.config)
+
     def reporter(self) -> Perf_Benchmark__Timing__Reporter:                      # Create reporter
         return Perf_Benchmark__Timing__Reporter(results = self.results,
                                                 config  = self.config )
@@ -132,4 +157,18 @@ class Perf_Benchmark__Timing(Type_Safe):
 
         return (Safe_Str__Benchmark__Section('')  ,
                 Safe_Str__Benchmark__Index('')    ,
-                Safe_Str(id_str)                  )
\ No newline at end of file
+                Safe_Str(id_str)                  )
+
+    def runs(self) -> int:                                                       # Sessions measured per benchmark
+        return max(1, self.config.repeats)
+
+    def session__merge(self, sessions: List[Perf]) -> Perf:                      # Single session with the times of all runs (for the scores)
+        if len(sessions) == 1:
+            return sessions[0]
+        loops_times = {}
+        for session in sessions:
+            for loop_size, measurement in session.result.measurements.items():
+                loops_times.setdefault(loop_size, []).extend(int(raw_time) for raw_time in measurement.raw_times)
+        merged = Perf(assert_enabled=sessions[0].assert_enabled).measure__from_times(sessions[0].result.name, list(loops_times.items()))
+        merged.result.memory = sessions[0].result.memory                         # Memory doesn't change between runs
+        return merged
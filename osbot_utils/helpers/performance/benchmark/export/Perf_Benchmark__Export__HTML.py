@@ -48,6 +48,9 @@ class Perf_Benchmark__Export__HTML(Perf_Benchmark__Export):
 </body>
 </html>'''
 
+    def js_scores(self, scores) -> str:                                          # Scores as a javascript array (missing scores are null, so that Chart.js shows a gap)
+        return '[' + ', '.join('null' if score is None else str(int(score)) for score in scores) + ']'
+
     def trend_class(self, trend: Enum__Benchmark__Trend) -> str:                 # CSS class for trend
         if trend in [Enum__Benchmark__Trend.STRONG_IMPROVEMENT, Enum__Benchmark__Trend.IMPROVEMENT]:
             return 'improvement'
@@ -106,7 +109,7 @@ class Perf_Benchmark__Export__HTML(Perf_Benchmark__Export):
         for i, evolution in enumerate(result.evolutions):
             color      = CHART_COLORS[i % len(CHART_COLORS)]
             bg_color   = color.replace('0.8', '0.2')
-            scores     = [int(s) for s in evolution.scores]
+            scores     = self.js_scores(evolution.scores)
 
             datasets.append(f'''{{
                 label: '{evolution.name}',
@@ -148,6 +151,66 @@ new Chart(ctx, {{
 
         return self.html_wrapper('Performance Evolution', body)
 
+    def export_dashboard(self, result: Schema__Perf__Evolution) -> str:          # Export evolution as a trend dashboard (one small chart per benchmark)
+        if result.status != Enum__Comparison__Status.SUCCESS:
+            return self.html_wrapper('Error', f'<p>{result.error}</p>')
+
+        labels     = [str(title) for title in result.titles]
+        trend_rank = {'regression': 0, 'improvement': 1, 'unchanged': 2}          # regressions first
+        evolutions = sorted(result.evolutions, key=lambda e: (trend_rank[self.trend_class(e.trend)], str(e.benchmark_id)))
+
+        rows   = []
+        charts = []
+        for i, evolution in enumerate(evolutions):
+            css_class  = self.trend_class(evolution.trend)
+            change_pct = float(evolution.change_percent)
+            scores     = self.js_scores(evolution.scores)
+            if change_pct > 0:
+                change_str = f'-{change_pct:.1f}%'
+            elif change_pct < 0:
+                change_str = f'+{abs(change_pct):.1f}%'
+            else:
+                change_str = '0%'
+
+            rows.append(f'''        <tr>
+            <td>{evolution.name}</td>
+            <td class="sparkline"><canvas id="trend_{i}"></canvas></td>
+            <td>{int(evolution.first_score):,} ns</td>
+            <td>{int(evolution.last_score):,} ns</td>
+            <td class="{css_class}">{change_str}</td>
+        </tr>''')
+            charts.append(f"trendChart('trend_{i}', {scores}, '{CHART_COLORS[i % len(CHART_COLORS)]}');")
+
+        body = f'''    <h1>Performance Trends: {len(evolutions)} Benchmarks, {result.session_count} Runs</h1>
+    <style>
+        .sparkline {{ width: 320px; height: 60px; }}
+    </style>
+    <table>
+        <tr>
+            <th>Benchmark</th>
+            <th>Trend</th>
+            <th>First</th>
+            <th>Last</th>
+            <th>Change</th>
+        </tr>
+{chr(10).join(rows)}
+    </table>
+    <script>
+        const labels = {labels};
+        function trendChart(id, data, color) {{
+            new Chart(document.getElementById(id).getContext('2d'), {{
+                type: 'line',
+                data: {{ labels: labels, datasets: [{{ data: data, borderColor: color, pointRadius: 1, tension: 0.1 }}] }},
+                options: {{ responsive: true, maintainAspectRatio: false, animation: false,
+                           plugins: {{ legend: {{ display: false }} }},
+                           scales : {{ x: {{ display: false }}, y: {{ beginAtZero: true }} }} }}
+            }});
+        }}
+        {(chr(10) + '        ').join(charts)}
+    </script>'''
+
+        return self.html_wrapper('Performance Trends', body)
+
     def export_statistics(self, result: Schema__Perf__Statistics) -> str:        # Export statistics
         if result.status != Enum__Comparison__Status.SUCCESS:
             return self.html_wrapper('Error', f'<p>{result.error}</p>')
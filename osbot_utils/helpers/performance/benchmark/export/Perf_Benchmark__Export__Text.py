@@ -74,7 +74,7 @@ class Perf_Benchmark__Export__Text(Perf_Benchmark__Export):
         for evolution in result.evolutions:
             row    = [evolution.name]
             for score in evolution.scores:
-                if score > 0:
+                if score is not None and score > 0:
                     row.append(f'{score:,} ns')
                 else:
                     row.append('-')
@@ -3,12 +3,15 @@
 # Pure data schema capturing timing and metadata for one benchmark
 # ═══════════════════════════════════════════════════════════════════════════════
 
+from typing                                                                                               import Optional
 from osbot_utils.type_safe.Type_Safe                                                                      import Type_Safe
 from osbot_utils.type_safe.primitives.core.Safe_Str                                                       import Safe_Str
 from osbot_utils.type_safe.primitives.core.Safe_UInt                                                      import Safe_UInt
 from osbot_utils.helpers.performance.benchmark.schemas.safe_str.Safe_Str__Benchmark_Id                    import Safe_Str__Benchmark_Id
 from osbot_utils.helpers.performance.benchmark.schemas.safe_str.Safe_Str__Benchmark__Section              import Safe_Str__Benchmark__Section
 from osbot_utils.helpers.performance.benchmark.schemas.safe_str.Safe_Str__Benchmark__Index                import Safe_Str__Benchmark__Index
+from osbot_utils.helpers.performance.benchmark.schemas.collections.List__Run_Scores                       import List__Run_Scores
+from osbot_utils.helpers.performance.schemas.Schema__Performance_Measure__Memory                          import Schema__Performance_Measure__Memory
 
 
 class Schema__Perf__Benchmark__Result(Type_Safe):                                # Single benchmark result
@@ -18,3 +21,5 @@ class Schema__Perf__Benchmark__Result(Type_Safe):
     name         : Safe_Str                                                      # Extracted: "python__nop"
     final_score  : Safe_UInt                                                     # Normalized score in ns
     raw_score    : Safe_UInt                                                     # Raw score in ns
+    run_scores   : List__Run_Scores                                              # raw_score of each run (config.repeats), compared by the significance tests
+    memory       : Optional[Schema__Performance_Measure__Memory]                 # Only set when config.measure_memory is enabled
@@ -0,0 +1,25 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Schema__Perf__Benchmark__Significance - Statistical comparison of two benchmarks
+# Compares the scores of repeated runs (Mann-Whitney U, Cliff's delta, bootstrap CI)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+from osbot_utils.type_safe.Type_Safe                                                              import Type_Safe
+from osbot_utils.type_safe.primitives.core.Safe_Float                                             import Safe_Float
+from osbot_utils.type_safe.primitives.core.Safe_UInt                                              import Safe_UInt
+from osbot_utils.helpers.performance.benchmark.schemas.enums.Enum__Benchmark__Trend               import Enum__Benchmark__Trend
+from osbot_utils.type_safe.primitives.domains.numerical.safe_float.Safe_Float__Percentage_Change  import Safe_Float__Percentage_Change
+
+
+class Schema__Perf__Benchmark__Significance(Type_Safe):                          # Is the change real or noise?
+    sample_size_a  : Safe_UInt                                                   # Number of runs (before)
+    sample_size_b  : Safe_UInt                                                   # Number of runs (after)
+    median_a       : Safe_UInt                                                   # Median score (ns) before
+    median_b       : Safe_UInt                                                   # Median score (ns) after
+    change_percent : Safe_Float__Percentage_Change                               # Change of the median, positive = faster
+    ci_low         : Safe_Float__Percentage_Change                               # Bootstrap confidence interval of change_percent
+    ci_high        : Safe_Float__Percentage_Change
+    u_statistic    : Safe_Float                                                  # Mann-Whitney U (of the before times)
+    p_value        : Safe_Float                                                  # Two-sided, normal approximation (with ties correction)
+    effect_size    : Safe_Float                                                  # Cliff's delta (-1 ... 1), positive = faster
+    significant    : bool                                                        # p_value < alpha, non-negligible effect, change >= min_change and CI excluding 0
+    trend          : Enum__Benchmark__Trend                                      # UNCHANGED when not significant
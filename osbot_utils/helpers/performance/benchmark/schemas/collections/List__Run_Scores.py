@@ -0,0 +1,9 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# List__Run_Scores - Score of each repeated run of a benchmark (nanoseconds)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+from osbot_utils.type_safe.type_safe_core.collections.Type_Safe__List                           import Type_Safe__List
+
+
+class List__Run_Scores(Type_Safe__List):                                         # [score_ns, score_ns, ...]
+    expected_type = int                                                          # plain int (not Safe_UInt), same as the raw_score values
@@ -6,5 +6,10 @@ from osbot_utils.type_safe.type_safe_core.collections.Type_Safe__List
 from osbot_utils.type_safe.primitives.core.Safe_UInt                                            import Safe_UInt
 
 
-class List__Scores(Type_Safe__List):                                             # [score, score, ...]
+class List__Scores(Type_Safe__List):                                             # [score, score, ...] (None when the benchmark has no score in that session)
     expected_type = Safe_UInt
+
+    def _validate_and_convert_item(self, item):
+        if item is None:                                                         # a missing score (which charts show as a gap, not as 0)
+            return None
+        return super()._validate_and_convert_item(item)
@@ -6,6 +6,7 @@ from osbot_utils.helpers.performance.benchmark.schemas.safe_str.Safe_Str__Benchm
 from osbot_utils.type_safe.Type_Safe                                                                      import Type_Safe
 from osbot_utils.type_safe.primitives.core.Safe_Float                                                     import Safe_Float
 from osbot_utils.helpers.performance.benchmark.schemas.collections.Dict__Benchmark_Results                import Dict__Benchmark_Results
+from osbot_utils.helpers.performance.benchmark.schemas.collections.List__Benchmark_Comparisons            import List__Benchmark_Comparisons
 from osbot_utils.helpers.performance.benchmark.schemas.enums.Enum__Hypothesis__Status                     import Enum__Hypothesis__Status
 from osbot_utils.type_safe.primitives.domains.identifiers.safe_int.Timestamp_Now                          import Timestamp_Now
 
@@ -16,6 +17,7 @@ class Schema__Perf__Hypothesis__Result(Type_Safe):
     actual_improvement : Safe_Float                                              # Calculated from results
     before_results     : Dict__Benchmark_Results                                 # Baseline measurements
     after_results      : Dict__Benchmark_Results                                 # Optimized measurements
+    comparisons        : List__Benchmark_Comparisons                             # Per benchmark change (with significance when there are enough run_scores)
     status             : Enum__Hypothesis__Status                                # SUCCESS, FAILURE, etc.
     timestamp          : Timestamp_Now                                           # When evaluated
     comments           : Safe_Str__Benchmark__Description                        # Optional notes
@@ -24,3 +24,11 @@ class Schema__Perf_Benchmark__Timing__Config(Type_Safe):
     measure_quick           : bool            = True                             # Allow to control if session.measure__quick(..) or session.measure(..) is used
     measure_fast            : bool            = False
     measure_only_3          : bool            = False
+    workers                 : int             = 0                                # Run the queued benchmarks in this many (forked) worker processes (0 or 1 runs them in-process)
+    pin_cpus                : bool            = False                            # Pin each worker process to its own CPU (os.sched_setaffinity, where available)
+    warmup_invocations      : int             = 0                                # Calls made before measuring (not timed)
+    gc_disabled             : bool            = False                            # Collect and disable the GC while measuring
+    calibrate_budget_ns     : int             = 0                                # When set, the loops are the Fibonacci schedule prefix that fits in this time budget
+    measure_memory          : bool            = False                            # Also capture peak/allocated memory, GC and object counts (Performance_Measure__Session.measure__memory)
+    batch_size              : int             = 0                                # When > 1, time blocks of this many calls, minus the empty loop cost (for sub-microsecond targets)
+    repeats                 : int             = 0                                # When > 1, measure each benchmark this many times (at least 4 for the significance tests), round-robin across the queued benchmarks
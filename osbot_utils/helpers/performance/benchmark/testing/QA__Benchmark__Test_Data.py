@@ -97,14 +97,16 @@ class QA__Benchmark__Test_Data(Type_Safe):
                                 index        : str = None                   ,
                                 name         : str = None                   ,
                                 final_score  : int = None                   ,
-                                raw_score    : int = None                   ) -> Schema__Perf__Benchmark__Result:
+                                raw_score    : int = None                   ,
+                                run_scores   : list = None                  ) -> Schema__Perf__Benchmark__Result:
 
         return Schema__Perf__Benchmark__Result(benchmark_id = Safe_Str__Benchmark_Id(benchmark_id or self.benchmark_id_1)     ,
                                                section      = Safe_Str__Benchmark__Section(section or self.section_a)         ,
                                                index        = Safe_Str__Benchmark__Index(index or self.index_01)              ,
                                                name         = name or 'python__nop'                                           ,
                                                final_score  = Safe_UInt(final_score if final_score is not None else 100)      ,
-                                               raw_score    = Safe_UInt(raw_score if raw_score is not None else 87)           )
+                                               raw_score    = Safe_UInt(raw_score if raw_score is not None else 87)           ,
+                                               run_scores   = run_scores or []                                                 )
 
     def create_results_dict(self                                            ,    # Create results dict
                             count: int = 3                                  ) -> Dict__Benchmark_Results:
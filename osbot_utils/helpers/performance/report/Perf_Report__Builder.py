@@ -66,7 +66,8 @@ class Perf_Report__Builder(Type_Safe):                              # Main build
             benchmark = Schema__Perf_Report__Benchmark(benchmark_id = bench_id      ,
                                                        time_ns      = time_ns       ,
                                                        category_id  = category_id   ,
-                                                       pct_of_total = pct           )
+                                                       pct_of_total = pct           ,
+                                                       memory       = result.memory )
             benchmarks.append(benchmark)
 
         return benchmarks
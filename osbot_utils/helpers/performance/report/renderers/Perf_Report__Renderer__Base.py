@@ -1,6 +1,6 @@
 # ═══════════════════════════════════════════════════════════════════════════════
 # Perf_Report__Renderer__Base - Abstract base for report renderers
-# Provides shared formatting helpers for time and percentage values
+# Provides shared formatting helpers for time, memory and percentage values
 # ═══════════════════════════════════════════════════════════════════════════════
 
 from osbot_utils.helpers.performance.report.schemas.Schema__Perf_Report import Schema__Perf_Report
@@ -33,6 +33,20 @@ class Perf_Report__Renderer__Base(Type_Safe):                       # Abstract b
             return f'{sign}{abs_ns / 1_000_000_000:.2f}s'
 
 
+    @type_safe
+    def format_bytes(self, size: int) -> str:
+        abs_size = abs(size)
+        sign     = '-' if size < 0 else ''
+
+        if abs_size < 1_024:
+            return f'{sign}{abs_size}B'
+        elif abs_size < 1_024 ** 2:
+            return f'{sign}{abs_size / 1_024:.2f}KB'
+        elif abs_size < 1_024 ** 3:
+            return f'{sign}{abs_size / 1_024 ** 2:.2f}MB'
+        else:
+            return f'{sign}{abs_size / 1_024 ** 3:.2f}GB'
+
     @type_safe
     def format_pct(self, pct: float, width: int = 5) -> str:        # Format percentage with padding
         return f'{pct:>{width}.1f}%'
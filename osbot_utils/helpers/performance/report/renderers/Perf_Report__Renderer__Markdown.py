@@ -20,6 +20,7 @@ class Perf_Report__Renderer__Markdown(Perf_Report__Renderer__Base): # Markdown f
         lines.extend(self.render_metadata(report))
         lines.extend(self.render_legend(report))
         lines.extend(self.render_benchmarks(report))
+        lines.extend(self.render_memory(report))
         lines.extend(self.render_categories(report))
         lines.extend(self.render_analysis(report))
         return '\n'.join(lines)
@@ -84,6 +85,26 @@ class Perf_Report__Renderer__Markdown(Perf_Report__Renderer__Base): # Markdown f
         lines.append('')
         return lines
 
+    @type_safe
+    def render_memory(self, report: Schema__Perf_Report) -> List[str]:     # Only rendered when some benchmark has memory metrics
+        benchmarks = [benchmark for benchmark in report.benchmarks if benchmark.memory is not None]
+        if not benchmarks:
+            return []
+        lines = ['## Memory'                                                                        ,
+                 ''                                                                                 ,
+                 '| Benchmark | Peak | Allocated/call | Blocks/call | GC Objects/call | GC Runs |'   ,
+                 '|-----------|------|----------------|-------------|-----------------|---------|'   ]
+
+        for benchmark in benchmarks:
+            memory    = benchmark.memory
+            bench_id  = self.escape_markdown(str(benchmark.benchmark_id))
+            peak      = self.format_bytes(int(memory.peak_bytes))
+            allocated = self.format_bytes(int(memory.allocated_bytes))
+            lines.append(f'| {bench_id} | {peak} | {allocated} | {int(memory.allocated_blocks)} | {int(memory.gc_objects)} | {int(memory.gc_collections)} |')
+
+        lines.append('')
+        return lines
+
     @type_safe
     def render_categories(self, report: Schema__Perf_Report) -> List[str]:
         lines = ['## Category Totals'                                               ,
@@ -26,6 +26,8 @@ class Perf_Report__Renderer__Text(Perf_Report__Renderer__Base):     # Renders to
         lines.append(self.render_description(report.metadata))
         lines.append(self.render_legend(report.legend))
         lines.append(self.render_benchmarks_table(report.benchmarks, report.categories))
+        if self.has_memory(report.benchmarks):
+            lines.append(self.render_memory_table(report.benchmarks))
         lines.append(self.render_category_summary(report.categories))
         lines.append(self.render_percentage_analysis(report.categories))
         lines.append(self.render_stage_breakdown(report.benchmarks, report.categories))
@@ -120,6 +122,27 @@ class Perf_Report__Renderer__Text(Perf_Report__Renderer__Base):     # Renders to
         table.set_footer(f'Total: {len(benchmarks)} benchmarks')
         return table.text()
 
+    @type_safe
+    def render_memory_table(self                                      ,  # Memory metrics (only for benchmarks measured with measure_memory)
+                            benchmarks: List__Perf_Report__Benchmarks
+                       ) -> str:
+        table = Print_Table()
+        table.set_title('MEMORY')
+        table.add_headers('Benchmark', 'Peak', 'Allocated/call', 'Blocks/call', 'GC Objects/call', 'GC Runs')
+
+        for benchmark in benchmarks:
+            memory = benchmark.memory
+            if memory is None:
+                continue
+            table.add_row([str(benchmark.benchmark_id)                     ,
+                           self.format_bytes(int(memory.peak_bytes))       ,
+                           self.format_bytes(int(memory.allocated_bytes))  ,
+                           str(int(memory.allocated_blocks))               ,
+                           str(int(memory.gc_objects))                     ,
+                           str(int(memory.gc_collections))                 ])
+
+        return table.text()
+
     @type_safe
     def render_category_summary(self                                      ,  # Category totals
                                 categories: List__Perf_Report__Categories
@@ -254,6 +277,10 @@ class Perf_Report__Renderer__Text(Perf_Report__Renderer__Base):     # Renders to
     # Helpers
     # ═══════════════════════════════════════════════════════════════════════════
 
+    @type_safe
+    def has_memory(self, benchmarks: List__Perf_Report__Benchmarks) -> bool:     # True when at least one benchmark has memory metrics
+        return any(benchmark.memory is not None for benchmark in benchmarks)
+
     @type_safe
     def format_ns_padded(self, ns: int, width: int) -> str:         # Format ns with padding
         return self.format_ns(ns).rjust(width)
@@ -2,7 +2,9 @@
 # Schema__Perf_Report__Benchmark - Single benchmark result
 # Contains benchmark ID, timing in nanoseconds, category, and percentage
 # ═══════════════════════════════════════════════════════════════════════════════
+from typing                                                                                      import Optional
 from osbot_utils.helpers.performance.benchmark.schemas.safe_str.Safe_Str__Benchmark_Id           import Safe_Str__Benchmark_Id
+from osbot_utils.helpers.performance.schemas.Schema__Performance_Measure__Memory                 import Schema__Performance_Measure__Memory
 from osbot_utils.helpers.performance.benchmark.schemas.safe_str.Safe_Str__Benchmark__Section     import Safe_Str__Benchmark__Section
 from osbot_utils.type_safe.primitives.core.Safe_UInt                                             import Safe_UInt
 from osbot_utils.type_safe.Type_Safe                                                             import Type_Safe
@@ -14,3 +16,4 @@ class Schema__Perf_Report__Benchmark(Type_Safe):                    # Single ben
     time_ns      : Safe_UInt                                        # Execution time in nanoseconds
     category_id  : Safe_Str__Benchmark__Section                     # Category letter (e.g., A, B, C)
     pct_of_total : Safe_Float__Percentage_Change                    # Percentage of total time
+    memory       : Optional[Schema__Performance_Measure__Memory]    # Memory metrics (when measured)
@@ -0,0 +1,16 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Schema__Perf_Report__History__Point - One benchmark time in the history store
+# Row schema of the (indexed) benchmarks table, and the time-series query result
+# ═══════════════════════════════════════════════════════════════════════════════
+
+from osbot_utils.type_safe.Type_Safe import Type_Safe
+
+
+class Schema__Perf_Report__History__Point(Type_Safe):               # One benchmark, in one run
+    run_id       : int                                              # Row id of the run
+    run_key      : str                                              # Storage key (usually the git commit)
+    machine      : str                                              # Machine fingerprint
+    timestamp    : int                                              # Report timestamp (ms)
+    benchmark_id : str                                              # Benchmark identifier (e.g., A_01__name)
+    category_id  : str                                              # Category letter (e.g., A, B, C)
+    time_ns      : int                                              # Execution time in nanoseconds
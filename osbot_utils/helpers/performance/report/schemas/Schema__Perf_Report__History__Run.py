@@ -0,0 +1,14 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Schema__Perf_Report__History__Run - One saved report in the history store
+# Row schema of the runs table (the full report is kept as json)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+from osbot_utils.type_safe.Type_Safe import Type_Safe
+
+
+class Schema__Perf_Report__History__Run(Type_Safe):                 # One report, per key (git commit) and machine
+    run_key   : str                                                 # Storage key (usually the git commit)
+    machine   : str                                                 # Machine fingerprint
+    timestamp : int                                                 # Report timestamp (ms)
+    title     : str                                                 # Report title
+    report    : str                                                 # Schema__Perf_Report json
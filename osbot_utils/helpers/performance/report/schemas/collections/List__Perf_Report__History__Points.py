@@ -0,0 +1,10 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# List__Perf_Report__History__Points - Typed list of history points (time series)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+from osbot_utils.helpers.performance.report.schemas.Schema__Perf_Report__History__Point import Schema__Perf_Report__History__Point
+from osbot_utils.type_safe.type_safe_core.collections.Type_Safe__List                   import Type_Safe__List
+
+
+class List__Perf_Report__History__Points(Type_Safe__List):          # Collection of history points
+    expected_type = Schema__Perf_Report__History__Point
@@ -0,0 +1,221 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Perf_Report__Storage__History - Indexed (sqlite) history of reports
+# Keeps one run per key (git commit) and machine fingerprint, with every benchmark
+# time in an indexed table, so that time series and trends don't rescan files
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import os
+import platform
+from typing                                                                                         import List
+from osbot_utils.decorators.methods.cache_on_self                                                   import cache_on_self
+from osbot_utils.helpers.performance.benchmark.Perf_Benchmark__Diff                                 import Perf_Benchmark__Diff
+from osbot_utils.helpers.performance.benchmark.export.Perf_Benchmark__Export__HTML                  import Perf_Benchmark__Export__HTML
+from osbot_utils.helpers.performance.benchmark.schemas.Schema__Perf__Evolution                      import Schema__Perf__Evolution
+from osbot_utils.helpers.performance.benchmark.schemas.benchmark.Schema__Perf__Benchmark__Evolution import Schema__Perf__Benchmark__Evolution
+from osbot_utils.helpers.performance.benchmark.schemas.collections.List__Benchmark_Evolutions       import List__Benchmark_Evolutions
+from osbot_utils.helpers.performance.benchmark.schemas.collections.List__Scores                     import List__Scores
+from osbot_utils.helpers.performance.benchmark.schemas.collections.List__Titles                     import List__Titles
+from osbot_utils.helpers.performance.benchmark.schemas.enums.Enum__Comparison__Status               import Enum__Comparison__Status
+from osbot_utils.helpers.performance.report.schemas.Schema__Perf_Report                             import Schema__Perf_Report
+from osbot_utils.helpers.performance.report.schemas.Schema__Perf_Report__History__Point             import Schema__Perf_Report__History__Point
+from osbot_utils.helpers.performance.report.schemas.Schema__Perf_Report__History__Run               import Schema__Perf_Report__History__Run
+from osbot_utils.helpers.performance.report.schemas.collections.List__Perf_Report__History__Points  import List__Perf_Report__History__Points
+from osbot_utils.helpers.performance.report.storage.Perf_Report__Storage__Base                      import Perf_Report__Storage__Base
+from osbot_utils.helpers.sqlite.Sqlite__Database                                                    import Sqlite__Database
+from osbot_utils.helpers.sqlite.Sqlite__Table                                                       import Sqlite__Table
+from osbot_utils.type_safe.type_safe_core.decorators.type_safe                                      import type_safe
+from osbot_utils.utils.Json                                                                         import json_dumps, json_loads
+from osbot_utils.utils.Misc                                                                         import str_sha256
+
+HISTORY__TABLE__RUNS          = 'perf_history_runs'
+HISTORY__TABLE__POINTS        = 'perf_history_points'
+HISTORY__FIELDS__POINTS       = [field for field in Schema__Perf_Report__History__Point.__annotations__]
+HISTORY__EVOLUTION__LIMIT     = 20                                  # Runs shown in the evolution / dashboard
+HISTORY__MACHINE__HASH_LENGTH = 16
+
+
+class Perf_Report__Storage__History(Perf_Report__Storage__Base):    # Sqlite history storage backend
+    db_path : str                                                   # Sqlite file (in-memory when empty)
+    machine : str                                                   # Machine fingerprint (defaults to machine_fingerprint())
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        if not self.machine:
+            self.machine = self.machine_fingerprint()
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Storage Interface
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    @type_safe
+    def save(self                                 ,                 # Save report as the run of key (on this machine)
+             report : Schema__Perf_Report         ,                 # Report to save
+             key    : str                         ,                 # Storage key (usually the git commit)
+             formats: List[str] = None            ) -> bool:        # Not used (the history keeps the report data, not rendered files)
+        timestamp  = int(report.metadata.timestamp)
+        connection = self.database().connection()
+        fields     = ', '.join(HISTORY__FIELDS__POINTS)
+        values     = ', '.join('?' * len(HISTORY__FIELDS__POINTS))
+        try:                                                        # the old run is only removed if the new one is saved (i.e. a single transaction)
+            run = self.run(key)
+            if run is not None:                                     # saving the same key again replaces its run
+                self.delete__run(run.get('id'))
+            run_id = connection.execute(f'INSERT INTO {HISTORY__TABLE__RUNS} (run_key, machine, timestamp, title, report) VALUES (?, ?, ?, ?, ?)',
+                                        (key, self.machine, timestamp, str(report.metadata.title), json_dumps(report.json(), pretty=False))).lastrowid
+            rows   = [(run_id, key, self.machine, timestamp, str(benchmark.benchmark_id), str(benchmark.category_id), int(benchmark.time_ns))
+                      for benchmark in report.benchmarks]
+            connection.executemany(f'INSERT INTO {HISTORY__TABLE__POINTS} ({fields}) VALUES ({values})', rows)
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        return True
+
+    @type_safe
+    def save_content(self                         ,                 # Rendered content is not kept in the history
+                     key        : str             ,
+                     content    : str             ,
+                     format_type: str             ) -> bool:
+        return False
+
+    @type_safe
+    def load(self, key: str) -> Schema__Perf_Report:                # Load the report of key (on this machine)
+        run = self.run(key)
+        if run is None:
+            return None
+        return Schema__Perf_Report.from_json(json_loads(run.get('report')))
+
+    @type_safe
+    def list_reports(self) -> List[str]:                            # Keys of this machine, oldest first
+        sql_query = f'SELECT run_key FROM {HISTORY__TABLE__RUNS} WHERE machine = ? ORDER BY timestamp, id'
+        return [row.get('run_key') for row in self.database().cursor().execute__fetch_all(sql_query, (self.machine,))]
+
+    @type_safe
+    def exists(self, key: str) -> bool:
+        return self.run(key) is not None
+
+    @type_safe
+    def delete(self, key: str) -> bool:                             # Delete the run of key (and its points)
+        run = self.run(key)
+        if run is None:
+            return False
+        self.delete__run(run.get('id'))
+        self.database().connection().commit()
+        return True
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Time Series Queries
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    @type_safe
+    def history(self                          ,                     # Times of one benchmark (on this machine), oldest first
+                benchmark_id : str            ,
+                since        : int  = 0       ,                     # Only runs with a timestamp (ms) after this
+                limit        : int  = 0                             # Only the most recent runs (0 = all)
+           ) -> List__Perf_Report__History__Points:
+        sql_query = (f'SELECT {", ".join(HISTORY__FIELDS__POINTS)} FROM {HISTORY__TABLE__POINTS} '
+                     f'WHERE benchmark_id = ? AND machine = ? AND timestamp > ? ORDER BY timestamp DESC, run_id DESC')
+        if limit:
+            sql_query += f' LIMIT {int(limit)}'
+        rows   = self.database().cursor().execute__fetch_all(sql_query, (benchmark_id, self.machine, since))
+        points = List__Perf_Report__History__Points()
+        for row in reversed(rows):
+            points.append(Schema__Perf_Report__History__Point(**row))
+        return points
+
+    @type_safe
+    def benchmark_ids(self) -> List[str]:                           # Benchmarks recorded on this machine
+        sql_query = f'SELECT DISTINCT benchmark_id FROM {HISTORY__TABLE__POINTS} WHERE machine = ? ORDER BY benchmark_id'
+        return [row.get('benchmark_id') for row in self.database().cursor().execute__fetch_all(sql_query, (self.machine,))]
+
+    @type_safe
+    def machines(self) -> List[str]:                                # All machine fingerprints in the store
+        sql_query = f'SELECT DISTINCT machine FROM {HISTORY__TABLE__RUNS} ORDER BY machine'
+        return [row.get('machine') for row in self.database().cursor().execute__fetch_all(sql_query)]
+
+    @type_safe
+    def evolution(self, limit: int = HISTORY__EVOLUTION__LIMIT) -> Schema__Perf__Evolution:  # Every benchmark over the last runs of this machine
+        sql_query = f'SELECT id, run_key FROM {HISTORY__TABLE__RUNS} WHERE machine = ? ORDER BY timestamp DESC, id DESC LIMIT {int(limit)}'
+        runs      = list(reversed(self.database().cursor().execute__fetch_all(sql_query, (self.machine,))))
+        if len(runs) == 0:
+            return Schema__Perf__Evolution(status = Enum__Comparison__Status.ERROR_NO_SESSIONS          ,
+                                           error  = 'No runs in history'                                )
+        if len(runs) < 2:
+            return Schema__Perf__Evolution(status = Enum__Comparison__Status.ERROR_INSUFFICIENT_SESSIONS,
+                                           error  = 'Need at least 2 runs for evolution'                )
+
+        run_indexes  = {run.get('id'): index for index, run in enumerate(runs)}
+        placeholders = ', '.join('?' * len(runs))
+        sql_query    = f'SELECT run_id, benchmark_id, time_ns FROM {HISTORY__TABLE__POINTS} WHERE run_id IN ({placeholders})'
+        times        = {}                                           # benchmark_id -> time per run (None when missing)
+        for row in self.database().cursor().execute__fetch_all(sql_query, list(run_indexes)):
+            run_times = times.setdefault(row.get('benchmark_id'), [None] * len(runs))
+            run_times[run_indexes[row.get('run_id')]] = row.get('time_ns')
+
+        diff       = Perf_Benchmark__Diff()
+        evolutions = List__Benchmark_Evolutions()
+        for benchmark_id in sorted(times):
+            measured   = [time_ns for time_ns in times[benchmark_id] if time_ns is not None]
+            first      = measured[0]
+            last       = measured[-1]
+            change_pct = ((first - last) / first) * 100 if first > 0 else 0.0
+            evolutions.append(Schema__Perf__Benchmark__Evolution(benchmark_id   = benchmark_id                                          ,
+                                                                 name           = benchmark_id                                          ,
+                                                                 scores         = List__Scores(times[benchmark_id])                     ,   # None for the runs without this benchmark
+                                                                 first_score    = first                                                 ,
+                                                                 last_score     = last                                                  ,
+                                                                 change_percent = change_pct                                            ,
+                                                                 trend          = diff.calculate_trend(change_pct)                      ))
+
+        return Schema__Perf__Evolution(status        = Enum__Comparison__Status.SUCCESS                     ,
+                                       session_count = len(runs)                                            ,
+                                       titles        = List__Titles([run.get('run_key') for run in runs])   ,
+                                       evolutions    = evolutions                                           )
+
+    @type_safe
+    def dashboard(self, limit: int = HISTORY__EVOLUTION__LIMIT) -> str:   # Static HTML trend dashboard
+        return Perf_Benchmark__Export__HTML().export_dashboard(self.evolution(limit=limit))
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Helper Methods
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    @cache_on_self
+    def database(self) -> Sqlite__Database:                         # Connected database, with the tables and indexes created
+        database = Sqlite__Database(db_path=self.db_path or None)
+        self.setup(database)
+        return database
+
+    def setup(self, database: Sqlite__Database) -> None:
+        for table_name, row_schema in [(HISTORY__TABLE__RUNS  , Schema__Perf_Report__History__Run  ),
+                                       (HISTORY__TABLE__POINTS, Schema__Perf_Report__History__Point)]:
+            with Sqlite__Table(database=database, table_name=table_name, row_schema=row_schema) as _:
+                if _.exists() is False:
+                    _.create()
+        cursor = database.cursor()
+        cursor.execute_and_commit(f'CREATE INDEX IF NOT EXISTS idx__{HISTORY__TABLE__RUNS}__machine_key '
+                                  f'ON {HISTORY__TABLE__RUNS}(machine, run_key)')
+        cursor.execute_and_commit(f'CREATE INDEX IF NOT EXISTS idx__{HISTORY__TABLE__RUNS}__machine_timestamp '
+                                  f'ON {HISTORY__TABLE__RUNS}(machine, timestamp)')
+        cursor.execute_and_commit(f'CREATE INDEX IF NOT EXISTS idx__{HISTORY__TABLE__POINTS}__series '           # the time series queries
+                                  f'ON {HISTORY__TABLE__POINTS}(benchmark_id, machine, timestamp)')
+        cursor.execute_and_commit(f'CREATE INDEX IF NOT EXISTS idx__{HISTORY__TABLE__POINTS}__run_id '
+                                  f'ON {HISTORY__TABLE__POINTS}(run_id)')
+
+    def delete__run(self, run_id: int) -> None:                     # Delete a run and its points (without committing, so that save can replace a run in one transaction)
+        connection = self.database().connection()
+        connection.execute(f'DELETE FROM {HISTORY__TABLE__POINTS} WHERE run_id = ?', (run_id,))
+        connection.execute(f'DELETE FROM {HISTORY__TABLE__RUNS  } WHERE id = ?'    , (run_id,))
+
+    def run(self, key: str) -> dict:                                # Row of the run of key (on this machine)
+        sql_query = f'SELECT * FROM {HISTORY__TABLE__RUNS} WHERE machine = ? AND run_key = ?'
+        return self.database().cursor().execute__fetch_one(sql_query, (self.machine, key))
+
+    def machine_fingerprint(self) -> str:                           # Same value on machines with the same platform, cpus and python (hostnames are not used)
+        parts = [platform.system()                 ,
+                 platform.machine()                ,
+                 platform.processor()              ,
+                 platform.python_implementation()  ,
+                 platform.python_version()         ,
+                 str(os.cpu_count())               ]
+        return str_sha256('|'.join(parts))[:HISTORY__MACHINE__HASH_LENGTH]
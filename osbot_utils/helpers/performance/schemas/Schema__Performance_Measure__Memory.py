@@ -0,0 +1,12 @@
+from osbot_utils.type_safe.Type_Safe                    import Type_Safe
+from osbot_utils.type_safe.primitives.core.Safe_Int     import Safe_Int
+from osbot_utils.type_safe.primitives.core.Safe_UInt    import Safe_UInt
+
+
+class Schema__Performance_Measure__Memory(Type_Safe):                                          # Pure data container for memory metrics (captured in a separate, traced, pass)
+    invocations      : Safe_UInt                                                               # Number of calls made while tracing
+    peak_bytes       : Safe_UInt                                                               # Highest extra memory used during one call (tracemalloc peak)
+    allocated_bytes  : Safe_Int                                                                # Net memory per call still allocated after it returns (tracemalloc)
+    allocated_blocks : Safe_Int                                                                # Net memory blocks per call (sys.getallocatedblocks)
+    gc_objects       : Safe_Int                                                                # Net objects tracked by the GC per call
+    gc_collections   : Safe_UInt                                                               # GC collections (all generations) triggered by the calls
@@ -1,5 +1,6 @@
-from typing                                                                               import Dict
+from typing                                                                               import Dict, Optional
 from osbot_utils.helpers.performance.schemas.Schema__Performance_Measure__Measurement     import Schema__Performance_Measure__Measurement
+from osbot_utils.helpers.performance.schemas.Schema__Performance_Measure__Memory          import Schema__Performance_Measure__Memory
 from osbot_utils.helpers.performance.schemas.safe_str.Safe_Str__Performance__Name         import Safe_Str__Performance__Name
 from osbot_utils.type_safe.Type_Safe                                                      import Type_Safe
 from osbot_utils.type_safe.primitives.core.Safe_Int                                       import Safe_Int
@@ -10,4 +11,4 @@ class Schema__Performance_Measure__Result(Type_Safe):
     name         : Safe_Str__Performance__Name                                                     # Name of measured target
     raw_score    : Safe_Int
     final_score  : Safe_Int
-
+    memory       : Optional[Schema__Performance_Measure__Memory]                              # Only set when measured with measure_memory=True
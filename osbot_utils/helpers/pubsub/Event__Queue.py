@@ -1,5 +1,6 @@
 import time
-from queue                                                      import Queue, Empty
+import threading
+from queue                                                      import Queue, Empty, Full
 from threading                                                  import Thread
 from osbot_utils.type_safe.Type_Safe                         import Type_Safe
 from osbot_utils.helpers.pubsub.schemas.Schema__Event           import Schema__Event
@@ -9,25 +10,46 @@ from osbot_utils.utils.Misc                                     import random_te
 TIMEOUT__THREAD_JOIN              = 1.0                             # todo: see if this value is a good one to use here
 TIMEOUT__QUEUE_GET                = 1.0
 TIMEOUT__WAIT_FOR_QUEUE_COMPLETED = 0.05                            # todo: see if this value is too aggressive (or if will be better to use a value like 0.1 or 0.5)
+QUEUE_FULL_MODE__BLOCK            = 'block'                         # send_event waits until there is space in the queue
+QUEUE_FULL_MODE__DROP_OLDEST      = 'drop-oldest'                   # the oldest event in the queue is dropped to make space for the new one
+QUEUE_FULL_MODE__REJECT           = 'reject'                        # send_event returns False
+QUEUE_FULL_MODES                  = [QUEUE_FULL_MODE__BLOCK, QUEUE_FULL_MODE__DROP_OLDEST, QUEUE_FULL_MODE__REJECT]
 
 
 class Event__Queue(Type_Safe):
+    batch_size          : int    = 1                                # when > 1, up to batch_size events are pulled per wakeup and sent to handle_events
+    batches_handled     : int
     events              : list
     event_class         : type
     events_added        : int
     events_completed    : int
+    events_dropped      : int
     events_failed       : int
+    events_rejected     : int
+    latency_max         : float                                     # max seconds an event waited in the queue
+    latency_total       : float
     log_events          : bool   = False
+    ordering_key_field  : str    = 'connection_id'                  # events with the same value in this field are always handled by the same worker (i.e. in order)
     queue               : Queue
+    queue_full_mode     : str    = QUEUE_FULL_MODE__BLOCK
+    queue_max_size      : int    = 0                                # 0 means an unbounded queue
     queue_name          : str    = random_text('event_queue')
     queue_get_timeout   : float  = TIMEOUT__QUEUE_GET
     running             : bool
     thread              : Thread = None
+    worker_queues       : list
+    worker_threads      : list
+    workers             : int    = 1                                # when > 1, events are handled by a pool of worker threads
 
 
     def __init__(self, **kwargs):
         self.event_class = Schema__Event
         super().__init__(**kwargs)
+        self.lock = threading.RLock()                               # protects the counters (which are updated by the worker threads)
+        if self.queue_full_mode not in QUEUE_FULL_MODES:
+            raise ValueError(f"in Event__Queue, invalid queue_full_mode '{self.queue_full_mode}', it must be one of: {QUEUE_FULL_MODES}")
+        if self.queue_max_size > 0:
+            self.queue = Queue(maxsize=self.queue_max_size)
 
     def __enter__(self):
         self.start()
@@ -45,15 +67,18 @@ class Event__Queue(Type_Safe):
             self.events.append(event)
         return True
 
+    def handle_events(self, events):                                # batch hook (used when batch_size > 1), override it to process the events in bulk
+        for event in events:
+            self.handle_event(event)
+        return True
+
     def send_event(self, event: Schema__Event):
         if isinstance(event, Schema__Event):
             if not event.timestamp:
                 event.timestamp = timestamp_utc_now()
             if not event.event_id:
                 event.event_id = random_guid()
-            self.events_added += 1
-            self.queue.put(event)
-            return True
+            return self.queue_put(event)
         return False
 
     def send_data(self, event_data, **kwargs):
@@ -70,6 +95,11 @@ class Event__Queue(Type_Safe):
 
     def start(self):
         self.running = True
+        if self.workers > 1:
+            self.worker_queues  = [Queue(maxsize=self.queue_max_size) for _ in range(self.workers)]        # bounded like the main queue, so that a slow worker pushes back on the dispatcher (and on send_event)
+            self.worker_threads = [Thread(target=self.run_worker, args=(worker_queue,), daemon=True) for worker_queue in self.worker_queues]
+            for worker_thread in self.worker_threads:
+                worker_thread.start()
         self.thread =  Thread(target=self.run_thread, daemon=True)
         self.thread.start()
         return self
@@ -78,21 +108,118 @@ class Event__Queue(Type_Safe):
         self.running = False                                         # will make the event loop stop at the next self.queue_get_timeout
         return self
 
+    def metrics(self):
+        events_handled = self.events_completed + self.events_failed
+        latency_avg    = self.latency_total / events_handled if events_handled else 0
+        return dict(batches_handled   = self.batches_handled               ,
+                    events_added      = self.events_added                  ,
+                    events_completed  = self.events_completed              ,
+                    events_dropped    = self.events_dropped                ,
+                    events_failed     = self.events_failed                 ,
+                    events_rejected   = self.events_rejected               ,
+                    latency_avg_ms    = round(latency_avg      * 1000, 3)  ,
+                    latency_max_ms    = round(self.latency_max * 1000, 3)  ,
+                    queue_depth       = self.queue_size()                  ,
+                    queue_max_size    = self.queue_max_size                )
+
+    def queue_put(self, event):
+        item = (event, time.perf_counter())                         # the enqueue time is used for the latency metrics
+        if self.queue_full_mode == QUEUE_FULL_MODE__REJECT:
+            try:
+                self.queue.put_nowait(item)
+            except Full:
+                with self.lock:
+                    self.events_rejected += 1
+                return False
+        elif self.queue_full_mode == QUEUE_FULL_MODE__DROP_OLDEST:
+            while True:
+                try:
+                    self.queue.put_nowait(item)
+                    break
+                except Full:
+                    try:
+                        self.queue.get_nowait()
+                        with self.lock:
+                            self.events_dropped += 1
+                    except Empty:                                   # the consumer got there first
+                        pass
+        else:
+            self.queue.put(item)
+        with self.lock:
+            self.events_added += 1
+        return True
+
+    def ordering_key(self, event):
+        return getattr(event, self.ordering_key_field, None)
+
+    def queue_get_batch(self, queue=None):                          # blocks (up to queue_get_timeout) for the first item, and then drains up to batch_size items without waiting
+        queue = queue or self.queue
+        items = [queue.get(timeout=self.queue_get_timeout)]
+        while len(items) < self.batch_size:
+            try:
+                items.append(queue.get_nowait())
+            except Empty:
+                break
+        return items
+
     def queue_size(self):
         return self.queue.qsize()
 
     def run_thread(self):
         while self.running:
             try:
-                event = self.queue.get(timeout=self.queue_get_timeout)
+                items = self.queue_get_batch()
+            except Empty:
+                continue
+            events = []
+            now    = time.perf_counter()
+            for item in items:
+                if type(item) is tuple:                             # items added via send_event have the enqueue time
+                    event, enqueued_at  = item
+                    latency             = now - enqueued_at
+                    self.latency_total += latency
+                    self.latency_max    = max(self.latency_max, latency)
+                else:
+                    event = item
                 if isinstance(event, self.event_class):
-                    self.handle_event(event)
+                    events.append(event)
+            if self.workers > 1:
+                for event in events:
+                    self.worker_queue_put(event)
+            else:
+                self.run_events(events)
+
+    def run_batch(self, events):
+        if events:
+            try:
+                self.handle_events(events)
+                completed = len(events)
+            except Exception as e:                                  # an exception in handle_events fails the whole batch
+                completed = 0
+            with self.lock:
+                self.events_completed += completed
+                self.events_failed    += len(events) - completed
+                self.batches_handled  += 1
+
+    def run_events(self, events):
+        if self.batch_size > 1:
+            return self.run_batch(events)
+        for event in events:
+            try:
+                self.handle_event(event)
+                with self.lock:
                     self.events_completed += 1
+            except Exception as e:                                  # todo: add way to handle this (which are errors in the handle_event), may call an on_event_handler_exceptions method
+                with self.lock:
+                    self.events_failed += 1
+
+    def run_worker(self, worker_queue):
+        while self.running:
+            try:
+                events = self.queue_get_batch(worker_queue)
             except Empty:
                 continue
-            except Exception as e:                          # todo: add way to handle this (which are errors in the handle_event), may call an on_event_handler_exceptions method
-                self.events_failed += 1
-                continue
+            self.run_events(events)
 
     def wait_micro_seconds(self, value=10):
         time.sleep(0.000001 * value)
@@ -100,8 +227,25 @@ class Event__Queue(Type_Safe):
 
     def wait_for_thread_ends(self):
         self.thread.join()
+        for worker_thread in self.worker_threads:
+            worker_thread.join()
         return self
 
+    def worker_queue(self, event):                                  # the same ordering key always maps to the same worker (there is no global ordering between workers)
+        return self.worker_queues[hash(self.ordering_key(event)) % self.workers]
+
+    def worker_queue_put(self, event):                              # blocks while the worker queue is full (and gives up when the queue is stopped)
+        worker_queue = self.worker_queue(event)
+        while self.running:
+            try:
+                worker_queue.put(event, timeout=self.queue_get_timeout)
+                return True
+            except Full:
+                continue
+        with self.lock:                                             # the queue was stopped before the event could be handed to its worker
+            self.events_dropped += 1
+        return False
+
     # todo see if there are valid use cases for wait_for_queue_empty , or the wait_for_queue_completed is the one that is always used
     def wait_for_queue_empty(self, thread_join_timeout=TIMEOUT__THREAD_JOIN):             # this will start a new thread to wait for the main queue to be empty
         def wait_until_queue_empty():
@@ -118,7 +262,7 @@ class Event__Queue(Type_Safe):
     def wait_for_queue_completed(self, thread_join_timeout=TIMEOUT__THREAD_JOIN):             # this will start a new thread to wait for the main queue to be empty
         def wait_until_queue_completed():
             while self.running:
-                if self.queue.empty() and self.events_added == self.events_completed :
+                if self.queue.empty() and self.events_added == self.events_completed + self.events_failed + self.events_dropped:
                     break
                 time.sleep(TIMEOUT__WAIT_FOR_QUEUE_COMPLETED)
         wait_thread = Thread(target=wait_until_queue_completed)
@@ -0,0 +1,115 @@
+import asyncio
+from osbot_utils.type_safe.Type_Safe                            import Type_Safe
+from osbot_utils.helpers.pubsub.schemas.Schema__Event           import Schema__Event
+from osbot_utils.helpers.pubsub.schemas.Schema__Event__Message  import Schema__Event__Message
+from osbot_utils.utils.Misc                                     import random_text, timestamp_utc_now, random_guid
+
+TIMEOUT__WAIT_FOR_QUEUE_COMPLETED__ASYNC = 1.0
+
+
+class Event__Queue__Async(Type_Safe):                               # asyncio version of Event__Queue (one task per queue, which is woken up by asyncio.Queue, i.e. no polling)
+    events              : list
+    event_class         : type
+    events_added        : int
+    events_completed    : int
+    events_failed       : int
+    log_events          : bool                      = False
+    loop                : asyncio.AbstractEventLoop = None          # captured on start, used by the *__threadsafe methods
+    queue               : asyncio.Queue             = None          # created on start (so that it is bound to the running loop)
+    queue_name          : str                       = random_text('event_queue_async')
+    running             : bool
+    task                : asyncio.Task              = None
+
+    def __init__(self, **kwargs):
+        self.event_class = Schema__Event
+        super().__init__(**kwargs)
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop()
+        return False
+
+    def new_event_obj(self, **kwargs):
+        return self.event_class(**kwargs)
+
+    async def handle_event(self, event):
+        if self.log_events:
+            self.events.append(event)
+        return True
+
+    def send_event(self, event: Schema__Event):                         # needs to be called from the event loop thread (use send_event__threadsafe from other threads)
+        if self.queue is None:
+            raise ValueError("in Event__Queue__Async, send_event was called before start() (which creates the queue inside the running event loop)")
+        if isinstance(event, Schema__Event):
+            if not event.timestamp:
+                event.timestamp = timestamp_utc_now()
+            if not event.event_id:
+                event.event_id = random_guid()
+            self.events_added += 1
+            self.queue.put_nowait(event)
+            return True
+        return False
+
+    def send_event__threadsafe(self, event: Schema__Event):            # bridge used by threaded code (for example an Event__Queue handler) to publish into this queue
+        if isinstance(event, Schema__Event) and self.loop:
+            self.loop.call_soon_threadsafe(self.send_event, event)
+            return True
+        return False
+
+    def send_data(self, event_data, **kwargs):
+        if type(event_data) is not dict:
+            event_data = {'data': event_data}
+        new_event = Schema__Event__Message(event_data=event_data, **kwargs)
+        if self.send_event(new_event):
+            return new_event
+
+    def send_message(self, message, **kwargs):
+        new_event = Schema__Event__Message(event_message=str(message), **kwargs)
+        if self.send_event(new_event):
+            return new_event
+
+    def start(self):                                                    # needs to be called from inside a running event loop
+        if self.queue is None:
+            self.queue = asyncio.Queue()
+        self.loop    = asyncio.get_running_loop()
+        self.running = True
+        self.task    = self.loop.create_task(self.run_task(), name=self.queue_name)
+        return self
+
+    async def stop(self):
+        self.running = False
+        if self.task:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+        return self
+
+    def queue_size(self):
+        if self.queue is None:
+            return 0
+        return self.queue.qsize()
+
+    async def run_task(self):
+        while True:
+            event = await self.queue.get()
+            try:
+                if isinstance(event, self.event_class):
+                    await self.handle_event(event)
+                    self.events_completed += 1
+            except Exception:                                           # todo: add way to handle this (same as in Event__Queue.run_thread)
+                self.events_failed += 1
+            finally:
+                self.queue.task_done()
+
+    async def wait_for_queue_completed(self, timeout=TIMEOUT__WAIT_FOR_QUEUE_COMPLETED__ASYNC):     # awaits queue.join() (which is notified by task_done), so there is no sleep-polling
+        try:
+            await asyncio.wait_for(self.queue.join(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
@@ -15,6 +15,7 @@ class PubSub__Client(Kwargs_To_Self):
     event_queue       : Event__Queue
     client_id         : str
     received_messages : List[str]           # todo: fix this to be Events/Messages received via event_queue
+    received_payloads : List[bytes]         # serialised messages (shared with the other clients in the same room)
 
     def __init__(self, **kwargs):
         self.client_id = kwargs.get('client_id') or random_guid()
@@ -52,3 +53,6 @@ class PubSub__Client(Kwargs_To_Self):
 
     def receive_message(self, message):
         self.received_messages.append(message)      # todo: fix this to be Events/Messages received via event_queue
+
+    def receive_payload(self, payload: bytes):      # override this to write the payload to the client's connection (for example a websocket)
+        self.received_payloads.append(payload)
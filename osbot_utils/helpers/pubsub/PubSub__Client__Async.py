@@ -0,0 +1,67 @@
+import asyncio
+from osbot_utils.base_classes.Kwargs_To_Self                        import Kwargs_To_Self
+from osbot_utils.helpers.pubsub.Event__Queue__Async                 import Event__Queue__Async
+from osbot_utils.helpers.pubsub.schemas.Schema__Event               import Schema__Event
+from osbot_utils.helpers.pubsub.schemas.Schema__Event__Connect      import Schema__Event__Connect
+from osbot_utils.helpers.pubsub.schemas.Schema__Event__Disconnect   import Schema__Event__Disconnect
+from osbot_utils.helpers.pubsub.schemas.Schema__Event__Join_Room    import Schema__Event__Join_Room
+from osbot_utils.helpers.pubsub.schemas.Schema__Event__Leave_Room   import Schema__Event__Leave_Room
+from osbot_utils.utils.Misc                                         import random_guid
+
+
+class PubSub__Client__Async(Kwargs_To_Self):
+    event_queue       : Event__Queue__Async
+    client_id         : str
+    messages          : asyncio.Queue           = None          # subscriber side: messages are awaited with receive (no polling), and this is the only place they are kept
+
+    def __init__(self, **kwargs):
+        self.client_id = kwargs.get('client_id') or random_guid()
+        super().__init__(**kwargs)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        return await self.receive()
+
+    def connect(self):
+        self.send_event(Schema__Event__Connect(connection_id=self.client_id))
+        return self
+
+    def disconnect(self):
+        self.send_event(Schema__Event__Disconnect(connection_id=self.client_id))
+        return self
+
+    def join_room(self, room_name):
+        self.send_event(Schema__Event__Join_Room(connection_id=self.client_id, room_name=room_name))
+        return self
+
+    def leave_room(self, room_name):
+        self.send_event(Schema__Event__Leave_Room(connection_id=self.client_id, room_name=room_name))
+        return self
+
+    def messages_queue(self):
+        if self.messages is None:
+            self.messages = asyncio.Queue()
+        return self.messages
+
+    async def receive(self, timeout=None):                          # waits for the next message sent to this client
+        if timeout is None:
+            return await self.messages_queue().get()
+        try:
+            return await asyncio.wait_for(self.messages_queue().get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def receive_message(self, message):
+        self.messages_queue().put_nowait(message)
+
+    def send_data(self, event_data, **kwargs):
+        return self.event_queue.send_data(event_data, connection_id=self.client_id, **kwargs)
+
+    def send_event(self, event : Schema__Event):
+        event.connection_id = self.client_id
+        return self.event_queue.send_event(event)
+
+    def send_message(self, message, **kwargs):
+        return self.event_queue.send_message(message, connection_id=self.client_id, **kwargs)
@@ -3,6 +3,17 @@ from typing import Set
 from osbot_utils.base_classes.Kwargs_To_Self import Kwargs_To_Self
 from osbot_utils.helpers.pubsub.Event__Queue import Event__Queue
 from osbot_utils.helpers.pubsub.PubSub__Client import PubSub__Client
+from osbot_utils.utils.Json import json_dumps_to_bytes
+
+
+def pubsub__payload(message):                                       # serialises message into the bytes that are sent to the clients
+    if type(message) is bytes:
+        return message
+    if type(message) is str:
+        return message.encode()
+    if isinstance(message, Kwargs_To_Self):                         # for example one of the Schema__Event classes
+        message = message.json()
+    return json_dumps_to_bytes(message, pretty=False)
 
 
 class PubSub__Room(Kwargs_To_Self):
@@ -11,5 +22,11 @@ class PubSub__Room(Kwargs_To_Self):
     clients    : Set[PubSub__Client]
 
     def send_to_clients__message(self, message):
-        for client in self.clients:
+        for client in list(self.clients):                           # iterate over a copy, since the server's worker threads can change the clients
             client.receive_message(message)
+
+    def send_to_clients__payload(self, message):                    # message is serialised once, and the same bytes object is shared by all clients
+        payload = pubsub__payload(message)
+        for client in list(self.clients):
+            client.receive_payload(payload)
+        return payload
@@ -0,0 +1,13 @@
+from typing                                             import Set
+from osbot_utils.base_classes.Kwargs_To_Self            import Kwargs_To_Self
+from osbot_utils.helpers.pubsub.PubSub__Client__Async   import PubSub__Client__Async
+
+
+class PubSub__Room__Async(Kwargs_To_Self):                  # rooms don't have their own task, so thousands of them can share the server's event loop
+    room_name  : str
+    clients    : Set[PubSub__Client__Async]
+
+    def send_to_clients__message(self, message):
+        for client in self.clients:
+            client.receive_message(message)
+        return len(self.clients)
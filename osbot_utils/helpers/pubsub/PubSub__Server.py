@@ -3,9 +3,11 @@ from threading import Thread
 from queue import Queue
 from typing import Set, Dict
 
+from osbot_utils.decorators.methods.cache_on_self                   import cache_on_self
 from osbot_utils.helpers.pubsub.Event__Queue                        import Event__Queue
 from osbot_utils.helpers.pubsub.PubSub__Client                      import PubSub__Client
-from osbot_utils.helpers.pubsub.PubSub__Room import PubSub__Room
+from osbot_utils.helpers.pubsub.PubSub__Room                        import PubSub__Room, pubsub__payload
+from osbot_utils.helpers.pubsub.PubSub__Topic__Trie                 import PubSub__Topic__Trie, topic__is_wildcard
 from osbot_utils.helpers.pubsub.schemas.Schema__Event               import Schema__Event
 from osbot_utils.helpers.pubsub.schemas.Schema__Event__Connect      import Schema__Event__Connect
 from osbot_utils.helpers.pubsub.schemas.Schema__Event__Leave_Room   import Schema__Event__Leave_Room
@@ -22,9 +24,10 @@ class PubSub__Server(Event__Queue):
     clients_connected: Set[PubSub__Client]
     rooms            : Dict[str, PubSub__Room]
     logging          : Logging
+    topics           : PubSub__Topic__Trie                  # wildcard room subscriptions (like 'alerts.*' or 'alerts.#')
 
-    def __init__ (self):
-        super().__init__()
+    def __init__ (self, **kwargs):
+        super().__init__(**kwargs)
 
     # def db_table_clients(self):
     #     return self.pubsub_db.table_clients()     # todo refactor to class that uses this as a base and uses sqlite to capture connections
@@ -32,19 +35,26 @@ class PubSub__Server(Event__Queue):
     def add_client(self, client: PubSub__Client):
         client_id = client.client_id
         if client_id:
-            self.clients[client_id] = client
+            with self.lock:
+                self.clients[client_id] = client
         return self
 
-    def client_connect(self, client):
-        self.clients_connected.add(client)
+    def client_connect(self, client):                               # the clients, rooms and topics are shared by all worker threads (when workers > 1), so they are only changed under self.lock
+        with self.lock:
+            self.clients_connected.add(client)
 
     def client_disconnect(self, client):
-        self.clients_connected.discard(client)
+        with self.lock:
+            self.clients_connected.discard(client)
 
     def client_join_room(self, client, event):
         room_name = event.room_name
         if room_name:
-            self.room(room_name).clients.add(client)
+            with self.lock:
+                if topic__is_wildcard(room_name):
+                    self.topics.subscribe(room_name, client)
+                else:
+                    self.room(room_name).clients.add(client)
 
     def client_message(self, client, event):
         pass
@@ -52,22 +62,30 @@ class PubSub__Server(Event__Queue):
     def client_leave_room(self, client, event):
         room_name = event.room_name
         if room_name:
-            self.room(room_name).clients.discard(client)
+            with self.lock:
+                if topic__is_wildcard(room_name):
+                    self.topics.unsubscribe(room_name, client)
+                else:
+                    self.room(room_name).clients.discard(client)
+
+    @cache_on_self
+    def event_handlers(self):                                       # dispatch table used by handle_event (subclasses can add handlers for their own event classes)
+        return { Schema__Event__Connect    : lambda client, event: self.client_connect   (client)       ,
+                 Schema__Event__Disconnect : lambda client, event: self.client_disconnect(client)       ,
+                 Schema__Event__Join_Room  : self.client_join_room                                      ,
+                 Schema__Event__Leave_Room : self.client_leave_room                                     ,
+                 Schema__Event__Message    : self.client_message                                        }
 
     def get_client(self, client_id):
         return self.clients.get(client_id)
 
     def handle_event(self, event: Schema__Event):
-        event_type = type(event)
         client     = self.clients.get(event.connection_id)
         if client:
-            if   event_type is Schema__Event__Connect    : self.client_connect   (client)
-            elif event_type is Schema__Event__Disconnect : self.client_disconnect(client)
-            elif event_type is Schema__Event__Join_Room  : self.client_join_room (client, event)
-            elif event_type is Schema__Event__Leave_Room : self.client_leave_room(client, event)
-            elif event_type is Schema__Event__Message    : self.client_message   (client, event)
-            else:
+            handler = self.event_handlers().get(type(event))
+            if handler is None:
                 return False
+            handler(client, event)
 
         if self.log_events:
             self.events.append(event)
@@ -82,12 +100,28 @@ class PubSub__Server(Event__Queue):
         self.add_client(client)
         return client
 
+    def publish(self, room_name, message):                          # sends message to the room's clients and to the clients with a matching wildcard subscription
+        clients = self.room_subscribers(room_name)
+        payload = pubsub__payload(message)                          # serialised once for all clients
+        for client in clients:
+            client.receive_payload(payload)
+        return len(clients)
+
+    def room_subscribers(self, room_name):                          # returns a copy, so that it can be iterated while the workers change the rooms
+        with self.lock:
+            room    = self.rooms.get(room_name)
+            clients = self.topics.match(room_name)
+            if room:
+                clients.update(room.clients)
+            return clients
+
     def room(self, room_name):
-        if room_name not in self.rooms:
-            new_room = PubSub__Room(room_name=room_name)
-            self.rooms[room_name] = new_room
+        with self.lock:
+            if room_name not in self.rooms:
+                new_room = PubSub__Room(room_name=room_name)
+                self.rooms[room_name] = new_room
 
-        return self.rooms.get(room_name)
+            return self.rooms.get(room_name)
 
 
 
@@ -0,0 +1,76 @@
+from typing                                                         import Set, Dict
+from osbot_utils.helpers.pubsub.Event__Queue__Async                 import Event__Queue__Async
+from osbot_utils.helpers.pubsub.PubSub__Client__Async               import PubSub__Client__Async
+from osbot_utils.helpers.pubsub.PubSub__Room__Async                 import PubSub__Room__Async
+from osbot_utils.helpers.pubsub.schemas.Schema__Event               import Schema__Event
+from osbot_utils.helpers.pubsub.schemas.Schema__Event__Connect      import Schema__Event__Connect
+from osbot_utils.helpers.pubsub.schemas.Schema__Event__Disconnect   import Schema__Event__Disconnect
+from osbot_utils.helpers.pubsub.schemas.Schema__Event__Join_Room    import Schema__Event__Join_Room
+from osbot_utils.helpers.pubsub.schemas.Schema__Event__Leave_Room   import Schema__Event__Leave_Room
+from osbot_utils.helpers.pubsub.schemas.Schema__Event__Message      import Schema__Event__Message
+
+
+class PubSub__Server__Async(Event__Queue__Async):
+    clients          : Dict
+    clients_connected: Set[PubSub__Client__Async]
+    rooms            : Dict[str, PubSub__Room__Async]
+
+    def add_client(self, client: PubSub__Client__Async):
+        client_id = client.client_id
+        if client_id:
+            self.clients[client_id] = client
+        return self
+
+    def client_connect(self, client):
+        self.clients_connected.add(client)
+
+    def client_disconnect(self, client):
+        self.clients_connected.discard(client)
+
+    def client_join_room(self, client, event):
+        room_name = event.room_name
+        if room_name:
+            self.room(room_name).clients.add(client)
+
+    def client_message(self, client, event):
+        pass
+
+    def client_leave_room(self, client, event):
+        room_name = event.room_name
+        if room_name:
+            self.room(room_name).clients.discard(client)
+
+    def get_client(self, client_id):
+        return self.clients.get(client_id)
+
+    async def handle_event(self, event: Schema__Event):
+        event_type = type(event)
+        client     = self.clients.get(event.connection_id)
+        if client:
+            if   event_type is Schema__Event__Connect    : self.client_connect   (client)
+            elif event_type is Schema__Event__Disconnect : self.client_disconnect(client)
+            elif event_type is Schema__Event__Join_Room  : self.client_join_room (client, event)
+            elif event_type is Schema__Event__Leave_Room : self.client_leave_room(client, event)
+            elif event_type is Schema__Event__Message    : self.client_message   (client, event)
+            else:
+                return False
+
+        if self.log_events:
+            self.events.append(event)
+        return True
+
+    def new_client(self):
+        client = PubSub__Client__Async(event_queue = self)
+        self.add_client(client)
+        return client
+
+    def publish(self, room_name, message):                              # returns the number of clients that received the message
+        room = self.rooms.get(room_name)
+        if room:
+            return room.send_to_clients__message(message)
+        return 0
+
+    def room(self, room_name):
+        if room_name not in self.rooms:
+            self.rooms[room_name] = PubSub__Room__Async(room_name=room_name)
+        return self.rooms.get(room_name)
@@ -1,16 +1,192 @@
-from osbot_utils.decorators.methods.cache_on_self import cache_on_self
-from osbot_utils.helpers.pubsub.schemas.Schema__PubSub__Client import Schema__PubSub__Clients
-from osbot_utils.helpers.sqlite.Sqlite__Database import Sqlite__Database
+import json
+import threading
+from functools                                                      import lru_cache
+from osbot_utils.decorators.methods.cache_on_self                   import cache_on_self
+from osbot_utils.helpers.pubsub.schemas.Schema__Event               import Schema__Event
+from osbot_utils.helpers.pubsub.schemas.Schema__PubSub__Client      import Schema__PubSub__Clients
+from osbot_utils.helpers.pubsub.schemas.Schema__PubSub__Event_Log   import Schema__PubSub__Events, Schema__PubSub__Cursors
+from osbot_utils.helpers.sqlite.Sqlite__Database                    import Sqlite__Database
+from osbot_utils.utils.Json                                         import json_loads
+from osbot_utils.utils.Misc                                         import timestamp_utc_now, random_guid
 
 TABLE_NAME__PUB_SUB__CLIENTS   = 'pubsub_clients'
 TABLE_SCHEMA__PUB_SUB__CLIENTS = Schema__PubSub__Clients
+TABLE_NAME__PUB_SUB__EVENTS    = 'pubsub_events'
+TABLE_SCHEMA__PUB_SUB__EVENTS  = Schema__PubSub__Events
+TABLE_NAME__PUB_SUB__CURSORS   = 'pubsub_cursors'
+TABLE_SCHEMA__PUB_SUB__CURSORS = Schema__PubSub__Cursors
+EVENT_LOG__COMMIT_BATCH_SIZE   = 1000
+EVENT_LOG__COMMIT_MAX_DELAY    = 1.0                                # seconds
+EVENT_LOG__FIELDS              = list(Schema__PubSub__Events.__annotations__)
+EVENT_LOG__FIELDS__BASE_EVENT  = set(Schema__Event.__annotations__)
+EVENT_LOG__FIELDS__JSON_TYPES  = (str, int, float, bool, list, dict, type(None))       # only these subclass fields are kept (for example not the method_target of Schema__Event__Execute_Method)
+EVENT_LOG__SQL__INSERT         = f'INSERT INTO {TABLE_NAME__PUB_SUB__EVENTS} ({", ".join(EVENT_LOG__FIELDS)}) VALUES ({", ".join("?" * len(EVENT_LOG__FIELDS))})'
+EVENT_LOG__JSON_ENCODE         = json.JSONEncoder(default=str).encode                 # same output as json_dumps(..., pretty=False), without the per call setup
+EVENT_LOG__SYNCHRONOUS__NORMAL = 'NORMAL'                           # WAL commits are not fsync'ed (only the checkpoints are), so the last commits can be lost on a power failure (but not on a process crash)
+EVENT_LOG__SYNCHRONOUS__FULL   = 'FULL'                             # each commit is fsync'ed (i.e. durable), at the cost of one fsync per commit_batch_size events
+EVENT_LOG__SYNCHRONOUS_MODES   = [EVENT_LOG__SYNCHRONOUS__NORMAL, EVENT_LOG__SYNCHRONOUS__FULL]
+
+@lru_cache(maxsize=None)
+def event_class__path(event_class):
+    return f'{event_class.__module__}.{event_class.__name__}'
+
+@lru_cache(maxsize=None)
+def event_class__fields(event_class):                              # names of all the fields declared by event_class (and by its base classes)
+    return frozenset(name for base in event_class.__mro__ for name in getattr(base, '__annotations__', {}))
+
+@lru_cache(maxsize=None)
+def event_class__fields__extra(event_class):                       # fields added by a Schema__Event subclass (empty for Schema__Event itself)
+    return tuple(sorted(event_class__fields(event_class) - EVENT_LOG__FIELDS__BASE_EVENT))
+
+def event_classes(event_class=Schema__Event):                      # all loaded Schema__Event subclasses (by path), the stored class paths are never imported
+    classes = {event_class__path(event_class): event_class}
+    for subclass in event_class.__subclasses__():
+        classes.update(event_classes(subclass))
+    return classes
 
 class PubSub__Sqlite(Sqlite__Database):
+    check_same_thread : bool  = False                               # the background flush commits from the commit_timer thread
+    commit_batch_size : int   = EVENT_LOG__COMMIT_BATCH_SIZE        # appended events are committed in batches of this size (or on flush, close and after commit_max_delay)
+    commit_max_delay  : float = EVENT_LOG__COMMIT_MAX_DELAY         # max seconds an appended event stays uncommitted (0 disables the background flush)
+    commit_timer      : threading.Timer = None                      # background flush, started when the first event of a batch is appended
+    event_classes     : dict                                        # cache of the loaded Schema__Event subclasses (by path)
+    events_pending    : int                                         # events appended since the last commit
+    synchronous       : str   = EVENT_LOG__SYNCHRONOUS__NORMAL      # (file databases only) use EVENT_LOG__SYNCHRONOUS__FULL to make each commit durable
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.lock = threading.RLock()                               # serialises the appends and the commits (from the commit_timer thread)
+        if self.synchronous not in EVENT_LOG__SYNCHRONOUS_MODES:
+            raise ValueError(f"in PubSub__Sqlite, invalid synchronous '{self.synchronous}', it must be one of: {EVENT_LOG__SYNCHRONOUS_MODES}")
+
+    def close(self):
+        if self.closed is False and self.connected:
+            self.events_flush()
+        return super().close()
+
+    def consumer_ack(self, consumer_group, event_offset):            # only move the cursor after the events have been processed (which gives at-least-once delivery)
+        sql_command = (f'INSERT INTO {TABLE_NAME__PUB_SUB__CURSORS} (consumer_group, event_offset, timestamp) VALUES (?, ?, ?) '
+                       f'ON CONFLICT(consumer_group) DO UPDATE SET event_offset=excluded.event_offset, timestamp=excluded.timestamp')
+        self.events_flush()                                         # the cursor must never be ahead of the committed events
+        self.cursor().execute_and_commit(sql_command, (consumer_group, event_offset, timestamp_utc_now()))
+        return self
+
+    def consumer_offset(self, consumer_group):
+        sql_query = f'SELECT event_offset FROM {TABLE_NAME__PUB_SUB__CURSORS} WHERE consumer_group=?'
+        row       = self.cursor().execute__fetch_one(sql_query, (consumer_group,))
+        if row:
+            return row.get('event_offset')
+        return 0
+
+    def consumer_read(self, consumer_group, limit=100, room_name=None):     # events after the consumer group's cursor (which is not moved until consumer_ack is called)
+        return list(self.events_replay(self.consumer_offset(consumer_group), room_name=room_name, limit=limit))
+
+    def event_append(self, event: Schema__Event, room_name=''):
+        return self.events_append([event], room_name=room_name)
+
+    def event_class(self, class_path):                              # the Schema__Event subclass stored in the event_class column (Schema__Event if it is not loaded)
+        event_class = self.event_classes.get(class_path)
+        if event_class is None:
+            self.event_classes = event_classes()                    # a new subclass could have been loaded since the last scan
+            event_class        = self.event_classes.get(class_path, Schema__Event)
+        return event_class
+
+    def event_fields(self, event):                                  # fields added by the event's class (json serialisable values only)
+        event_fields = {}
+        for name in event_class__fields__extra(type(event)):
+            value = getattr(event, name, None)
+            if isinstance(value, EVENT_LOG__FIELDS__JSON_TYPES):
+                event_fields[name] = value
+        return event_fields
+
+    def event_from_row(self, row):
+        event_class  = self.event_class(row.get('event_class'))
+        event_fields = json_loads(row.get('event_fields')) or {}
+        event        = event_class(connection_id = row.get('connection_id')              ,
+                                   event_data    = json_loads(row.get('event_data')) or {} ,
+                                   event_id      = row.get('event_id')                   ,
+                                   event_message = row.get('event_message')              ,
+                                   event_target  = row.get('event_target')               ,
+                                   event_type    = row.get('event_type')                 ,
+                                   timestamp     = row.get('timestamp')                  ,
+                                   **{name: value for name, value in event_fields.items() if name in event_class__fields(event_class)})
+        return row.get('id'), event
+
+    def event_to_row(self, event, room_name, timestamp=None):       # called once per event, so the common cases (no event_data, no subclass fields) skip the json encoding
+        event_data   = event.event_data
+        event_fields = self.event_fields(event) if event_class__fields__extra(type(event)) else None
+        return (event.connection_id or ''                                               ,
+                event_class__path(type(event))                                          ,
+                EVENT_LOG__JSON_ENCODE(event_data  ) if event_data   else '{}'          ,
+                EVENT_LOG__JSON_ENCODE(event_fields) if event_fields else '{}'          ,
+                event.event_id      or random_guid()                                    ,     # events sent via Event__Queue already have an event_id (and a timestamp)
+                event.event_message or ''                                               ,
+                event.event_target  or ''                                               ,
+                event.event_type    or ''                                               ,
+                room_name           or getattr(event, 'room_name', '') or ''            ,
+                event.timestamp     or timestamp or timestamp_utc_now()                 )
+
+    def events_append(self, events, room_name=''):                  # returns the offset of the last event appended
+        timestamp  = timestamp_utc_now()                            # used for the events without one
+        rows       = [self.event_to_row(event, room_name, timestamp) for event in events]
+        connection = self.connection()
+        with self.lock:
+            if not rows:
+                return self.events_offset_last()
+            cursor = connection.cursor()
+            if len(rows) > 1:
+                cursor.executemany(EVENT_LOG__SQL__INSERT, rows[:-1])
+            cursor.execute(EVENT_LOG__SQL__INSERT, rows[-1])        # the last row on its own, since executemany doesn't set lastrowid
+            event_offset         = cursor.lastrowid
+            self.events_pending += len(rows)
+            if self.events_pending >= self.commit_batch_size:
+                self.events_flush()
+            elif self.commit_max_delay > 0 and self.commit_timer is None:   # makes sure that the last events of a slow stream are also committed
+                self.commit_timer = threading.Timer(self.commit_max_delay, self.events_flush)
+                self.commit_timer.daemon = True
+                self.commit_timer.start()
+            return event_offset
+
+    def events_flush(self):
+        with self.lock:
+            if self.commit_timer:
+                if self.commit_timer is not threading.current_thread():
+                    self.commit_timer.cancel()
+                self.commit_timer = None
+            if self.events_pending and self.closed is False:
+                self.connection().commit()
+                self.events_pending = 0
+        return self
+
+    def events_offset_last(self):                                   # last offset assigned (with AUTOINCREMENT, offsets are never reused, even after deletes)
+        sql_query = 'SELECT seq FROM sqlite_sequence WHERE name = ?'
+        row       = self.cursor().execute__fetch_one(sql_query, (TABLE_NAME__PUB_SUB__EVENTS,))
+        return (row and row.get('seq')) or 0
+
+    def events_replay(self, event_offset=0, room_name=None, limit=None):   # yields (offset, event) for the events after event_offset
+        sql_query = f'SELECT * FROM {TABLE_NAME__PUB_SUB__EVENTS} WHERE id > ?'
+        params    = [event_offset]
+        if room_name is not None:
+            sql_query += ' AND room_name = ?'
+            params.append(room_name)
+        sql_query += ' ORDER BY id'
+        if limit is not None:
+            sql_query += f' LIMIT {int(limit)}'
+        for row in self.cursor().execute__fetch_iter(sql_query, params):
+            yield self.event_from_row(row)
 
     @cache_on_self
     def table_clients(self):
         return self.table(TABLE_NAME__PUB_SUB__CLIENTS)
 
+    @cache_on_self
+    def table_cursors(self):
+        return self.table(TABLE_NAME__PUB_SUB__CURSORS)
+
+    @cache_on_self
+    def table_events(self):
+        return self.table(TABLE_NAME__PUB_SUB__EVENTS)
+
     def table_clients__create(self):
         with self.table_clients() as _:
             _.row_schema = TABLE_SCHEMA__PUB_SUB__CLIENTS
@@ -19,6 +195,32 @@ class PubSub__Sqlite(Sqlite__Database):
                 return True
         return False
 
+    def table_cursors__create(self):
+        with self.table_cursors() as _:
+            _.row_schema = TABLE_SCHEMA__PUB_SUB__CURSORS
+            if _.exists() is False:
+                _.create()
+                self.cursor().execute_and_commit(f'CREATE UNIQUE INDEX IF NOT EXISTS idx__{TABLE_NAME__PUB_SUB__CURSORS}__consumer_group '
+                                                 f'ON {TABLE_NAME__PUB_SUB__CURSORS}(consumer_group)')     # needed by the upsert in consumer_ack
+                return True
+        return False
+
+    def table_events__create(self):
+        with self.table_events() as _:
+            _.row_schema = TABLE_SCHEMA__PUB_SUB__EVENTS
+            if _.exists() is False:
+                table_create = _._table_create()
+                table_create.fields[0].autoincrement = True         # AUTOINCREMENT makes sure that the offsets (i.e. the ids) are never reused
+                table_create.create_table__from_row_schema(TABLE_SCHEMA__PUB_SUB__EVENTS)
+                _.index_create('room_name')
+                return True
+        return False
+
     def setup(self):
+        if self.in_memory is False:                                 # WAL with synchronous=NORMAL doesn't fsync the commits (only the checkpoints), see EVENT_LOG__SYNCHRONOUS__FULL for durable commits
+            self.cursor().execute('PRAGMA journal_mode=WAL')
+            self.cursor().execute(f'PRAGMA synchronous={self.synchronous}')
         self.table_clients__create()
-        return self
\ No newline at end of file
+        self.table_events__create()
+        self.table_cursors__create()
+        return self
@@ -0,0 +1,84 @@
+from osbot_utils.type_safe.Type_Safe import Type_Safe
+
+TOPIC__SEPARATOR                = '.'
+TOPIC__WILDCARD__SINGLE_LEVEL   = '*'                               # matches exactly one segment     (a.*.c matches a.b.c)
+TOPIC__WILDCARD__MULTI_LEVEL    = '#'                               # matches zero or more segments   (a.#   matches a, a.b and a.b.c)
+
+
+def topic__is_wildcard(topic):
+    segments = topic.split(TOPIC__SEPARATOR)
+    return TOPIC__WILDCARD__SINGLE_LEVEL in segments or TOPIC__WILDCARD__MULTI_LEVEL in segments
+
+
+class PubSub__Topic__Trie(Type_Safe):                               # index of the wildcard subscriptions, so that a publish only visits the trie paths that can match the topic
+    root          : dict
+    subscriptions : int
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.root = self.new_node()
+
+    def match(self, topic):                                         # returns the set of subscribers of all patterns that match topic
+        subscribers = set()
+        self.match_node(self.root, topic.split(TOPIC__SEPARATOR), 0, subscribers)
+        return subscribers
+
+    def match_node(self, node, segments, index, subscribers):
+        children    = node['children']
+        multi_level = children.get(TOPIC__WILDCARD__MULTI_LEVEL)
+        if multi_level:
+            subscribers.update(multi_level['subscribers'])
+        if index == len(segments):
+            subscribers.update(node['subscribers'])
+            return
+        for key in (segments[index], TOPIC__WILDCARD__SINGLE_LEVEL):
+            child = children.get(key)
+            if child:
+                self.match_node(child, segments, index + 1, subscribers)
+
+    def new_node(self):
+        return dict(children={}, subscribers=set())
+
+    def patterns(self):                                             # all patterns that currently have subscribers
+        patterns = []
+        def collect(node, path):
+            if node['subscribers']:
+                patterns.append(TOPIC__SEPARATOR.join(path))
+            for segment, child in node['children'].items():
+                collect(child, path + [segment])
+        collect(self.root, [])
+        return sorted(patterns)
+
+    def segments(self, pattern):
+        segments = pattern.split(TOPIC__SEPARATOR)
+        if TOPIC__WILDCARD__MULTI_LEVEL in segments[:-1]:
+            raise ValueError(f"in PubSub__Topic__Trie, the '{TOPIC__WILDCARD__MULTI_LEVEL}' wildcard can only be used as the last segment, and it was used in: {pattern}")
+        return segments
+
+    def subscribe(self, pattern, subscriber):
+        node = self.root
+        for segment in self.segments(pattern):
+            node = node['children'].setdefault(segment, self.new_node())
+        if subscriber not in node['subscribers']:
+            node['subscribers'].add(subscriber)
+            self.subscriptions += 1
+        return self
+
+    def unsubscribe(self, pattern, subscriber):
+        path = [self.root]
+        for segment in self.segments(pattern):
+            node = path[-1]['children'].get(segment)
+            if node is None:
+                return False
+            path.append(node)
+        if subscriber not in path[-1]['subscribers']:
+            return False
+        path[-1]['subscribers'].discard(subscriber)
+        self.subscriptions -= 1
+        segments = self.segments(pattern)
+        for depth in range(len(segments), 0, -1):                   # remove the nodes that are no longer used
+            node = path[depth]
+            if node['subscribers'] or node['children']:
+                break
+            del path[depth - 1]['children'][segments[depth - 1]]
+        return True
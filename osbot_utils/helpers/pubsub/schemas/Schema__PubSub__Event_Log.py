@@ -0,0 +1,20 @@
+from osbot_utils.base_classes.Kwargs_To_Self import Kwargs_To_Self
+
+
+class Schema__PubSub__Events(Kwargs_To_Self):                       # the row id is the (monotonic, never reused) event offset
+    connection_id : str
+    event_class   : str                                             # module and name of the event's class (used to rebuild the same Schema__Event subclass on replay)
+    event_data    : str                                             # json
+    event_fields  : str                                             # json of the fields added by the Schema__Event subclass (like room_name)
+    event_id      : str
+    event_message : str
+    event_target  : str
+    event_type    : str
+    room_name     : str
+    timestamp     : int
+
+
+class Schema__PubSub__Cursors(Kwargs_To_Self):
+    consumer_group : str
+    event_offset   : int                                            # offset of the last event acknowledged by this consumer group
+    timestamp      : int
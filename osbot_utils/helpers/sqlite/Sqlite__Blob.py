@@ -0,0 +1,155 @@
+import struct
+from osbot_utils.type_safe.Type_Safe                import Type_Safe
+from osbot_utils.helpers.sqlite.Sqlite__Database    import Sqlite__Database
+
+SQLITE__BLOB__CHUNK_SIZE            = 1024 * 1024                            # 1Mb chunks when streaming blobs in and out of sqlite
+SQLITE__BLOB__PICKLE_HEADER__SIZE   = 32                                     # enough bytes to hold PROTO + FRAME + the largest (8 byte) length opcode
+PICKLE__OPCODE__PROTO               = 0x80
+PICKLE__OPCODE__FRAME               = 0x95
+PICKLE__OPCODE__STOP                = b'.'
+PICKLE__OPCODES__PAYLOAD            = { ord('C') : (1, False),               # SHORT_BINBYTES   : (size of length field, is_text)
+                                        ord('B') : (4, False),               # BINBYTES
+                                        0x8e     : (8, False),               # BINBYTES8
+                                        0x8c     : (1, True ),               # SHORT_BINUNICODE
+                                        ord('X') : (4, True ),               # BINUNICODE
+                                        0x8d     : (8, True )}               # BINUNICODE8
+PICKLE__LENGTH_FORMATS              = { 1: '<B', 4: '<I', 8: '<Q'}
+
+
+def sqlite_blob__open_supported(connection):                                 # Connection.blobopen was only added in Python 3.11
+    return hasattr(connection, 'blobopen')
+
+def sqlite_blob__pickle_header(size, is_text=False):                         # protocol 4 pickle header for a bytes (or str) payload of a known size
+    opcode = 0x8d if is_text else 0x8e
+    return bytes([PICKLE__OPCODE__PROTO, 4, opcode]) + struct.pack('<Q', size)
+
+def sqlite_blob__pickle_header__parse(header):                               # returns (payload_offset, payload_size, is_text) or None if header is not of a pickled bytes or str
+    position = 0
+    while position < len(header):
+        opcode = header[position]
+        if opcode == PICKLE__OPCODE__PROTO:
+            position += 2
+        elif opcode == PICKLE__OPCODE__FRAME:                                # frames only delimit the stream, so we can just skip them
+            position += 9
+        elif opcode in PICKLE__OPCODES__PAYLOAD:
+            length_size, is_text = PICKLE__OPCODES__PAYLOAD[opcode]
+            length_start         = position + 1
+            length_end           = length_start + length_size
+            if length_end > len(header):
+                return None
+            payload_size = struct.unpack(PICKLE__LENGTH_FORMATS[length_size], header[length_start:length_end])[0]
+            return length_end, payload_size, is_text
+        else:
+            return None
+    return None
+
+
+class Sqlite__Blob(Type_Safe):                                              # file-like access to a (region of a) BLOB cell, without loading it all into memory
+    database     : Sqlite__Database
+    table_name   : str
+    field_name   : str
+    row_id       : int
+    readonly     : bool = True
+    offset_start : int                                                      # where the data starts inside the blob (for example after a pickle header)
+    size         : int                                                      # size of the data exposed by this object
+    position     : int
+    use_blobopen : bool = True                                              # when False (or not supported) fallback to chunked substr() reads and || appends
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __iter__(self):
+        return self.chunks()
+
+    def __len__(self):
+        return self.size
+
+    def blob_size(self):                                                    # size of the full blob cell (i.e. not just the region exposed)
+        sql_query = f'SELECT length({self.field_name}) as size FROM {self.table_name} WHERE rowid=?'
+        row       = self.cursor().execute__fetch_one(sql_query, (self.row_id,))
+        if row:
+            return row.get('size') or 0
+        return 0
+
+    def blobopen_enabled(self):
+        return self.use_blobopen and sqlite_blob__open_supported(self.database.connection())
+
+    def chunks(self, chunk_size=SQLITE__BLOB__CHUNK_SIZE):
+        while True:
+            chunk = self.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+    def close(self):
+        self.commit()
+        return self
+
+    def commit(self):
+        if self.readonly is False:
+            self.database.connection().commit()
+        return self
+
+    def cursor(self):
+        return self.database.cursor()
+
+    def read(self, size=-1):
+        remaining = self.size - self.position
+        if size is None or size < 0 or size > remaining:
+            size = remaining
+        if size <= 0:
+            return b''
+        blob_offset = self.offset_start + self.position
+        if self.blobopen_enabled():
+            with self.database.connection().blobopen(self.table_name, self.field_name, self.row_id, readonly=True) as blob:
+                blob.seek(blob_offset)
+                data = blob.read(size)
+        else:
+            sql_query = f'SELECT substr({self.field_name}, ?, ?) as chunk FROM {self.table_name} WHERE rowid=?'   # substr is 1-indexed
+            row       = self.cursor().execute__fetch_one(sql_query, (blob_offset + 1, size, self.row_id))
+            data      = row.get('chunk') if row else b''
+        self.position += len(data)
+        return data
+
+    def readable(self):
+        return True
+
+    def seek(self, offset, whence=0):
+        if whence == 1:
+            offset += self.position
+        elif whence == 2:
+            offset += self.size
+        if offset < 0:
+            raise ValueError(f"in Sqlite__Blob.seek, invalid position: {offset}")
+        self.position = offset
+        return self.position
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self.position
+
+    def writable(self):
+        return self.readonly is False
+
+    def write(self, data):
+        if self.readonly:
+            raise ValueError("in Sqlite__Blob.write, blob was opened as readonly")
+        data        = bytes(data)
+        blob_offset = self.offset_start + self.position
+        if self.blobopen_enabled():                                         # blobopen can't change the size of the blob, so the space must already be reserved (for example with zeroblob)
+            with self.database.connection().blobopen(self.table_name, self.field_name, self.row_id, readonly=False) as blob:
+                blob.seek(blob_offset)
+                blob.write(data)
+        else:                                                               # without blobopen we can only append to the end of the blob
+            if blob_offset != self.blob_size():
+                raise ValueError("in Sqlite__Blob.write, without blobopen support data can only be appended to the end of the blob")
+            sql_query = f'UPDATE {self.table_name} SET {self.field_name} = CAST({self.field_name} || ? AS BLOB) WHERE rowid=?'   # || returns TEXT, so cast it back
+            self.cursor().execute(sql_query, (data, self.row_id))
+        self.position += len(data)
+        self.size      = max(self.size, self.position)
+        return len(data)
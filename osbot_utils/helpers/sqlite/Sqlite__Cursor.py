@@ -40,6 +40,18 @@ class Sqlite__Cursor(Kwargs_To_Self):
         self.execute(sql_query, *params)
         return self.cursor().fetchone()
 
+    def execute__fetch_iter(self, sql_query, *params, batch_size=1000):      # streams rows using a separate cursor (so that other queries can run while the results are consumed)
+        cursor = self.connection().cursor()
+        try:
+            cursor.execute(sql_query, *params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            cursor.close()
+
     def fetch_all(self):
         return self.cursor().fetchall()
 
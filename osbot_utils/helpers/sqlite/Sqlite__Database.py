@@ -9,12 +9,15 @@ TEMP_DATABASE__FILE_NAME_PREFIX = 'random_sqlite_db__'
 TEMP_DATABASE__FILE_EXTENSION   = '.sqlite'
 
 class Sqlite__Database(Type_Safe):
-    db_path         : str  = None
-    closed          : bool = False
-    connected       : bool = False
-    deleted         : bool = False
-    in_memory       : bool = True                       # default to an in-memory database
-    auto_schema_row : bool = False                      # option to map the table's schema_row when creating an table object
+    db_path           : str   = None
+    closed            : bool  = False
+    connected         : bool  = False
+    deleted           : bool  = False
+    in_memory         : bool  = True                    # default to an in-memory database
+    auto_schema_row   : bool  = False                   # option to map the table's schema_row when creating an table object
+    check_same_thread : bool  = True                    # set to False when the connection is also used from other threads (the in-memory snapshots always allow it)
+    snapshot_path     : str   = None                    # when set, the in-memory database is restored from (and saved to) this file
+    snapshot_interval : float = 0.0                     # seconds between the background snapshots (0 means only on close or on snapshot().save())
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -23,6 +26,8 @@ class Sqlite__Database(Type_Safe):
 
     def close(self):
         if self.closed is False:
+            if self.snapshot_path and self.connected:
+                self.snapshot().stop(save=self.deleted is False)        # stops the background snapshots and saves the latest data
             self.connection().close()
             self.closed    = True
             self.connected = False
@@ -37,9 +42,15 @@ class Sqlite__Database(Type_Safe):
         import sqlite3
 
         connection_string      = self.connection_string()
-        connection             = sqlite3.connect(connection_string)
+        if self.snapshot_path:                                          # hybrid mode: in-memory database that is restored from (and periodically saved to) snapshot_path
+            connection = sqlite3.connect(connection_string, check_same_thread=False)    # the background snapshots are taken from another thread
+            self.snapshot().restore(connection)
+        else:
+            connection = sqlite3.connect(connection_string, check_same_thread=self.check_same_thread)
         connection.row_factory = self.dict_factory                      # this returns a dict as the row value of every query
         self.connected         = True
+        if self.snapshot_path:
+            self.snapshot().start()
         return connection
 
     def connection(self):
@@ -58,6 +69,13 @@ class Sqlite__Database(Type_Safe):
         return Sqlite__Cursor(database=self)
 
     def delete(self):
+        if self.snapshot_path:      # in hybrid mode, deleting means removing the snapshot file
+            if self.deleted:
+                return False
+            self.deleted = True     # set before close() so that no new snapshot is saved
+            self.close()
+            self.snapshot().delete()
+            return True
         if self.in_memory:          # can't delete an in-memory database
             return False
         if self.deleted:
@@ -73,6 +91,8 @@ class Sqlite__Database(Type_Safe):
         return {key: value for key, value in zip(fields, row)}
 
     def exists(self):
+        if self.snapshot_path and self.deleted:
+            return False
         if self.in_memory:
             return True
         return file_exists(self.db_path)
@@ -97,6 +117,11 @@ class Sqlite__Database(Type_Safe):
         return path
 
 
+    @cache_on_self
+    def snapshot(self):
+        from osbot_utils.helpers.sqlite.Sqlite__Database__Snapshot import Sqlite__Database__Snapshot      # need to import here due to circular imports
+        return Sqlite__Database__Snapshot(database=self)
+
     def table(self, table_name):
         from osbot_utils.helpers.sqlite.Sqlite__Table import Sqlite__Table              # need to import here due to circular imports
         table = Sqlite__Table(database=self, table_name=table_name)
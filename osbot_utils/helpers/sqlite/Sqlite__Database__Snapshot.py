@@ -0,0 +1,100 @@
+import threading
+from threading                                      import Event, Thread
+from osbot_utils.type_safe.Type_Safe                import Type_Safe
+from osbot_utils.helpers.sqlite.Sqlite__Database    import Sqlite__Database
+from osbot_utils.utils.Files                        import file_exists, file_delete, folder_create, parent_folder
+
+SQLITE__SNAPSHOT__PAGES_PER_STEP    = 1024                              # backup in steps (so that the in-memory database is not locked during the whole copy)
+SQLITE__SNAPSHOT__TEMP_EXTENSION    = '.tmp'
+
+class Sqlite__Database__Snapshot(Type_Safe):                            # persists an in-memory database to disk (using the sqlite3 backup api)
+    database         : Sqlite__Database
+    pages_per_step   : int = SQLITE__SNAPSHOT__PAGES_PER_STEP
+    saves            : int                                              # number of snapshots written to disk
+    saved_changes    : int = -1                                         # value of connection.total_changes at the last save (used to skip saves when nothing changed)
+    saved_schema     : int = -1                                         # value of PRAGMA schema_version at the last save (total_changes doesn't count DDL, like CREATE or DROP TABLE)
+    stop_event       : Event  = None
+    thread           : Thread = None
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.lock       = threading.RLock()                             # serialises the saves from the background thread and from close()
+        self.stop_event = threading.Event()
+
+    def delete(self):
+        return file_delete(self.snapshot_path())
+
+    def exists(self):
+        return file_exists(self.snapshot_path())
+
+    def interval(self):
+        return self.database.snapshot_interval
+
+    def is_dirty(self):
+        connection = self.database.connection()
+        return (connection.total_changes        != self.saved_changes or
+                self.schema_version(connection) != self.saved_schema )
+
+    def restore(self, connection):                                      # called when the in-memory database is created (with the connection to that in-memory db)
+        if self.exists() is False:
+            return False
+        import sqlite3
+        source = sqlite3.connect(self.snapshot_path())
+        try:
+            source.backup(connection)
+        finally:
+            source.close()
+        self.saved_changes = connection.total_changes
+        self.saved_schema  = self.schema_version(connection)
+        return True
+
+    def run_thread(self):
+        while self.stop_event.wait(self.interval()) is False:
+            self.save()
+
+    def save(self, force=False):
+        import os
+        import sqlite3
+        with self.lock:
+            connection = self.database.connection()
+            if force is False and self.is_dirty() is False:
+                return False
+            total_changes  = connection.total_changes
+            schema_version = self.schema_version(connection)
+            snapshot_path  = self.snapshot_path()
+            temp_path      = snapshot_path + SQLITE__SNAPSHOT__TEMP_EXTENSION         # write to a temp file and then move it, so that a crash mid-save doesn't corrupt the last good snapshot
+            folder_create(parent_folder(snapshot_path))
+            target         = sqlite3.connect(temp_path)
+            try:
+                connection.backup(target, pages=self.pages_per_step)
+            finally:
+                target.close()
+            os.replace(temp_path, snapshot_path)
+            self.saved_changes = total_changes
+            self.saved_schema  = schema_version
+            self.saves        += 1
+            return True
+
+    def schema_version(self, connection):                              # incremented by sqlite on every schema change
+        cursor             = connection.cursor()
+        cursor.row_factory = None                                       # restore() is called before the connection's dict row_factory is set
+        return cursor.execute('PRAGMA schema_version').fetchone()[0]
+
+    def snapshot_path(self):
+        return self.database.snapshot_path
+
+    def start(self):
+        if self.thread is None and self.interval() > 0:
+            self.stop_event.clear()
+            self.thread = Thread(target=self.run_thread, daemon=True)
+            self.thread.start()
+        return self
+
+    def stop(self, save=True):
+        if self.thread:
+            self.stop_event.set()
+            self.thread.join()
+            self.thread = None
+        if save:
+            self.save()
+        return self
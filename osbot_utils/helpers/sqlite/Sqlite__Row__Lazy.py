@@ -0,0 +1,60 @@
+from osbot_utils.utils.Objects import bytes_to_obj
+
+
+class Sqlite__Row__Lazy(dict):                                  # row dict where the pickled BLOB fields are only unpickled when they are accessed
+
+    def __init__(self, row, lazy_fields):
+        super().__init__(row)
+        self.lazy_fields = set(field_name for field_name in lazy_fields if field_name in row)
+
+    def __getitem__(self, key):
+        if key in self.lazy_fields:
+            self.lazy_fields.discard(key)
+            super().__setitem__(key, bytes_to_obj(super().__getitem__(key)))
+        return super().__getitem__(key)
+
+    def __setitem__(self, key, value):
+        self.lazy_fields.discard(key)
+        super().__setitem__(key, value)
+
+    def __iter__(self):                                         # overriding __iter__ makes dict(row) and {**row} read the values via keys() and __getitem__ (and so decode them)
+        return super().__iter__()
+
+    def __eq__(self, other):
+        return self.decoded() == other
+
+    def __ne__(self, other):
+        return self.decoded() != other
+
+    def __repr__(self):
+        return repr(self.decoded())
+
+    def copy(self):
+        return self.decoded()
+
+    def decoded(self):                                          # returns a normal dict with all fields unpickled
+        return {key: self[key] for key in self.keys()}
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def items(self):
+        return self.decoded().items()
+
+    def keys(self):
+        return super().keys()
+
+    def pop(self, key, *default):
+        if key in self:
+            value = self[key]
+            super().pop(key)
+            return value
+        return super().pop(key, *default)
+
+    def raw(self, key):                                         # access the stored (still pickled) bytes, without decoding them
+        return super().__getitem__(key)
+
+    def values(self):
+        return self.decoded().values()
@@ -17,6 +17,7 @@ class Sqlite__Table(Kwargs_To_Self):
     table_name      : str
     row_schema      : type
     auto_pickle_blob: bool = False
+    lazy_pickle_blob: bool = False                                                          # when auto_pickle_blob is set, only unpickle BLOB fields when they are accessed
 
     def __setattr__(self, key, value):
         if key =='table_name':                                                              # SQL injection protection
@@ -39,6 +40,19 @@ class Sqlite__Table(Kwargs_To_Self):
         new_row  = self.new_row_obj(row_data)
         return self.row_add_and_commit(new_row)
 
+    def blob_open(self, field_name, row_id, readonly=True, use_blobopen=True):              # file-like (streaming) access to the raw bytes of a BLOB cell
+        from osbot_utils.helpers.sqlite.Sqlite__Blob import Sqlite__Blob
+        if field_name not in self.fields__cached():
+            raise ValueError(f"in blob_open, invalid field_name: {field_name}")
+        blob      = Sqlite__Blob(database     = self.database  ,
+                                 table_name   = self.table_name,
+                                 field_name   = field_name     ,
+                                 row_id       = row_id         ,
+                                 readonly     = readonly       ,
+                                 use_blobopen = use_blobopen   )
+        blob.size = blob.blob_size()
+        return blob
+
     def clear(self):
         sql_query = self.sql_builder().command__delete_table()
         return self.cursor().execute_and_commit(sql_query)
@@ -157,6 +171,10 @@ class Sqlite__Table(Kwargs_To_Self):
     def parse_row(self, row):
         if row and self.auto_pickle_blob:
             fields = self.fields__cached()
+            if self.lazy_pickle_blob:
+                from osbot_utils.helpers.sqlite.Sqlite__Row__Lazy import Sqlite__Row__Lazy
+                lazy_fields = [field_name for field_name in row if fields.get(field_name, {}).get('type') == 'BLOB']
+                return Sqlite__Row__Lazy(row, lazy_fields)
             for field_name, field_value in row.items():
                 field_type = fields.get(field_name, {}).get('type')
                 if field_type == 'BLOB':
@@ -5,9 +5,12 @@ from osbot_utils.helpers.sqlite.Sqlite__Database import Sqlite__Database, SQLITE
 class Temp_Sqlite__Database__Disk(Kwargs_To_Self):
     database : Sqlite__Database
 
-    def __init__(self):
+    def __init__(self, snapshot=False):
         super().__init__()
-        self.database.in_memory = False
+        if snapshot:                                                                # in-memory database, which is saved to the temp file on close
+            self.database.snapshot_path = self.database.path_temp_database()
+        else:
+            self.database.in_memory = False
 
     def __enter__(self):
         self.database.connect()
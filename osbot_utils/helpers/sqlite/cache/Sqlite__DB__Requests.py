@@ -8,11 +8,11 @@ class Sqlite__DB__Requests(Sqlite__DB__Local):
     table_name  : str
     table_schema: type
 
-    def __init__(self,db_path=None, db_name=None, table_name=None):
+    def __init__(self,db_path=None, db_name=None, table_name=None, snapshot=False, snapshot_interval=0.0):
         self.table_name   = table_name or SQLITE_TABLE__REQUESTS
         self.table_schema = Schema__Table__Requests
         in_memory         = not (db_path or db_name)
-        super().__init__(db_path=db_path, db_name=db_name, in_memory=in_memory)
+        super().__init__(db_path=db_path, db_name=db_name, in_memory=in_memory, snapshot=snapshot, snapshot_interval=snapshot_interval)
         self.setup()
 
     def __repr__(self):
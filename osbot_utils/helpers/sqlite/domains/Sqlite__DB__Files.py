@@ -12,6 +12,9 @@ class Sqlite__DB__Files(Sqlite__DB__Local):
     def add_file(self, path, contents=None, metadata=None):
         return self.table_files().add_file(path, contents, metadata)
 
+    def add_file__from_stream(self, path, stream, size, metadata=None):
+        return self.table_files().add_file__from_stream(path, stream, size, metadata)
+
     def clear_table(self):
         self.table_files().clear()
 
@@ -24,6 +27,12 @@ class Sqlite__DB__Files(Sqlite__DB__Local):
     def file_contents(self, path) -> str:
         return self.table_files().file_contents(path)
 
+    def file_contents__chunks(self, path):
+        return self.table_files().file_contents__chunks(path)
+
+    def file_contents__open(self, path):
+        return self.table_files().file_contents__open(path)
+
     def file_contents__json(self, path) -> dict:
         file_contents = self.file_contents(path)
         return str_to_json(file_contents)
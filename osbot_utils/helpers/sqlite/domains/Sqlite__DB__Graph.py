@@ -1,6 +1,6 @@
 from osbot_utils.decorators.methods.cache_on_self import cache_on_self
 from osbot_utils.helpers.sqlite.domains.Sqlite__DB__Local import Sqlite__DB__Local
-from osbot_utils.helpers.sqlite.tables.Sqlite__Table__Edges import Sqlite__Table__Edges
+from osbot_utils.helpers.sqlite.tables.Sqlite__Table__Edges import Sqlite__Table__Edges, SQLITE__GRAPH__MAX_DEPTH
 from osbot_utils.helpers.sqlite.tables.Sqlite__Table__Nodes import Sqlite__Table__Nodes
 
 
@@ -26,12 +26,35 @@ class Sqlite__DB__Graph(Sqlite__DB__Local):
     def edges(self):
         return self.table_edges().edges()
 
+    def export_semantic_graph(self):
+        from osbot_utils.helpers.sqlite.domains.Sqlite__DB__Graph__Bulk import Sqlite__DB__Graph__Bulk      # need to import here due to circular imports
+        return Sqlite__DB__Graph__Bulk(db_graph=self).export_graph()
+
+    def import_semantic_graph(self, graph, resume=True):
+        from osbot_utils.helpers.sqlite.domains.Sqlite__DB__Graph__Bulk import Sqlite__DB__Graph__Bulk
+        return Sqlite__DB__Graph__Bulk(db_graph=self).import_graph(graph, resume=resume)
+
+    def is_reachable(self, source_key, target_key, direction='out'):
+        return self.table_edges().is_reachable(source_key, target_key, direction)
+
+    def k_hop(self, key, max_depth, direction='out'):
+        return self.table_edges().k_hop(key, max_depth, direction)
+
+    def neighbours(self, key, direction='out'):
+        return self.table_edges().neighbours(key, direction)
+
     def nodes(self):
         return self.table_nodes().nodes()
 
     def nodes_keys(self):
         return self.table_nodes().keys()
 
+    def reachable(self, key, direction='out'):
+        return self.table_edges().reachable(key, direction)
+
+    def shortest_path(self, source_key, target_key, direction='out', max_depth=SQLITE__GRAPH__MAX_DEPTH):
+        return self.table_edges().shortest_path(source_key, target_key, direction, max_depth)
+
     @cache_on_self
     def table_edges(self):
         return Sqlite__Table__Edges(database=self).setup()
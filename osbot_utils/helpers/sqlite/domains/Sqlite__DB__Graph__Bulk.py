@@ -0,0 +1,123 @@
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from osbot_utils.decorators.methods.cache_on_self                               import cache_on_self
+from osbot_utils.helpers.sqlite.domains.Sqlite__DB__Graph                       import Sqlite__DB__Graph
+from osbot_utils.helpers.sqlite.tables.Sqlite__Table__Config                    import Sqlite__Table__Config
+from osbot_utils.helpers.semantic_graphs.schemas.graph.Schema__Semantic_Graph   import Schema__Semantic_Graph
+from osbot_utils.utils.Misc                                                     import timestamp_utc_now
+from osbot_utils.utils.Objects                                                  import obj_to_bytes, bytes_to_obj
+
+SQLITE__GRAPH_BULK__BATCH_SIZE         = 10000
+SQLITE__GRAPH_BULK__CONFIG__GRAPH      = 'semantic_graph'                       # graph level data (i.e. everything except the nodes and edges)
+SQLITE__GRAPH_BULK__CONFIG__PROGRESS   = 'semantic_graph__import'               # import progress (committed with each batch, which is what allows the import to be resumed)
+SQLITE__GRAPH_BULK__INDEXES            = { 'nodes': ['key'], 'edges': ['source_key', 'target_key']}
+
+
+class Sqlite__DB__Graph__Bulk(Type_Safe):                                      # bulk import and export between Schema__Semantic_Graph and the Sqlite__DB__Graph tables
+    db_graph   : Sqlite__DB__Graph = None
+    batch_size : int               = SQLITE__GRAPH_BULK__BATCH_SIZE
+
+    def cursor(self):
+        return self.db_graph.cursor()
+
+    # import
+
+    def import_graph(self, graph: Schema__Semantic_Graph, resume=True):         # replaces the current nodes and edges with the ones from graph
+        progress = self.import_progress()
+        if not (resume and self.import_can_resume(graph, progress)):
+            progress = self.import_start(graph)
+        timestamp = timestamp_utc_now()
+        nodes     = list(graph.nodes.values())
+        edges     = list(graph.edges)
+        while progress['nodes_imported'] < len(nodes):
+            batch = nodes[progress['nodes_imported']:progress['nodes_imported'] + self.batch_size]
+            self.import_batch(self.insert_nodes, batch, timestamp, progress, 'nodes_imported')
+        while progress['edges_imported'] < len(edges):
+            batch = edges[progress['edges_imported']:progress['edges_imported'] + self.batch_size]
+            self.import_batch(self.insert_edges, batch, timestamp, progress, 'edges_imported')
+        self.indexes_create()                                                   # it is much faster to create the indexes after the data is loaded
+        progress['completed'] = True
+        self.import_progress__save(progress)
+        return progress
+
+    def import_batch(self, insert_rows, batch, timestamp, progress, progress_key):   # commits the batch and the progress in the same transaction
+        try:
+            insert_rows(batch, timestamp)
+            progress[progress_key] += len(batch)
+            self.import_progress__save(progress)
+        except Exception:
+            self.db_graph.connection().rollback()                               # drop the rows of the failed batch, so that the next commit (i.e. a resume) doesn't persist them as duplicates
+            progress[progress_key] = self.import_progress()[progress_key]
+            raise
+
+    def import_can_resume(self, graph, progress):
+        return (progress                                      and
+                progress.get('completed') is False            and
+                progress.get('graph_id' ) == str(graph.graph_id))
+
+    def import_progress(self):
+        return self.table_config().value(SQLITE__GRAPH_BULK__CONFIG__PROGRESS)
+
+    def import_progress__save(self, progress):
+        self.table_config().set_value(SQLITE__GRAPH_BULK__CONFIG__PROGRESS, progress)          # set_value commits
+
+    def import_start(self, graph):
+        self.db_graph.clear()
+        self.indexes_delete()
+        graph_data = graph.json()
+        del graph_data['nodes']
+        del graph_data['edges']
+        progress = dict(graph_id       = str(graph.graph_id),
+                        nodes_imported = 0                  ,
+                        edges_imported = 0                  ,
+                        completed      = False              )
+        self.table_config().set_value(SQLITE__GRAPH_BULK__CONFIG__GRAPH, graph_data)
+        self.import_progress__save(progress)
+        return progress
+
+    def insert_edges(self, edges, timestamp):
+        table_name  = self.db_graph.table_edges().table_name
+        sql_command = f'INSERT INTO {table_name} (source_key, target_key, value, properties, timestamp) VALUES (?, ?, ?, ?, ?)'
+        properties  = obj_to_bytes(None)
+        rows        = [(str(edge.from_node_id), str(edge.to_node_id), obj_to_bytes(edge.json()), properties, timestamp) for edge in edges]
+        self.cursor().cursor().executemany(sql_command, rows)
+
+    def insert_nodes(self, nodes, timestamp):
+        table_name  = self.db_graph.table_nodes().table_name
+        sql_command = f'INSERT INTO {table_name} (key, value, properties, timestamp) VALUES (?, ?, ?, ?)'
+        properties  = obj_to_bytes(None)
+        rows        = [(str(node.node_id), obj_to_bytes(node.json()), properties, timestamp) for node in nodes]
+        self.cursor().cursor().executemany(sql_command, rows)
+
+    # indexes
+
+    def indexes_create(self):
+        for table in self.tables():
+            for index_field in SQLITE__GRAPH_BULK__INDEXES.get(table.table_name, []):
+                table.index_create(index_field)
+
+    def indexes_delete(self):
+        for table in self.tables():
+            for index_field in SQLITE__GRAPH_BULK__INDEXES.get(table.table_name, []):
+                table.index_delete(table.index_name(index_field))
+
+    # export
+
+    def export_graph(self) -> Schema__Semantic_Graph:
+        graph_data = self.table_config().value(SQLITE__GRAPH_BULK__CONFIG__GRAPH)
+        if graph_data is None:
+            return None
+        graph_data          = dict(graph_data)
+        graph_data['nodes'] = {row.get('key'): bytes_to_obj(row.get('value')) for row in self.export_rows(self.db_graph.table_nodes(), 'key, value')}
+        graph_data['edges'] = [bytes_to_obj(row.get('value'))                   for row in self.export_rows(self.db_graph.table_edges(), 'value'     )]
+        return Schema__Semantic_Graph.from_json(graph_data)
+
+    def export_rows(self, table, fields):                                       # streams the rows (in insert order), without the per row unpickling done by table.rows()
+        sql_query = f'SELECT {fields} FROM {table.table_name} ORDER BY id'
+        return self.cursor().execute__fetch_iter(sql_query, batch_size=self.batch_size)
+
+    @cache_on_self
+    def table_config(self):
+        return Sqlite__Table__Config(database=self.db_graph).setup()
+
+    def tables(self):
+        return [self.db_graph.table_nodes(), self.db_graph.table_edges()]
@@ -2,6 +2,7 @@ from osbot_utils.base_classes.Kwargs_To_Self                import Kwargs_To_Sel
 from osbot_utils.helpers.sqlite.Sqlite__Database            import Sqlite__Database
 from osbot_utils.helpers.sqlite.Sqlite__Table__Create       import Sqlite__Table__Create
 from osbot_utils.helpers.sqlite.models.Sqlite__Field__Type  import Sqlite__Field__Type
+from osbot_utils.helpers.sqlite.tables.Sqlite__Table__Json_Docs import Sqlite__Table__Json_Docs, SQLITE__TABLE_NAME__JSON_DOCS
 
 
 class Sqlite__DB__Json(Kwargs_To_Self):
@@ -35,6 +36,9 @@ class Sqlite__DB__Json(Kwargs_To_Self):
 
     #def add_data_to_data_from_json_data(self, json_data):
 
+    def table_json_docs(self, table_name=SQLITE__TABLE_NAME__JSON_DOCS):           # mode where the json data is stored as documents (and queried via sqlite's json_extract)
+        return Sqlite__Table__Json_Docs(database=self.database, table_name=table_name).setup()
+
     def get_schema_from_json_data(self, json_data):
         if type(json_data) is dict:
             return self.get_schema_from_dict(json_data)
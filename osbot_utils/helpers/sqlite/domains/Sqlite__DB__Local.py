@@ -9,12 +9,16 @@ ENV_NAME_PATH_LOCAL_DBS = 'PATH_LOCAL_DBS'
 class Sqlite__DB__Local(Sqlite__Database):
     db_name: str
 
-    def __init__(self, db_path=None, db_name=None, in_memory=False):
+    def __init__(self, db_path=None, db_name=None, in_memory=False, snapshot=False, snapshot_interval=0.0):
 
         if hasattr(self, 'db_name') is False:
             self.db_name = db_name or random_text('db_local') + '.sqlite'
         if in_memory:
+            if snapshot:
+                raise ValueError(f"in {self.__class__.__name__}, snapshot=True needs a db_path or db_name (an in_memory database has no file to save the snapshots to)")
             super().__init__()
+        elif snapshot:                                                  # in-memory database, restored from (and saved to) the local db file
+            super().__init__(snapshot_path=db_path or self.path_local_db(), snapshot_interval=snapshot_interval)
         else:
             super().__init__(db_path=db_path or self.path_local_db())  # todo: add option to run this in memory, without creating a temp file
 
@@ -3,7 +3,10 @@ from osbot_utils.helpers.sqlite.Sqlite__Table   import Sqlite__Table
 from osbot_utils.base_classes.Kwargs_To_Self    import Kwargs_To_Self
 from osbot_utils.utils.Misc import timestamp_utc_now
 
-SQLITE__TABLE_NAME__EDGES = 'edges'
+SQLITE__TABLE_NAME__EDGES       = 'edges'
+SQLITE__GRAPH__DIRECTIONS       = ('out', 'in', 'both')
+SQLITE__GRAPH__MAX_DEPTH        = 32                                        # default limit for the shortest_path search
+SQLITE__GRAPH__QUERY_BATCH      = 500                                       # max number of keys per IN (...) query in shortest_path (below sqlite's default limit of 999 variables)
 
 class Schema__Table__Edges(Kwargs_To_Self):
     source_key : str
@@ -38,9 +41,82 @@ class Sqlite__Table__Edges(Sqlite__Table):
     def edges(self):
         return self.rows()
 
+    # traversal queries (executed inside sqlite via recursive CTEs over the indexed source_key and target_key columns, and returned as streams)
+
+    def edges_columns(self, direction='out'):                               # (from, to) columns to follow for the requested direction
+        if direction == 'out':
+            return [('source_key', 'target_key')]
+        if direction == 'in':
+            return [('target_key', 'source_key')]
+        if direction == 'both':
+            return [('source_key', 'target_key'), ('target_key', 'source_key')]
+        raise ValueError(f"in Sqlite__Table__Edges, invalid direction: {direction} (it must be one of {SQLITE__GRAPH__DIRECTIONS})")
+
+    def edges_steps(self, direction, step_template, union='UNION'):         # one recursive select per direction (so that each one can use its own index)
+        steps = [step_template.format(from_key=from_key, to_key=to_key, table_name=self.table_name)
+                 for from_key, to_key in self.edges_columns(direction)]
+        return f' {union} '.join(steps)
+
+    def is_reachable(self, source_key, target_key, direction='out'):
+        steps     = self.edges_steps(direction, 'SELECT e.{to_key} FROM {table_name} e JOIN reach r ON e.{from_key} = r.key')
+        sql_query = (f'WITH RECURSIVE reach(key) AS (SELECT ? UNION {steps}) '
+                     f'SELECT 1 AS found FROM reach WHERE key = ? LIMIT 1')                     # the CTE runs as a co-routine, so this stops as soon as target_key is found
+        return self.cursor().execute__fetch_one(sql_query, (source_key, target_key)) is not None
+
+    def k_hop(self, key, max_depth, direction='out'):                       # yields {key, depth} for all nodes within max_depth hops (with their shortest depth)
+        steps     = self.edges_steps(direction, 'SELECT e.{to_key}, h.depth + 1 FROM {table_name} e JOIN hops h ON e.{from_key} = h.key WHERE h.depth < ?')
+        sql_query = (f'WITH RECURSIVE hops(key, depth) AS (SELECT ?, 0 UNION {steps}) '
+                     f'SELECT key, MIN(depth) AS depth FROM hops WHERE key != ? GROUP BY key ORDER BY depth, key')
+        params    = (key, *[max_depth] * len(self.edges_columns(direction)), key)
+        return self.cursor().execute__fetch_iter(sql_query, params)
+
+    def neighbours(self, key, direction='out'):                             # yields the keys of the nodes directly connected to key
+        sql_query = self.edges_steps(direction, 'SELECT DISTINCT {to_key} AS key FROM {table_name} WHERE {from_key} = ?')
+        params    = [key] * len(self.edges_columns(direction))
+        for row in self.cursor().execute__fetch_iter(sql_query, params):
+            yield row.get('key')
+
+    def reachable(self, key, direction='out'):                              # yields all descendants (direction='out') or ancestors (direction='in') of key
+        steps     = self.edges_steps(direction, 'SELECT e.{to_key} FROM {table_name} e JOIN reach r ON e.{from_key} = r.key')
+        sql_query = f'WITH RECURSIVE reach(key) AS (SELECT ? UNION {steps}) SELECT key FROM reach WHERE key != ?'
+        for row in self.cursor().execute__fetch_iter(sql_query, (key, key)):
+            yield row.get('key')
+
+    def shortest_path(self, source_key, target_key, direction='out', max_depth=SQLITE__GRAPH__MAX_DEPTH):
+        if source_key == target_key:
+            return [source_key]
+        parents  = {source_key: None}                                       # breadth-first search (one query per level) with a visited set, so each node is only expanded once
+        frontier = [source_key]
+        for _ in range(max_depth):
+            next_frontier = []
+            for from_key, to_key in self.shortest_path__level(frontier, direction):
+                if to_key in parents:
+                    continue
+                parents[to_key] = from_key
+                if to_key == target_key:
+                    path = [target_key]
+                    while parents[path[-1]] is not None:
+                        path.append(parents[path[-1]])
+                    return path[::-1]
+                next_frontier.append(to_key)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+        return None
+
+    def shortest_path__level(self, frontier, direction):                    # yields the (from, to) edges leaving the frontier nodes (using the source_key and target_key indexes)
+        for start in range(0, len(frontier), SQLITE__GRAPH__QUERY_BATCH):
+            batch        = frontier[start:start + SQLITE__GRAPH__QUERY_BATCH]
+            placeholders = ', '.join('?' * len(batch))
+            sql_query    = self.edges_steps(direction, 'SELECT {from_key} AS from_key, {to_key} AS to_key FROM {table_name} WHERE {from_key} IN (' + placeholders + ')',
+                                            union='UNION ALL')
+            params       = batch * len(self.edges_columns(direction))
+            for row in self.cursor().execute__fetch_iter(sql_query, params):
+                yield row.get('from_key'), row.get('to_key')
+
     def setup(self):
         if self.exists() is False:
             self.create()
             self.index_create('source_key')
             self.index_create('target_key')
-        return self
\ No newline at end of file
+        return self
@@ -1,7 +1,9 @@
 from osbot_utils.base_classes.Kwargs_To_Self  import Kwargs_To_Self
+from osbot_utils.helpers.sqlite.Sqlite__Blob  import SQLITE__BLOB__CHUNK_SIZE, SQLITE__BLOB__PICKLE_HEADER__SIZE, PICKLE__OPCODE__STOP, sqlite_blob__open_supported, sqlite_blob__pickle_header, sqlite_blob__pickle_header__parse
 from osbot_utils.helpers.sqlite.Sqlite__Table import Sqlite__Table
 from osbot_utils.utils.Misc                   import timestamp_utc_now, bytes_sha256, str_sha256
-from osbot_utils.utils.Status                 import status_warning, status_ok
+from osbot_utils.utils.Objects                import obj_to_bytes
+from osbot_utils.utils.Status                 import status_warning, status_ok, status_error
 
 SQLITE__TABLE_NAME__FILES = 'files'
 
@@ -14,7 +16,9 @@ class Schema__Table__Files(Kwargs_To_Self):
 
 class Sqlite__Table__Files(Sqlite__Table):
     auto_pickle_blob    : bool = True
+    lazy_pickle_blob    : bool = False                                                  # set to True to only unpickle contents/metadata when they are accessed
     set_timestamp       : bool = True
+    use_blobopen        : bool = True                                                   # set to False to force the (chunked substr() and || appends) fallback
 
     def __init__(self, **kwargs):
         self.table_name = SQLITE__TABLE_NAME__FILES
@@ -31,6 +35,45 @@ class Sqlite__Table__Files(Sqlite__Table):
         new_row_obj = self.add_row_and_commit(**row_data)
         return status_ok(message='file added', data= new_row_obj)
 
+    def add_file__from_stream(self, path, stream, size, metadata=None, chunk_size=SQLITE__BLOB__CHUNK_SIZE):      # stores the bytes read from stream, without loading them all into memory
+        if self.contains(path=path):
+            return status_warning(f"File not added, since file with path '{path}' already exists in the database")
+        import hashlib
+        header    = sqlite_blob__pickle_header(size)                                      # contents are stored as a pickled bytes object, so that file_contents still works
+        blob_size = len(header) + size + len(PICKLE__OPCODE__STOP)
+        row_id    = self.file_row__reserve(path, blob_size)
+        hasher    = hashlib.sha256()
+        written   = 0
+        chunks    = []
+        with self.blob_open('contents', row_id, readonly=False, use_blobopen=self.use_blobopen) as blob:
+            in_place = blob.blobopen_enabled()                                          # without blobopen, each chunk appended with || would copy the whole blob again (i.e. O(n^2)) ...
+            if in_place:
+                blob.write(header)
+            while written < size:
+                chunk = stream.read(min(chunk_size, size - written))
+                if not chunk:
+                    break
+                hasher.update(chunk)
+                if in_place:
+                    blob.write(chunk)
+                else:
+                    chunks.append(chunk)
+                written += len(chunk)
+            if in_place:
+                blob.write(PICKLE__OPCODE__STOP)
+            elif written == size:                                                       # ... so the chunks are written with a single append
+                blob.write(b''.join([header, *chunks, PICKLE__OPCODE__STOP]))
+        if written != size:
+            self.rows_delete_where(id=row_id)
+            return status_error(f"File not added, since only {written} of the expected {size} bytes could be read from the stream")
+        if metadata is None:
+            metadata = {}
+        metadata.update(dict(file_contents=dict(hash      = hasher.hexdigest(),
+                                                is_binary = True              ,
+                                                size      = size              )))
+        self.row_update(dict(metadata=obj_to_bytes(metadata)), dict(id=row_id))
+        return status_ok(message='file added', data=dict(id=row_id, path=str(path)))
+
     def create_contents_metadata(self, contents):
         file_size       = len(contents)
         file_is_binary = type(contents) is bytes
@@ -73,6 +116,35 @@ class Sqlite__Table__Files(Sqlite__Table):
         if row:
             return row.get('contents')
 
+    def file_contents__chunks(self, path, chunk_size=SQLITE__BLOB__CHUNK_SIZE):
+        blob = self.file_contents__open(path)
+        if blob:
+            yield from blob.chunks(chunk_size)
+
+    def file_contents__open(self, path):                                                # file-like object over the stored contents (for str contents this will return the utf-8 bytes)
+        row = self.row(where=dict(path=path), fields=['id'])
+        if row is None:
+            return None
+        blob = self.blob_open('contents', row.get('id'), use_blobopen=self.use_blobopen)
+        if self.auto_pickle_blob:                                                       # skip the pickle header so that only the raw bytes are exposed
+            pickle_header = sqlite_blob__pickle_header__parse(blob.read(SQLITE__BLOB__PICKLE_HEADER__SIZE))
+            if pickle_header is None:
+                raise ValueError(f"in file_contents__open, the contents of '{path}' are not stored as bytes or str")
+            blob.offset_start, blob.size, _ = pickle_header
+            blob.position                   = 0
+        return blob
+
+    def file_row__reserve(self, path, blob_size):                                       # inserts the file row with space for the contents (i.e. a zeroblob when blobopen is available)
+        timestamp = timestamp_utc_now() if self.set_timestamp else 0
+        if self.use_blobopen and sqlite_blob__open_supported(self.connection()):
+            contents_value, params = 'zeroblob(?)', [str(path), blob_size, timestamp]
+        else:
+            contents_value, params = "X''"        , [str(path), timestamp]
+        sql_command = f'INSERT INTO {self.table_name} (path, contents, timestamp) VALUES (?, {contents_value}, ?)'
+        cursor      = self.connection().cursor()                                        # lastrowid must be read from the same cursor that executed the INSERT
+        cursor.execute(sql_command, params)
+        return cursor.lastrowid
+
     def file_without_contents(self, path):
         return self.file(path, include_contents=False)
 
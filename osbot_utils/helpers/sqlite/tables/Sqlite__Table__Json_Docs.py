@@ -0,0 +1,126 @@
+import re
+from osbot_utils.base_classes.Kwargs_To_Self                import Kwargs_To_Self
+from osbot_utils.helpers.sqlite.Sqlite__Table               import Sqlite__Table
+from osbot_utils.helpers.sqlite.models.Sqlite__Field__Type  import Sqlite__Field__Type
+from osbot_utils.utils.Json                                 import json_dumps, json_loads
+
+SQLITE__TABLE_NAME__JSON_DOCS    = 'json_docs'
+SQLITE__JSON_DOCS__FIELD_NAME    = 'document'
+SQLITE__JSON_DOCS__COLUMN_PREFIX = 'json__'
+SQLITE__JSON_DOCS__EXPR_PREFIX   = 'json_expr__'                                                                     # expression indexes get their own prefix, so they never share a name with a generated column index
+SQLITE__JSON_DOCS__PATH_ESCAPES  = {'_': '_u', '.': '__', '[': '_i', ']': ''}                                      # collision free encoding of json paths into column names (a.b -> a__b , a_b -> a_ub , a[0] -> a_i0)
+REGEX__SQLITE__JSON_PATH         = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*|\[\d+\])*$')      # only allow simple paths (like a.b[0].c) since they are used inside the sql queries
+
+class Schema__Table__Json_Docs(Kwargs_To_Self):
+    document : str
+
+
+class Sqlite__Table__Json_Docs(Sqlite__Table):                  # stores json documents in a JSON (TEXT) column and pushes filters and projections into sqlite (via json_extract)
+
+    def __init__(self, **kwargs):
+        if 'table_name' not in kwargs:
+            self.table_name = SQLITE__TABLE_NAME__JSON_DOCS
+        self.row_schema  = Schema__Table__Json_Docs
+        super().__init__(**kwargs)
+
+    def add_document(self, document):
+        return self.add_documents([document])
+
+    def add_documents(self, documents, commit=True):
+        sql_command = f'INSERT INTO {self.table_name} ({SQLITE__JSON_DOCS__FIELD_NAME}) VALUES (json(?))'      # json() validates (and minifies) the document
+        params      = [(json_dumps(document, pretty=False),) for document in documents]
+        self.cursor().cursor().executemany(sql_command, params)
+        if commit:
+            self.commit()
+        return self
+
+    def document(self, doc_id):
+        row = self.row(where=dict(id=doc_id), fields=[SQLITE__JSON_DOCS__FIELD_NAME])
+        if row:
+            return json_loads(row.get(SQLITE__JSON_DOCS__FIELD_NAME))
+
+    def documents(self, where=None, limit=None):
+        return [json_loads(row.get(SQLITE__JSON_DOCS__FIELD_NAME)) for row in self.json_select(where=where, limit=limit)]
+
+    def json_column_add(self, json_path, field_type=str, index=True):        # adds a (virtual) generated column for a hot json path, which is then used by json_select
+        column_name = self.json_column_name(json_path)
+        if column_name not in self.json_columns():
+            sqlite_type = Sqlite__Field__Type.type_map().get(field_type)
+            if sqlite_type is None:
+                raise ValueError(f"in json_column_add, field_type {field_type} is not supported by Sqlite__Field__Type")
+            sql_command = (f'ALTER TABLE {self.table_name} ADD COLUMN {column_name} {sqlite_type.name} '
+                           f'GENERATED ALWAYS AS ({self.json_path_expression(json_path)}) VIRTUAL')
+            self.cursor().execute_and_commit(sql_command)
+        if index:
+            self.json_index_create(self.index_name(column_name), column_name)
+        return column_name
+
+    def json_column_name(self, json_path):                                      # each json_path maps to a different column name (see SQLITE__JSON_DOCS__PATH_ESCAPES)
+        self.json_path_validate(json_path)
+        return SQLITE__JSON_DOCS__COLUMN_PREFIX + ''.join(SQLITE__JSON_DOCS__PATH_ESCAPES.get(char, char) for char in json_path)
+
+    def json_columns(self):                                                     # generated columns are hidden from PRAGMA table_info, so we need to use table_xinfo
+        rows = self.cursor().execute__fetch_all(f'PRAGMA table_xinfo({self.table_name});')
+        return [row.get('name') for row in rows if row.get('hidden') in (2, 3)]
+
+    def json_index_add(self, json_path):                                        # expression index, which is used by json_select when there is no generated column for json_path
+        column_name = self.json_column_name(json_path)
+        index_name  = self.index_name(SQLITE__JSON_DOCS__EXPR_PREFIX + column_name[len(SQLITE__JSON_DOCS__COLUMN_PREFIX):])
+        return self.json_index_create(index_name, self.json_path_expression(json_path))
+
+    def json_index_create(self, index_name, expression):                        # creates the index, unless an index with the same name already exists on a different expression
+        sql_query = "SELECT sql FROM sqlite_master WHERE type='index' AND name=?"
+        row       = self.cursor().execute__fetch_one(sql_query, (index_name,))
+        if row:
+            if not row.get('sql', '').endswith(f'({expression})'):
+                raise ValueError(f"in json_index_create, index {index_name} already exists for a different expression: {row.get('sql')}")
+            return index_name
+        sql_command = f'CREATE INDEX {index_name} ON {self.table_name}({expression});'
+        self.cursor().execute_and_commit(sql_command)
+        return index_name
+
+    def json_path_expression(self, json_path, json_columns=None):
+        if json_columns is not None:
+            column_name = self.json_column_name(json_path)
+            if column_name in json_columns:
+                return column_name
+        self.json_path_validate(json_path)
+        return f"json_extract({SQLITE__JSON_DOCS__FIELD_NAME}, '$.{json_path}')"
+
+    def json_path_validate(self, json_path):
+        if type(json_path) is not str or REGEX__SQLITE__JSON_PATH.match(json_path) is None:
+            raise ValueError(f"in Sqlite__Table__Json_Docs, invalid json_path: {json_path}")
+
+    def json_select(self, fields=None, where=None, limit=None):                 # where is a dict of json_path:value, and fields a list of json_paths (if None the full document is returned)
+        json_columns = self.json_columns()
+        if fields:
+            select_fields = [f'{self.json_path_expression(field, json_columns)} AS "{field}"' for field in fields]
+        else:
+            select_fields = [SQLITE__JSON_DOCS__FIELD_NAME]
+        sql_query = f'SELECT id, {", ".join(select_fields)} FROM {self.table_name}'
+        params    = []
+        if where:
+            where_clauses = []
+            for json_path, value in where.items():
+                expression = self.json_path_expression(json_path, json_columns)
+                if value is None:
+                    where_clauses.append(f'{expression} IS NULL')
+                else:
+                    where_clauses.append(f'{expression} = ?')
+                    params.append(value)
+            sql_query += ' WHERE ' + ' AND '.join(where_clauses)
+        if limit is not None:
+            sql_query += f' LIMIT {int(limit)}'
+        return self.cursor().execute__fetch_all(sql_query, params)
+
+    def query_plan(self, where):                                                # useful to confirm that the indexes are being used
+        json_columns  = self.json_columns()
+        where_clauses = [f'{self.json_path_expression(json_path, json_columns)} = ?' for json_path in where]
+        sql_query     = f'EXPLAIN QUERY PLAN SELECT id FROM {self.table_name} WHERE {" AND ".join(where_clauses)}'
+        rows          = self.cursor().execute__fetch_all(sql_query, list(where.values()))
+        return [row.get('detail') for row in rows]
+
+    def setup(self):
+        if self.exists() is False:
+            self.create()
+        return self
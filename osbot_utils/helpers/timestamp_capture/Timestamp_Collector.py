@@ -3,7 +3,9 @@ Timestamp Collector - Core Recording
 =====================================
 
 Collects timestamps from @timestamp decorated methods.
-Found via stack-walking - no need to pass through call chain.
+Found via a ContextVar set on __enter__ (with stack-walking as fallback) - no need to pass through call chain.
+Calls from other threads and asyncio tasks are recorded in their own lanes (see Timestamp_Collector__Lane).
+With histograms=True no events are stored, only per-method latency histograms (for long running services).
 
 Usage:
     _timestamp_collector_ = Timestamp_Collector(name="my_workflow")
@@ -13,40 +15,80 @@ Usage:
 
 import time
 import threading
-from typing                                                                        import List, Dict, Any
+from asyncio                                                                       import Task, current_task
+from contextvars                                                                   import ContextVar, Token
+from heapq                                                                         import merge
+from threading                                                                     import get_ident
+from typing                                                                        import List, Dict, Any, Iterable, Optional
+from osbot_utils.helpers.timestamp_capture.Timestamp_Collector__Aggregate          import Timestamp_Collector__Aggregate
+from osbot_utils.helpers.timestamp_capture.Timestamp_Collector__Buffer             import Timestamp_Collector__Buffer
+from osbot_utils.helpers.timestamp_capture.Timestamp_Collector__Histogram          import Timestamp_Collector__Histogram
+from osbot_utils.helpers.timestamp_capture.Timestamp_Collector__Lane               import Timestamp_Collector__Lane
 from osbot_utils.helpers.timestamp_capture.schemas.capture.Schema__Timestamp_Entry import Schema__Timestamp_Entry
+from osbot_utils.helpers.timestamp_capture.static_methods.asyncio__running_loop    import asyncio__running_loop
+from osbot_utils.helpers.timestamp_capture.static_methods.timestamp_collector__context import timestamp_collector__activate, timestamp_collector__deactivate
+from osbot_utils.helpers.timestamp_capture.timestamp_capture__config               import EVENT_IDS
 from osbot_utils.type_safe.Type_Safe                                               import Type_Safe
 
 
 class Timestamp_Collector(Type_Safe):
 
     name            : str                              = 'default'
+    all_threads     : bool                             = False         # Also used by threads that can't find it (for example thread pool workers, which don't share the ContextVar)
+    buffer          : Timestamp_Collector__Buffer      = None          # When set, events are recorded in columns (and entries is not used)
+    columnar        : bool                             = False         # Creates a default buffer
     entries         : List[Schema__Timestamp_Entry]    = None
+    histograms      : bool                             = False         # Only keeps per-method latency histograms (fixed memory, no entries or buffer)
     start_time_ns   : int                              = 0
     end_time_ns     : int                              = 0
     thread_id       : int                              = 0
     _depth          : int                              = 0
     _active         : bool                             = False
     _call_stack     : List[Schema__Timestamp_Entry]    = None          # For self-time calculation
+    _context_token  : Token                            = None          # For restoring the previous active collector on __exit__
+    _aggregate      : Timestamp_Collector__Aggregate   = None          # Cached analysis (recalculated when new events are recorded)
+    _histograms     : dict                                             # Histograms mode: thread_id -> (name -> Timestamp_Collector__Histogram)
+    _lanes          : List[Timestamp_Collector__Lane]                  # main lane (which uses the fields above) plus one per other thread and asyncio task
+    _main_task      : Task                             = None          # asyncio task that entered the collector (if any), which uses the main lane
+    _task_lane      : ContextVar                       = None          # (task, lane) of the current asyncio task (since each task runs on a copy of its parent's context)
+    _thread_data    : threading.local                  = None          # lane of the current thread
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.entries     = []
-        self._call_stack = []
-        self.thread_id   = threading.get_ident()
+        self.entries      = []
+        self._call_stack  = []
+        self.thread_id    = threading.get_ident()
+        if self.columnar and self.buffer is None:
+            self.buffer = Timestamp_Collector__Buffer()
+        self._lanes_lock  = threading.RLock()                                   # protects _lanes (new lanes are added from the other threads and tasks)
+        self._task_lane   = ContextVar('timestamp_collector__task_lane', default=None)
+        self._thread_data = threading.local()
+        self._lanes.append(Timestamp_Collector__Lane(name       = self.lane_name__thread(threading.current_thread()),
+                                                     thread_id  = self.thread_id                         ,
+                                                     buffer     = self.buffer                            ,
+                                                     entries    = self.entries                           ,
+                                                     histograms = self.histograms__thread(self.thread_id)))
 
     # ═══════════════════════════════════════════════════════════════════════════
     # Context Manager
     # ═══════════════════════════════════════════════════════════════════════════
 
     def __enter__(self):
-        self.start_time_ns = time.perf_counter_ns()
-        self._active       = True
+        if self.buffer is not None:
+            self.buffer.start()
+        self._context_token = timestamp_collector__activate(self)
+        if threading.get_ident() == self.thread_id:
+            self._main_task = self.current_task()
+        self.start_time_ns  = time.perf_counter_ns()
+        self._active        = True
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.end_time_ns = time.perf_counter_ns()
         self._active     = False
+        if self._context_token is not None:
+            timestamp_collector__deactivate(self._context_token, self)
+            self._context_token = None
         return False                                                            # Don't suppress exceptions
 
     # ═══════════════════════════════════════════════════════════════════════════
@@ -68,17 +110,108 @@ class Timestamp_Collector(Type_Safe):
         return entry
 
     def enter(self, name: str, extra: Dict[str, Any] = None):                   # Record method entry
+        lane = self.lane_current()
+        if lane is None and self.histograms:
+            lane = self._lanes[0]
+        if lane is not None:                                                    # Another thread or asyncio task
+            if self._active:
+                lane.enter(name, extra)
+            return
+        if self.buffer is not None:                                             # Columnar mode (extra is not stored)
+            if self._active:
+                self.buffer.enter(name)
+            return
         entry = self.record(name, 'enter', extra)
         if entry:
             self._call_stack.append(entry)
         self._depth += 1
 
     def exit(self, name: str, extra: Dict[str, Any] = None):                    # Record method exit
+        lane = self.lane_current()
+        if lane is None and self.histograms:
+            lane = self._lanes[0]
+        if lane is not None:
+            if self._active:
+                lane.exit(name, extra)
+            return
+        if self.buffer is not None:
+            if self._active:
+                self.buffer.exit(name)
+            return
         self._depth = max(0, self._depth - 1)
         self.record(name, 'exit', extra)
         if self._call_stack:
             self._call_stack.pop()
 
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Lanes (per thread and per asyncio task)
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def current_task(self) -> Optional[Task]:
+        if asyncio__running_loop() is None:                                     # No event loop running in this thread (avoids current_task's RuntimeError)
+            return None
+        return current_task()
+
+    def lane_current(self) -> Optional[Timestamp_Collector__Lane]:              # Returns None for the main lane (recorded via the collector's own fields)
+        if asyncio__running_loop() is not None:
+            task = current_task()
+            if task is not None and task is not self._main_task:
+                value = self._task_lane.get()
+                if value is None or value[0] is not task:                       # First call in this task (the value, if any, was inherited from the parent task)
+                    lane = self.lane_new(name=f'Task: {task.get_name()}')
+                    self._task_lane.set((task, lane))
+                    return lane
+                return value[1]
+        if get_ident() == self.thread_id:
+            return None
+        lane = getattr(self._thread_data, 'lane', None)
+        if lane is None:
+            lane                   = self.lane_new(name=self.lane_name__thread(threading.current_thread()))
+            self._thread_data.lane = lane
+        return lane
+
+    def lane_name__thread(self, thread: threading.Thread) -> str:
+        return f'Thread: {thread.name} ({thread.ident})'
+
+    def lane_new(self, name: str) -> Timestamp_Collector__Lane:
+        thread_id = get_ident()
+        if self.histograms:                                                     # Not kept in _lanes (so that long running services don't accumulate one per task)
+            return Timestamp_Collector__Lane(name=name, thread_id=thread_id, histograms=self.histograms__thread(thread_id))
+        buffer = None
+        if self.buffer is not None:
+            buffer = Timestamp_Collector__Buffer(capacity=self.buffer.capacity, ring_buffer=self.buffer.ring_buffer).start()
+        lane = Timestamp_Collector__Lane(name=name, thread_id=thread_id, buffer=buffer)
+        with self._lanes_lock:
+            self._lanes.append(lane)
+        return lane
+
+    def lanes(self) -> List[Timestamp_Collector__Lane]:                         # Main lane first, then the others in creation order
+        with self._lanes_lock:
+            return list(self._lanes)
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Histograms
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def histograms__thread(self, thread_id: int) -> Optional[dict]:             # Histograms written by one thread (so no lock is needed when recording)
+        if not self.histograms:
+            return None
+        with self._lanes_lock:
+            return self._histograms.setdefault(thread_id, {})
+
+    def histograms_merged(self, reset: bool = False) -> Dict[str, Timestamp_Collector__Histogram]:
+        merged = {}                                                             # name -> histogram with the values of all threads
+        with self._lanes_lock:
+            for thread_histograms in self._histograms.values():
+                items = list(thread_histograms.items())
+                if reset:                                                       # a call recording at the same time may be lost (recording doesn't use a lock)
+                    thread_histograms.clear()
+                for name, histogram in items:
+                    if name not in merged:
+                        merged[name] = Timestamp_Collector__Histogram(name=name)
+                    merged[name].merge(histogram)
+        return merged
+
     # ═══════════════════════════════════════════════════════════════════════════
     # Basic Accessors
     # ═══════════════════════════════════════════════════════════════════════════
@@ -90,10 +223,43 @@ class Timestamp_Collector(Type_Safe):
         return self.total_duration_ns() / 1_000_000
 
     def entry_count(self) -> int:
-        return len(self.entries)
+        return sum(lane.entry_count() for lane in self.lanes())
+
+    def get_entries(self) -> List[Schema__Timestamp_Entry]:                     # Entries of all lanes merged by timestamp (materialised from the buffers in columnar mode)
+        lanes = self.lanes()
+        if len(lanes) == 1:
+            return lanes[0].get_entries()
+        return list(merge(*[lane.get_entries() for lane in lanes], key=lambda entry: entry.timestamp_ns))
+
+    def events_count(self) -> int:                                              # Events recorded so far (including the ones overwritten in ring buffer mode)
+        return sum(lane.events_count() for lane in self.lanes())
+
+    def iter_events(self) -> Iterable[tuple]:                                   # (name, event_id, timestamp_ns, depth) of all lanes, merged by timestamp
+        lanes = self.lanes()
+        if len(lanes) == 1:
+            return lanes[0].iter_events()
+        return merge(*[lane.iter_events() for lane in lanes], key=lambda event: event[2])
+
+    def aggregate(self) -> Timestamp_Collector__Aggregate:                      # Timings, call tree and flame graph stacks (shared by the analysis, reports and exports)
+        if self.histograms:                                                     # Only the method timings are available (no events)
+            aggregate                = Timestamp_Collector__Aggregate()
+            aggregate.method_timings = {name: histogram.method_timing() for name, histogram in self.histograms_merged().items()}
+            return aggregate
+        events_count = self.events_count()
+        if self._aggregate is None or self._aggregate.events_count != events_count:
+            aggregate = Timestamp_Collector__Aggregate(events_count=events_count)
+            for lane in self.lanes():                                           # Each lane has its own call stack
+                aggregate.add_events(lane.iter_events())
+            self._aggregate = aggregate
+        return self._aggregate
 
     def method_count(self) -> int:
-        return len(set(e.name for e in self.entries))
+        if self.histograms:
+            return len(self.histograms_merged())
+        lanes = self.lanes()
+        if len(lanes) == 1 and self.buffer is not None:
+            return self.buffer.method_count()
+        return len(set().union(*[lane.names() for lane in lanes]))
 
     def is_active(self) -> bool:
-        return self._active
\ No newline at end of file
+        return self._active
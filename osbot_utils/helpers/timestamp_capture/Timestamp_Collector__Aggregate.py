@@ -0,0 +1,121 @@
+"""
+Timestamp Collector Aggregate - Single Pass Analysis
+=====================================================
+
+Calculates, in one linear pass over the events, the per-method timings, the
+call tree and the flame graph (folded) stacks. It is cached by the collector
+(see Timestamp_Collector.aggregate) so that the analysis, reports and exports
+share the same results. When the collector has several lanes (threads and
+asyncio tasks), add_events is called once per lane.
+
+Each exit is matched with the most recent enter with the same name (the
+enters left open above it are closed without timings), and a per-name count
+of open enters means that exits without an enter are skipped in O(1).
+"""
+
+from typing                                                                        import Iterable, List
+from osbot_utils.helpers.timestamp_capture.schemas.capture.Schema__Method_Timing   import Schema__Method_Timing
+from osbot_utils.helpers.timestamp_capture.schemas.export.Schema__Call_Tree_Node   import Schema__Call_Tree_Node
+from osbot_utils.helpers.timestamp_capture.timestamp_capture__config               import EVENT_ENTER, EVENT_EXIT, NS_TO_MS
+from osbot_utils.type_safe.Type_Safe                                               import Type_Safe
+
+NODE__NAME, NODE__START_NS, NODE__END_NS, NODE__DEPTH, NODE__CALL_INDEX, NODE__CHILDREN, NODE__CHILD_NS = range(7)      # positions in the (lightweight) call tree nodes
+
+
+class Timestamp_Collector__Aggregate(Type_Safe):
+
+    calls_count        : int                                                   # Enters seen so far (used as the call_index of the next node)
+    events_count       : int                                                   # Events recorded by the collector when this aggregate was calculated
+    flame_graph_stacks : list                                                  # Folded stacks (plain list and dict, since the Type_Safe collections check each value)
+    method_timings     : dict                                                  # name -> Schema__Method_Timing
+    tree_roots         : list                                                  # Lightweight nodes (see NODE__*), converted by call_tree
+    _call_tree         : list                              = None              # Cached Schema__Call_Tree_Node roots
+
+    def aggregate(self, events: Iterable[tuple], events_count: int = 0):       # events are (name, event_id, timestamp_ns, depth) tuples
+        self.calls_count        = 0
+        self.events_count       = events_count
+        self.flame_graph_stacks = []
+        self.method_timings     = {}
+        self.tree_roots         = []
+        return self.add_events(events)
+
+    def add_events(self, events: Iterable[tuple]):                             # Events of one lane (with its own call stack), added to the current results
+        timings     = self.method_timings
+        stacks      = self.flame_graph_stacks
+        roots       = self.tree_roots
+        stack       = []                                                        # nodes of the open calls
+        paths       = []                                                        # paths[i] is the folded path of stack[i] (only calculated when needed)
+        open_counts = {}                                                        # name -> open calls with that name
+        call_index  = self.calls_count
+
+        for name, event, timestamp_ns, depth in events:
+            if event == EVENT_ENTER:
+                node = [name, timestamp_ns, 0, depth, call_index, [], 0]
+                call_index += 1
+                if stack:
+                    stack[-1][NODE__CHILDREN].append(node)
+                else:
+                    roots.append(node)
+                stack.append(node)
+                open_counts[name] = open_counts.get(name, 0) + 1
+
+            elif event == EVENT_EXIT:
+                if not open_counts.get(name):                                   # No matching enter
+                    continue
+                while True:                                                     # Each node is only popped once (so this is amortised O(1))
+                    node = stack.pop()
+                    if len(paths) > len(stack):
+                        paths.pop()
+                    open_counts[node[NODE__NAME]] -= 1
+                    if node[NODE__NAME] == name:
+                        break
+
+                duration_ns          = timestamp_ns - node[NODE__START_NS]
+                self_ns              = duration_ns  - node[NODE__CHILD_NS]
+                node[NODE__END_NS]   = timestamp_ns
+                if stack:
+                    stack[-1][NODE__CHILD_NS] += duration_ns
+
+                timing = timings.get(name)
+                if timing is None:
+                    timing = timings[name] = Schema__Method_Timing(name=name, min_ns=duration_ns, max_ns=duration_ns)
+                timing.call_count += 1
+                timing.total_ns   += duration_ns
+                timing.self_ns    += self_ns
+                if duration_ns < timing.min_ns: timing.min_ns = duration_ns
+                if duration_ns > timing.max_ns: timing.max_ns = duration_ns
+
+                if node[NODE__CHILDREN]:                                        # Folded stacks (in the same order as a post-order traversal of the call tree)
+                    value = self_ns // 1000 if self_ns > 0 else None            # Self-time in μs
+                else:
+                    value = duration_ns // 1000                                 # Leaf node - full duration in μs
+                if value is not None:
+                    while len(paths) < len(stack):                              # Parent paths are built once (and never for calls that don't exit)
+                        parent_name = stack[len(paths)][NODE__NAME]
+                        paths.append(f'{paths[-1]};{parent_name}' if paths else parent_name)
+                    path = f'{paths[-1]};{name}' if paths else name
+                    stacks.append(f'{path} {value}')
+
+        self.calls_count = call_index
+        self._call_tree  = None
+        return self
+
+    def call_tree(self) -> List[Schema__Call_Tree_Node]:                        # Schema__Call_Tree_Node objects are only created when needed
+        if self._call_tree is None:
+            self._call_tree = [self.call_tree_node(node) for node in self.tree_roots]
+        return self._call_tree
+
+    def call_tree_node(self, node: list) -> Schema__Call_Tree_Node:
+        tree_node = Schema__Call_Tree_Node(name       = node[NODE__NAME      ],
+                                           start_ns   = node[NODE__START_NS  ],
+                                           depth      = node[NODE__DEPTH     ],
+                                           call_index = node[NODE__CALL_INDEX])
+        if node[NODE__END_NS]:                                                  # Calls without an exit have no timings
+            tree_node.end_ns      = node[NODE__END_NS]
+            tree_node.duration_ns = tree_node.end_ns - tree_node.start_ns
+            tree_node.duration_ms = tree_node.duration_ns / NS_TO_MS
+            tree_node.self_ns     = tree_node.duration_ns - node[NODE__CHILD_NS]
+            tree_node.self_ms     = tree_node.self_ns / NS_TO_MS
+        for child in node[NODE__CHILDREN]:
+            tree_node.children.append(self.call_tree_node(child))
+        return tree_node
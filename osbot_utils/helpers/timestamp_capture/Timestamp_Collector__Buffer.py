@@ -0,0 +1,142 @@
+"""
+Timestamp Collector Buffer - Columnar Recording
+================================================
+
+Stores the enter/exit events in preallocated array columns (with the names
+interned to integer ids), instead of one Schema__Timestamp_Entry per event.
+The wall clock is captured once (as an offset from perf_counter_ns) and the
+thread_id is the collector's.
+
+Usage:
+    _timestamp_collector_ = Timestamp_Collector(columnar=True)
+    _timestamp_collector_ = Timestamp_Collector(buffer=Timestamp_Collector__Buffer(capacity=100_000, ring_buffer=True))
+"""
+
+import time
+from array                                                                         import array
+from dataclasses                                                                   import dataclass
+from itertools                                                                     import chain
+from typing                                                                        import Iterable, List
+from osbot_utils.helpers.timestamp_capture.schemas.capture.Schema__Timestamp_Entry import Schema__Timestamp_Entry
+from osbot_utils.helpers.timestamp_capture.timestamp_capture__config               import BUFFER_CAPACITY, EVENT_ENTER, EVENT_EXIT, EVENT_NAMES
+
+
+@dataclass(slots=True)                                                          # slots dataclass (like the schemas) since Type_Safe's __setattr__ is too slow for the recording path
+class Timestamp_Collector__Buffer:
+    capacity        : int   = BUFFER_CAPACITY
+    ring_buffer     : bool  = False                                             # when True the oldest events are overwritten (fixed memory), when False the columns grow
+    clock_offset_ns : int   = 0                                                 # time_ns - perf_counter_ns (captured on start)
+    count           : int   = 0                                                 # events recorded (including the ones overwritten in ring buffer mode)
+    depth           : int   = 0
+    depths          : array = None
+    events          : array = None                                              # EVENT_ENTER | EVENT_EXIT
+    name_ids        : array = None
+    names           : list  = None                                              # name_id -> name
+    names_index     : dict  = None                                              # name    -> name_id
+    timestamps      : array = None                                              # perf_counter_ns
+
+    def __post_init__(self):
+        if self.capacity < 1:
+            raise ValueError(f"in Timestamp_Collector__Buffer, capacity must be bigger than 0, and it was: {self.capacity}")
+        self.depths      = array('i', bytes(4 * self.capacity))
+        self.events      = array('b', bytes(    self.capacity))
+        self.name_ids    = array('i', bytes(4 * self.capacity))
+        self.timestamps  = array('q', bytes(8 * self.capacity))
+        self.names       = []
+        self.names_index = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Recording
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def start(self):
+        self.clock_offset_ns = time.time_ns() - time.perf_counter_ns()
+        return self
+
+    def enter(self, name: str):
+        self.append(name, EVENT_ENTER, time.perf_counter_ns())
+        self.depth += 1
+
+    def exit(self, name: str):
+        if self.depth > 0:
+            self.depth -= 1
+        self.append(name, EVENT_EXIT, time.perf_counter_ns())
+
+    def append(self, name: str, event: int, timestamp_ns: int):
+        name_id = self.names_index.get(name)
+        if name_id is None:
+            name_id = self.name_id(name)
+        index = self.count
+        if index >= self.capacity:
+            if self.ring_buffer:
+                index %= self.capacity
+            else:
+                self.grow()
+        self.depths    [index] = self.depth
+        self.events    [index] = event
+        self.name_ids  [index] = name_id
+        self.timestamps[index] = timestamp_ns
+        self.count            += 1
+
+    def grow(self):                                                             # doubles the capacity (amortised O(1) appends)
+        for column in (self.depths, self.events, self.name_ids, self.timestamps):
+            column.frombytes(bytes(column.itemsize * self.capacity))
+        self.capacity *= 2
+
+    def name_id(self, name: str) -> int:
+        name_id = self.names_index.get(name)
+        if name_id is None:
+            name_id                = len(self.names)
+            self.names_index[name] = name_id
+            self.names.append(name)
+        return name_id
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Accessors
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def events_dropped(self) -> int:                                            # events overwritten in ring buffer mode
+        return self.count - self.size()
+
+    def indexes(self) -> Iterable[int]:                                         # positions of the stored events, in recording order
+        size = self.size()
+        if self.count > size:                                                   # ring buffer has wrapped, so the oldest event is at the next write position
+            start = self.count % self.capacity
+            return chain(range(start, self.capacity), range(0, start))
+        return range(size)
+
+    def iter_events(self) -> Iterable[tuple]:                                   # (name, event_id, timestamp_ns, depth) without creating entries
+        names      = self.names
+        name_ids   = self.name_ids
+        events     = self.events
+        timestamps = self.timestamps
+        depths     = self.depths
+        for index in self.indexes():
+            yield names[name_ids[index]], events[index], timestamps[index], depths[index]
+
+    def method_count(self) -> int:
+        name_ids = self.name_ids
+        return len({name_ids[index] for index in self.indexes()})
+
+    def size(self) -> int:
+        return min(self.count, self.capacity)
+
+    def to_entries(self, thread_id: int = 0) -> List[Schema__Timestamp_Entry]:  # materialises the events (used by the reports and exports)
+        names   = self.names
+        offset  = self.clock_offset_ns
+        entries = []
+        for index in self.indexes():
+            timestamp_ns = self.timestamps[index]
+            entries.append(Schema__Timestamp_Entry(name         = names[self.name_ids[index]]    ,
+                                                   event        = EVENT_NAMES[self.events[index]],
+                                                   timestamp_ns = timestamp_ns                   ,
+                                                   clock_ns     = timestamp_ns + offset          ,
+                                                   thread_id    = thread_id                      ,
+                                                   depth        = self.depths[index]             ))
+        return entries
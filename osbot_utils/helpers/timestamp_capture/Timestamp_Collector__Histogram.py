@@ -0,0 +1,112 @@
+"""
+Timestamp Collector Histogram - Fixed Memory Latency Distribution
+==================================================================
+
+HDR-style log-linear histogram of call durations (in ns): the values below
+2**HISTOGRAM_SUB_BUCKET_BITS have one bucket each, and every power of two above
+it is split into 2**(HISTOGRAM_SUB_BUCKET_BITS - 1) buckets, so the memory is
+fixed (one array of counts) and the percentiles have a bounded relative error.
+
+Used by Timestamp_Collector(histograms=True), which keeps one histogram per
+method (per thread) instead of storing the events.
+"""
+
+from array                                                                         import array
+from dataclasses                                                                   import dataclass
+from osbot_utils.helpers.timestamp_capture.schemas.capture.Schema__Method_Timing   import Schema__Method_Timing
+from osbot_utils.helpers.timestamp_capture.timestamp_capture__config               import HISTOGRAM_SUB_BUCKET_BITS, HISTOGRAM_PERCENTILES
+
+SUB_BUCKET_COUNT = 1 << HISTOGRAM_SUB_BUCKET_BITS                               # values with their own bucket
+SUB_BUCKET_HALF  = SUB_BUCKET_COUNT >> 1                                        # buckets per power of two (above SUB_BUCKET_COUNT)
+
+
+def histogram__bucket_index(value: int) -> int:
+    if value < SUB_BUCKET_COUNT:
+        return value if value > 0 else 0
+    shift = value.bit_length() - HISTOGRAM_SUB_BUCKET_BITS
+    return SUB_BUCKET_HALF * shift + (value >> shift)
+
+def histogram__bucket_lowest(index: int) -> int:                                # smallest value stored in the bucket
+    if index < SUB_BUCKET_COUNT:
+        return index
+    shift = index // SUB_BUCKET_HALF - 1
+    return (index - SUB_BUCKET_HALF * shift) << shift
+
+def histogram__bucket_highest(index: int) -> int:                               # biggest value stored in the bucket
+    return histogram__bucket_lowest(index + 1) - 1
+
+BUCKETS_COUNT = histogram__bucket_index((1 << 63) - 1) + 1                      # enough for any int64 duration
+
+
+@dataclass(slots=True)                                                          # slots dataclass (like Schema__Method_Timing) since it is updated on every call
+class Timestamp_Collector__Histogram:
+    name     : str   = ''
+    count    : int   = 0
+    total_ns : int   = 0
+    self_ns  : int   = 0                                                        # Exclusive time (minus children)
+    min_ns   : int   = 0
+    max_ns   : int   = 0
+    buckets  : array = None
+
+    def __post_init__(self):
+        if self.buckets is None:
+            self.buckets = array('q', bytes(8 * BUCKETS_COUNT))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    def record(self, duration_ns: int, self_ns: int = None):
+        if self.count == 0 or duration_ns < self.min_ns: self.min_ns = duration_ns
+        if duration_ns > self.max_ns                   : self.max_ns = duration_ns
+        self.count    += 1
+        self.total_ns += duration_ns
+        self.self_ns  += duration_ns if self_ns is None else self_ns
+        self.buckets[histogram__bucket_index(duration_ns)] += 1
+
+    def merge(self, other: 'Timestamp_Collector__Histogram'):
+        if other.count == 0:
+            return self
+        if self.count == 0 or other.min_ns < self.min_ns: self.min_ns = other.min_ns
+        if other.max_ns > self.max_ns                   : self.max_ns = other.max_ns
+        self.count    += other.count
+        self.total_ns += other.total_ns
+        self.self_ns  += other.self_ns
+        buckets = self.buckets
+        for index, count in enumerate(other.buckets):
+            if count:
+                buckets[index] += count
+        return self
+
+    def mean_ns(self) -> float:
+        if self.count > 0:
+            return self.total_ns / self.count
+        return 0.0
+
+    def method_timing(self) -> Schema__Method_Timing:                           # so that the analysis and reports also work in histograms mode
+        return Schema__Method_Timing(name       = self.name     ,
+                                     call_count = self.count    ,
+                                     total_ns   = self.total_ns ,
+                                     min_ns     = self.min_ns   ,
+                                     max_ns     = self.max_ns   ,
+                                     self_ns    = self.self_ns  )
+
+    def percentile(self, percentile: float) -> int:                             # value (in ns) at the percentile, within the bucket's precision
+        if self.count == 0:
+            return 0
+        rank       = max(1, -(-self.count * percentile // 100))                 # ceil without floats rounding (for int percentiles)
+        cumulative = 0
+        for index, count in enumerate(self.buckets):
+            if count:
+                cumulative += count
+                if cumulative >= rank:
+                    return max(self.min_ns, min(self.max_ns, histogram__bucket_highest(index)))
+        return self.max_ns                                                      # only possible if the buckets were changed while reading them
+
+    def percentiles(self, percentiles: tuple = HISTOGRAM_PERCENTILES) -> dict:
+        return {percentile: self.percentile(percentile) for percentile in percentiles}
+
+    def sparse_buckets(self) -> dict:                                           # lowest value (in ns) of the bucket -> count (only the buckets used)
+        return {histogram__bucket_lowest(index): count for index, count in enumerate(self.buckets) if count}
@@ -0,0 +1,124 @@
+"""
+Timestamp Collector Lane - Per Thread / Per Task Recording
+===========================================================
+
+Each thread and asyncio task that records into a Timestamp_Collector gets its
+own lane (with its own depth, call stack and entries or columnar buffer), so
+concurrent calls don't corrupt each other's depths and self-times. A lane is
+only written by its own thread/task, so the appends don't need a lock.
+
+The lanes are merged by timestamp (see Timestamp_Collector.get_entries) and
+exported as one speedscope profile per lane. In histograms mode the lane only
+keeps the (start_ns, child_ns) of the open calls, and on exit records the
+duration in the per-method histograms of its thread.
+"""
+
+import threading
+import time
+from dataclasses                                                                   import dataclass
+from typing                                                                        import Any, Dict, Iterable, List
+from osbot_utils.helpers.timestamp_capture.Timestamp_Collector__Buffer             import Timestamp_Collector__Buffer
+from osbot_utils.helpers.timestamp_capture.Timestamp_Collector__Histogram          import Timestamp_Collector__Histogram
+from osbot_utils.helpers.timestamp_capture.schemas.capture.Schema__Timestamp_Entry import Schema__Timestamp_Entry
+from osbot_utils.helpers.timestamp_capture.timestamp_capture__config               import EVENT_IDS
+
+
+@dataclass(slots=True)                                                          # slots dataclass (like Timestamp_Collector__Buffer) since it is updated on every call
+class Timestamp_Collector__Lane:
+    name        : str                          = ''
+    thread_id   : int                          = 0
+    buffer      : Timestamp_Collector__Buffer  = None                           # Columnar mode
+    call_stack  : list                         = None
+    depth       : int                          = 0
+    entries     : list                         = None
+    histograms  : dict                         = None                           # Histograms mode: name -> Timestamp_Collector__Histogram (shared by the lanes of the same thread)
+
+    def __post_init__(self):
+        if self.call_stack is None: self.call_stack = []
+        if self.entries    is None: self.entries    = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Recording (only called from the lane's own thread or task)
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def enter(self, name: str, extra: Dict[str, Any] = None):
+        if self.histograms is not None:
+            self.call_stack.append([time.perf_counter_ns(), 0])                 # start_ns, child_ns
+            return
+        if self.buffer is not None:
+            self.buffer.enter(name)
+            return
+        entry = self.record(name, 'enter', extra)
+        self.call_stack.append(entry)
+        self.depth += 1
+
+    def exit(self, name: str, extra: Dict[str, Any] = None):
+        if self.histograms is not None:
+            if self.call_stack:
+                self.histogram_record(name, time.perf_counter_ns())
+            return
+        if self.buffer is not None:
+            self.buffer.exit(name)
+            return
+        self.depth = max(0, self.depth - 1)
+        self.record(name, 'exit', extra)
+        if self.call_stack:
+            self.call_stack.pop()
+
+    def histogram_record(self, name: str, end_ns: int):
+        start_ns, child_ns = self.call_stack.pop()
+        duration_ns        = end_ns - start_ns
+        if self.call_stack:
+            self.call_stack[-1][1] += duration_ns                               # child time of the parent call
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Timestamp_Collector__Histogram(name=name)
+        histogram.record(duration_ns, duration_ns - child_ns)
+
+    def record(self, name: str, event: str, extra: Dict[str, Any] = None) -> Schema__Timestamp_Entry:
+        entry = Schema__Timestamp_Entry(name         = name                   ,
+                                        event        = event                  ,
+                                        timestamp_ns = time.perf_counter_ns() ,
+                                        clock_ns     = time.time_ns()         ,
+                                        thread_id    = threading.get_ident()  ,
+                                        depth        = self.depth             ,
+                                        extra        = extra                  )
+        self.entries.append(entry)
+        return entry
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Accessors
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def events_count(self) -> int:                                              # Events recorded (including the ones overwritten in ring buffer mode)
+        if self.buffer is not None:
+            return self.buffer.count
+        return len(self.entries)
+
+    def entry_count(self) -> int:
+        if self.buffer is not None:
+            return self.buffer.size()
+        return len(self.entries)
+
+    def get_entries(self) -> List[Schema__Timestamp_Entry]:
+        if self.buffer is not None:
+            return self.buffer.to_entries(thread_id=self.thread_id)
+        return self.entries
+
+    def iter_events(self) -> Iterable[tuple]:                                   # (name, event_id, timestamp_ns, depth) in recording order
+        if self.buffer is not None:
+            return self.buffer.iter_events()
+        return ((entry.name, EVENT_IDS.get(entry.event), entry.timestamp_ns, entry.depth) for entry in self.entries)
+
+    def names(self) -> set:
+        if self.buffer is not None:
+            name_ids = self.buffer.name_ids
+            names    = self.buffer.names
+            return {names[name_ids[index]] for index in self.buffer.indexes()}
+        return {entry.name for entry in self.entries}
@@ -7,7 +7,7 @@ designed for integration with the Html_MGraph pipeline.
 
 Key Features:
 - Inherits from Type_Safe for consistency with codebase
-- Stack-walking to find collector (no signature changes needed)
+- ContextVar (with stack-walking fallback) to find collector (no signature changes needed)
 - Minimal overhead when collector not present
 - Rich timing data with aggregation
 
@@ -7,10 +7,12 @@ Exports timestamp data in various formats using Type_Safe schemas:
 - Summary export (Schema__Export_Summary)
 - Speedscope format (Schema__Speedscope)
 - Flame graph stacks (plain text)
+- Histograms snapshot (Schema__Export_Histograms)
 
 All schema-based exports support .json() roundtrip serialization.
 """
 
+import time
 from typing                                                                              import List
 from osbot_utils.helpers.timestamp_capture.actions.Timestamp_Collector__Analysis         import Timestamp_Collector__Analysis
 from osbot_utils.helpers.timestamp_capture.schemas.export.Schema__Call_Tree_Node         import Schema__Call_Tree_Node
@@ -19,6 +21,8 @@ from osbot_utils.helpers.timestamp_capture.schemas.export.Schema__Export_Entry
 from osbot_utils.helpers.timestamp_capture.schemas.export.Schema__Export_Method_Timing   import Schema__Export_Method_Timing
 from osbot_utils.helpers.timestamp_capture.schemas.export.Schema__Export_Full            import Schema__Export_Full
 from osbot_utils.helpers.timestamp_capture.schemas.export.Schema__Export_Hotspot         import Schema__Export_Hotspot
+from osbot_utils.helpers.timestamp_capture.schemas.export.Schema__Export_Histogram       import Schema__Export_Histogram
+from osbot_utils.helpers.timestamp_capture.schemas.export.Schema__Export_Histograms      import Schema__Export_Histograms
 from osbot_utils.helpers.timestamp_capture.schemas.export.Schema__Export_Summary         import Schema__Export_Summary
 from osbot_utils.helpers.timestamp_capture.schemas.speedscope.Schema__Speedscope         import Schema__Speedscope
 from osbot_utils.helpers.timestamp_capture.schemas.speedscope.Schema__Speedscope_Shared  import Schema__Speedscope_Shared
@@ -26,6 +30,7 @@ from osbot_utils.helpers.timestamp_capture.schemas.speedscope.Schema__Speedscope
 from osbot_utils.helpers.timestamp_capture.schemas.speedscope.Schema__Speedscope_Frame   import Schema__Speedscope_Frame
 from osbot_utils.helpers.timestamp_capture.schemas.speedscope.Schema__Speedscope_Event   import Schema__Speedscope_Event
 from osbot_utils.helpers.timestamp_capture.static_methods.timestamp_utils                import method_timing__total_ms, method_timing__self_ms, method_timing__avg_ms
+from osbot_utils.helpers.timestamp_capture.timestamp_capture__config                     import EVENT_ENTER, NS_TO_MS
 from osbot_utils.type_safe.Type_Safe                                                     import Type_Safe
 from osbot_utils.helpers.timestamp_capture.Timestamp_Collector                           import Timestamp_Collector
 from osbot_utils.utils.Json import json_to_str
@@ -39,49 +44,8 @@ class Timestamp_Collector__Export(Type_Safe):
     # Call Tree Building
     # ═══════════════════════════════════════════════════════════════════════════════
 
-    def build_call_tree(self) -> List[Schema__Call_Tree_Node]:                   # Build hierarchical call tree from flat entries
-        entries = self.collector.entries
-        if not entries:
-            return []
-
-        roots      = []                                                          # Top-level calls
-        stack      = []                                                          # Stack of nodes for matching enter/exit
-        call_index = 0
-
-        i = 0
-        while i < len(entries):
-            entry = entries[i]
-
-            if entry.event == 'enter':
-                node = Schema__Call_Tree_Node(
-                    name       = entry.name,
-                    start_ns   = entry.timestamp_ns,
-                    depth      = entry.depth,
-                    call_index = call_index
-                )
-                call_index += 1
-
-                if stack:
-                    stack[-1].children.append(node)                              # Add as child of current
-                else:
-                    roots.append(node)                                           # Top-level call
-
-                stack.append(node)
-
-            elif entry.event == 'exit' and stack:
-                node             = stack.pop()
-                node.end_ns      = entry.timestamp_ns
-                node.duration_ns = node.end_ns - node.start_ns
-                node.duration_ms = node.duration_ns / 1_000_000
-
-                # Calculate self-time (duration minus children)
-                child_time   = sum(child.duration_ns for child in node.children)
-                node.self_ns = node.duration_ns - child_time
-                node.self_ms = node.self_ns / 1_000_000
-
-            i += 1
-
-        return roots
+    def build_call_tree(self) -> List[Schema__Call_Tree_Node]:                   # Hierarchical call tree (built once by the collector's aggregate)
+        return self.collector.aggregate().call_tree()
 
     # ═══════════════════════════════════════════════════════════════════════════════
     # Flame Graph Format
@@ -96,28 +60,7 @@ class Timestamp_Collector__Export(Type_Safe):
         Where the number is duration in microseconds.
         Compatible with flamegraph.pl and speedscope.
         """
-        stacks = []
-        roots  = self.build_call_tree()
-
-        def traverse(node: Schema__Call_Tree_Node, path: List[str]):
-            current_path = path + [node.name]
-
-            if node.children:
-                for child in node.children:
-                    traverse(child, current_path)
-                # Add self-time as a separate entry if significant
-                if node.self_ns > 0:
-                    stack_str = ";".join(current_path)
-                    stacks.append(f"{stack_str} {node.self_ns // 1000}")         # Convert to μs
-            else:
-                # Leaf node - add full duration
-                stack_str = ";".join(current_path)
-                stacks.append(f"{stack_str} {node.duration_ns // 1000}")
-
-        for root in roots:
-            traverse(root, [])
-
-        return stacks
+        return list(self.collector.aggregate().flame_graph_stacks)
 
     def to_flame_graph_string(self) -> str:                                      # Get flame graph data as single string
         return "\n".join(self.to_flame_graph_stacks())
@@ -147,7 +90,7 @@ class Timestamp_Collector__Export(Type_Safe):
                                         clock_ns     = e.clock_ns,
                                         depth        = e.depth,
                                         thread_id    = e.thread_id)
-                for e in self.collector.entries]
+                for e in self.collector.get_entries()]
 
         # Build method timings list
         method_timings = [Schema__Export_Method_Timing( name       = mt.name,
@@ -208,6 +151,34 @@ class Timestamp_Collector__Export(Type_Safe):
     def to_summary_json(self, indent: int = 2) -> str:                           # Export summary as JSON
         return self.to_export_summary().json()
 
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Histograms Export (Type_Safe Schema)
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def to_histograms(self, reset: bool = False) -> Schema__Export_Histograms:   # Snapshot of the histograms (reset=True starts a new interval)
+        histograms = []
+        merged     = self.collector.histograms_merged(reset=reset).values()
+        for histogram in sorted(merged, key=lambda h: h.total_ns, reverse=True):  # Sorted by total time (like the reports)
+            p50, p95, p99 = (histogram.percentile(percentile) for percentile in (50, 95, 99))
+            histograms.append(Schema__Export_Histogram(name     = histogram.name                  ,
+                                                       count    = histogram.count                 ,
+                                                       total_ms = histogram.total_ns   / NS_TO_MS ,
+                                                       self_ms  = histogram.self_ns    / NS_TO_MS ,
+                                                       mean_ms  = histogram.mean_ns()  / NS_TO_MS ,
+                                                       min_ms   = histogram.min_ns     / NS_TO_MS ,
+                                                       max_ms   = histogram.max_ns     / NS_TO_MS ,
+                                                       p50_ms   = p50                  / NS_TO_MS ,
+                                                       p95_ms   = p95                  / NS_TO_MS ,
+                                                       p99_ms   = p99                  / NS_TO_MS ,
+                                                       buckets  = histogram.sparse_buckets()      ))
+        return Schema__Export_Histograms(name       = self.collector.name ,
+                                         clock_ns   = time.time_ns()      ,
+                                         reset      = reset               ,
+                                         histograms = histograms          )
+
+    def to_histograms_json(self, reset: bool = False) -> str:                    # Export histograms snapshot as JSON
+        return json_to_str(self.to_histograms(reset=reset).json())
+
     # ═══════════════════════════════════════════════════════════════════════════════
     # Speedscope Format (Type_Safe Schema)
     # ═══════════════════════════════════════════════════════════════════════════════
@@ -215,41 +186,47 @@ class Timestamp_Collector__Export(Type_Safe):
     def to_speedscope(self) -> Schema__Speedscope:                               # Export in speedscope.app format
         """
         Generates speedscope format for visualization at https://speedscope.app
-        Uses the 'evented' profile type for accurate timing.
+        Uses the 'evented' profile type for accurate timing, with one profile
+        per lane (i.e. per thread and asyncio task that recorded calls).
         """
         frames_dict = {}                                                         # name -> frame_index
         frame_list  = []
-        events      = []
-
-        for entry in self.collector.entries:
-            if entry.name not in frames_dict:
-                frames_dict[entry.name] = len(frame_list)
-                frame_list.append(Schema__Speedscope_Frame(name=entry.name))
-
-            frame_idx = frames_dict[entry.name]
-            # Convert to microseconds from start
-            at_us = (entry.timestamp_ns - self.collector.start_time_ns) / 1000
-
-            events.append(Schema__Speedscope_Event(
-                type  = 'O' if entry.event == 'enter' else 'C',                  # O=Open, C=Close
-                frame = frame_idx,
-                at    = at_us
+        profiles    = []
+        lanes       = self.collector.lanes()
+
+        for lane in lanes:
+            events = []
+            for name, event, timestamp_ns, _ in lane.iter_events():              # No need to materialise the entries (in columnar mode)
+                if name not in frames_dict:
+                    frames_dict[name] = len(frame_list)
+                    frame_list.append(Schema__Speedscope_Frame(name=name))
+
+                frame_idx = frames_dict[name]
+                # Convert to microseconds from start
+                at_us = (timestamp_ns - self.collector.start_time_ns) / 1000
+
+                events.append(Schema__Speedscope_Event(
+                    type  = 'O' if event == EVENT_ENTER else 'C',                # O=Open, C=Close
+                    frame = frame_idx,
+                    at    = at_us
+                ))
+
+            if profiles and not events:                                          # Lanes without events are skipped (the main one is always exported)
+                continue
+            profiles.append(Schema__Speedscope_Profile(
+                type       = 'evented',
+                name       = self.collector.name if len(lanes) == 1 else f'{self.collector.name} | {lane.name}',
+                unit       = 'microseconds',
+                startValue = 0,
+                endValue   = self.collector.total_duration_ns() / 1000,
+                events     = events
             ))
 
-        profile = Schema__Speedscope_Profile(
-            type       = 'evented',
-            name       = self.collector.name,
-            unit       = 'microseconds',
-            startValue = 0,
-            endValue   = self.collector.total_duration_ns() / 1000,
-            events     = events
-        )
-
         shared = Schema__Speedscope_Shared(frames=frame_list)
 
         return Schema__Speedscope(
             shared             = shared,
-            profiles           = [profile],
+            profiles           = profiles,
             name               = self.collector.name,
             activeProfileIndex = 0
         )
@@ -82,7 +82,7 @@ class Timestamp_Collector__Report(Type_Safe):
         return "\n".join(lines)
 
     def format_timeline(self, max_entries: int = 100) -> str:                    # Format timeline view
-        entries = self.collector.entries[:max_entries]
+        entries = self.collector.get_entries()[:max_entries]
 
         # Calculate width based on deepest indent + longest name
         if entries:
@@ -98,8 +98,9 @@ class Timestamp_Collector__Report(Type_Safe):
         lines.append("Execution Timeline")
         lines.append("=" * total_width)
 
-        if len(self.collector.entries) > max_entries:
-            lines.append(f"(showing first {max_entries} of {len(self.collector.entries)} entries)")
+        entry_count = self.collector.entry_count()
+        if entry_count > max_entries:
+            lines.append(f"(showing first {max_entries} of {entry_count} entries)")
 
         for entry in entries:
             offset_ms = (entry.timestamp_ns - self.collector.start_time_ns) / 1_000_000
@@ -0,0 +1,79 @@
+"""
+Timestamp Collector Snapshots
+==============================
+
+Periodic export of the histograms of a Timestamp_Collector(histograms=True),
+from a background thread. Each snapshot covers one interval (the histograms
+are reset after each one) and is passed to on_snapshot, or kept in snapshots
+(which only holds the most recent ones).
+
+Usage:
+    _timestamp_collector_ = Timestamp_Collector(histograms=True, all_threads=True)
+    with _timestamp_collector_:
+        with Timestamp_Collector__Snapshots(collector=_timestamp_collector_, interval=60, on_snapshot=send_metrics):
+            run_service()
+"""
+
+import threading
+from collections                                                                     import deque
+from threading                                                                       import Event, Thread
+from typing                                                                          import Callable
+from osbot_utils.helpers.timestamp_capture.Timestamp_Collector                       import Timestamp_Collector
+from osbot_utils.helpers.timestamp_capture.actions.Timestamp_Collector__Export       import Timestamp_Collector__Export
+from osbot_utils.helpers.timestamp_capture.schemas.export.Schema__Export_Histograms  import Schema__Export_Histograms
+from osbot_utils.helpers.timestamp_capture.timestamp_capture__config                 import SNAPSHOT_INTERVAL
+from osbot_utils.type_safe.Type_Safe                                                 import Type_Safe
+
+SNAPSHOTS__MAX_KEPT     = 100
+SNAPSHOTS__THREAD_NAME  = 'Timestamp_Collector__Snapshots'
+
+
+class Timestamp_Collector__Snapshots(Type_Safe):
+
+    collector   : Timestamp_Collector = None
+    interval    : float               = SNAPSHOT_INTERVAL                       # Seconds between snapshots
+    on_snapshot : Callable            = None                                    # Called with each Schema__Export_Histograms (from the background thread)
+    snapshots   : deque               = None                                    # Used when there is no on_snapshot
+    stop_event  : Event               = None
+    thread      : Thread              = None
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        if self.interval <= 0:
+            raise ValueError(f"in Timestamp_Collector__Snapshots, interval must be bigger than 0, and it was: {self.interval}")
+        self.snapshots  = deque(maxlen=SNAPSHOTS__MAX_KEPT)
+        self.stop_event = threading.Event()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+        return False
+
+    def run_thread(self):
+        while self.stop_event.wait(self.interval) is False:
+            self.snapshot()
+
+    def snapshot(self) -> Schema__Export_Histograms:                            # Exports (and resets) the histograms
+        snapshot = Timestamp_Collector__Export(collector=self.collector).to_histograms(reset=True)
+        if self.on_snapshot:
+            self.on_snapshot(snapshot)
+        else:
+            self.snapshots.append(snapshot)
+        return snapshot
+
+    def start(self):
+        if self.thread is None:
+            self.stop_event.clear()
+            self.thread = Thread(target=self.run_thread, name=SNAPSHOTS__THREAD_NAME, daemon=True)
+            self.thread.start()
+        return self
+
+    def stop(self):                                                             # Also exports the values recorded since the last snapshot
+        if self.thread:
+            self.stop_event.set()
+            self.thread.join()
+            self.thread = None
+            self.snapshot()
+        return self
@@ -14,7 +14,8 @@ Timestamp Capture - @timestamp decorator
 
 from functools                                                                     import wraps
 from typing                                                                        import Callable, Optional
-from osbot_utils.helpers.timestamp_capture.static_methods.find_timestamp_collector import find_timestamp_collector
+from osbot_utils.helpers.timestamp_capture.static_methods.find_timestamp_collector     import find_timestamp_collector__fallback
+from osbot_utils.helpers.timestamp_capture.static_methods.timestamp_collector__context import timestamp_collector__context
 
 
 def timestamp(func: Callable = None, *, name: str = None):          #  Decorator to capture method timestamps.
@@ -24,10 +25,11 @@ def timestamp(func: Callable = None, *, name: str = None):          #  Decorator
 
         @wraps(fn)
         def wrapper(*args, **kwargs):
-            collector = find_timestamp_collector()
-
+            collector = timestamp_collector__context.get()                         # Fast path (a single ContextVar lookup when there is no collector)
             if collector is None:
-                return fn(*args, **kwargs)
+                collector = find_timestamp_collector__fallback()                   # Only walks the stack if a collector is active in another context
+                if collector is None:
+                    return fn(*args, **kwargs)
 
             collector.enter(method_name)
             try:
@@ -21,7 +21,8 @@ For static names, use @timestamp instead (lower overhead).
 import inspect
 from functools                                                                     import wraps
 from typing                                                                        import Callable
-from osbot_utils.helpers.timestamp_capture.static_methods.find_timestamp_collector import find_timestamp_collector
+from osbot_utils.helpers.timestamp_capture.static_methods.find_timestamp_collector     import find_timestamp_collector__fallback
+from osbot_utils.helpers.timestamp_capture.static_methods.timestamp_collector__context import timestamp_collector__context
 
 
 def timestamp_args(*, name: str):                                                  # Decorator with dynamic name from args
@@ -35,10 +36,11 @@ def timestamp_args(*, name: str):
 
         @wraps(fn)
         def wrapper(*args, **kwargs):
-            collector = find_timestamp_collector()
-
+            collector = timestamp_collector__context.get()                         # Fast path (a single ContextVar lookup when there is no collector)
             if collector is None:
-                return fn(*args, **kwargs)
+                collector = find_timestamp_collector__fallback()                   # Only walks the stack if a collector is active in another context
+                if collector is None:
+                    return fn(*args, **kwargs)
 
             try:                                                                   # Resolve dynamic name from arguments
                 bound = fn_signature.bind(*args, **kwargs)
@@ -0,0 +1,20 @@
+"""
+Schema for Export Histogram - per-method latency distribution
+"""
+
+from typing                          import Dict
+from osbot_utils.type_safe.Type_Safe import Type_Safe
+
+
+class Schema__Export_Histogram(Type_Safe):                                       # Latency distribution of one method
+    name     : str   = ''
+    count    : int   = 0
+    total_ms : float = 0.0
+    self_ms  : float = 0.0
+    mean_ms  : float = 0.0
+    min_ms   : float = 0.0
+    max_ms   : float = 0.0
+    p50_ms   : float = 0.0
+    p95_ms   : float = 0.0
+    p99_ms   : float = 0.0
+    buckets  : Dict[int, int]                                                    # lowest value (in ns) of the bucket -> count (only the buckets used)
@@ -0,0 +1,14 @@
+"""
+Schema for Export Histograms - snapshot of the per-method histograms
+"""
+
+from typing                                                                        import List
+from osbot_utils.type_safe.Type_Safe                                               import Type_Safe
+from osbot_utils.helpers.timestamp_capture.schemas.export.Schema__Export_Histogram import Schema__Export_Histogram
+
+
+class Schema__Export_Histograms(Type_Safe):                                      # Snapshot of Timestamp_Collector(histograms=True)
+    name        : str   = ''
+    clock_ns    : int   = 0                                                      # Wall clock when the snapshot was taken
+    reset       : bool  = False                                                  # True if the histograms were cleared after this snapshot (i.e. it covers one interval)
+    histograms  : List[Schema__Export_Histogram]
@@ -0,0 +1,24 @@
+"""
+Timestamp Capture - running event loop lookup
+===============================================
+
+Timestamp_Collector.lane_current checks for a running event loop on every
+enter/exit, so this needs to be cheap in threads without one.
+
+asyncio.get_running_loop() raises RuntimeError when there is no loop (about
+10x slower than a lookup that returns None). asyncio exports that lookup as
+asyncio._get_running_loop (it is in asyncio.__all__, for event loop
+implementations), which is used when available.
+"""
+
+import asyncio
+from typing     import Optional
+
+
+def asyncio__running_loop__fallback() -> Optional[asyncio.AbstractEventLoop]:      # Same result via the public API (used if asyncio stops exporting _get_running_loop)
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+asyncio__running_loop = getattr(asyncio, '_get_running_loop', asyncio__running_loop__fallback)   # Returns the running loop of the current thread (or None)
@@ -1,13 +1,39 @@
 import sys
-from typing                                                             import Optional
-from osbot_utils.helpers.timestamp_capture.Timestamp_Collector          import Timestamp_Collector
-from osbot_utils.helpers.timestamp_capture.timestamp_capture__config    import MAX_STACK_DEPTH, COLLECTOR_VAR_NAME
+import threading
+from typing                                                                             import Optional
+from osbot_utils.helpers.timestamp_capture.Timestamp_Collector                          import Timestamp_Collector
+from osbot_utils.helpers.timestamp_capture.static_methods.timestamp_collector__context import timestamp_collector__context, timestamp_collectors__active, timestamp_collector__all_threads, timestamp_collectors__generation
+from osbot_utils.helpers.timestamp_capture.timestamp_capture__config                    import MAX_STACK_DEPTH, COLLECTOR_VAR_NAME
 
+_fallback_cache = threading.local()                                     # (generation, collector) resolved by find_timestamp_collector__fallback in the current thread
 
-def find_timestamp_collector(max_depth: int = MAX_STACK_DEPTH           # Walk call stack to find Timestamp_Collector
+
+def find_timestamp_collector(max_depth: int = MAX_STACK_DEPTH           # Find the active collector (ContextVar first, then stack walk)
                             ) -> Optional[Timestamp_Collector]:         # Returns None if not found (instrumentation disabled)
 
-    frame = sys._getframe(1)
+    collector = timestamp_collector__context.get()                      # Set by Timestamp_Collector.__enter__
+    if collector is not None:
+        return collector
+    return find_timestamp_collector__in_stack(sys._getframe(1), max_depth)
+
+
+def find_timestamp_collector__fallback(max_depth: int = MAX_STACK_DEPTH # Used by the decorators when the ContextVar lookup returned None
+                                      ) -> Optional[Timestamp_Collector]:
+    if timestamp_collectors__active() == 0:                             # No collector entered anywhere, so skip the (expensive) stack walk
+        return None
+    generation = timestamp_collectors__generation()
+    cached     = getattr(_fallback_cache, 'value', None)
+    if cached is not None and cached[0] == generation:                  # Already resolved in this thread (and no collector was entered or exited since)
+        return cached[1]
+    collector = find_timestamp_collector__in_stack(sys._getframe(1), max_depth)
+    if collector is None:
+        collector = timestamp_collector__all_threads()                  # For example, calls from thread pool workers
+    _fallback_cache.value = (generation, collector)
+    return collector
+
+
+def find_timestamp_collector__in_stack(frame, max_depth: int = MAX_STACK_DEPTH      # Walk call stack to find Timestamp_Collector
+                                      ) -> Optional[Timestamp_Collector]:
 
     for _ in range(max_depth):
         if frame is None:
@@ -20,4 +46,4 @@ def find_timestamp_collector(max_depth: int = MAX_STACK_DEPTH           # Walk c
 
         frame = frame.f_back
 
-    return None
\ No newline at end of file
+    return None
@@ -0,0 +1,59 @@
+"""
+Timestamp Capture - active collector context
+==============================================
+
+Timestamp_Collector.__enter__ publishes the collector in a ContextVar, which
+is what the @timestamp decorators check first (a single ContextVar.get when
+there is no collector). The count of active collectors is used to decide if
+the (much slower) stack-walk fallback is needed.
+
+Threads started outside the collector's context (like thread pool workers)
+don't see the ContextVar, so the collectors created with all_threads=True are
+also registered here, to be used when nothing else is found.
+
+The generation changes every time a collector is entered or exited, which is
+what find_timestamp_collector__fallback uses to cache its (per thread) result.
+"""
+
+import threading
+from contextvars                                                    import ContextVar
+
+timestamp_collector__context = ContextVar('timestamp_collector__context', default=None)   # collector entered in the current context (also seen by the asyncio tasks created inside it)
+
+_active_count = 0                                                                          # number of collectors currently entered (in any thread or context)
+_active_lock  = threading.Lock()
+_generation   = 0                                                                          # incremented on every activate and deactivate
+_all_threads  = []                                                                         # entered collectors with all_threads=True (most recent last)
+
+
+def timestamp_collectors__active() -> int:
+    return _active_count
+
+def timestamp_collectors__generation() -> int:
+    return _generation
+
+def timestamp_collector__all_threads():                                                    # collector to use in threads that can't find one
+    if _all_threads:
+        return _all_threads[-1]
+    return None
+
+def timestamp_collector__activate(collector):                                              # returns the token needed by timestamp_collector__deactivate
+    global _active_count, _generation
+    with _active_lock:
+        _active_count += 1
+        _generation   += 1
+        if collector.all_threads:
+            _all_threads.append(collector)
+    return timestamp_collector__context.set(collector)
+
+def timestamp_collector__deactivate(token, collector=None):
+    global _active_count, _generation
+    with _active_lock:
+        _active_count = max(0, _active_count - 1)
+        _generation  += 1
+        if collector in _all_threads:
+            _all_threads.remove(collector)
+    try:
+        timestamp_collector__context.reset(token)
+    except ValueError:                                                                     # token was created in a different context (for example __exit__ called from another task)
+        timestamp_collector__context.set(None)
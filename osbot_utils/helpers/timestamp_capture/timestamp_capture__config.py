@@ -3,4 +3,12 @@
 MAX_STACK_DEPTH      : int = 50                             # Max frames to walk looking for collector
 COLLECTOR_VAR_NAME   : str = '_timestamp_collector_'        # Magic variable name to search for
 OVERHEAD_THRESHOLD_NS: int = 1000                           # 1μs - warn if overhead exceeds
-NS_TO_MS             : int = 1_000_000                       # nanoseconds to milliseconds
\ No newline at end of file
+NS_TO_MS             : int = 1_000_000                       # nanoseconds to milliseconds
+BUFFER_CAPACITY      : int = 65_536                         # Initial capacity (events) of Timestamp_Collector__Buffer
+EVENT_ENTER          : int = 0                              # Event ids used by Timestamp_Collector__Buffer
+EVENT_EXIT           : int = 1
+EVENT_NAMES          : tuple = ('enter', 'exit')            # Event id -> Schema__Timestamp_Entry.event
+EVENT_IDS            : dict  = {'enter': 0, 'exit': 1}      # Schema__Timestamp_Entry.event -> Event id
+HISTOGRAM_SUB_BUCKET_BITS : int   = 6                      # Timestamp_Collector__Histogram: 2**(bits-1) buckets per power of two (max relative error ~3%)
+HISTOGRAM_PERCENTILES     : tuple = (50, 95, 99)           # Percentiles included in the histogram exports
+SNAPSHOT_INTERVAL         : float = 60.0                   # Seconds between the periodic histogram snapshots
@@ -3,14 +3,24 @@ import sys
 import threading
 from functools                                              import wraps
 from osbot_utils.base_classes.Kwargs_To_Self                import Kwargs_To_Self
-from osbot_utils.helpers.trace.Trace_Call__Config           import Trace_Call__Config, PRINT_MAX_STRING_LENGTH
+from osbot_utils.helpers.trace.Trace_Call__Config           import Trace_Call__Config, PRINT_MAX_STRING_LENGTH, TRACE_BACKEND__SETTRACE, TRACE_BACKEND__SETPROFILE, TRACE_BACKEND__MONITORING, TRACE_BACKEND__SAMPLING
 from osbot_utils.helpers.trace.Trace_Call__Handler          import Trace_Call__Handler
+from osbot_utils.helpers.trace.Trace_Call__Sampler          import Trace_Call__Sampler
+from osbot_utils.helpers.trace.Trace_Call__Sink             import Trace_Call__Sink
+from osbot_utils.helpers.trace.Trace_Call__Sink__Json_Lines import Trace_Call__Sink__Json_Lines
+from osbot_utils.helpers.trace.Trace_Call__Sink__Tree       import Trace_Call__Sink__Tree
 from osbot_utils.helpers.trace.Trace_Call__Print_Lines      import Trace_Call__Print_Lines
 from osbot_utils.helpers.trace.Trace_Call__Print_Traces     import Trace_Call__Print_Traces
 from osbot_utils.helpers.trace.Trace_Call__View_Model       import Trace_Call__View_Model
 from osbot_utils.testing.Stdout                             import Stdout
 from osbot_utils.utils.Str                                  import ansi_to_text
 
+MONITORING__GENERAL_TOOL_IDS = [3, 4]                                                          # sys.monitoring tool ids that (unlike DEBUGGER_ID, COVERAGE_ID, PROFILER_ID and OPTIMIZER_ID) have no pre-defined use
+
+def monitoring__events():                                                                       # sys.monitoring events used by the TRACE_BACKEND__MONITORING backend (sys.monitoring is only available in 3.12+)
+    events = sys.monitoring.events
+    return events.PY_START | events.PY_RESUME | events.PY_RETURN | events.PY_YIELD | events.PY_UNWIND
+
 
 def trace_calls(title         = None , print_traces = True , show_locals    = False, source_code          = False ,
                 ignore        = None , include      = None , show_path      = False, duration_bigger_than = 0     ,
@@ -62,6 +72,11 @@ class Trace_Call(Kwargs_To_Self):
         self.config.print_max_string_length                     = self.config.print_max_string_length  or PRINT_MAX_STRING_LENGTH
         self.stack                                              = self.trace_call_handler.stack
         self.trace_on_thread__data                              = {}
+        self.prev_profile_function                              = None
+        self.prev_thread_function                               = None                          # trace (or profile) function used by the other threads before trace_threads was enabled
+        self.trace_backend                                      = ''                            # backend used by the current trace session (see Trace_Call__Config.trace_backend)
+        self.monitoring_tool_id                                 = None                          # sys.monitoring tool id used by the current trace session (when the trace_backend is TRACE_BACKEND__MONITORING)
+        self.trace_call_sampler                                 = None                          # set when the trace_backend is TRACE_BACKEND__SAMPLING
         #self.prev_trace_function                                = None                                                # Stores the previous trace function
 
 
@@ -89,6 +104,9 @@ class Trace_Call(Kwargs_To_Self):
         return self
 
     def view_data(self):
+        if self.stack.sink:                                                                     # when streaming, the tree needs to be rebuilt from the sink events
+            sink_tree = Trace_Call__Sink__Tree(config=self.config).add_events(self.stack.sink.events())
+            return self.trace_call_view_model.create(sink_tree.stack())
         return self.trace_call_view_model.create(self.stack)
 
     def print(self):
@@ -110,12 +128,89 @@ class Trace_Call(Kwargs_To_Self):
         print_lines = Trace_Call__Print_Lines(config=self.config, view_model=view_model)
         print_lines.print_lines()
 
+    def sink__create(self):
+        if self.config.trace_backend == TRACE_BACKEND__SAMPLING:                               # the sampler's tree is already aggregated (i.e. its size is not bound to the trace duration)
+            return None
+        if self.config.trace_sink_path:
+            return Trace_Call__Sink__Json_Lines(config=self.config)
+        if self.config.trace_sink_max_events:
+            return Trace_Call__Sink(config=self.config)
+
     def start(self):
+        self.stack.sink = self.sink__create()                                                   # needs to be set before the root node is added
         self.trace_call_handler.stack.add_node(title=self.trace_call_handler.config.title)
+        self.trace_call_handler.capture_filter__compile()                                       # the config might have changed since the last session
+        self.trace_call_handler.stacks__setup()
+        self.trace_backend       = self.config.trace_backend
+        if self.trace_backend == TRACE_BACKEND__SAMPLING:
+            self.started = True
+            return self.start__sampling()
+        if self.trace_backend == TRACE_BACKEND__MONITORING:
+            if hasattr(sys, 'monitoring'):
+                self.start__monitoring()
+                self.started = True
+                return
+            self.trace_backend = TRACE_BACKEND__SETPROFILE                                      # sys.monitoring is only available in 3.12+
+        if self.trace_backend == TRACE_BACKEND__SETPROFILE:
+            self.prev_profile_function = sys.getprofile()
+            self.started               = True
+            self.start__threads(self.trace_call_handler.trace_profile)
+            sys.setprofile(self.trace_call_handler.trace_profile)
+            return
         self.prev_trace_function = sys.gettrace()
         self.started             = True                                                         # set this here so that it does show in the trace
+        self.start__threads(self.trace_call_handler.trace_calls)
         sys.settrace(self.trace_call_handler.trace_calls)                                       # Set the new trace function
 
+    def start__monitoring(self):
+        monitoring = sys.monitoring
+        tool_id    = self.monitoring__free_tool_id()
+        events     = monitoring.events
+        handler    = self.trace_call_handler
+        handler.thread_id       = threading.get_ident()
+        monitoring.use_tool_id      (tool_id, 'Trace_Call')
+        self.monitoring_tool_id = tool_id
+        monitoring.register_callback(tool_id, events.PY_START , handler.monitoring__py_start )
+        monitoring.register_callback(tool_id, events.PY_RESUME, handler.monitoring__py_start )     # like settrace, a generator (or coroutine) that is resumed is a new call ...
+        monitoring.register_callback(tool_id, events.PY_RETURN, handler.monitoring__py_return)
+        monitoring.register_callback(tool_id, events.PY_YIELD , handler.monitoring__py_return)     # ... and one that yields (or awaits) returns (otherwise it would stay in the stack)
+        monitoring.register_callback(tool_id, events.PY_UNWIND, handler.monitoring__py_unwind)
+        monitoring.set_events       (tool_id, monitoring__events())
+
+    def monitoring__free_tool_id(self):                                                        # PROFILER_ID can already be used (for example by cProfile), in which case one of the ids without a reserved use is tried
+        monitoring = sys.monitoring
+        tool_ids   = [monitoring.PROFILER_ID] + [tool_id for tool_id in MONITORING__GENERAL_TOOL_IDS if tool_id != monitoring.PROFILER_ID]
+        for tool_id in tool_ids:
+            if monitoring.get_tool(tool_id) is None:
+                return tool_id
+        tools_in_use = {tool_id: monitoring.get_tool(tool_id) for tool_id in tool_ids}
+        raise ValueError(f"in Trace_Call, there are no free sys.monitoring tool ids (the ones that can be used are taken by: {tools_in_use}), "
+                         f"use the '{TRACE_BACKEND__SETPROFILE}' or '{TRACE_BACKEND__SETTRACE}' trace_backend instead")
+
+    def start__sampling(self):                                                                  # the samples are added to the current root node (so that they can be printed and viewed like the other backends)
+        thread_ids              = [] if self.config.sampling_all_threads else [threading.get_ident()]
+        self.trace_call_sampler = Trace_Call__Sampler(config         = self.config                               ,
+                                                      capture_filter = self.trace_call_handler.capture_filter    ,
+                                                      root_node      = self.stack.root_node                      ,
+                                                      thread_ids     = thread_ids                                )
+        self.trace_call_sampler.start()
+
+    def start__threads(self, trace_function):                                                  # when trace_threads is set, also trace the other threads (the ones already running are only traced in 3.12+)
+        if self.config.trace_threads:
+            if self.trace_backend == TRACE_BACKEND__SETPROFILE:
+                self.prev_thread_function = threading.getprofile()
+                self.set_threads_function(threading.setprofile, 'setprofile_all_threads', trace_function)
+            else:
+                self.prev_thread_function = threading.gettrace()
+                self.set_threads_function(threading.settrace  , 'settrace_all_threads'  , trace_function)
+
+    def set_threads_function(self, set_function, set_all_threads_name, trace_function):
+        set_all_threads_function = getattr(threading, set_all_threads_name, None)
+        if set_all_threads_function:
+            set_all_threads_function(trace_function)
+        else:
+            set_function(trace_function)
+
     def start__on_thread(self, root_node=None):
         if sys.gettrace() is None:
             current_thread    = threading.current_thread()
@@ -140,10 +235,43 @@ class Trace_Call(Kwargs_To_Self):
 
     def stop(self):
         if self.started:
-            sys.settrace(self.prev_trace_function)                                              # Restore the previous trace function
+            if self.trace_backend == TRACE_BACKEND__SAMPLING:
+                self.trace_call_sampler.stop()
+            elif self.trace_backend == TRACE_BACKEND__MONITORING:
+                self.stop__monitoring()
+            elif self.trace_backend == TRACE_BACKEND__SETPROFILE:
+                if self.config.trace_threads:                                                   # checked here so that stop__threads doesn't show in the trace
+                    self.stop__threads()
+                sys.setprofile(self.prev_profile_function)
+            else:
+                if self.config.trace_threads:
+                    self.stop__threads()
+                sys.settrace(self.prev_trace_function)                                          # Restore the previous trace function
             self.stack.empty_stack()
+            self.trace_call_handler.stacks__merge()
+            if self.stack.sink:
+                self.stack.sink.close()
+            self.trace_call_handler.capture_filter__reset()
             self.started = False
 
+    def stop__monitoring(self):
+        monitoring = sys.monitoring
+        tool_id    = self.monitoring_tool_id
+        events     = monitoring.events
+        monitoring.set_events(tool_id, events.NO_EVENTS)
+        for event in (events.PY_START, events.PY_RESUME, events.PY_RETURN, events.PY_YIELD, events.PY_UNWIND):
+            monitoring.register_callback(tool_id, event, None)
+        monitoring.restart_events()                                                             # re-enable the code locations that were DISABLEd during this session
+        monitoring.free_tool_id(tool_id)
+        self.monitoring_tool_id = None
+
+    def stop__threads(self):
+        if self.trace_backend == TRACE_BACKEND__SETPROFILE:
+            self.set_threads_function(threading.setprofile, 'setprofile_all_threads', self.prev_thread_function)
+        else:
+            self.set_threads_function(threading.settrace  , 'settrace_all_threads'  , self.prev_thread_function)
+        self.prev_thread_function = None
+
     def stop__on_thread(self):
         current_thread = threading.current_thread()
         thread_id      = current_thread.native_id
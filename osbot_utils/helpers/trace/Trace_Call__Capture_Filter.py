@@ -0,0 +1,72 @@
+import re
+from osbot_utils.base_classes.Kwargs_To_Self        import Kwargs_To_Self
+from osbot_utils.helpers.trace.Trace_Call__Config   import Trace_Call__Config
+
+
+def regex__any_of(items, prefix=''):                                    # compiles a list of strings into a single regex (None when there are no items)
+    if not items:
+        return None
+    alternatives = '|'.join(re.escape(item) for item in items)
+    return re.compile(f'{prefix}(?:{alternatives})')
+
+
+def capture_rules(config: Trace_Call__Config):                         # fingerprint of the config values compiled by Trace_Call__Capture_Filter (the lists are copied, so that in place changes are also detected)
+    return (config.trace_capture_all                          ,
+            tuple(config.trace_capture_start_with or [])      ,
+            tuple(config.trace_capture_contains   or [])      ,
+            tuple(config.trace_ignore_start_with  or [])      ,
+            tuple(config.trace_ignore_contains    or [])      ,
+            config.trace_show_internals                       )
+
+
+class Trace_Call__Capture_Filter(Kwargs_To_Self):                       # compiled version of the Trace_Call__Handler.should_capture config checks (the callers memoise the result per code object)
+    capture_all          : bool
+    capture_rules        : tuple                                        # the capture_rules(config) that were compiled
+    capture_start_all    : bool                                         # set when trace_capture_start_with contains '*'
+    functions_to_ignore  : set
+    modules_to_ignore    : set
+    regex_capture_start  : re.Pattern = None
+    regex_capture_any    : re.Pattern = None
+    regex_ignore_start   : re.Pattern = None
+    regex_ignore_any     : re.Pattern = None
+    show_internals       : bool
+
+    def compile(self, config: Trace_Call__Config, modules_to_ignore=None, functions_to_ignore=None):
+        capture_start_with       = [item for item in config.trace_capture_start_with or [] if item]       # empty capture queries are skipped (since they would always match)
+        capture_contains         = [item for item in config.trace_capture_contains   or [] if item]
+        self.capture_rules       = capture_rules(config)
+        self.capture_all         = config.trace_capture_all
+        self.capture_start_all   = '*' in capture_start_with
+        self.functions_to_ignore = set(functions_to_ignore or [])
+        self.modules_to_ignore   = set(modules_to_ignore   or [])
+        self.regex_capture_start = regex__any_of(capture_start_with, prefix='^')
+        self.regex_capture_any   = regex__any_of(capture_contains)
+        self.regex_ignore_start  = regex__any_of(config.trace_ignore_start_with or [], prefix='^')
+        self.regex_ignore_any    = regex__any_of(config.trace_ignore_contains   or [])
+        self.show_internals      = config.trace_show_internals
+        return self
+
+    def is_stale(self, config: Trace_Call__Config):                      # True when the config capture rules changed since compile
+        return self.capture_rules != capture_rules(config)
+
+    def should_capture(self, module, func_name):                        # same rules as Trace_Call__Handler.should_capture__config
+        if module in self.modules_to_ignore or func_name in self.functions_to_ignore:
+            return False
+        if not (module and func_name):
+            return False
+        capture = (self.capture_all                                                                                  or
+                   self.capture_start_all                                                                            or
+                   (self.regex_capture_start is not None and self.regex_capture_start.match (module) is not None)   or
+                   (self.regex_capture_any   is not None and (self.regex_capture_any.search(module   ) is not None  or
+                                                              self.regex_capture_any.search(func_name) is not None)))
+        if capture is False:
+            return False
+        if self.show_internals is False and func_name.startswith('_'):
+            return False
+        if self.regex_ignore_start is not None:
+            if self.regex_ignore_start.match(module) or self.regex_ignore_start.match(func_name):
+                return False
+        if self.regex_ignore_any is not None:
+            if self.regex_ignore_any.search(module) or self.regex_ignore_any.search(func_name):
+                return False
+        return True
@@ -6,6 +6,13 @@ from osbot_utils.utils.Dev              import pprint                   # todo:
 PRINT_MAX_STRING_LENGTH    = 100
 PRINT_PADDING__DURATION    = 100
 PRINT_PADDING_PARENT_INFO  = 60
+TRACE_BACKEND__SETTRACE    = 'settrace'                 # sys.settrace: call, line and return events for every frame (needed for trace_capture_lines)
+TRACE_BACKEND__SETPROFILE  = 'setprofile'               # sys.setprofile: only call and return events (no per frame trace function)
+TRACE_BACKEND__MONITORING  = 'monitoring'               # PEP 669 sys.monitoring (3.12+), where code objects that are not captured are disabled after the first call
+TRACE_BACKEND__SAMPLING    = 'sampling'                 # statistical profiler (see Trace_Call__Sampler), where a background thread periodically samples the stack
+TRACE_BACKENDS             = [TRACE_BACKEND__SETTRACE, TRACE_BACKEND__SETPROFILE, TRACE_BACKEND__MONITORING, TRACE_BACKEND__SAMPLING]
+TRACE_SAMPLING__INTERVAL   = 0.01                       # 100 samples per second
+TRACE_SINK__MAX_EVENTS     = 100000
 
 class Trace_Call__Config(Type_Safe):
     capture_locals             : bool = False
@@ -22,11 +29,15 @@ class Trace_Call__Config(Type_Safe):
     print_locals               : bool
     print_traces_on_exit       : bool
     print_lines_on_exit        : bool
+    sampling_all_threads       : bool                   # when False only the thread that started the trace is sampled
+    sampling_interval          : float = TRACE_SAMPLING__INTERVAL
     show_parent_info           : bool = False
     show_caller                : bool
     show_method_class          : bool = True
     show_source_code_path      : bool
     title                      : str
+    trace_async_tasks          : bool                   # when True, each asyncio task is captured in its own stack (see Trace_Call__Stacks)
+    trace_backend              : str  = TRACE_BACKEND__SETTRACE
     trace_capture_all          : bool
     trace_capture_source_code  : bool
     trace_capture_start_with   : list
@@ -36,6 +47,9 @@ class Trace_Call__Config(Type_Safe):
     trace_ignore_contains      : list
     trace_capture_lines        : bool
     trace_show_internals       : bool
+    trace_sink_max_events      : int                    # when set (and there is no trace_sink_path), the trace events are kept in a ring buffer (see Trace_Call__Sink)
+    trace_sink_path            : str                    # when set, the trace events are streamed to this json-lines file (see Trace_Call__Sink__Json_Lines)
+    trace_threads              : bool                   # when True, all threads are traced (each in its own stack)
     trace_up_to_depth          : int
     with_duration_bigger_than  : float
 
@@ -49,6 +63,12 @@ class Trace_Call__Config(Type_Safe):
         self.trace_up_to_depth    = up_to_depth
         return self
 
+    def backend(self, trace_backend):
+        if trace_backend not in TRACE_BACKENDS:
+            raise ValueError(f"in Trace_Call__Config.backend, invalid trace_backend '{trace_backend}', it must be one of: {TRACE_BACKENDS}")
+        self.trace_backend = trace_backend
+        return self
+
     def capture(self, starts_with=None, contains=None, ignore=None):
         if starts_with:
             if type(starts_with) is str:
@@ -91,6 +111,16 @@ class Trace_Call__Config(Type_Safe):
         self.print_traces_on_exit = value
         return self
 
+    def sink(self, path=None, max_events=TRACE_SINK__MAX_EVENTS):       # stream the trace events (instead of keeping the full tree in memory)
+        self.trace_sink_path       = path or ''
+        self.trace_sink_max_events = max_events
+        return self
+
+    def threads(self, all_threads=True, async_tasks=True):
+        self.trace_threads     = all_threads
+        self.trace_async_tasks = async_tasks
+        return self
+
     def up_to_depth(self, depth):
         self.trace_up_to_depth = depth
         return self
\ No newline at end of file
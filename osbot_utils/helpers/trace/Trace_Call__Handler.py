@@ -1,10 +1,14 @@
 import inspect
 import linecache
+import sys
+import threading
 from osbot_utils.utils.Objects                          import class_full_name
 from osbot_utils.base_classes.Kwargs_To_Self            import Kwargs_To_Self
+from osbot_utils.helpers.trace.Trace_Call__Capture_Filter import Trace_Call__Capture_Filter
 from osbot_utils.helpers.trace.Trace_Call__Config       import Trace_Call__Config
 from osbot_utils.helpers.trace.Trace_Call__Stack        import Trace_Call__Stack
 from osbot_utils.helpers.trace.Trace_Call__Stack_Node   import Trace_Call__Stack_Node, EXTRA_DATA__RETURN_VALUE
+from osbot_utils.helpers.trace.Trace_Call__Stacks       import Trace_Call__Stacks
 from osbot_utils.helpers.trace.Trace_Call__Stats        import Trace_Call__Stats
 
 DEFAULT_ROOT_NODE_NODE_TITLE = 'Trace Session'
@@ -36,9 +40,13 @@ GLOBAL_FUNCTIONS_TO_IGNORE = []
 #GLOBAL_FUNCTIONS_TO_IGNORE = []
 
 class Trace_Call__Handler(Kwargs_To_Self):
-    config : Trace_Call__Config
-    stack  : Trace_Call__Stack
-    stats  : Trace_Call__Stats
+    capture_decisions : dict                                                                # code object -> capture_filter result (the only memo of the capture rules, cleared by capture_filter__compile)
+    capture_filter    : Trace_Call__Capture_Filter = None                                   # compiled version of the config capture rules, set by capture_filter__compile
+    config            : Trace_Call__Config
+    stack             : Trace_Call__Stack
+    stacks            : Trace_Call__Stacks = None                                           # set when the threads and asyncio tasks are captured in separate stacks
+    stats             : Trace_Call__Stats
+    thread_id         : int                                                                 # thread that started the trace session (the sys.monitoring callbacks fire for all threads)
 
 
     def __init__(self, **kwargs):
@@ -52,9 +60,9 @@ class Trace_Call__Handler(Kwargs_To_Self):
     def add_line(self, frame):
         if self.config.trace_capture_lines:
             if frame:
-                target_node = self.stack.top()  # lines captured are added to the current top of the stack
+                target_node = self.stack_current().top()  # lines captured are added to the current top of the stack
                 #obj_info(target_node)
-                if self.stack.top():
+                if target_node:
                     target_node__func_name = target_node.func_name
                     target_node__module    = target_node.module
                     frame_func_name        = frame.f_code.co_name
@@ -117,14 +125,37 @@ class Trace_Call__Handler(Kwargs_To_Self):
 
     def add_trace_ignore(self, value):
         self.config.trace_ignore_start_with.append(value)
+        if self.capture_filter:                                                             # recompile now (instead of on the next capture_decision for a new code object)
+            self.capture_filter__compile()
         return
 
-    def handle_event__call(self, frame):
+    def capture_decision(self, frame):                                                      # the capture filters are only evaluated once per code object
+        code     = frame.f_code
+        decision = self.capture_decisions.get(code)
+        if decision is None:
+            if self.capture_filter and self.capture_filter.is_stale(self.config):           # the capture rules are only compared on new code objects (i.e. changes made during a trace session are picked up lazily)
+                self.capture_filter__compile()
+            decision = self.should_capture__config(frame)
+            self.capture_decisions[code] = decision
+        return decision
+
+    def capture_filter__compile(self):                                                      # called when tracing starts, and when the config capture rules changed during the trace session
+        self.capture_decisions.clear()
+        self.capture_filter = Trace_Call__Capture_Filter().compile(self.config, modules_to_ignore=GLOBAL_MODULES_TO_IGNORE, functions_to_ignore=GLOBAL_FUNCTIONS_TO_IGNORE)
+        return self.capture_filter
+
+    def capture_filter__reset(self):
+        self.capture_filter = None
+        return self
+
+    def handle_event__call(self, frame, capture=None):
         if frame:
             if self.config.capture_frame_stats:
                 self.stats.log_frame(frame)
-            if self.should_capture(frame):
-                new_node = self.stack.add_frame(frame)
+            if capture is None:
+                capture = self.should_capture(frame)
+            if capture:
+                new_node = self.stack_current().add_frame(frame)
                 if self.config.trace_capture_lines:
                     self.add_line_to_node(frame, new_node,'call')
                 return  new_node
@@ -140,19 +171,62 @@ class Trace_Call__Handler(Kwargs_To_Self):
             extra_data = { EXTRA_DATA__RETURN_VALUE : return_value}
         else:
             extra_data = {}
-        return self.stack.pop(target=frame, extra_data = extra_data)
+        return self.stack_current().pop(target=frame, extra_data = extra_data)
+
+    def monitoring__other_thread(self):                                                     # events from other threads are ignored, unless trace_threads is set (they can't be DISABLEd, since that applies to all threads)
+        return self.config.trace_threads is False and threading.get_ident() != self.thread_id
+
+    def monitoring__py_return(self, code, instruction_offset, return_value):                # sys.monitoring PY_RETURN callback
+        if self.monitoring__other_thread():
+            return
+        if self.capture_decisions.get(code) is not True:
+            return sys.monitoring.DISABLE
+        self.stats.returns += 1
+        self.handle_event__return(sys._getframe(1), return_value)
 
-    def should_capture(self, frame):                                                    # todo: see if we can optimise these 3 lines (starting with frame.f_code) which are repeated in a number of places here
+    def monitoring__py_start(self, code, instruction_offset):                               # sys.monitoring PY_START callback
+        if self.monitoring__other_thread():
+            return
+        self.stats.calls += 1
+        frame = sys._getframe(1)
+        if self.capture_decision(frame) is False:
+            self.stats.calls_skipped += 1
+            return sys.monitoring.DISABLE                                                   # no more PY_START events for this code object (for this trace session)
+        self.handle_event__call(frame, capture=self.should_capture__depth())
+
+    def monitoring__py_unwind(self, code, instruction_offset, exception):                   # sys.monitoring PY_UNWIND callback (i.e. function exited with an exception), which can't be disabled
+        if self.monitoring__other_thread():
+            return
+        if self.capture_decisions.get(code) is True:
+            self.stats.exceptions += 1
+            self.handle_event__return(sys._getframe(1))
+
+    def should_capture(self, frame):
+        if self.should_capture__depth() is False:
+            return False
+        return self.should_capture__frame(frame)
+
+    def should_capture__depth(self):
         if self.config.trace_up_to_depth:
-            if len(self.stack) > self.config.trace_up_to_depth:
+            if len(self.stack_current()) > self.config.trace_up_to_depth:
                 return False
+        return True
+
+    def should_capture__frame(self, frame):
+        if frame and self.capture_filter:                                                   # when tracing was started via Trace_Call.start, use the compiled filter (which is a dict lookup for code objects already seen)
+            return self.capture_decision(frame)
+        return self.should_capture__config(frame)
 
+    def should_capture__config(self, frame):
         capture = False
         if frame:
             code        = frame.f_code                                                      # Get code object from frame
             func_name   = code.co_name                                                      # Get function name
             module      = frame.f_globals.get("__name__", "")                               # Get module name
 
+            if self.capture_filter:
+                return self.capture_filter.should_capture(module, func_name)
+
             if module in GLOBAL_MODULES_TO_IGNORE:                                         # check if we should skip this module
                 return False
 
@@ -195,6 +269,22 @@ class Trace_Call__Handler(Kwargs_To_Self):
         node['children'] = new_children
         return node
 
+    def stack_current(self):
+        if self.stacks is None:
+            return self.stack
+        return self.stacks.current()
+
+    def stacks__merge(self):
+        if self.stacks:
+            self.stacks.merge()
+            self.stacks = None
+        return self
+
+    def stacks__setup(self):                                                                # called when tracing starts
+        if self.config.trace_threads or self.config.trace_async_tasks:
+            self.stacks = Trace_Call__Stacks(config=self.config, main_stack=self.stack)
+        return self.stacks
+
     def stack_top(self):
         if self.stack:
             return self.stack[-1]
@@ -218,6 +308,18 @@ class Trace_Call__Handler(Kwargs_To_Self):
 
 
 
+    def trace_profile(self, frame, event, arg):                                             # sys.setprofile handler (there are no line events, and c_call/c_return events are ignored)
+        if event == 'call':
+            self.stats.calls += 1
+            if self.capture_decision(frame):
+                self.handle_event__call(frame, capture=self.should_capture__depth())
+            else:
+                self.stats.calls_skipped += 1
+        elif event == 'return':
+            if self.capture_decisions.get(frame.f_code):
+                self.stats.returns += 1
+                self.handle_event__return(frame, arg)
+
     def traces(self):
         def map_traces(node, all_traces):
             if node:
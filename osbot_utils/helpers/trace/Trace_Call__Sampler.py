@@ -0,0 +1,119 @@
+import sys
+import threading
+from threading                                              import Event, Thread
+from osbot_utils.base_classes.Kwargs_To_Self                import Kwargs_To_Self
+from osbot_utils.helpers.trace.Trace_Call__Capture_Filter   import Trace_Call__Capture_Filter
+from osbot_utils.helpers.trace.Trace_Call__Config           import Trace_Call__Config
+from osbot_utils.helpers.trace.Trace_Call__Handler          import GLOBAL_MODULES_TO_IGNORE, GLOBAL_FUNCTIONS_TO_IGNORE
+from osbot_utils.helpers.trace.Trace_Call__Stack_Node       import Trace_Call__Stack_Node
+
+EXTRA_DATA__SAMPLES         = '(samples)'
+TRACE_SAMPLER__THREAD_NAME  = 'Trace_Call__Sampler'
+
+
+class Trace_Call__Sampler(Kwargs_To_Self):                              # statistical profiler: samples sys._current_frames() from a background thread and merges the stacks into a Trace_Call__Stack_Node tree
+    call_index      : int
+    capture_filter  : Trace_Call__Capture_Filter = None                 # same capture rules as the deterministic backends (compiled from config on start if not provided)
+    code_names      : dict                                              # code object -> node name (or None when the code object is not captured)
+    config          : Trace_Call__Config
+    nodes           : dict                                              # (id(parent_node), name) -> child node
+    root_node       : Trace_Call__Stack_Node = None
+    samples         : int                                               # number of times the threads were sampled
+    stop_event      : Event  = None
+    thread          : Thread = None
+    thread_ids      : list                                              # threads to sample (when empty all threads are sampled, and grouped by thread)
+    thread_names    : dict
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.stop_event = threading.Event()
+
+    def add_stack(self, frame, parent_node):
+        names = []
+        while frame is not None:
+            name = self.code_name(frame)
+            if name:
+                names.append(name)
+            frame = frame.f_back
+        names.reverse()
+        if self.config.trace_up_to_depth:
+            names = names[:self.config.trace_up_to_depth]
+        self.node_add_sample(parent_node)
+        for name in names:
+            parent_node = self.child_node(parent_node, name)
+            self.node_add_sample(parent_node)
+
+    def child_node(self, parent_node, name):
+        key  = (id(parent_node), name)
+        node = self.nodes.get(key)
+        if node is None:
+            self.call_index += 1
+            func_name = name.rpartition('.')[-1]
+            node      = Trace_Call__Stack_Node(call_index=self.call_index, func_name=func_name, name=name)
+            parent_node.children.append(node)
+            self.nodes[key] = node
+        return node
+
+    def code_name(self, frame):                                         # the capture decision (and name) is only calculated once per code object
+        code = frame.f_code
+        if code in self.code_names:
+            return self.code_names[code]
+        module    = frame.f_globals.get('__name__', '')
+        func_name = code.co_name
+        name      = None
+        if self.capture_filter.should_capture(module, func_name):
+            qualified_name = getattr(code, 'co_qualname', func_name)   # co_qualname (3.11+) has the class name (the f_locals of other threads' frames should not be read)
+            name           = f'{module}.{qualified_name}'.replace('.<locals>', '')
+        self.code_names[code] = name
+        return name
+
+    def interval(self):
+        return self.config.sampling_interval
+
+    def node_add_sample(self, node):
+        samples                              = node.extra_data.get(EXTRA_DATA__SAMPLES, 0) + 1
+        node.extra_data[EXTRA_DATA__SAMPLES] = samples
+        node.call_duration                   = samples * self.interval()               # estimated time spent in (and below) this node
+
+    def run_thread(self):
+        while self.stop_event.wait(self.interval()) is False:
+            self.sample()
+
+    def sample(self):
+        sampler_thread_id = self.thread.ident if self.thread else None
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == sampler_thread_id:
+                continue
+            if self.thread_ids:
+                if thread_id in self.thread_ids:
+                    self.add_stack(frame, self.root_node)
+            else:
+                self.add_stack(frame, self.thread_node(thread_id))
+        self.samples += 1
+        return self
+
+    def start(self):
+        if self.root_node is None:
+            self.root_node = Trace_Call__Stack_Node(name=self.config.title or TRACE_SAMPLER__THREAD_NAME)
+        if self.capture_filter is None:
+            self.capture_filter = Trace_Call__Capture_Filter().compile(self.config, modules_to_ignore=GLOBAL_MODULES_TO_IGNORE, functions_to_ignore=GLOBAL_FUNCTIONS_TO_IGNORE)
+        if self.thread is None:
+            self.stop_event.clear()
+            self.thread = Thread(target=self.run_thread, name=TRACE_SAMPLER__THREAD_NAME, daemon=True)
+            self.thread.start()
+        return self
+
+    def stop(self):
+        if self.thread:
+            self.stop_event.set()
+            self.thread.join()
+            self.thread = None
+        return self
+
+    def thread_node(self, thread_id):
+        thread_name = self.thread_names.get(thread_id)
+        if thread_name is None:
+            for thread in threading.enumerate():
+                self.thread_names[thread.ident] = thread.name
+            thread_name = self.thread_names.get(thread_id, 'unknown')
+        return self.child_node(self.root_node, f'Thread: {thread_name} ({thread_id})')
@@ -0,0 +1,87 @@
+import reprlib
+import threading
+from collections                                        import deque
+from osbot_utils.base_classes.Kwargs_To_Self            import Kwargs_To_Self
+from osbot_utils.helpers.trace.Trace_Call__Config       import Trace_Call__Config
+from osbot_utils.helpers.trace.Trace_Call__Stack_Node   import Trace_Call__Stack_Node
+
+TRACE_SINK__EVENT__CALL   = 'call'
+TRACE_SINK__EVENT__RETURN = 'return'
+
+
+class Trace_Call__Sink(Kwargs_To_Self):                                 # receives the Trace_Call__Stack nodes as they are pushed and popped (this version keeps the last max_events in a ring buffer)
+    config         : Trace_Call__Config
+    events_written : int
+    live_ids       : dict                                               # id(node) -> sink id, for the nodes currently in the stack (i.e. bounded by the trace depth)
+    next_id        : int
+    ring_buffer    : deque = None
+    value_repr     : reprlib.Repr = None                                # used to convert locals and extra_data into (size limited) strings
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.lock                 = threading.RLock()                   # the sink is shared by the stacks of all traced threads (see Trace_Call__Stacks.stack_new)
+        self.ring_buffer          = deque(maxlen=self.config.trace_sink_max_events or None)
+        self.value_repr           = reprlib.Repr()
+        self.value_repr.maxstring = self.config.print_max_string_length
+        self.value_repr.maxother  = self.config.print_max_string_length
+
+    def close(self):
+        return self
+
+    def event__call(self, node: Trace_Call__Stack_Node, parent_node: Trace_Call__Stack_Node = None):
+        self.next_id            += 1
+        self.live_ids[id(node)]  = self.next_id
+        event = dict(event      = TRACE_SINK__EVENT__CALL                                    ,
+                     id         = self.next_id                                               ,
+                     parent     = self.live_ids.get(id(parent_node)) if parent_node else None,
+                     call_index = node.call_index                                            ,
+                     name       = node.name                                                  ,
+                     module     = node.module                                                ,
+                     func_name  = node.func_name                                             ,
+                     call_start = node.call_start                                            )
+        if node.source_code_location:
+            event['source_code'         ] = node.source_code
+            event['source_code_caller'  ] = node.source_code_caller
+            event['source_code_location'] = node.source_code_location
+        if node.locals:
+            event['locals'] = self.values(node.locals)
+        return event
+
+    def event__return(self, node: Trace_Call__Stack_Node):
+        event = dict(event         = TRACE_SINK__EVENT__RETURN        ,
+                     id            = self.live_ids.pop(id(node), None),
+                     call_duration = node.call_duration               ,
+                     call_end      = node.call_end                    )
+        if node.extra_data:
+            event['extra_data'] = self.values(node.extra_data)
+        if node.lines:
+            event['lines'] = node.lines
+        return event
+
+    def events(self):
+        return list(self.ring_buffer)
+
+    def on_call(self, node, parent_node=None):
+        with self.lock:                                                 # so that next_id, live_ids and write are consistent across threads
+            self.write(self.event__call(node, parent_node))
+
+    def on_return(self, node):
+        with self.lock:
+            self.write(self.event__return(node))
+
+    def value(self, value):
+        if value is None or isinstance(value, (bool, int, float)):
+            return value
+        if isinstance(value, str):
+            return value[:self.config.print_max_string_length]
+        try:
+            return self.value_repr.repr(value)
+        except Exception as error:
+            return f'<error in repr: {error}>'
+
+    def values(self, data: dict):
+        return {key: self.value(value) for key, value in data.items()}
+
+    def write(self, event):
+        self.ring_buffer.append(event)
+        self.events_written += 1
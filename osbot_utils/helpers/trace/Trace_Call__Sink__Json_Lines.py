@@ -0,0 +1,39 @@
+import json
+from io                                             import TextIOWrapper
+from osbot_utils.helpers.trace.Trace_Call__Sink     import Trace_Call__Sink
+
+TRACE_SINK__JSON_LINES__BUFFER_SIZE = 1024 * 1024
+
+
+class Trace_Call__Sink__Json_Lines(Trace_Call__Sink):                   # writes one compact json object per line (so that the file can be tailed and read back while the trace is running)
+    file : TextIOWrapper = None
+    path : str
+
+    def close(self):
+        if self.file:
+            self.file.close()
+            self.file = None
+        return self
+
+    def events(self):
+        if self.file:
+            self.file.flush()
+        return list(self.read_events(self.path))
+
+    def open(self):
+        if self.file is None:
+            self.path = self.path or self.config.trace_sink_path
+            self.file = open(self.path, 'w', buffering=TRACE_SINK__JSON_LINES__BUFFER_SIZE)
+        return self
+
+    @staticmethod
+    def read_events(path):                                              # lazy, so that large files can be processed line by line
+        with open(path, 'r') as file:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+    def write(self, event):
+        self.open()
+        self.file.write(json.dumps(event, separators=(',', ':'), default=str) + '\n')
+        self.events_written += 1
@@ -0,0 +1,69 @@
+from osbot_utils.base_classes.Kwargs_To_Self                import Kwargs_To_Self
+from osbot_utils.helpers.trace.Trace_Call__Config           import Trace_Call__Config
+from osbot_utils.helpers.trace.Trace_Call__Print_Traces     import Trace_Call__Print_Traces
+from osbot_utils.helpers.trace.Trace_Call__Sink             import TRACE_SINK__EVENT__CALL, TRACE_SINK__EVENT__RETURN
+from osbot_utils.helpers.trace.Trace_Call__Sink__Json_Lines import Trace_Call__Sink__Json_Lines
+from osbot_utils.helpers.trace.Trace_Call__Stack            import Trace_Call__Stack
+from osbot_utils.helpers.trace.Trace_Call__Stack_Node       import Trace_Call__Stack_Node
+from osbot_utils.helpers.trace.Trace_Call__View_Model       import Trace_Call__View_Model
+
+TRACE_SINK__TREE__ROOT_TITLE = 'Trace Sink'
+NODE_FIELDS__CALL            = ['call_index', 'call_start', 'func_name', 'locals', 'module', 'name', 'source_code', 'source_code_caller', 'source_code_location']
+NODE_FIELDS__RETURN          = ['call_duration', 'call_end', 'extra_data', 'lines']
+
+
+class Trace_Call__Sink__Tree(Kwargs_To_Self):                           # offline tool that rebuilds the Trace_Call__Stack_Node tree from the events written by a Trace_Call__Sink
+    config    : Trace_Call__Config
+    nodes     : dict                                                    # sink id -> node
+    root_node : Trace_Call__Stack_Node = None
+
+    def add_event(self, event: dict):
+        if event.get('event') == TRACE_SINK__EVENT__CALL:
+            return self.add_event__call(event)
+        if event.get('event') == TRACE_SINK__EVENT__RETURN:
+            return self.add_event__return(event)
+
+    def add_event__call(self, event):
+        node        = Trace_Call__Stack_Node(**{field: event.get(field) for field in NODE_FIELDS__CALL if event.get(field) is not None})
+        parent_node = self.nodes.get(event.get('parent'))
+        if parent_node:
+            parent_node.children.append(node)
+        elif self.root_node is None and event.get('parent') is None:
+            self.root_node = node
+        else:                                                           # the parent was not captured (for example it was evicted from the ring buffer)
+            self.root().children.append(node)
+        self.nodes[event.get('id')] = node
+        return node
+
+    def add_event__return(self, event):
+        node = self.nodes.get(event.get('id'))
+        if node:
+            for field in NODE_FIELDS__RETURN:
+                value = event.get(field)
+                if value is not None:
+                    setattr(node, field, value)
+        return node
+
+    def add_events(self, events):
+        for event in events:
+            self.add_event(event)
+        return self
+
+    def load(self, path):                                                # rebuilds the tree from a file created by Trace_Call__Sink__Json_Lines
+        return self.add_events(Trace_Call__Sink__Json_Lines.read_events(path))
+
+    def print(self):
+        view_model = self.view_data()
+        Trace_Call__Print_Traces(config=self.config).print_traces(view_model)
+        return view_model
+
+    def root(self):
+        if self.root_node is None:
+            self.root_node = Trace_Call__Stack_Node(name=TRACE_SINK__TREE__ROOT_TITLE)
+        return self.root_node
+
+    def stack(self):
+        return Trace_Call__Stack(config=self.config, root_node=self.root())
+
+    def view_data(self):
+        return Trace_Call__View_Model().create(self.stack())
@@ -3,6 +3,7 @@ import time
 from copy                                               import deepcopy
 from osbot_utils.base_classes.Kwargs_To_Self            import Kwargs_To_Self
 from osbot_utils.helpers.trace.Trace_Call__Config       import Trace_Call__Config
+from osbot_utils.helpers.trace.Trace_Call__Sink         import Trace_Call__Sink
 from osbot_utils.helpers.trace.Trace_Call__Stack_Node   import Trace_Call__Stack_Node
 
 
@@ -12,6 +13,7 @@ class Trace_Call__Stack(Kwargs_To_Self):
     config     : Trace_Call__Config
     root_node  : Trace_Call__Stack_Node
     line_index : int
+    sink       : Trace_Call__Sink = None                                  # when set, the nodes are streamed to it (and the children are not kept in memory)
 
     def __eq__(self, target):
         if self is target:
@@ -54,11 +56,15 @@ class Trace_Call__Stack(Kwargs_To_Self):
 
     def add_stack_node(self, stack_node : Trace_Call__Stack_Node, frame=None):
         if type(stack_node) is Trace_Call__Stack_Node:
-            if self.stack_data:                                             # if there are items in the stack
-                self.top().children.append(stack_node)                      # add an xref to the new node to the children of the top node
+            parent_node = self.top()
+            if parent_node:                                                 # if there are items in the stack
+                if self.sink is None:
+                    parent_node.children.append(stack_node)                 # add an xref to the new node to the children of the top node
             else:
                 self.root_node = stack_node                                 # if not this is the first node and capture it as a root node
             self.stack_data.append(stack_node)                              # append the new node to the stack
+            if self.sink:
+                self.sink.on_call(stack_node, parent_node)
             return True
         return False
 
@@ -141,6 +147,8 @@ class Trace_Call__Stack(Kwargs_To_Self):
             top_node.call_duration = top_node.call_end - top_node.call_start
         if type(extra_data) is dict:
             top_node.extra_data.update(extra_data)
+        if self.sink:
+            self.sink.on_return(top_node)
         self.stack_data.pop()
         return True
 
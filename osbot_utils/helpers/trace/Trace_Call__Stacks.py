@@ -0,0 +1,68 @@
+import threading
+from asyncio                                            import current_task, Task
+from contextvars                                        import ContextVar
+from osbot_utils.base_classes.Kwargs_To_Self            import Kwargs_To_Self
+from osbot_utils.helpers.trace.Trace_Call__Config       import Trace_Call__Config
+from osbot_utils.helpers.trace.Trace_Call__Stack        import Trace_Call__Stack
+
+
+class Trace_Call__Stacks(Kwargs_To_Self):                               # one Trace_Call__Stack per thread and per asyncio task, which are merged into the main stack at the end
+    config          : Trace_Call__Config
+    context_var     : ContextVar = None                                 # (task, stack) of the current asyncio task (since each task runs on a copy of its parent's context)
+    main_stack      : Trace_Call__Stack
+    main_task       : Task       = None                                 # task that started the trace (if any), which also uses main_stack
+    main_thread_id  : int                                               # thread that started the trace (which uses main_stack)
+    stacks          : list                                              # the per thread and per task stacks (in creation order)
+    thread_data     : threading.local = None
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.context_var    = ContextVar('trace_call__stacks', default=None)
+        self.lock           = threading.RLock()                         # protects the stacks list (which is appended to from all traced threads)
+        self.main_task      = self.current_task()
+        self.main_thread_id = self.main_thread_id or threading.get_ident()
+        self.thread_data    = threading.local()
+
+    def current(self):                                                  # stack for the code that is currently executing
+        if self.config.trace_async_tasks:
+            task = self.current_task()
+            if task is not None and task is not self.main_task:
+                value = self.context_var.get()
+                if value is None or value[0] is not task:               # first event in this task (the value, if any, was inherited from the parent task)
+                    stack = self.stack_new(f'Task: {task.get_name()}')
+                    self.context_var.set((task, stack))
+                    return stack
+                return value[1]
+        stack = getattr(self.thread_data, 'stack', None)
+        if stack is None:
+            if self.config.trace_threads and threading.get_ident() != self.main_thread_id:
+                current_thread = threading.current_thread()
+                stack          = self.stack_new(f'Thread: {current_thread.name} ({current_thread.native_id})')
+            else:
+                stack = self.main_stack
+            self.thread_data.stack = stack
+        return stack
+
+    def current_task(self):
+        try:
+            return current_task()
+        except RuntimeError:                                            # there is no running event loop in this thread
+            return None
+
+    def merge(self):                                                    # adds the root node of each stack as a child of the main stack's root node
+        with self.lock:
+            root_node = self.main_stack.root_node
+            for stack in self.stacks:
+                stack.empty_stack()
+                if self.main_stack.sink is None:                        # when streaming, the sink tree will add them to its root
+                    root_node.children.append(stack.root_node)
+            stacks      = self.stacks
+            self.stacks = []
+        return stacks
+
+    def stack_new(self, title):
+        stack = Trace_Call__Stack(config=self.config, sink=self.main_stack.sink)
+        stack.add_node(title=title)
+        with self.lock:
+            self.stacks.append(stack)
+        return stack
@@ -95,12 +95,15 @@ class test_LLM_Request__Cache__Sqlite(unittest.TestCase):        # Test cache in
                                       'shared_areas'    : [],
                                       'shared_domains'  : [],
                                       'virtual_storage' : { 'db': { 'auto_schema_row': False        ,
+                                                                    'check_same_thread': True       ,
                                                                     'closed'         : False        ,
                                                                     'connected'      : True         ,
                                                                     'db_name'        : db_name      ,
                                                                     'db_path'        : self.db_path ,
                                                                     'deleted'        : False        ,
-                                                                    'in_memory'      : False        },
+                                                                    'in_memory'      : False        ,
+                                                                    'snapshot_interval': 0.0        ,
+                                                                    'snapshot_path'  : None         },
                                                              'root_folder': 'llm-cache/'}}
 
         with self.virtual_storage.db  as _:
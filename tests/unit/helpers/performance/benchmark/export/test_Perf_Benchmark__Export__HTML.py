@@ -282,6 +282,46 @@ class test_Perf_Benchmark__Export__HTML(TestCase):
             assert 'No sessions' in html
 
 
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # export_dashboard Tests
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test_export_dashboard(self):                                             # Test one trend chart per benchmark
+        regression = Schema__Perf__Benchmark__Evolution(benchmark_id   = 'B_01__test'                       ,
+                                                        name           = 'test_slower'                      ,
+                                                        scores         = List__Scores([100, 150, 200])      ,
+                                                        first_score    = Safe_UInt(100)                     ,
+                                                        last_score     = Safe_UInt(200)                     ,
+                                                        change_percent = Safe_Float(-100.0)                 ,
+                                                        trend          = Enum__Benchmark__Trend.STRONG_REGRESSION)
+        evolutions = List__Benchmark_Evolutions([self.evolution, regression])
+        result     = Schema__Perf__Evolution(status        = Enum__Comparison__Status.SUCCESS,
+                                             session_count = Safe_UInt(3)                    ,
+                                             titles        = self.titles                     ,
+                                             evolutions    = evolutions                      )
+
+        with self.exporter as _:
+            html = _.export_dashboard(result)
+
+            assert '<html>'                                 in html
+            assert '2 Benchmarks, 3 Runs'                   in html
+            assert '<canvas id="trend_0"></canvas>'         in html
+            assert '<canvas id="trend_1"></canvas>'         in html
+            assert "trendChart('trend_0', [100, 150, 200]"  in html          # regressions are shown first
+            assert "trendChart('trend_1', [1000, 900, 800]" in html
+            assert '<td class="regression">+100.0%</td>'    in html
+            assert '<td class="improvement">-20.0%</td>'    in html
+            assert "'Session 1', 'Session 2', 'Session 3'"  in html
+
+    def test_export_dashboard__error_status(self):                               # Test error status
+        result = Schema__Perf__Evolution(status = Enum__Comparison__Status.ERROR_INSUFFICIENT_SESSIONS,
+                                         error  = 'Need at least 2 runs for evolution'                 )
+
+        with self.exporter as _:
+            html = _.export_dashboard(result)
+            assert 'Need at least 2 runs' in html
+
+
     # ═══════════════════════════════════════════════════════════════════════════════
     # export_statistics Tests
     # ═══════════════════════════════════════════════════════════════════════════════
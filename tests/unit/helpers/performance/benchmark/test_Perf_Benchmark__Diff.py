@@ -61,7 +61,8 @@ class test_Perf_Benchmark__Diff(TestCase):
             assert isinstance(_, Type_Safe)
             assert type(_.sessions) is List__Benchmark_Sessions
             assert len(_.sessions)  == 0
-            assert _.obj()          == __(sessions=[])
+            assert _.obj()          == __(sessions     = []                                                   ,
+                                          significance = __(alpha=0.05, confidence=0.95, bootstrap_samples=200, negligible_effect=0.147, min_change=5.0, seed=0))
 
 
     # ═══════════════════════════════════════════════════════════════════════════════
@@ -85,20 +86,24 @@ class test_Perf_Benchmark__Diff(TestCase):
                                                                                                             index        = '01'                         ,
                                                                                                             name         = 'python__nop'                ,
                                                                                                             final_score  = 1000                         ,
-                                                                                                            raw_score    = 870                          ),
+                                                                                                            raw_score    = 870                          ,
+                                                                                                            run_scores   = []                           ),
                                                                                A_02__python__class_empty = __(benchmark_id = 'A_02__python__class_empty' ,
                                                                                                             section      = 'A'                          ,
                                                                                                             index        = '02'                         ,
                                                                                                             name         = 'python__class_empty'        ,
                                                                                                             final_score  = 500                          ,
-                                                                                                            raw_score    = 455                          ),
+                                                                                                            raw_score    = 455                          ,
+                                                                                                            run_scores   = []                           ),
                                                                                B_01__type_safe__empty    = __(benchmark_id = 'B_01__type_safe__empty'    ,
                                                                                                             section      = 'B'                          ,
                                                                                                             index        = '01'                         ,
                                                                                                             name         = 'type_safe__empty'           ,
                                                                                                             final_score  = 2000                         ,
-                                                                                                            raw_score    = 1760                         )),
-                                                             legend      = __()                            )])
+                                                                                                            raw_score    = 1760                         ,
+                                                                                                            run_scores   = []                           )),
+                                                             legend      = __()                            )],
+                                              significance = __SKIP__)
 
 
 
@@ -448,6 +453,44 @@ class test_Perf_Benchmark__Diff(TestCase):
             assert comparison.score_b      >= 0
             assert comparison.trend        in list(Enum__Benchmark__Trend)
 
+    def test_compare_two__significance(self):                                    # Test trends come from the run_scores when the results have them
+        noise      = [1000, 1010, 990, 1005, 995, 1000, 1020, 980] * 4
+        slower     = [value + 200 for value in noise]
+        test_data  = QA__Benchmark__Test_Data()
+        session_a  = test_data.create_session(title='A')
+        session_b  = test_data.create_session(title='B')
+        session_a.results['A_01__noise'] = test_data.create_benchmark_result(benchmark_id='A_01__noise', final_score=1000, run_scores=noise      )
+        session_b.results['A_01__noise'] = test_data.create_benchmark_result(benchmark_id='A_01__noise', final_score=2000, run_scores=noise[::-1])
+        session_a.results['A_02__slow' ] = test_data.create_benchmark_result(benchmark_id='A_02__slow' , final_score=1000, run_scores=noise      )
+        session_b.results['A_02__slow' ] = test_data.create_benchmark_result(benchmark_id='A_02__slow' , final_score=1000, run_scores=slower     )
+
+        with Perf_Benchmark__Diff() as _:
+            comparisons = {str(c.benchmark_id): c for c in _.compare_two(session_a, session_b).comparisons}
+
+            noise_comparison = comparisons['A_01__noise']
+            assert noise_comparison.score_b                  == 2000                    # the scores changed ...
+            assert noise_comparison.significance.significant is False                   # ... but the distributions didn't
+            assert noise_comparison.change_percent           == 0.0                     # so the change is the one of the medians
+            assert noise_comparison.trend                    == Enum__Benchmark__Trend.UNCHANGED
+
+            slow_comparison = comparisons['A_02__slow']
+            assert slow_comparison.score_a                   == slow_comparison.score_b # same (bucketed) score ...
+            assert slow_comparison.significance.significant  is True                    # ... but a real slowdown
+            assert slow_comparison.change_percent            == -20.0                   # which is consistent with the trend
+            assert slow_comparison.trend                     == Enum__Benchmark__Trend.STRONG_REGRESSION
+            assert slow_comparison.significance.effect_size  == -1.0
+
+            assert comparisons['A_01__python__nop'].significance is None                # no run_scores: percentage trend
+
+            _.sessions.extend([session_a, session_b])
+            statistics = _.statistics()                                                 # the averages and the worst regression use the same change_percent
+            assert statistics.regression_count               == 1
+            assert statistics.avg_regression                 == 20.0
+            assert statistics.worst_regression.benchmark_id  == 'A_02__slow'
+
+            evolution = {str(e.benchmark_id): e for e in _.compare_all().evolutions}
+            assert evolution['A_01__noise'].change_percent   == 0.0
+            assert evolution['A_02__slow' ].change_percent   == -20.0
 
     # ═══════════════════════════════════════════════════════════════════════════════
     # compare_all Tests
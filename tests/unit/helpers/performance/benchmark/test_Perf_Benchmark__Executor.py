@@ -0,0 +1,132 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Test Perf_Benchmark__Executor - Tests for the benchmark execution engine
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import gc
+import os
+import pytest
+from unittest                                                                                             import TestCase
+from osbot_utils.helpers.performance.Performance_Measure__Session                                         import Performance_Measure__Session as Perf
+from osbot_utils.helpers.performance.Performance_Measure__Session                                         import MEASURE__INVOCATION__LOOPS, MEASURE__INVOCATION__LOOPS__QUICK
+from osbot_utils.helpers.performance.Performance_Measure__Session                                         import MEASURE__INVOCATION__LOOPS__FAST, MEASURE__INVOCATION__LOOPS__ONLY__3
+from osbot_utils.helpers.performance.benchmark.Perf_Benchmark__Executor                                   import Perf_Benchmark__Executor
+from osbot_utils.helpers.performance.Performance_Measure__Session                                         import MEASURE__MEMORY__INVOCATIONS
+from osbot_utils.helpers.performance.benchmark.schemas.timing.Schema__Perf_Benchmark__Timing__Config      import Schema__Perf_Benchmark__Timing__Config
+from osbot_utils.helpers.performance.schemas.Schema__Performance_Measure__Memory                          import Schema__Performance_Measure__Memory
+
+
+def target_nop():
+    pass
+
+def target_pinned():                                                             # Fails (in the worker) if the process is not pinned to one CPU
+    assert len(os.sched_getaffinity(0)) == 1
+
+def target_pid():
+    return os.getpid()
+
+
+class test_Perf_Benchmark__Executor(TestCase):
+
+    def test__init__(self):
+        with Perf_Benchmark__Executor() as _:
+            assert type(_.config)        is Schema__Perf_Benchmark__Timing__Config
+            assert _.config.workers      == 0
+            assert _.config.gc_disabled  is False
+
+    def test_loops(self):                                                        # Test loop schedule selection
+        with Perf_Benchmark__Executor() as _:
+            assert _.loops(target_nop) == MEASURE__INVOCATION__LOOPS__QUICK          # measure_quick is the default
+            _.config.measure_quick  = False
+            assert _.loops(target_nop) == MEASURE__INVOCATION__LOOPS
+            _.config.measure_fast   = True
+            assert _.loops(target_nop) == MEASURE__INVOCATION__LOOPS__FAST
+            _.config.measure_only_3 = True
+            assert _.loops(target_nop) == MEASURE__INVOCATION__LOOPS__ONLY__3
+
+    def test_loops__calibrated(self):                                            # Test loops fit in the budget
+        with Perf_Benchmark__Executor() as _:
+            _.config.calibrate_budget_ns = 1
+            assert _.loops(target_nop) == [1, 2]                                     # always at least 3 invocations
+
+            _.config.calibrate_budget_ns = 10_000_000_000                            # 10s is more than enough for all loops of a nop
+            assert _.loops(target_nop) == MEASURE__INVOCATION__LOOPS
+
+            _.config.calibrate_budget_ns = 1_000_000
+            loops = _.loops(target_nop)
+            assert loops == MEASURE__INVOCATION__LOOPS[:len(loops)]                  # a prefix of the default schedule
+
+    def test_measure(self):
+        with Perf_Benchmark__Executor() as _:
+            session = _.measure(target_nop)
+            assert type(session)                    is Perf
+            assert session.result.name              == 'target_nop'
+            assert list(session.result.measurements) == MEASURE__INVOCATION__LOOPS__QUICK
+
+    def test_measure__times__warmup_and_gc(self):                                # Test warm-up calls are not measured, and GC is off while measuring
+        calls       = []
+        gc_states   = []
+        def target():
+            calls.append(1)
+            gc_states.append(gc.isenabled())
+        with Perf_Benchmark__Executor() as _:
+            _.config.measure_only_3     = True
+            _.config.warmup_invocations = 5
+            _.config.gc_disabled        = True
+            name, loops_times, memory = _.measure__times(target)
+            assert name                                  == 'target'
+            assert memory                                is None                     # measure_memory is off by default
+            assert [loop for loop, _ in loops_times]     == MEASURE__INVOCATION__LOOPS__ONLY__3
+            assert len(calls)                            == 5 + sum(MEASURE__INVOCATION__LOOPS__ONLY__3)
+            assert gc_states[:5]                         == [True] * 5
+            assert set(gc_states[5:])                    == {False}
+            assert gc.isenabled()                        is True                     # restored after the measurement
+
+    def test_measure__times__batch_size(self):                                   # Test the batch size is used by the session
+        calls = []
+        def target():
+            calls.append(1)
+        with Perf_Benchmark__Executor() as _:
+            _.config.measure_only_3 = True
+            _.config.batch_size     = 4
+            name, loops_times, memory = _.measure__times(target)
+            assert [len(times) for loop, times in loops_times] == MEASURE__INVOCATION__LOOPS__ONLY__3
+            assert len(calls)                                  == 4 * sum(MEASURE__INVOCATION__LOOPS__ONLY__3)
+
+    def test_run(self):                                                          # Test in-process run (workers <= 1)
+        with Perf_Benchmark__Executor() as _:
+            sessions = _.run([target_nop, target_pid])
+            assert [s.result.name for s in sessions] == ['target_nop', 'target_pid']
+
+    def test_run__workers(self):                                                 # Test each target is measured in its own process
+        with Perf_Benchmark__Executor() as _:
+            if _.can_fork() is False:
+                pytest.skip('fork start method not available')
+            _.config.workers        = 2
+            _.config.measure_only_3 = True
+            targets  = [target_pid, target_nop, target_pid]
+            sessions = _.run(targets)
+            assert [s.result.name for s in sessions] == ['target_pid', 'target_nop', 'target_pid']   # same order as the targets
+            assert all(type(s) is Perf for s in sessions)
+            assert list(sessions[0].result.measurements) == MEASURE__INVOCATION__LOOPS__ONLY__3
+
+    def test_run__workers__measure_memory(self):                                 # Test the memory metrics are sent back from the workers
+        with Perf_Benchmark__Executor() as _:
+            if _.can_fork() is False:
+                pytest.skip('fork start method not available')
+            _.config.workers        = 2
+            _.config.measure_only_3 = True
+            _.config.measure_memory = True
+            sessions = _.run([target_nop, target_pid])
+            assert [type(s.result.memory) for s in sessions] == [Schema__Performance_Measure__Memory] * 2
+            assert sessions[0].result.memory.invocations     == MEASURE__MEMORY__INVOCATIONS
+
+    def test_run__workers__pin_cpus(self):                                       # Test the workers are pinned to one CPU
+        with Perf_Benchmark__Executor() as _:
+            if _.can_fork() is False or _.can_pin_cpus() is False:
+                pytest.skip('fork or sched_setaffinity not available')
+            _.config.workers        = 2
+            _.config.pin_cpus       = True
+            _.config.measure_only_3 = True
+            sessions = _.run([target_pinned, target_pinned])
+            assert [s.result.name for s in sessions] == ['target_pinned', 'target_pinned']
+            assert len(os.sched_getaffinity(0))      == len(_.cpus())                # the main process is not pinned
@@ -49,6 +49,14 @@ class test_Perf_Benchmark__Hypothesis(TestCase):
                                                                                       measure_quick   = True    ,
                                                                                       measure_fast    = False   ,
                                                                                       measure_only_3  = False   ,
+                                                                                      workers         = 0       ,
+                                                                                      pin_cpus        = False   ,
+                                                                                      warmup_invocations=0,
+                                                                                      gc_disabled     = False   ,
+                                                                                      calibrate_budget_ns=0,
+                                                                                      measure_memory=False,
+                                                                                      batch_size=0,
+                                                                                      repeats=0,
                                                                                       title='',
                                                                                       description='',
                                                                                       output_path='',
@@ -58,7 +66,8 @@ class test_Perf_Benchmark__Hypothesis(TestCase):
                                                            target_improvement=0.0,
                                                            before_results=__(),
                                                            after_results=__(),
-                                                           comments='')
+                                                           comments='',
+                                                           significance=__SKIP__)
 
     def test__init____with_values(self):                                         # Test with values
         with Perf_Benchmark__Hypothesis(description        = 'Test hypothesis',
@@ -76,6 +85,14 @@ class test_Perf_Benchmark__Hypothesis(TestCase):
                                                                                   measure_quick     = True,
                                                                                   measure_fast      = False,
                                                                                   measure_only_3    = False,
+                                                                                  workers           = 0,
+                                                                                  pin_cpus          = False,
+                                                                                  warmup_invocations=0,
+                                                                                  gc_disabled       = False,
+                                                                                  calibrate_budget_ns=0,
+                                                                                  measure_memory=False,
+                                                                                  batch_size=0,
+                                                                                  repeats=0,
                                                                                   title='',
                                                                                   description='',
                                                                                   output_path='',
@@ -85,7 +102,8 @@ class test_Perf_Benchmark__Hypothesis(TestCase):
                                                        target_improvement=0.5,
                                                        before_results=__(),
                                                        after_results=__(),
-                                                       comments='Test comment')
+                                                       comments='Test comment',
+                                                       significance=__SKIP__)
 
     def test__init____with_config(self):                                         # Test with custom config
         config = Schema__Perf__Benchmark__Hypothesis__Config(use_raw_scores = False,
@@ -120,9 +138,11 @@ class test_Perf_Benchmark__Hypothesis(TestCase):
                                                                                                index='01',
                                                                                                name='test',
                                                                                                final_score=__SKIP__,
-                                                                                               raw_score=__SKIP__)),
+                                                                                               raw_score=__SKIP__,
+                                                                                               run_scores=__SKIP__)),
                                                                after_results=__(),
-                                                               comments='')
+                                                               comments='',
+                                                               significance=__SKIP__)
 
     def test_run_after(self):                                                    # Test run_after method
         def benchmarks(timing):
@@ -142,8 +162,10 @@ class test_Perf_Benchmark__Hypothesis(TestCase):
                                                                               index='01',
                                                                               name='test',
                                                                               final_score=__SKIP__,
-                                                                              raw_score=__SKIP__)),
-                                               comments='')
+                                                                              raw_score=__SKIP__,
+                                                                              run_scores=__SKIP__)),
+                                               comments='',
+                                               significance=__SKIP__)
 
     def test_run_both(self):                                                     # Test both before and after
         def benchmarks(timing):
@@ -164,26 +186,31 @@ class test_Perf_Benchmark__Hypothesis(TestCase):
                                                                                index='01',
                                                                                name='test',
                                                                                final_score=__SKIP__,
-                                                                               raw_score=__SKIP__),
+                                                                               raw_score=__SKIP__,
+                                                                               run_scores=__SKIP__),
                                                                  A_02__test=__(benchmark_id='A_02__test',
                                                                                section='A',
                                                                                index='02',
                                                                                name='test',
                                                                                final_score=__SKIP__,
-                                                                               raw_score=__SKIP__)),
+                                                                               raw_score=__SKIP__,
+                                                                               run_scores=__SKIP__)),
                                                after_results=__(A_01__test=__(benchmark_id='A_01__test',
                                                                               section='A',
                                                                               index='01',
                                                                               name='test',
                                                                               final_score=__SKIP__,
-                                                                              raw_score=__SKIP__),
+                                                                              raw_score=__SKIP__,
+                                                                              run_scores=__SKIP__),
                                                                 A_02__test=__(benchmark_id='A_02__test',
                                                                               section='A',
                                                                               index='02',
                                                                               name='test',
                                                                               final_score=__SKIP__,
-                                                                              raw_score=__SKIP__)),
-                                               comments='')
+                                                                              raw_score=__SKIP__,
+                                                                              run_scores=__SKIP__)),
+                                               comments='',
+                                               significance=__SKIP__)
 
 
     # ═══════════════════════════════════════════════════════════════════════════════
@@ -246,6 +273,26 @@ class test_Perf_Benchmark__Hypothesis(TestCase):
 
             assert type(result.status) is Enum__Hypothesis__Status
 
+    def test_evaluate__significance(self):                                       # Test noise is INCONCLUSIVE, even when the scores moved
+        noise  = [1000, 1010, 990, 1005, 995, 1000, 1020, 980] * 4
+        faster = [value // 2 for value in noise]
+        def result(raw_score, run_scores):
+            return self.test_data.create_benchmark_result(benchmark_id='A_01__test', raw_score=raw_score, run_scores=run_scores)
+
+        with Perf_Benchmark__Hypothesis(target_improvement = Safe_Float(0.1)) as _:
+            _.before_results['A_01__test'] = result(1000, noise      )
+            _.after_results ['A_01__test'] = result( 800, noise[::-1])
+            evaluation = _.evaluate()
+            assert float(evaluation.actual_improvement)                 == 0.2
+            assert evaluation.status                                    == Enum__Hypothesis__Status.INCONCLUSIVE
+            assert evaluation.comparisons[0].significance.significant   is False
+
+            _.after_results ['A_01__test'] = result( 500, faster     )
+            evaluation = _.evaluate()
+            assert evaluation.status                                    == Enum__Hypothesis__Status.SUCCESS
+            assert evaluation.comparisons[0].score_b                    == 500                      # use_raw_scores
+            assert evaluation.comparisons[0].significance.p_value       <  0.05
+
     def test_evaluate__result_contains_description(self):                        # Test result has description
         def benchmarks(timing):
             timing.benchmark(Safe_Str__Benchmark_Id('A_01__test'), self.test_data.target_nop)
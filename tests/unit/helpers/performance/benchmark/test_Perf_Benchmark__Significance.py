@@ -0,0 +1,107 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Test Perf_Benchmark__Significance - Tests for statistical regression detection
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import random
+from unittest                                                                                             import TestCase
+from osbot_utils.helpers.performance.benchmark.Perf_Benchmark__Significance                               import Perf_Benchmark__Significance, SIGNIFICANCE__ALPHA, SIGNIFICANCE__BOOTSTRAP_SAMPLES, SIGNIFICANCE__MIN_CHANGE
+from osbot_utils.helpers.performance.benchmark.schemas.benchmark.Schema__Perf__Benchmark__Significance    import Schema__Perf__Benchmark__Significance
+from osbot_utils.helpers.performance.benchmark.schemas.enums.Enum__Benchmark__Trend                       import Enum__Benchmark__Trend
+
+
+def noisy_times(mean: int, count: int = 200, seed: int = 0) -> list:            # Timing-like samples: normal noise plus a few slow outliers
+    rng   = random.Random(seed)
+    times = [max(1, int(rng.gauss(mean, mean * 0.05))) for _ in range(count)]
+    for index in range(0, count, 50):
+        times[index] *= 5
+    return times
+
+
+class test_Perf_Benchmark__Significance(TestCase):
+
+    def test__init__(self):
+        with Perf_Benchmark__Significance() as _:
+            assert _.alpha             == SIGNIFICANCE__ALPHA
+            assert _.bootstrap_samples == SIGNIFICANCE__BOOTSTRAP_SAMPLES
+            assert _.min_change        == SIGNIFICANCE__MIN_CHANGE
+            assert _.obj().seed        == 0
+
+    def test_mann_whitney_u(self):                                               # Test known values (normal approximation, two-sided)
+        with Perf_Benchmark__Significance() as _:
+            u_statistic, p_value = _.mann_whitney_u([1, 2, 3], [4, 5, 6])
+            assert u_statistic               == 0.0
+            assert round(p_value, 4)         == 0.0809
+            u_statistic, p_value = _.mann_whitney_u([1, 2, 2, 3], [2, 3, 3, 4])  # with ties
+            assert u_statistic               == 3.0
+            assert round(p_value, 4)         == 0.172
+            assert _.mann_whitney_u([5, 5, 5], [5, 5, 5]) == (4.5, 1.0)             # no variance
+
+    def test_cliffs_delta(self):
+        with Perf_Benchmark__Significance() as _:
+            assert _.cliffs_delta(9, 3, 3) ==  1.0                               # all before times are bigger (i.e. after is faster)
+            assert _.cliffs_delta(0, 3, 3) == -1.0
+            assert _.cliffs_delta(0, 0, 3) ==  0.0
+
+    def test_compare__noise(self):                                               # Test the same distribution is not flagged
+        with Perf_Benchmark__Significance() as _:
+            result = _.compare(noisy_times(1000, seed=1), noisy_times(1000, seed=2))
+            assert type(result)          is Schema__Perf__Benchmark__Significance
+            assert result.significant    is False
+            assert result.trend          == Enum__Benchmark__Trend.UNCHANGED
+            assert result.p_value        >  SIGNIFICANCE__ALPHA
+            assert abs(result.effect_size) < 0.147
+            assert result.ci_low         <= 0 <= result.ci_high
+
+    def test_compare__regression(self):                                          # Test a real slowdown is reported, with its size
+        with Perf_Benchmark__Significance() as _:
+            result = _.compare(noisy_times(1000, seed=1), noisy_times(1300, seed=2))
+            assert result.significant    is True
+            assert result.trend          == Enum__Benchmark__Trend.STRONG_REGRESSION
+            assert result.p_value        <  SIGNIFICANCE__ALPHA
+            assert result.effect_size    <  -0.9
+            assert result.ci_high        <  0
+            assert -35 < result.change_percent < -25
+            assert (result.sample_size_a, result.sample_size_b) == (200, 200)
+
+    def test_compare__improvement(self):
+        with Perf_Benchmark__Significance() as _:
+            result = _.compare(noisy_times(1000, seed=1), noisy_times(930, seed=2))
+            assert result.significant    is True
+            assert result.trend          == Enum__Benchmark__Trend.IMPROVEMENT           # small (< 10%) but real
+            assert result.ci_low         >  0
+
+    def test_compare__min_change(self):                                          # Test a statistically real, but tiny, change is not reported
+        with Perf_Benchmark__Significance() as _:
+            result = _.compare(noisy_times(1000, seed=1), noisy_times(980, seed=2))
+            assert result.p_value        <  SIGNIFICANCE__ALPHA
+            assert result.change_percent <  SIGNIFICANCE__MIN_CHANGE
+            assert result.significant    is False
+            assert result.trend          == Enum__Benchmark__Trend.UNCHANGED
+
+            _.min_change = 1.0
+            assert _.compare(noisy_times(1000, seed=1), noisy_times(980, seed=2)).trend == Enum__Benchmark__Trend.IMPROVEMENT
+
+    def test_compare__runs(self):                                                # Test the run scores of a few repeated runs
+        runs_a = [1000, 1010, 990, 1005, 995]
+        runs_b = [1300, 1290, 1310, 1305, 1295]
+        with Perf_Benchmark__Significance() as _:
+            assert _.can_compare(runs_a, runs_b)         is True
+            assert _.can_compare(runs_a[:3], runs_b[:3]) is False
+            result = _.compare(runs_a, runs_b)
+            assert result.significant    is True
+            assert result.trend          == Enum__Benchmark__Trend.STRONG_REGRESSION
+            assert result.change_percent == -30.0
+            assert _.compare(runs_a[:3], runs_b[:3]).trend == Enum__Benchmark__Trend.UNCHANGED   # 3 runs are not enough
+
+    def test_compare__not_enough_samples(self):
+        with Perf_Benchmark__Significance() as _:
+            result = _.compare([100, 100], [500, 500])
+            assert result.significant    is False
+            assert result.trend          == Enum__Benchmark__Trend.UNCHANGED
+            assert result.p_value        == 1.0
+            assert result.change_percent == -400.0
+
+    def test_compare__deterministic(self):                                       # Test the bootstrap uses a fixed seed
+        times_a = noisy_times(1000, seed=1)
+        times_b = noisy_times(1020, seed=2)
+        assert Perf_Benchmark__Significance().compare(times_a, times_b).json() == Perf_Benchmark__Significance().compare(times_a, times_b).json()
@@ -14,6 +14,8 @@ from osbot_utils.helpers.performance.benchmark.Perf_Benchmark__Timing__Reporter
 from osbot_utils.helpers.performance.benchmark.schemas.collections.Dict__Benchmark_Results                import Dict__Benchmark_Results
 from osbot_utils.helpers.performance.benchmark.schemas.benchmark.Schema__Perf__Benchmark__Result          import Schema__Perf__Benchmark__Result
 from osbot_utils.helpers.performance.benchmark.schemas.safe_str.Safe_Str__Benchmark_Id                    import Safe_Str__Benchmark_Id
+from osbot_utils.helpers.performance.benchmark.schemas.enums.Enum__Benchmark__Trend                       import Enum__Benchmark__Trend
+from osbot_utils.helpers.performance.benchmark.Perf_Benchmark__Diff                                       import Perf_Benchmark__Diff
 
 
 class test_Perf_Benchmark__Timing(TestCase):
@@ -37,13 +39,22 @@ class test_Perf_Benchmark__Timing(TestCase):
                                                      measure_quick=True,
                                                      measure_fast=False,
                                                      measure_only_3=False,
+                                                     workers=0,
+                                                     pin_cpus=False,
+                                                     warmup_invocations=0,
+                                                     gc_disabled=False,
+                                                     calibrate_budget_ns=0,
+                                                     measure_memory=False,
+                                                     batch_size=0,
+                                                     repeats=0,
                                                      title='',
                                                      description='',
                                                      output_path='',
                                                      output_prefix='',
                                                      legend=__()),
                                            results=__(),
-                                           sessions=__())
+                                           sessions=__(),
+                                           queued=[])
 
 
 
@@ -116,7 +127,10 @@ class test_Perf_Benchmark__Timing(TestCase):
                                       index        = '01'          ,
                                       name         = 'test'        ,
                                       final_score  = __SKIP__      ,
-                                      raw_score    = __SKIP__      )
+                                      raw_score    = __SKIP__      ,
+                                      run_scores   = __SKIP__      ,
+                                      memory       = None          )
+            assert result.run_scores        == []                                 # a single run (config.repeats is 0), so nothing for the significance tests
 
 
             assert timing.obj() == __(config=__( time_unit='ns',
@@ -126,6 +140,14 @@ class test_Perf_Benchmark__Timing(TestCase):
                                                  measure_quick=True,
                                                  measure_fast=False,
                                                  measure_only_3=False,
+                                                 workers=0,
+                                                 pin_cpus=False,
+                                                 warmup_invocations=0,
+                                                 gc_disabled=False,
+                                                 calibrate_budget_ns=0,
+                                                 measure_memory=False,
+                                                 batch_size=0,
+                                                 repeats=0,
                                                  title='Test Benchmarks',
                                                  description='',
                                                  output_path='',
@@ -136,7 +158,9 @@ class test_Perf_Benchmark__Timing(TestCase):
                                                                                index        = '01'          ,
                                                                                name         = 'test'        ,
                                                                                final_score  = __SKIP__      ,
-                                                                               raw_score    = __SKIP__      )),
+                                                                               raw_score    = __SKIP__      ,
+                                                                               run_scores   = __SKIP__      ,
+                                                                               memory       = None          )),
                                       sessions = __(A_01__test              = __(result     = __(measurements = __( _1 = __(avg_time     = __SKIP__ ,
                                                                                                                         min_time     = __SKIP__ ,
                                                                                                                         max_time     = __SKIP__ ,
@@ -152,9 +176,14 @@ class test_Perf_Benchmark__Timing(TestCase):
                                                                                                                    _8 = __SKIP__),
                                                                                           name         = 'target_nop'         ,
                                                                                           raw_score    = __SKIP__              ,
-                                                                                          final_score  = __SKIP__              ),
-                                                                              assert_enabled = True                            ,
-                                                                              padding        = 30                              )))
+                                                                                          final_score  = __SKIP__              ,
+                                                                                          memory       = None                  ),
+                                                                              assert_enabled     = True                        ,
+                                                                              padding            = 30                          ,
+                                                                              measure_memory     = False                       ,
+                                                                              memory_invocations = 10                          ,
+                                                                              batch_size         = 0                           )),
+                                      queued   = [])
 
 
     def test_benchmark__stored_in_results(self):                                 # Test result stored
@@ -225,6 +254,43 @@ class test_Perf_Benchmark__Timing(TestCase):
             assert reporter.results       is timing.results
             assert reporter.config        is timing.config
 
+    def test_queue__run_queued(self):                                            # Test queued benchmarks are measured together (in workers)
+        with Perf_Benchmark__Timing(config=self.config) as timing:
+            timing.config.workers = 2
+            timing.queue(Safe_Str__Benchmark_Id('A_01__nop'), self.test_data.target_nop)
+            timing.queue(Safe_Str__Benchmark_Id('A_02__nop'), self.test_data.target_nop)
+            assert len(timing.queued)  == 2
+            results = timing.run_queued()
+            assert timing.queued       == []
+            assert [str(r.benchmark_id) for r in results]  == ['A_01__nop', 'A_02__nop']
+            assert list(timing.results)                    == ['A_01__nop', 'A_02__nop']
+            assert list(timing.sessions)                   == ['A_01__nop', 'A_02__nop']
+            assert timing.sessions['A_01__nop'].result.name == 'target_nop'
+
+    def test_benchmark__repeats(self):                                           # Test each run gives one run score, and the session has the times of all runs
+        config = Schema__Perf_Benchmark__Timing__Config(print_to_console=False, repeats=4)
+        with Perf_Benchmark__Timing(config=config) as timing:
+            assert timing.runs()            == 4
+            result  = timing.benchmark(Safe_Str__Benchmark_Id('A_01__nop'), self.test_data.target_nop)
+            session = timing.sessions['A_01__nop']
+            assert len(result.run_scores)   == 4
+            assert session.result.name      == 'target_nop'
+            assert [int(measurement.sample_size) for measurement in session.result.measurements.values()] == [4, 8, 12, 20, 32]   # 4 x measure_quick (1, 2, 3, 5, 8)
+
+    def test_run_queued__same_target(self):                                      # Test measuring the same target twice is not reported as a change (A/A)
+        config = Schema__Perf_Benchmark__Timing__Config(print_to_console=False, repeats=5)
+        with Perf_Benchmark__Timing(config=config) as timing:
+            timing.queue(Safe_Str__Benchmark_Id('A_01__before'), self.test_data.target_simple)
+            timing.queue(Safe_Str__Benchmark_Id('A_02__after' ), self.test_data.target_simple)
+            result_a, result_b = timing.run_queued()
+            assert len(result_a.run_scores) == 5
+            assert len(result_b.run_scores) == 5
+
+            comparison = Perf_Benchmark__Diff().compare_results('A_01', result_a, result_b, use_raw_scores=True)
+            assert comparison.significance             is not None
+            assert comparison.significance.significant is False
+            assert comparison.significance.trend       == Enum__Benchmark__Trend.UNCHANGED
+
     def test_reporter__with_results(self):                                       # Test reporter has results
         with Perf_Benchmark__Timing(config=self.config) as timing:
             timing.benchmark(Safe_Str__Benchmark_Id('A_01__test'), self.test_data.target_nop)
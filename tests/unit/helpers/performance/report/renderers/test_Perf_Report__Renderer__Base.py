@@ -44,6 +44,15 @@ class test_Perf_Report__Renderer__Base(TestCase):
             assert _.format_ns(999_999_999)   == '1000.00ms'
             assert _.format_ns(1_000_000_000) == '1.00s'
 
+    def test__format_bytes(self):                                   # Test byte formatting
+        with Perf_Report__Renderer__Base() as _:
+            assert _.format_bytes(512)            == '512B'
+            assert _.format_bytes(1_024)          == '1.00KB'
+            assert _.format_bytes(1_536)          == '1.50KB'
+            assert _.format_bytes(3 * 1_024 ** 2) == '3.00MB'
+            assert _.format_bytes(2 * 1_024 ** 3) == '2.00GB'
+            assert _.format_bytes(-2_048)         == '-2.00KB'
+
     def test__format_pct(self):                                     # Test percentage formatting
         with Perf_Report__Renderer__Base() as _:
             assert _.format_pct(50.0)   == ' 50.0%'
@@ -10,6 +10,7 @@ from osbot_utils.helpers.performance.report.renderers.Perf_Report__Renderer__Bas
 from osbot_utils.helpers.performance.report.renderers.Perf_Report__Renderer__Markdown                            import Perf_Report__Renderer__Markdown
 from osbot_utils.helpers.performance.report.schemas.Schema__Perf_Report import Schema__Perf_Report
 from osbot_utils.helpers.performance.testing.QA__Perf_Report__Test_Data                                          import QA__Perf_Report__Test_Data
+from osbot_utils.helpers.performance.schemas.Schema__Performance_Measure__Memory                                 import Schema__Performance_Measure__Memory
 from osbot_utils.type_safe.Type_Safe                                                                             import Type_Safe
 
 
@@ -86,6 +87,18 @@ class test_Perf_Report__Renderer__Markdown(TestCase):
             assert '## Individual Benchmarks' in output
             assert '| Benchmark | Time | Percentage |' in output
 
+    def test_render__memory(self):                                  # Test memory table is only shown when there are memory metrics
+        report = self.test_data.create_report()
+
+        with self.renderer as _:
+            assert _.render_memory(report) == []
+
+            report.benchmarks[1].memory = Schema__Performance_Measure__Memory(invocations=10, peak_bytes=1_536, allocated_bytes=-64,
+                                                                              allocated_blocks=-1, gc_objects=2, gc_collections=1)
+            output = _.render(report)
+            assert '## Memory' in output
+            assert '| A\\_02\\_\\_full\\_convert | 1.50KB | -64B | -1 | 2 | 1 |' in output
+
     def test_render__contains_categories_table(self):               # Test categories table
         report = self.test_data.create_report()
 
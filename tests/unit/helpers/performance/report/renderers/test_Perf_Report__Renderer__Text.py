@@ -7,6 +7,7 @@ from osbot_utils.helpers.performance.report.renderers.Perf_Report__Renderer__Bas
 from osbot_utils.helpers.performance.report.renderers.Perf_Report__Renderer__Text             import Perf_Report__Renderer__Text
 from osbot_utils.helpers.performance.report.schemas.collections.List__Perf_Report__Categories import List__Perf_Report__Categories
 from osbot_utils.helpers.performance.testing.QA__Perf_Report__Test_Data                       import QA__Perf_Report__Test_Data
+from osbot_utils.helpers.performance.schemas.Schema__Performance_Measure__Memory              import Schema__Performance_Measure__Memory
 from osbot_utils.type_safe.Type_Safe                                                          import Type_Safe
 
 
@@ -137,6 +138,20 @@ class test_Perf_Report__Renderer__Text(TestCase):
             assert 'Category' in output                             # Print_Table header
             assert 'A_01__' in output
 
+    def test_render__memory_table(self):                            # Test memory section is only shown when there are memory metrics
+        report = self.test_data.create_report()
+
+        with self.renderer as _:
+            assert 'MEMORY' not in _.render(report)
+
+            report.benchmarks[0].memory = Schema__Performance_Measure__Memory(invocations=10, peak_bytes=2_048, allocated_bytes=512,
+                                                                              allocated_blocks=3, gc_objects=1, gc_collections=0)
+            output = _.render(report)
+            assert 'MEMORY'         in output
+            assert 'Allocated/call' in output
+            assert '2.00KB'         in output
+            assert '512B'           in output
+
     def test_render__contains_category_summary(self):               # Test category summary
         report = self.test_data.create_report()
 
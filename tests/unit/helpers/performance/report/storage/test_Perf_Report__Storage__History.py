@@ -0,0 +1,157 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# test_Perf_Report__Storage__History - Tests for the sqlite history storage
+# ═══════════════════════════════════════════════════════════════════════════════
+
+from unittest                                                                                       import TestCase
+from unittest.mock                                                                                  import patch
+from osbot_utils.helpers.performance.benchmark.schemas.enums.Enum__Benchmark__Trend                 import Enum__Benchmark__Trend
+from osbot_utils.helpers.performance.benchmark.schemas.enums.Enum__Comparison__Status               import Enum__Comparison__Status
+from osbot_utils.helpers.performance.report.schemas.Schema__Perf_Report                             import Schema__Perf_Report
+from osbot_utils.helpers.performance.report.schemas.collections.List__Perf_Report__History__Points  import List__Perf_Report__History__Points
+from osbot_utils.helpers.performance.report.storage.Perf_Report__Storage__Base                      import Perf_Report__Storage__Base
+from osbot_utils.helpers.performance.report.storage.Perf_Report__Storage__History                   import Perf_Report__Storage__History, HISTORY__MACHINE__HASH_LENGTH
+from osbot_utils.helpers.performance.testing.QA__Perf_Report__Test_Data                             import QA__Perf_Report__Test_Data
+from osbot_utils.testing.Temp_Folder                                                                import Temp_Folder
+from osbot_utils.type_safe.Type_Safe                                                                import Type_Safe
+from osbot_utils.utils.Files                                                                        import file_exists, path_combine
+
+
+class test_Perf_Report__Storage__History(TestCase):
+
+    @classmethod
+    def setUpClass(cls):                                            # Shared test data
+        cls.test_data = QA__Perf_Report__Test_Data()
+
+    def create_report(self, timestamp: int, time_ns: int) -> Schema__Perf_Report:     # Report where the first benchmark takes time_ns
+        report = self.test_data.create_report()
+        report.metadata.timestamp     = timestamp
+        report.benchmarks[0].time_ns  = time_ns
+        return report
+
+    def create_history(self, **kwargs) -> Perf_Report__Storage__History:              # History with the commits c1, c2, c3 (getting slower)
+        history = Perf_Report__Storage__History(**kwargs)
+        for index, key in enumerate(['c1', 'c2', 'c3']):
+            history.save(self.create_report(timestamp=1_000 + index, time_ns=1_000 * (index + 1)), key=key)
+        return history
+
+    def test__init__(self):                                         # Test initialization
+        with Perf_Report__Storage__History() as _:
+            assert type(_)         is Perf_Report__Storage__History
+            assert isinstance(_, Type_Safe)
+            assert isinstance(_, Perf_Report__Storage__Base)
+            assert _.db_path       == ''
+            assert len(_.machine)  == HISTORY__MACHINE__HASH_LENGTH
+            assert _.machine       == _.machine_fingerprint()            # stable on the same machine
+        assert Perf_Report__Storage__History(machine='ci-runner').machine == 'ci-runner'
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Storage Interface Tests
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def test_save__load(self):                                      # Test the report round-trips
+        with Perf_Report__Storage__History() as _:
+            report = self.test_data.create_report()
+            assert _.save(report, key='abc123')         is True
+            assert _.exists('abc123')                   is True
+            assert _.exists('other')                    is False
+            assert _.load('abc123').json()              == report.json()
+            assert _.load('other')                      is None
+            assert _.save_content('abc123', 'text', 'txt') is False
+
+    def test_save__replaces_key(self):                              # Test saving a key again replaces its run
+        with self.create_history() as _:
+            assert _.list_reports()                                 == ['c1', 'c2', 'c3']
+            _.save(self.create_report(timestamp=2_000, time_ns=500), key='c1')
+            assert _.list_reports()                                 == ['c2', 'c3', 'c1']
+            assert [int(point.time_ns) for point in _.history('A_01__full_operation')] == [2_000, 3_000, 500]
+
+    def test_save__replaces_key__in_one_transaction(self):           # Test a failed save keeps the previous run of the key
+        with self.create_history() as _:
+            with patch('osbot_utils.helpers.performance.report.storage.Perf_Report__Storage__History.json_dumps', side_effect=ValueError('json failed')):
+                try:
+                    _.save(self.create_report(timestamp=2_000, time_ns=500), key='c1')
+                    assert False, 'save should have raised'
+                except ValueError as error:
+                    assert str(error) == 'json failed'
+            assert _.database().connection().in_transaction         is False
+            assert _.list_reports()                                 == ['c1', 'c2', 'c3']           # the delete of c1 was rolled back
+            assert [int(point.time_ns) for point in _.history('A_01__full_operation')] == [1_000, 2_000, 3_000]
+
+    def test_delete(self):
+        with self.create_history() as _:
+            assert _.delete('c2')                       is True
+            assert _.delete('c2')                       is False
+            assert _.list_reports()                     == ['c1', 'c3']
+            assert len(_.history('A_01__full_operation')) == 2
+
+    def test_machines(self):                                        # Test runs are kept per machine
+        with Temp_Folder() as folder:
+            db_path   = path_combine(folder.path(), 'history.sqlite')
+            machine_a = self.create_history(db_path=db_path, machine='machine_a')
+            machine_b = Perf_Report__Storage__History(db_path=db_path, machine='machine_b')
+            machine_b.save(self.create_report(timestamp=5_000, time_ns=10), key='c1')
+            assert file_exists(db_path)          is True
+            assert machine_b.machines()          == ['machine_a', 'machine_b']
+            assert machine_a.list_reports()      == ['c1', 'c2', 'c3']
+            assert machine_b.list_reports()      == ['c1']
+            assert machine_a.load('c1').benchmarks[0].time_ns == 1_000
+            assert machine_b.load('c1').benchmarks[0].time_ns == 10
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Time Series Tests
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def test_history(self):                                         # Test the time series of one benchmark
+        with self.create_history() as _:
+            points = _.history('A_01__full_operation')
+            assert type(points)                            is List__Perf_Report__History__Points
+            assert [point.run_key for point in points]     == ['c1', 'c2', 'c3']
+            assert [point.time_ns for point in points]     == [1_000, 2_000, 3_000]
+            assert points[0].obj().category_id             == 'A'
+            assert [point.run_key for point in _.history('A_01__full_operation', limit=2)    ] == ['c2', 'c3']      # the most recent ones
+            assert [point.run_key for point in _.history('A_01__full_operation', since=1_000)] == ['c2', 'c3']
+            assert list(_.history('unknown'))              == []
+            assert _.benchmark_ids()                       == [str(benchmark.benchmark_id) for benchmark in self.test_data.create_benchmarks_list()]
+
+    def test_evolution(self):                                       # Test every benchmark over the last runs
+        with self.create_history() as _:
+            evolution = _.evolution()
+            assert evolution.status                 == Enum__Comparison__Status.SUCCESS
+            assert evolution.session_count          == 3
+            assert list(evolution.titles)           == ['c1', 'c2', 'c3']
+            first = evolution.evolutions[0]
+            assert first.benchmark_id               == 'A_01__full_operation'
+            assert list(first.scores)               == [1_000, 2_000, 3_000]
+            assert first.change_percent             == -200.0
+            assert first.trend                      == Enum__Benchmark__Trend.STRONG_REGRESSION
+            assert evolution.evolutions[1].trend    == Enum__Benchmark__Trend.UNCHANGED
+            assert list(_.evolution(limit=2).titles) == ['c2', 'c3']
+
+    def test_evolution__missing_benchmark(self):                    # Test runs without a benchmark are gaps (not 0)
+        with self.create_history() as _:
+            report       = self.create_report(timestamp=2_000, time_ns=4_000)
+            benchmark_id = str(report.benchmarks[1].benchmark_id)
+            del report.benchmarks[1]
+            _.save(report, key='c4')
+            evolution = {str(item.benchmark_id): item for item in _.evolution().evolutions}
+            assert list(evolution['A_01__full_operation'].scores)    == [1_000, 2_000, 3_000, 4_000]
+            assert list(evolution[benchmark_id].scores)[-1]          is None
+            assert evolution[benchmark_id].last_score                == evolution[benchmark_id].scores[2]
+            assert evolution[benchmark_id].trend                     == Enum__Benchmark__Trend.UNCHANGED
+            html = _.dashboard()
+            assert "trendChart('trend_0', [1000, 2000, 3000, 4000]" in html
+            assert ', null]'                                        in html                       # Chart.js leaves a gap
+
+    def test_evolution__not_enough_runs(self):
+        with Perf_Report__Storage__History() as _:
+            assert _.evolution().status == Enum__Comparison__Status.ERROR_NO_SESSIONS
+            _.save(self.test_data.create_report(), key='c1')
+            assert _.evolution().status == Enum__Comparison__Status.ERROR_INSUFFICIENT_SESSIONS
+
+    def test_dashboard(self):                                       # Test the static HTML dashboard
+        with self.create_history() as _:
+            html = _.dashboard()
+            assert '<html>'                                         in html
+            assert '6 Benchmarks, 3 Runs'                           in html
+            assert "trendChart('trend_0', [1000, 2000, 3000]"       in html
+            assert "const labels = ['c1', 'c2', 'c3'];"             in html
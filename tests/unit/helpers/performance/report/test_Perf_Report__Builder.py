@@ -98,6 +98,17 @@ class test_Perf_Report__Builder(TestCase):
             assert str(benchmarks[0].category_id) == 'A'
             assert str(benchmarks[1].category_id) == 'B'
 
+    def test_build_benchmarks__memory(self):                         # Test memory metrics are copied from the results
+        config = Schema__Perf_Benchmark__Timing__Config(print_to_console=False, measure_only_3=True, measure_memory=True)
+        with Perf_Report__Builder(config=config) as _:
+            timing = Perf_Benchmark__Timing(config=config)
+            timing.benchmark('A_01__test', self.test_data.target_list)
+
+            benchmarks = _.build_benchmarks(timing)
+            assert benchmarks[0].memory             is not None
+            assert benchmarks[0].memory             == timing.results['A_01__test'].memory
+            assert benchmarks[0].memory.invocations == 10
+
     def test_build_categories(self):                                # Test build_categories
         with self.test_data as td:
             benchmarks = td.create_benchmarks_list(count=4)
@@ -1,12 +1,15 @@
 import pytest
-from statistics                                                                         import mean, median
+from array                                                                              import array
+from statistics                                                                         import mean, median, stdev
 from unittest                                                                           import TestCase
 from unittest.mock                                                                      import patch
 from osbot_utils.helpers.performance.Performance_Measure__Session                       import Performance_Measure__Session
 from osbot_utils.helpers.performance.Performance_Measure__Session                       import MEASURE__INVOCATION__LOOPS
 from osbot_utils.helpers.performance.Performance_Measure__Session                       import MEASURE__INVOCATION__LOOPS__QUICK
 from osbot_utils.helpers.performance.Performance_Measure__Session                       import MEASURE__INVOCATION__LOOPS__FAST
+from osbot_utils.helpers.performance.Performance_Measure__Session                       import MEASURE__MEMORY__INVOCATIONS
 from osbot_utils.helpers.performance.schemas.Schema__Performance_Measure__Measurement   import Schema__Performance_Measure__Measurement
+from osbot_utils.helpers.performance.schemas.Schema__Performance_Measure__Memory        import Schema__Performance_Measure__Memory
 from osbot_utils.testing.Pytest                                                         import skip__if_not__in_github_actions
 from osbot_utils.type_safe.Type_Safe                                                    import Type_Safe
 
@@ -59,6 +62,19 @@ class test_Performance_Measure__Session(TestCase):
             raw_score = _.calculate_raw_score(times)
             assert 100 < raw_score < 200                                                        # Between extremes
 
+    # ------------------------------------------------
+    # Tests for calculate_stddev
+    # ------------------------------------------------
+
+    def test_calculate_stddev(self):                                                            # Test the sample standard deviation matches statistics.stdev
+        with self.session as _:
+            times = [100, 110, 105, 108, 102, 107, 103, 109, 104, 10000]
+            assert _.calculate_stddev(times)                    == pytest.approx(stdev(times))
+            assert _.calculate_stddev(times, total=sum(times))  == pytest.approx(stdev(times))
+            assert _.calculate_stddev(array('q', times))        == pytest.approx(stdev(times))
+            assert _.calculate_stddev([100])                    == 0
+            assert _.calculate_stddev([])                       == 0
+
     # ------------------------------------------------
     # Tests for calculate_stable_score
     # ------------------------------------------------
@@ -114,6 +130,15 @@ class test_Performance_Measure__Session(TestCase):
             assert metrics.median_time  == int(median(times))
             assert metrics.raw_times    == times
 
+    def test_calculate_metrics__stddev_and_array(self):                                         # Test stats match the statistics module, also for array('q') samples
+        with self.session as _:
+            times   = [100, 200, 150, 175, 125, 90]
+            metrics = _.calculate_metrics(array('q', times))
+            assert metrics.median_time             == int(median(times))
+            assert round(metrics.stddev_time, 9)   == round(stdev(times), 9)
+            assert metrics.raw_times               == times
+            assert metrics.obj()                   == _.calculate_metrics(times).obj()
+
     def test_calculate_metrics__empty_list(self):                                               # Test error on empty list
         with self.session as _:
             with pytest.raises(ValueError, match="Cannot calculate metrics from empty time list"):
@@ -201,6 +226,56 @@ class test_Performance_Measure__Session(TestCase):
             assert _.result.name == 'TestClass'
             assert _.result.final_score > 0
 
+    def test_measure__batched(self):                                                            # Test blocks of batch_size calls give one (per call) sample each
+        calls = []
+        def target():
+            calls.append(1)
+
+        with Performance_Measure__Session(batch_size=10) as _:
+            loops_times = _.measure__times(target, loops=[1, 2, 3])
+            assert [loop_size  for loop_size, times in loops_times] == [1, 2, 3]
+            assert [len(times) for loop_size, times in loops_times] == [1, 2, 3]
+            assert all(type(times) is array for loop_size, times in loops_times)
+            assert all(time_taken >= 0 for loop_size, times in loops_times for time_taken in times)
+            assert len(calls)                                        == (1 + 2 + 3) * 10
+
+            _.measure(target, loops=[1, 2, 3])
+            assert _.result.name                        == 'target'
+            assert _.result.measurements[3].sample_size == 3
+
+    def test_measure__baseline(self):                                                           # Test the empty loop calibration
+        with Performance_Measure__Session() as _:
+            assert _.measure__baseline(1)     >  0
+            assert _.measure__baseline(1_000) >  0
+
+    def test_measure__memory(self):                                                             # Test memory metrics are only captured when asked for
+        leaked = []
+        def target_leak():
+            leaked.append([0] * 64)                                                             # one list (tracked by the GC) kept per call
+
+        with Performance_Measure__Session() as _:
+            _.measure(target_leak, loops=[1, 2])
+            assert _.result.memory is None
+            assert len(leaked)     == 3
+
+        with Performance_Measure__Session(measure_memory=True) as _:
+            _.measure(target_leak, loops=[1, 2])
+            memory = _.result.memory
+            assert type(memory)             is Schema__Performance_Measure__Memory
+            assert memory.invocations       == MEASURE__MEMORY__INVOCATIONS
+            assert len(leaked)              == 3 + 3 + MEASURE__MEMORY__INVOCATIONS
+            assert memory.peak_bytes        >= 64 * 8                                           # the list's items
+            assert memory.allocated_bytes   >= 64 * 8                                           # still allocated after the calls
+            assert memory.allocated_blocks  >= 1
+            assert memory.gc_objects        == 1
+
+    def test_measure__memory__no_allocations(self):                                             # Test a target that keeps nothing
+        with Performance_Measure__Session(memory_invocations=5) as _:
+            memory = _.measure__memory(lambda: None)
+            assert memory.invocations     == 5
+            assert memory.allocated_bytes <  64 * 8                                            # only tracemalloc's own book-keeping
+            assert memory.gc_objects      <= 0
+
     # ------------------------------------------------
     # Tests for print methods
     # ------------------------------------------------
@@ -254,6 +329,24 @@ class test_Performance_Measure__Session(TestCase):
             output = captured.getvalue()
             assert len(output.split("|")[0].strip()) <= 50
 
+    def test_print_report__memory(self):                                                        # Test the memory lines in the detailed report
+        import io
+        import sys
+        with Performance_Measure__Session(measure_memory=True) as _:
+            _.measure(lambda: None, loops=[1, 2, 3])
+
+            captured = io.StringIO()
+            sys.stdout = captured
+            try:
+                _.print_report()
+            finally:
+                sys.stdout = sys.__stdout__
+
+            output = captured.getvalue()
+            assert "Peak Memory" in output
+            assert "GC Runs"     in output
+            assert "Distribution:" in output
+
     def test_print_measurement(self):                                                           # Test detailed measurement print
         import io
         import sys
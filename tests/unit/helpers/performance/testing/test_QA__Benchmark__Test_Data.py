@@ -132,7 +132,8 @@ class test_QA__Benchmark__Test_Data(TestCase):
                                              index='01',
                                              name='python__nop',
                                              final_score=100,
-                                             raw_score=87)
+                                             raw_score=87,
+                                             run_scores=[])
 
     def test_create_benchmark_result__custom_values(self):                       # Test with custom values
         with self.test_data as _:
@@ -223,19 +224,22 @@ class test_QA__Benchmark__Test_Data(TestCase):
                                                                                  index        = '01'                       ,
                                                                                  name         = 'python__nop'              ,
                                                                                  final_score  = 100                        ,
-                                                                                 raw_score    = 87)                        ,
+                                                                                 raw_score    = 87,
+                                                                                 run_scores   = [])                        ,
                                                    A_02__python__class_empty = __(benchmark_id = 'A_02__python__class_empty',
                                                                                  section       = 'A'                          ,
                                                                                  index         = '02'                         ,
                                                                                  name          = 'python__class_empty'       ,
                                                                                  final_score   = 500                          ,
-                                                                                 raw_score     = 456)                        ,
+                                                                                 raw_score     = 456,
+                                                                                 run_scores    = [])                        ,
                                                    B_01__type_safe__empty    = __(benchmark_id = 'B_01__type_safe__empty' ,
                                                                                  section       = 'B'                          ,
                                                                                  index         = '01'                         ,
                                                                                  name          = 'type_safe__empty'          ,
                                                                                  final_score   = 1000                         ,
-                                                                                 raw_score     = 876))
+                                                                                 raw_score     = 876,
+                                                                                 run_scores    = []))
 
     def test_create_results_dict__sections(self):                                # Test sections in results
         with self.test_data as _:
@@ -362,19 +366,22 @@ class test_QA__Benchmark__Test_Data(TestCase):
                                                                                                    index       = '01'                         ,
                                                                                                    name        = 'python__nop'                ,
                                                                                                    final_score = 100                          ,
-                                                                                                   raw_score   = 87)                          ,
+                                                                                                   raw_score   = 87,
+                                                                                                   run_scores  = [])                          ,
                                                                      A_02__python__class_empty = __(benchmark_id = 'A_02__python__class_empty',
                                                                                                    section     = 'A'                          ,
                                                                                                    index       = '02'                         ,
                                                                                                    name        = 'python__class_empty'        ,
                                                                                                    final_score = 500                          ,
-                                                                                                   raw_score   = 456)                         ,
+                                                                                                   raw_score   = 456,
+                                                                                                   run_scores  = [])                         ,
                                                                      B_01__type_safe__empty    = __(benchmark_id = 'B_01__type_safe__empty'   ,
                                                                                                    section     = 'B'                          ,
                                                                                                    index       = '01'                         ,
                                                                                                    name        = 'type_safe__empty'           ,
                                                                                                    final_score = 1000                         ,
-                                                                                                   raw_score   = 876))                        ,
+                                                                                                   raw_score   = 876,
+                                                                                                   run_scores  = []))                        ,
                                                     legend      = __(A = 'Python Baselines'    ,
                                                                     B = 'Type_Safe Creation') )
 
@@ -1,4 +1,5 @@
 import pytest
+import time
 import sys
 from threading                                          import Event
 from unittest                                           import TestCase
@@ -15,17 +16,30 @@ class test_Event_Queue(TestCase):
 
     def test__init__(self):
         with self.event_queue as _:
-            assert _.__dict__ == {'event_class'      : Schema__Event      ,
+            assert _.__dict__ == {'batch_size'       : 1                  ,
+                                  'batches_handled'  : 0                  ,
+                                  'event_class'      : Schema__Event      ,
                                   'events'           : []                 ,
                                   'events_added'     : 0                  ,
                                   'events_completed' : 0                  ,
+                                  'events_dropped'   : 0                  ,
                                   'events_failed'    : 0                  ,
+                                  'events_rejected'  : 0                  ,
+                                  'latency_max'      : 0.0                ,
+                                  'latency_total'    : 0.0                ,
+                                  'lock'             : _.lock             ,
                                   'log_events'       : False              ,
+                                  'ordering_key_field': 'connection_id'   ,
                                   'queue'            : _.queue            ,
+                                  'queue_full_mode'  : 'block'            ,
+                                  'queue_max_size'   : 0                  ,
                                   'queue_name'       : _.queue_name       ,
                                   'queue_get_timeout': TIMEOUT__QUEUE_GET ,
                                   'running'          : True               ,
-                                  'thread'           : _.thread           }
+                                  'thread'           : _.thread           ,
+                                  'worker_queues'    : []                 ,
+                                  'worker_threads'   : []                 ,
+                                  'workers'          : 1                  }
             assert _.queue_name.startswith('event_queue')
 
 
@@ -141,3 +155,106 @@ class test_Event_Queue(TestCase):
                                       'event_type'   : ''               ,
                                       'timestamp'    : event_6.timestamp,
                                       'connection_id': ''               }
+
+    def test_handle_events__batch(self):
+        class An_Batch_Queue(Event__Queue):
+            batches : list
+
+            def handle_events(self, events):
+                self.batches.append([event.event_message for event in events])
+
+        _ = An_Batch_Queue(batch_size=3)
+        for i in range(7):
+            _.send_message(f'event {i}')                                   # queue before starting, so that the batches are deterministic
+        assert _.queue_size() == 7
+        _.queue_get_timeout = 0.001
+        with _:
+            assert _.wait_for_queue_completed() is True
+        assert _.batches == [['event 0', 'event 1', 'event 2'],
+                             ['event 3', 'event 4', 'event 5'],
+                             ['event 6'                      ]]
+        assert _.batches_handled  == 3
+        assert _.events_completed == 7
+        assert _.metrics().get('latency_max_ms') > 0
+
+    def test_queue_full_mode(self):
+        _ = Event__Queue(queue_max_size=2, queue_full_mode='reject')               # not started, so nothing consumes the queue
+        assert _.send_message('a') is not None
+        assert _.send_message('b') is not None
+        assert _.send_message('c') is None                                          # rejected
+        assert _.metrics() == { 'batches_handled' : 0    , 'events_added'    : 2    , 'events_completed': 0    ,
+                                'events_dropped'  : 0    , 'events_failed'   : 0    , 'events_rejected' : 1    ,
+                                'latency_avg_ms'  : 0    , 'latency_max_ms'  : 0    , 'queue_depth'     : 2    ,
+                                'queue_max_size'  : 2    }
+
+        _ = Event__Queue(queue_max_size=2, queue_full_mode='drop-oldest')
+        for message in ['a', 'b', 'c', 'd']:
+            assert _.send_message(message) is not None
+        assert _.events_dropped  == 2
+        assert _.events_added    == 4
+        assert [item[0].event_message for item in _.queue.queue] == ['c', 'd']
+
+        with self.assertRaises(ValueError) as context:
+            Event__Queue(queue_full_mode='an-mode')
+        assert context.exception.args[0] == "in Event__Queue, invalid queue_full_mode 'an-mode', it must be one of: ['block', 'drop-oldest', 'reject']"
+
+    def test_workers__bounded_queues(self):                        # the worker queues are bounded like the main queue (so that backpressure still works)
+        release = Event()
+        class An_Blocked_Queue(Event__Queue):
+            def handle_event(self, event):
+                release.wait(5)
+
+        _ = An_Blocked_Queue(workers=2, queue_max_size=3, queue_full_mode='reject', queue_get_timeout=0.001)
+        with _:
+            assert [worker_queue.maxsize for worker_queue in _.worker_queues] == [3, 3]
+            results = [_.send_message(f'message {i}', connection_id='same-key') is not None for i in range(20)]
+            assert results.count(False)  > 0                                    # rejected, instead of moving all events into the worker queue
+            assert _.events_rejected     == results.count(False)
+            assert _.worker_queue(_.new_event_obj(connection_id='same-key')).qsize() <= 3
+            release.set()
+            assert _.wait_for_queue_completed(thread_join_timeout=5) is True
+        assert _.events_completed == results.count(True)
+
+    def test_workers__stopped_while_worker_queue_is_full(self):     # events that can't be handed to a worker before stop are counted as dropped
+        release = Event()
+        class An_Blocked_Queue(Event__Queue):
+            def handle_event(self, event):
+                release.wait(5)
+
+        _ = An_Blocked_Queue(workers=2, queue_max_size=1, queue_full_mode='reject', queue_get_timeout=0.001)
+        _.start()
+        worker_queue = _.worker_queue(_.new_event_obj(connection_id='same-key'))
+        for i in range(3):                                          # 1st is being handled, 2nd is in the (full) worker queue, 3rd is waiting in the dispatcher
+            assert _.send_message(f'message {i}', connection_id='same-key') is not None
+            while _.queue_size() or (i == 1 and worker_queue.qsize() == 0):
+                time.sleep(0.001)
+        time.sleep(0.01)
+        _.stop()
+        _.thread.join(timeout=5)
+        release.set()
+        _.wait_for_thread_ends()
+        assert _.events_dropped   == 1
+        assert _.metrics().get('events_dropped') == 1
+        assert _.events_added     == 3
+
+    def test_workers__ordering_key(self):
+        class An_Slow_Queue(Event__Queue):
+            handled : dict
+
+            def handle_event(self, event):
+                time.sleep(0.001)                                           # simulate an I/O bound handler
+                self.handled.setdefault(event.connection_id, []).append(event.event_message)
+
+        _ = An_Slow_Queue(workers=4, queue_get_timeout=0.001)
+        keys     = [f'key-{i}' for i in range(8)]
+        expected = {key: [f'{key} {i}' for i in range(10)] for key in keys}
+        with _:
+            assert len(_.worker_threads) == 4
+            for i in range(10):
+                for key in keys:
+                    _.send_message(f'{key} {i}', connection_id=key)
+            assert _.wait_for_queue_completed(thread_join_timeout=5) is True
+        assert _.events_completed == 80
+        assert _.handled          == expected                                # order is preserved per ordering key
+        for key in keys:
+            assert _.worker_queue(_.new_event_obj(connection_id=key)) in _.worker_queues
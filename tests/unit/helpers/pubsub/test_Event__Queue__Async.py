@@ -0,0 +1,112 @@
+import asyncio
+from unittest                                           import TestCase
+from osbot_utils.helpers.pubsub.Event__Queue__Async     import Event__Queue__Async
+from osbot_utils.helpers.pubsub.schemas.Schema__Event   import Schema__Event
+from osbot_utils.utils.Threads                          import invoke_async_function
+
+
+class test_Event__Queue__Async(TestCase):
+
+    def setUp(self):
+        self.event_queue = Event__Queue__Async()
+
+    def test__init__(self):
+        with self.event_queue as _:
+            assert _.__locals__() == {'event_class'      : Schema__Event  ,
+                                      'events'           : []             ,
+                                      'events_added'     : 0              ,
+                                      'events_completed' : 0              ,
+                                      'events_failed'    : 0              ,
+                                      'log_events'       : False          ,
+                                      'loop'             : None           ,
+                                      'queue'            : None           ,
+                                      'queue_name'       : _.queue_name   ,
+                                      'running'          : False          ,
+                                      'task'             : None           }
+            assert _.queue_name.startswith('event_queue_async')
+            assert _.queue_size() == 0
+
+    def test_start_stop(self):
+        async def run():
+            _ = self.event_queue
+            assert _.start()            is _
+            assert _.running            is True
+            assert type(_.queue)        is asyncio.Queue
+            assert _.loop               is asyncio.get_running_loop()
+            assert _.task.get_name()    == _.queue_name
+            assert _.task.done()        is False
+            task = _.task
+            assert await _.stop()       is _
+            assert _.running            is False
+            assert _.task               is None
+            assert task.cancelled()     is True
+        invoke_async_function(run())
+
+    def test_send_event__before_start(self):
+        with self.assertRaises(ValueError) as context:
+            self.event_queue.send_message('an message')
+        assert context.exception.args[0] == "in Event__Queue__Async, send_event was called before start() (which creates the queue inside the running event loop)"
+        assert self.event_queue.events_added == 0
+
+    def test_send_message__wait_for_queue_completed(self):
+        async def run():
+            async with self.event_queue as _:
+                _.log_events = True
+                event_1 = _.send_message('Hello World!')
+                event_2 = _.send_data   ({'some': 'data'})
+                event_3 = _.new_event_obj()
+                assert _.send_event(event_3)                is True
+                assert _.send_event('aaaa')                 is False
+                assert _.queue_size()                       == 3
+                assert await _.wait_for_queue_completed()   is True          # no sleep-polling, this returns as soon as the last event is handled
+                assert _.events                             == [event_1, event_2, event_3]
+                assert _.events_added                       == 3
+                assert _.events_completed                   == 3
+                assert event_1.event_message                == 'Hello World!'
+                assert event_2.event_data                   == {'some': 'data'}
+        invoke_async_function(run())
+
+    def test_handle_event__errors(self):
+        class An_Event_Queue(Event__Queue__Async):
+            async def handle_event(self, event):
+                if event.event_message == 'fail':
+                    raise ValueError('an error')
+                return True
+
+        async def run():
+            async with An_Event_Queue() as _:
+                _.send_message('ok'  )
+                _.send_message('fail')
+                _.send_message('ok'  )
+                assert await _.wait_for_queue_completed() is True
+                assert _.events_completed                 == 2
+                assert _.events_failed                    == 1
+        invoke_async_function(run())
+
+    def test_send_event__threadsafe(self):
+        from threading import Thread
+
+        async def run():
+            async with self.event_queue as _:
+                _.log_events = True
+                events  = [_.new_event_obj(event_message=f'event {i}') for i in range(10)]
+                threads = [Thread(target=_.send_event__threadsafe, args=(event,)) for event in events]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+                await asyncio.sleep(0)                                          # let the call_soon_threadsafe callbacks run
+                assert await _.wait_for_queue_completed() is True
+                assert sorted(_.events, key=lambda e: e.event_message) == sorted(events, key=lambda e: e.event_message)
+        invoke_async_function(run())
+
+    def test_wait_for_queue_completed__timeout(self):
+        class An_Slow_Event_Queue(Event__Queue__Async):
+            async def handle_event(self, event):
+                await asyncio.sleep(1)
+
+        async def run():
+            async with An_Slow_Event_Queue() as _:
+                _.send_message('slow')
+                assert await _.wait_for_queue_completed(timeout=0.01) is False
+        invoke_async_function(run())
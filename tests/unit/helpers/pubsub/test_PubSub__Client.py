@@ -4,4 +4,10 @@ from osbot_utils.helpers.pubsub.PubSub__Client import PubSub__Client
 
 class test_PubSub__Client(TestCase):
     def setUp(self):
-        self.client = PubSub__Client()
\ No newline at end of file
+        self.client = PubSub__Client()
+    def test_receive_payload(self):
+        with self.client as _:
+            payload = b'{"an": "message"}'
+            _.receive_payload(payload)
+            assert _.received_payloads    == [payload]
+            assert _.received_payloads[0] is payload
@@ -0,0 +1,91 @@
+import asyncio
+from unittest                                                       import TestCase
+from osbot_utils.helpers.pubsub.PubSub__Client__Async               import PubSub__Client__Async
+from osbot_utils.helpers.pubsub.PubSub__Room__Async                 import PubSub__Room__Async
+from osbot_utils.helpers.pubsub.PubSub__Server__Async               import PubSub__Server__Async
+from osbot_utils.helpers.pubsub.schemas.Schema__Event__Message      import Schema__Event__Message
+from osbot_utils.utils.Misc                                         import random_text
+from osbot_utils.utils.Threads                                      import invoke_async_function
+
+
+class test_PubSub__Server__Async(TestCase):
+
+    def setUp(self):
+        self.server = PubSub__Server__Async()
+
+    def test_client_send_event(self):
+        async def run():
+            async with self.server as _:
+                _.log_events = True
+                client   = _.new_client()
+                assert isinstance(client, PubSub__Client__Async)
+                event_1  = client.send_message('hello from the client')
+                event_2  = client.send_data   ({'we': 'can also send dict'})
+                event_3  = Schema__Event__Message(event_message='an message')
+                assert client.send_event(event_3)         is True
+                assert await _.wait_for_queue_completed() is True
+                assert _.events                           == [event_1, event_2, event_3]
+                assert event_3.connection_id              == client.client_id
+        invoke_async_function(run())
+
+    def test_client_connect__join_room__publish(self):
+        async def run():
+            async with self.server as _:
+                room_name = random_text('room_name')
+                client_1  = _.new_client().connect().join_room(room_name)
+                client_2  = _.new_client().connect().join_room(room_name)
+                await _.wait_for_queue_completed()
+                assert _.clients_connected          == {client_1, client_2}
+                assert type(_.room(room_name))      is PubSub__Room__Async
+                assert _.room(room_name).clients    == {client_1, client_2}
+
+                assert _.publish(room_name, 'hello both clients')   == 2
+                assert await client_1.receive()                     == 'hello both clients'
+                assert await client_2.receive()                     == 'hello both clients'
+
+                client_1.leave_room(room_name).disconnect()
+                await _.wait_for_queue_completed()
+                assert _.clients_connected                          == {client_2}
+                assert _.publish(room_name, 'now only to client 2') == 1
+                assert await client_1.receive(timeout=0.01)         is None
+                assert await client_2.receive()                     == 'now only to client 2'
+                assert _.publish('room-does-not-exist', 'abc')      == 0
+                assert client_1.messages.qsize()                    == 0           # received messages are only kept until they are awaited
+                assert client_2.messages.qsize()                    == 0
+        invoke_async_function(run())
+
+    def test_many_rooms__on_one_event_loop(self):
+        async def run():
+            async with self.server as _:
+                rooms_count = 2000
+                clients     = []
+                for i in range(rooms_count):
+                    client = _.new_client()
+                    client.join_room(f'room-{i}')
+                    clients.append(client)
+                assert await _.wait_for_queue_completed() is True
+                assert len(_.rooms)                       == rooms_count
+                for i in range(rooms_count):
+                    _.publish(f'room-{i}', f'message-{i}')
+                received = await asyncio.gather(*[client.receive() for client in clients])
+                assert received == [f'message-{i}' for i in range(rooms_count)]
+        invoke_async_function(run())
+
+    def test_subscriber__async_for(self):
+        async def run():
+            async with self.server as _:
+                client = _.new_client().join_room('an-room')
+                await _.wait_for_queue_completed()
+
+                async def subscriber():
+                    messages = []
+                    async for message in client:
+                        messages.append(message)
+                        if len(messages) == 3:
+                            return messages
+
+                subscriber_task = asyncio.create_task(subscriber())
+                for message in ['a', 'b', 'c']:
+                    _.publish('an-room', message)
+                assert await subscriber_task == ['a', 'b', 'c']
+        invoke_async_function(run())
@@ -1,5 +1,9 @@
 from unittest import TestCase
 
+from osbot_utils.helpers.pubsub.schemas.Schema__Event import Schema__Event
+from osbot_utils.helpers.pubsub.schemas.Schema__Event__Join_Room import Schema__Event__Join_Room
+from osbot_utils.utils.Files import file_delete
+
 from osbot_utils.helpers.pubsub.PubSub__Sqlite import PubSub__Sqlite, TABLE_SCHEMA__PUB_SUB__CLIENTS, \
     TABLE_NAME__PUB_SUB__CLIENTS
 from osbot_utils.helpers.sqlite.Sqlite__Table import Sqlite__Table
@@ -16,10 +20,121 @@ class test_PubSub__Sqlite(TestCase):
         with self.pubsub_sqlite as _:
             assert _.exists()  is True
             assert _.in_memory is True
-            assert _.tables_names() == ['pubsub_clients']
+            assert _.tables_names() == ['pubsub_clients'                                ,
+                                        'pubsub_events'                                 ,
+                                        'sqlite_sequence'                               ,      # created by the AUTOINCREMENT in pubsub_events
+                                        'idx__pubsub_events__room_name'                 ,
+                                        'pubsub_cursors'                                ,
+                                        'idx__pubsub_cursors__consumer_group'           ]
 
         with self.pubsub_sqlite.table_clients() as _:
             assert type(_)       is Sqlite__Table
             assert _.exists()    is True
             assert _.row_schema  is TABLE_SCHEMA__PUB_SUB__CLIENTS
             assert _.table_name  == TABLE_NAME__PUB_SUB__CLIENTS
+
+
+    def test_events_append__events_replay(self):
+        with PubSub__Sqlite().setup() as _:
+            event_1 = Schema__Event(event_message='message 1', connection_id='client-1')
+            event_2 = Schema__Event(event_data={'a': 42})
+            event_3 = Schema__Event__Join_Room(room_name='room-a')
+            assert _.event_append (event_1                    ) == 1
+            assert _.events_append([event_2], room_name='room-b') == 2
+            assert _.event_append (event_3                    ) == 3
+            assert _.events_pending                             == 3            # not committed yet
+            assert _.events_flush().events_pending              == 0
+
+            events = list(_.events_replay())
+            assert [offset for offset, _event in events] == [1, 2, 3]
+            assert events[0][1].event_message            == 'message 1'
+            assert events[0][1].connection_id            == 'client-1'
+            assert events[1][1].event_data               == {'a': 42}
+            assert events[2][1].event_type               == 'join-room'
+            assert [type(event) for offset, event in events] == [Schema__Event, Schema__Event, Schema__Event__Join_Room]      # the event classes are kept
+            assert events[2][1].room_name                == 'room-a'
+            assert [offset for offset, _event in _.events_replay(1)                   ] == [2, 3]
+            assert [offset for offset, _event in _.events_replay(0, room_name='room-a')] == [3]
+            assert [offset for offset, _event in _.events_replay(0, limit=1)          ] == [1]
+
+    def test_events_append__offsets(self):                                       # the offset returned is the one of the last event appended (not a separate query)
+        with PubSub__Sqlite().setup() as _:
+            assert _.events_append([Schema__Event(event_message=f'event {i}') for i in range(5)]) == 5
+            assert _.events_append([Schema__Event(event_message='event 5')])                     == 6
+            assert _.events_append([])                                                            == 6
+            _.events_flush()
+            rows = _.table_events().rows()
+            assert [row.get('id')            for row in rows] == [1, 2, 3, 4, 5, 6]
+            assert [row.get('event_data'  )  for row in rows] == ['{}'] * 6                      # events without data or subclass fields are not json encoded
+            assert [row.get('event_fields')  for row in rows] == ['{}'] * 6
+            assert len({row.get('event_id')  for row in rows}) == 6
+            assert len({row.get('timestamp') for row in rows[:5]}) == 1                           # the events of a batch without a timestamp get the same one
+
+    def test_synchronous(self):
+        db_path = PubSub__Sqlite().path_temp_database()
+        pubsub  = PubSub__Sqlite(db_path=db_path, in_memory=False, synchronous='FULL').setup()
+        assert pubsub.cursor().execute__fetch_one('PRAGMA synchronous') == {'synchronous': 2}    # FULL
+        pubsub.close()
+        file_delete(db_path)
+        try:
+            PubSub__Sqlite(synchronous='OFF')
+            assert False, 'should have raised'
+        except ValueError as error:
+            assert str(error) == "in PubSub__Sqlite, invalid synchronous 'OFF', it must be one of: ['NORMAL', 'FULL']"
+
+    def test_events_offset_last__not_reused(self):
+        with PubSub__Sqlite().setup() as _:
+            _.events_append([Schema__Event(event_message=f'event {i}') for i in range(3)])
+            _.table_events().rows_delete_where(id=3)                            # deleting the last event doesn't release its offset
+            assert _.events_offset_last()                                     == 3
+            assert _.event_append(Schema__Event(event_message='event 3'))     == 4
+            assert [offset for offset, event in _.events_replay()]            == [1, 2, 4]
+
+    def test_events_flush__max_delay(self):                                     # the last events of a slow stream are committed after commit_max_delay
+        db_path = PubSub__Sqlite().path_temp_database()
+        pubsub  = PubSub__Sqlite(db_path=db_path, in_memory=False, commit_max_delay=0.01).setup()
+        pubsub.event_append(Schema__Event(event_message='event 0'))
+        assert pubsub.events_pending         == 1
+        commit_timer = pubsub.commit_timer
+        assert commit_timer                 is not None
+        commit_timer.join(timeout=1)
+        assert pubsub.events_pending         == 0
+        assert pubsub.commit_timer           is None
+
+        reader = PubSub__Sqlite(db_path=db_path, in_memory=False)               # another connection can see the committed event (before close)
+        assert [event.event_message for offset, event in reader.events_replay()] == ['event 0']
+        reader.close()
+        pubsub.close()
+        for suffix in ['', '-wal', '-shm']:
+            file_delete(db_path + suffix)
+
+    def test_consumer_read__consumer_ack(self):
+        with PubSub__Sqlite().setup() as _:
+            _.events_append([Schema__Event(event_message=f'event {i}') for i in range(5)])
+            assert _.consumer_offset('group-a')                                     == 0
+            assert [offset for offset, _event in _.consumer_read('group-a', limit=2)] == [1, 2]
+            assert [offset for offset, _event in _.consumer_read('group-a', limit=2)] == [1, 2]     # cursor only moves on ack
+            _.consumer_ack('group-a', 2)
+            assert _.consumer_offset('group-a')                                     == 2
+            assert [offset for offset, _event in _.consumer_read('group-a')        ] == [3, 4, 5]
+            assert [offset for offset, _event in _.consumer_read('group-b')        ] == [1, 2, 3, 4, 5]
+            _.consumer_ack('group-a', 5)
+            assert _.consumer_read('group-a') == []
+
+    def test_durability__after_restart(self):
+        db_path = PubSub__Sqlite().path_temp_database()
+        pubsub  = PubSub__Sqlite(db_path=db_path, in_memory=False, commit_batch_size=10).setup()
+        assert pubsub.cursor().execute__fetch_one('PRAGMA journal_mode').get('journal_mode') == 'wal'
+        pubsub.events_append([Schema__Event(event_message=f'event {i}') for i in range(25)])
+        assert pubsub.events_pending == 0                                   # batches are committed as soon as commit_batch_size is reached
+        pubsub.consumer_ack('group-a', 20)
+        pubsub.event_append(Schema__Event(event_message='event 25'))
+        pubsub.close()                                                      # close commits the pending events
+
+        pubsub = PubSub__Sqlite(db_path=db_path, in_memory=False).setup()   # reopen (i.e. after a restart)
+        events = pubsub.consumer_read('group-a')
+        assert [offset for offset, event in events]   == [21, 22, 23, 24, 25, 26]
+        assert events[-1][1].event_message            == 'event 25'
+        pubsub.close()
+        for suffix in ['', '-wal', '-shm']:
+            file_delete(db_path + suffix)
@@ -0,0 +1,49 @@
+from unittest                                       import TestCase
+from osbot_utils.helpers.pubsub.PubSub__Topic__Trie import PubSub__Topic__Trie, topic__is_wildcard
+
+
+class test_PubSub__Topic__Trie(TestCase):
+
+    def setUp(self):
+        self.trie = PubSub__Topic__Trie()
+
+    def test_topic__is_wildcard(self):
+        assert topic__is_wildcard('a.b.c'  ) is False
+        assert topic__is_wildcard('a.*.c'  ) is True
+        assert topic__is_wildcard('a.#'    ) is True
+        assert topic__is_wildcard('a.b*.c' ) is False                   # wildcards need to be the full segment
+
+    def test_subscribe__match(self):
+        with self.trie as _:
+            _.subscribe('a.b.c', 'exact'     )
+            _.subscribe('a.*.c', 'single'    )
+            _.subscribe('a.#'  , 'multi'     )
+            _.subscribe('#'    , 'everything')
+            _.subscribe('*'    , 'one-level' )
+            assert _.subscriptions   == 5
+            assert _.match('a.b.c')  == {'exact', 'single', 'multi', 'everything'}
+            assert _.match('a.x.c')  == {'single', 'multi', 'everything'}
+            assert _.match('a.b'  )  == {'multi', 'everything'}
+            assert _.match('a'    )  == {'multi', 'everything', 'one-level'}
+            assert _.match('b.c'  )  == {'everything'}
+            assert _.match('a.b.c.d')== {'multi', 'everything'}
+
+    def test_unsubscribe(self):
+        with self.trie as _:
+            _.subscribe('a.*.c', 'client_1')
+            _.subscribe('a.*.c', 'client_2')
+            _.subscribe('a.*'  , 'client_3')
+            assert _.unsubscribe('a.*.c', 'client_1') is True
+            assert _.unsubscribe('a.*.c', 'client_1') is False
+            assert _.unsubscribe('x.y'  , 'client_1') is False
+            assert _.match('a.b.c')                   == {'client_2'}
+            assert _.unsubscribe('a.*.c', 'client_2') is True
+            assert _.patterns()                       == ['a.*']
+            assert _.unsubscribe('a.*'  , 'client_3') is True
+            assert _.root                             == {'children': {}, 'subscribers': set()}    # unused nodes are removed
+            assert _.subscriptions                    == 0
+
+    def test_segments__invalid(self):
+        with self.assertRaises(ValueError) as context:
+            self.trie.subscribe('a.#.c', 'client_1')
+        assert context.exception.args[0] == "in PubSub__Topic__Trie, the '#' wildcard can only be used as the last segment, and it was used in: a.#.c"
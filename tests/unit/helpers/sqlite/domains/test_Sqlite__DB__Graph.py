@@ -50,3 +50,16 @@ class test_Sqlite__DB__Graph(TestCase):
         with self.db_graph as _:
             _.add_node('key', 'value', 'property')
             assert _.nodes() == [{'id': 1, 'key': 'key', 'properties': 'property', 'timestamp': 0, 'value': 'value'}]
+
+
+    def test_traversal_queries(self):
+        with self.db_graph as _:
+            _.add_edge('a', 'b')
+            _.add_edge('b', 'c')
+            _.add_edge('c', 'a')
+            assert list(_.neighbours   ('a'          )) == ['b'                                              ]
+            assert list(_.k_hop        ('a', 2       )) == [{'depth': 1, 'key': 'b'}, {'depth': 2, 'key': 'c'}]
+            assert list(_.reachable    ('b', 'in'    )) == ['a', 'c'                                         ]
+            assert _.is_reachable      ('a', 'c'     )  is True
+            assert _.shortest_path     ('a', 'c'     )  == ['a', 'b', 'c'                                    ]
+            assert _.shortest_path     ('a', 'c', max_depth=1) is None
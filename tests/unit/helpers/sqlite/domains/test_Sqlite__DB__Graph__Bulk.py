@@ -0,0 +1,66 @@
+from unittest                                                                   import TestCase
+from unittest.mock                                                              import patch
+from osbot_utils.helpers.semantic_graphs.schemas.graph.Schema__Semantic_Graph   import Schema__Semantic_Graph
+from osbot_utils.helpers.semantic_graphs.testing.QA__Semantic_Graphs__Test_Data import QA__Semantic_Graphs__Test_Data
+from osbot_utils.helpers.sqlite.domains.Sqlite__DB__Graph                       import Sqlite__DB__Graph
+from osbot_utils.helpers.sqlite.domains.Sqlite__DB__Graph__Bulk                 import Sqlite__DB__Graph__Bulk, SQLITE__GRAPH_BULK__BATCH_SIZE
+
+
+class test_Sqlite__DB__Graph__Bulk(TestCase):
+    db_graph : Sqlite__DB__Graph
+    graph    : Schema__Semantic_Graph
+
+    @classmethod
+    def setUpClass(cls):
+        cls.graph    = QA__Semantic_Graphs__Test_Data().create_graph_with_properties().build()
+        cls.db_graph = Sqlite__DB__Graph().setup()
+
+    @classmethod
+    def tearDownClass(cls):
+        assert cls.db_graph.delete() is True
+
+    def test__init__(self):
+        with Sqlite__DB__Graph__Bulk() as _:
+            assert _.db_graph   is None
+            assert _.batch_size == SQLITE__GRAPH_BULK__BATCH_SIZE
+
+    def test_import_graph__export_graph(self):
+        with Sqlite__DB__Graph__Bulk(db_graph=self.db_graph, batch_size=3) as _:
+            assert _.import_graph(self.graph) == {'completed': True, 'edges_imported': 4, 'graph_id': str(self.graph.graph_id), 'nodes_imported': 4}
+            assert sorted(self.db_graph.nodes_keys()) == sorted(str(node_id) for node_id in self.graph.nodes)
+            assert len(self.db_graph.edges()) == 4
+            assert _.table_config().value('semantic_graph')['graph_id'] == str(self.graph.graph_id)
+            assert self.db_graph.tables_names() == ['nodes', 'edges', 'config', 'idx__config__key',
+                                                    'idx__nodes__key', 'idx__edges__source_key', 'idx__edges__target_key']
+
+            exported_graph = _.export_graph()
+            assert type(exported_graph)  is Schema__Semantic_Graph
+            assert exported_graph.json() == self.graph.json()
+
+            _.import_graph(self.graph)                                                          # importing again replaces the data
+            assert len(self.db_graph.nodes()) == 4
+            assert self.db_graph.export_semantic_graph().json() == self.graph.json()
+
+    def test_import_graph__resume(self):
+        with Sqlite__DB__Graph__Bulk(db_graph=self.db_graph, batch_size=2) as _:
+            insert_edges = Sqlite__DB__Graph__Bulk.insert_edges
+            calls        = []
+            def insert_edges__fail_on_second_batch(bulk, edges, timestamp):
+                calls.append(len(edges))
+                if len(calls) == 2:
+                    insert_edges(bulk, edges[:1], timestamp)                            # fail after some of the batch rows were inserted
+                    raise Exception('simulated failure')
+                return insert_edges(bulk, edges, timestamp)
+
+            with patch.object(Sqlite__DB__Graph__Bulk, 'insert_edges', insert_edges__fail_on_second_batch):
+                with self.assertRaises(Exception):
+                    _.import_graph(self.graph)
+            assert self.db_graph.connection().in_transaction is False                   # the partial batch was rolled back
+            assert _.import_progress() == {'completed': False, 'edges_imported': 2, 'graph_id': str(self.graph.graph_id), 'nodes_imported': 4}
+            assert _.db_graph.table_nodes().indexes() == []                                     # indexes are only created at the end
+            assert len(self.db_graph.edges())         == 2
+
+            assert _.import_graph(self.graph)['completed'] is True                              # resumes from the last committed batch
+            assert len(self.db_graph.edges())         == 4
+            assert _.export_graph().json()            == self.graph.json()
+            assert _.db_graph.table_nodes().indexes() == ['idx__nodes__key']
@@ -102,4 +102,12 @@ class test_Sqlite__DB__Json(TestCase):
         json_data__list_of_dict = self.json_data__list_of_dict()
         json_data__list_of_dict[1]['an_str'] = None
         json_data__list_of_dict__schema = self.json_db.get_schema_from_json_data(json_data__list_of_dict)
-        assert json_data__list_of_dict__schema == {'an_int': Sqlite__Field__Type.INTEGER, 'an_str': Sqlite__Field__Type.TEXT}
\ No newline at end of file
+        assert json_data__list_of_dict__schema == {'an_int': Sqlite__Field__Type.INTEGER, 'an_str': Sqlite__Field__Type.TEXT}
+
+    def test_table_json_docs(self):
+        table_docs = self.json_db.table_json_docs()
+        table_docs.add_documents(self.json_data__list_of_dict())
+        assert table_docs.database                                  == self.database
+        assert self.database.tables_names()                         == ['json_docs']
+        assert table_docs.size()                                    == 3
+        assert len(table_docs.json_select(where={'an_int': 42}))    == 3
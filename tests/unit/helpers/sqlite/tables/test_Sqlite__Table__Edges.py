@@ -74,4 +74,53 @@ class test_Sqlite__Table__Nodes(TestCase):
                                                     'timestamp' : 'INTEGER',
                                                     'value'     : 'BLOB'   }
             assert _.new_row_obj().__locals__() == {'source_key': '', 'target_key': '', 'value': b'', 'properties': b'', 'timestamp': 0}
-            assert _.indexes()                  == ['idx__edges__source_key', 'idx__edges__target_key']
\ No newline at end of file
+            assert _.indexes()                  == ['idx__edges__source_key', 'idx__edges__target_key']
+
+    def test__traversal_queries(self):
+        with self.table_edges as _:
+            for source_key, target_key in [('a', 'b'), ('b', 'c'), ('c', 'd'), ('a', 'e'), ('e', 'd'), ('d', 'a'), ('x', 'y')]:
+                _.add_edge(source_key, target_key)
+
+            assert list(_.neighbours('a'              )) == ['b', 'e'           ]
+            assert list(_.neighbours('d', 'in'        )) == ['c', 'e'           ]
+            assert list(_.neighbours('a', 'both'      )) == ['b', 'd', 'e'      ]
+            assert list(_.neighbours('y'              )) == [                   ]
+            assert list(_.reachable ('a'              )) == ['b', 'e', 'c', 'd' ]          # cycles (d -> a) are handled
+            assert list(_.reachable ('d', 'in'        )) == ['c', 'e', 'b', 'a' ]
+            assert list(_.reachable ('y', 'both'      )) == ['x'                ]
+            assert list(_.k_hop     ('a', 1           )) == [{'depth': 1, 'key': 'b'}, {'depth': 1, 'key': 'e'}]
+            assert list(_.k_hop     ('a', 2           )) == [{'depth': 1, 'key': 'b'}, {'depth': 1, 'key': 'e'},
+                                                             {'depth': 2, 'key': 'c'}, {'depth': 2, 'key': 'd'}]
+            assert _.is_reachable   ('a', 'd'         )  is True
+            assert _.is_reachable   ('d', 'e'         )  is True
+            assert _.is_reachable   ('a', 'x'         )  is False
+            assert _.is_reachable   ('y', 'x'         )  is False
+            assert _.is_reachable   ('y', 'x', 'both' )  is True
+            assert _.shortest_path  ('a', 'd'         )  == ['a', 'e', 'd'          ]
+            assert _.shortest_path  ('b', 'e'         )  == ['b', 'c', 'd', 'a', 'e']
+            assert _.shortest_path  ('b', 'e', 'both' )  == ['b', 'a', 'e'          ]
+            assert _.shortest_path  ('b', 'e', max_depth=3) is None
+            assert _.shortest_path  ('a', 'a'         )  == ['a'                    ]
+            assert _.shortest_path  ('a', 'y'         )  is None
+
+            with self.assertRaises(ValueError) as context:
+                list(_.neighbours('a', 'aaa'))
+            assert context.exception.args[0] == "in Sqlite__Table__Edges, invalid direction: aaa (it must be one of ('out', 'in', 'both'))"
+
+    def test__shortest_path__dense_graph(self):                                   # each node is only expanded once, so a complete graph (with an unreachable target) stays fast
+        with self.table_edges as _:
+            nodes = [f'n_{i:02}' for i in range(40)]
+            _.rows_add([_.create_node_data(source_key, target_key) for source_key in nodes for target_key in nodes if source_key != target_key])
+            _.add_edge('x', 'n_00')
+            assert _.size()                                       == 40 * 39 + 1
+            assert _.shortest_path('n_00', 'n_39'               ) == ['n_00', 'n_39'        ]
+            assert _.shortest_path('x'   , 'n_39'               ) == ['x', 'n_00', 'n_39'   ]
+            assert _.shortest_path('n_39', 'x'                  ) is None
+            assert _.shortest_path('n_39', 'x', direction='both') == ['n_39', 'n_00', 'x'   ]
+
+    def test__traversal_queries__use_indexes(self):
+        with self.table_edges as _:
+            sql_query  = "EXPLAIN QUERY PLAN WITH RECURSIVE reach(key) AS (SELECT 'a' UNION " + _.edges_steps('both', 'SELECT e.{to_key} FROM {table_name} e JOIN reach r ON e.{from_key} = r.key') + ") SELECT key FROM reach"
+            query_plan = [row.get('detail') for row in _.cursor().execute__fetch_all(sql_query)]
+            assert 'SEARCH e USING INDEX idx__edges__source_key (source_key=?)' in query_plan
+            assert 'SEARCH e USING INDEX idx__edges__target_key (target_key=?)' in query_plan
@@ -1,7 +1,12 @@
 import sys
 import pytest
+from io                                                         import BytesIO
 from unittest                                                   import TestCase
+from unittest.mock                                              import patch
+from osbot_utils.helpers.sqlite.Sqlite__Blob                    import Sqlite__Blob
 from osbot_utils.helpers.sqlite.Sqlite__Database                import Sqlite__Database
+from osbot_utils.helpers.sqlite.Sqlite__Row__Lazy               import Sqlite__Row__Lazy
+from osbot_utils.utils.Misc                                     import bytes_sha256
 from osbot_utils.helpers.sqlite.tables.Sqlite__Table__Files     import Sqlite__Table__Files
 
 class test_Sqlite__Table__Files(TestCase):
@@ -69,3 +74,82 @@ class test_Sqlite__Table__Files(TestCase):
             assert _.rows       ()          == []
             assert _.file       (file_path) is None
             assert _.file_exists(file_path) is False
+
+    def test_add_file__from_stream(self):
+        with self.table_files as _:
+            file_path     = 'file/path/large.bin'
+            file_contents = bytes(range(256)) * 1000
+            result        = _.add_file__from_stream(file_path, BytesIO(file_contents), len(file_contents))
+            assert result.get('status')                == 'ok'
+            assert result.get('data')                  == {'id': 1, 'path': file_path}
+            assert _.file_contents(file_path)          == file_contents                             # stored as a normal pickled bytes object
+            assert _.file(file_path, include_contents=False).get('metadata') == {'file_contents': {'hash'     : bytes_sha256(file_contents),
+                                                                                                   'is_binary': True                       ,
+                                                                                                   'size'     : 256000                     }}
+            assert _.add_file__from_stream(file_path, BytesIO(b''), 0).get('status') == 'warning'
+
+            result = _.add_file__from_stream('file/path/short.bin', BytesIO(b'abc'), 10)               # stream has less data than expected
+            assert result.get('status')  == 'error'
+            assert result.get('message') == 'File not added, since only 3 of the expected 10 bytes could be read from the stream'
+            assert _.file_exists('file/path/short.bin') is False
+
+    def test_add_file__from_stream__fallback(self):
+        with self.table_files as _:
+            _.use_blobopen = False
+            try:
+                file_contents = b'\x00\xff\x80' * 1000
+                assert _.add_file__from_stream('a.bin', BytesIO(file_contents), len(file_contents)).get('status') == 'ok'
+                assert _.file_contents('a.bin')                            == file_contents
+                assert b''.join(_.file_contents__chunks('a.bin'))          == file_contents
+                with patch.object(Sqlite__Blob, 'write', side_effect=Sqlite__Blob.write, autospec=True) as blob_write:
+                    assert _.add_file__from_stream('b.bin', BytesIO(file_contents), len(file_contents), chunk_size=100).get('status') == 'ok'
+                assert blob_write.call_count                               == 1            # a single || append (instead of one per chunk, which re-copies the blob)
+                assert _.file_contents('b.bin')                            == file_contents
+                assert _.add_file__from_stream('c.bin', BytesIO(b'abc'), 10).get('status') == 'error'
+                assert _.file_exists('c.bin')                              is False
+            finally:
+                _.use_blobopen = True
+
+    def test_file_row__reserve(self):
+        with self.table_files as _:
+            row_id_1 = _.file_row__reserve('reserved_1.bin', 10)
+            _.cursor().execute('SELECT 1')                                                     # other statements don't change the id returned
+            row_id_2 = _.file_row__reserve('reserved_2.bin', 10)
+            assert row_id_2                                == row_id_1 + 1
+            assert _.row(where=dict(id=row_id_2), fields=['path']).get('path') == 'reserved_2.bin'
+            _.rows_delete_where(id=row_id_1)
+            _.rows_delete_where(id=row_id_2)
+
+    def test_file_contents__open(self):
+        with self.table_files as _:
+            _.add_file('text.txt', 'some contents')
+            _.add_file('data.bin', b'\x00\x01' * 50000)
+            with _.file_contents__open('text.txt') as blob:
+                assert len(blob)       == 13
+                assert blob.read(4)    == b'some'
+                assert blob.read()     == b' contents'
+            with _.file_contents__open('data.bin') as blob:
+                assert len(blob)       == 100000
+                blob.seek(99998)
+                assert blob.read()     == b'\x00\x01'
+            assert b''.join(_.file_contents__chunks('data.bin')) == b'\x00\x01' * 50000
+            assert _.file_contents__open('aaaa.txt')             is None
+            assert list(_.file_contents__chunks('aaaa.txt'))     == []
+
+    def test_lazy_pickle_blob(self):
+        with self.table_files as _:
+            _.add_file('text.txt', 'some contents')
+            assert _.lazy_pickle_blob     is False                      # rows are decoded eagerly by default
+            assert type(_.file('text.txt')) is dict
+            _.lazy_pickle_blob = True
+            try:
+                file_row = _.file('text.txt')
+                assert type(file_row)         is Sqlite__Row__Lazy
+                assert file_row.lazy_fields   == {'contents', 'metadata'}
+                assert file_row['contents']   == 'some contents'
+                assert file_row.lazy_fields   == {'metadata'}
+                assert dict(_.file('text.txt')).get('contents')   == 'some contents'   # copies decode the values
+                assert {**_.file('text.txt')}.get('metadata')     == _.file_without_contents('text.txt').get('metadata')
+                assert _.file('text.txt').copy().get('contents') == 'some contents'
+            finally:
+                _.lazy_pickle_blob = False
@@ -0,0 +1,91 @@
+from unittest                                                   import TestCase
+from osbot_utils.helpers.sqlite.tables.Sqlite__Table__Json_Docs import Sqlite__Table__Json_Docs, SQLITE__TABLE_NAME__JSON_DOCS
+
+
+class test_Sqlite__Table__Json_Docs(TestCase):
+    table_docs : Sqlite__Table__Json_Docs
+
+    @classmethod
+    def setUpClass(cls):
+        cls.table_docs = Sqlite__Table__Json_Docs().setup()
+        cls.table_docs.add_documents([dict(name=f'name_{i}', info=dict(age=i % 10, tags=['a', f'tag_{i}'])) for i in range(100)])
+
+    def test__init__(self):
+        with self.table_docs as _:
+            assert _.table_name                     == SQLITE__TABLE_NAME__JSON_DOCS
+            assert _.exists()                       is True
+            assert _.schema__by_name_type()         == {'document': 'TEXT', 'id': 'INTEGER'}
+            assert _.size()                         == 100
+
+    def test_document(self):
+        with self.table_docs as _:
+            assert _.document(1)   == {'info': {'age': 0, 'tags': ['a', 'tag_0']}, 'name': 'name_0'}
+            assert _.document(999) is None
+
+    def test_json_select(self):
+        with self.table_docs as _:
+            assert _.json_select(fields=['name', 'info.tags[1]'], where={'info.age': 3}, limit=2) == [{'id': 4 , 'info.tags[1]': 'tag_3' , 'name': 'name_3' },
+                                                                                                        {'id': 14, 'info.tags[1]': 'tag_13', 'name': 'name_13'}]
+            assert len(_.json_select(where={'info.age': 3}))                                      == 10
+            assert _.json_select(where={'info.age': 3, 'name': 'name_13'})[0].get('id')           == 14
+            assert _.json_select(where={'aaa': None}, limit=1)[0].get('id')                       == 1
+            assert _.documents(where={'name': 'name_42'})                                         == [{'info': {'age': 2, 'tags': ['a', 'tag_42']}, 'name': 'name_42'}]
+            assert _.documents(where={'name': 'aaaaaa'})                                          == []
+
+    def test_json_path_validate(self):
+        with self.table_docs as _:
+            for bad_path in ["a') OR 1=1 --", 'a b', '', '$.a', None]:
+                with self.assertRaises(ValueError) as context:
+                    _.json_select(where={bad_path: 42})
+                assert context.exception.args[0] == f'in Sqlite__Table__Json_Docs, invalid json_path: {bad_path}'
+
+    def test_json_column_add(self):
+        with self.table_docs as _:
+            assert _.query_plan({'name': 'name_3'})     == ['SCAN json_docs']
+            assert _.json_column_add('name')            == 'json__name'
+            assert _.json_column_add('name')            == 'json__name'                         # adding it twice is ok
+            assert _.json_columns()                     == ['json__name']
+            assert _.query_plan({'name': 'name_3'})     == ['SEARCH json_docs USING INDEX idx__json_docs__json__name (json__name=?)']
+            assert _.json_select(fields=['name'], where={'name': 'name_3'}) == [{'id': 4, 'name': 'name_3'}]
+            with self.assertRaises(ValueError) as context:
+                _.json_column_add('info', field_type=dict)
+            assert context.exception.args[0] == "in json_column_add, field_type <class 'dict'> is not supported by Sqlite__Field__Type"
+
+    def test_json_index_add(self):
+        with self.table_docs as _:
+            assert _.json_index_add('info.age')             == 'idx__json_docs__json_expr__info__age'
+            assert _.json_index_add('info.age')             == 'idx__json_docs__json_expr__info__age'        # adding it twice is ok
+            assert 'idx__json_docs__json_expr__info__age'   in _.indexes()
+            assert _.query_plan({'info.age': 3})            == ['SEARCH json_docs USING INDEX idx__json_docs__json_expr__info__age (<expr>=?)']
+
+    def test_json_column_name(self):
+        with self.table_docs as _:
+            assert _.json_column_name('name'        ) == 'json__name'
+            assert _.json_column_name('info.age'    ) == 'json__info__age'
+            assert _.json_column_name('info_age'    ) == 'json__info_uage'
+            assert _.json_column_name('info__age'   ) == 'json__info_u_uage'
+            assert _.json_column_name('tags[0]'     ) == 'json__tags_i0'
+            assert _.json_column_name('tags[0].a'   ) == 'json__tags_i0__a'
+            paths        = ['a.b', 'a_b', 'a__b', 'a._b', 'a_.b', 'a[0]', 'a_i0', 'a.i0', 'a_0', 'a[1][0]', 'a[10]']
+            column_names = [_.json_column_name(path) for path in paths]
+            assert len(set(column_names)) == len(paths)                                         # no collisions
+
+    def test_json_column_add__similar_paths(self):
+        table_docs = Sqlite__Table__Json_Docs(table_name='json_docs_similar').setup()
+        with table_docs as _:
+            _.add_documents([{'a': {'b': 'from a.b'}, 'a_b': 'from a_b'}])
+            assert _.json_column_add('a.b') == 'json__a__b'
+            assert _.json_column_add('a_b') == 'json__a_ub'
+            assert _.json_select(fields=['a.b', 'a_b'])          == [{'id': 1, 'a.b': 'from a.b', 'a_b': 'from a_b'}]
+            assert len(_.json_select(where={'a.b': 'from a.b'})) == 1
+            assert len(_.json_select(where={'a_b': 'from a.b'})) == 0
+
+    def test_json_index_create(self):
+        table_docs = Sqlite__Table__Json_Docs(table_name='json_docs_index').setup()
+        with table_docs as _:
+            expression = _.json_path_expression('name')
+            assert _.json_index_create('idx__json_docs_index__name', expression) == 'idx__json_docs_index__name'
+            assert _.json_index_create('idx__json_docs_index__name', expression) == 'idx__json_docs_index__name'
+            with self.assertRaises(ValueError) as context:
+                _.json_index_create('idx__json_docs_index__name', _.json_path_expression('other'))
+            assert context.exception.args[0].startswith('in json_index_create, index idx__json_docs_index__name already exists for a different expression')
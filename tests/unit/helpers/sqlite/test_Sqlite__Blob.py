@@ -0,0 +1,92 @@
+import pickle
+from unittest                                       import TestCase
+from osbot_utils.helpers.sqlite.Sqlite__Blob        import Sqlite__Blob, sqlite_blob__pickle_header, sqlite_blob__pickle_header__parse, sqlite_blob__open_supported, PICKLE__OPCODE__STOP
+from osbot_utils.helpers.sqlite.Sqlite__Table       import Sqlite__Table
+from osbot_utils.base_classes.Kwargs_To_Self        import Kwargs_To_Self
+
+class An_Blob_Row(Kwargs_To_Self):
+    data : bytes
+
+class test_Sqlite__Blob(TestCase):
+    table : Sqlite__Table
+
+    @classmethod
+    def setUpClass(cls):
+        cls.table = Sqlite__Table(table_name='blobs', row_schema=An_Blob_Row)
+        assert cls.table.create() is True
+
+    def tearDown(self):
+        self.table.clear()
+
+    def test_blob_open(self):
+        data = bytes(range(256)) * 10
+        self.table.add_row_and_commit(data=data)
+        row_id = self.table.rows()[0].get('id')
+        with self.table.blob_open('data', row_id) as _:
+            assert type(_)      is Sqlite__Blob
+            assert len(_)       == 2560
+            assert _.read(4)    == b'\x00\x01\x02\x03'
+            assert _.tell()     == 4
+            assert _.seek(-2, 2) == 2558
+            assert _.read()     == b'\xfe\xff'
+            assert _.read()     == b''
+            _.seek(0)
+            assert b''.join(_.chunks(chunk_size=1000)) == data
+        with self.assertRaises(ValueError) as context:
+            self.table.blob_open('aaa', row_id)
+        assert context.exception.args[0] == 'in blob_open, invalid field_name: aaa'
+
+    def test_read__fallback_to_substr(self):
+        data = b'0123456789' * 100
+        self.table.add_row_and_commit(data=data)
+        row_id = self.table.rows()[0].get('id')
+        with self.table.blob_open('data', row_id, use_blobopen=False) as _:
+            assert _.blobopen_enabled() is False
+            assert _.read(10)           == b'0123456789'
+            _.seek(995)
+            assert _.read(100)          == b'56789'
+            _.seek(0)
+            assert b''.join(_)          == data
+
+    def test_write(self):
+        if sqlite_blob__open_supported(self.table.connection()) is False:
+            return
+        self.table.add_row_and_commit(data=b'\x00' * 10)
+        row_id = self.table.rows()[0].get('id')
+        with self.table.blob_open('data', row_id, readonly=False) as _:
+            _.seek(2)
+            assert _.write(b'abc') == 3
+        assert self.table.rows()[0].get('data') == b'\x00\x00abc\x00\x00\x00\x00\x00'
+        with self.table.blob_open('data', row_id) as _:
+            with self.assertRaises(ValueError) as context:
+                _.write(b'abc')
+            assert context.exception.args[0] == 'in Sqlite__Blob.write, blob was opened as readonly'
+
+    def test_write__fallback_appends(self):
+        self.table.add_row_and_commit(data=b'')
+        row_id = self.table.rows()[0].get('id')
+        with self.table.blob_open('data', row_id, readonly=False, use_blobopen=False) as _:
+            _.write(b'\x00\xff')
+            _.write(b'\x80abc')
+            assert len(_) == 6
+            _.seek(0)
+            with self.assertRaises(ValueError) as context:
+                _.write(b'abc')
+            assert context.exception.args[0] == 'in Sqlite__Blob.write, without blobopen support data can only be appended to the end of the blob'
+        assert self.table.rows()[0].get('data') == b'\x00\xff\x80abc'
+
+    def test_sqlite_blob__pickle_header__parse(self):
+        for value in [b'ab', b'x' * 300, b'y' * 70000, 'abc', 'z' * 70000, 'é' * 10]:
+            pickled                             = pickle.dumps(value, protocol=4)
+            payload_offset, payload_size, is_text = sqlite_blob__pickle_header__parse(pickled[:32])
+            payload                             = pickled[payload_offset:payload_offset + payload_size]
+            assert is_text is (type(value) is str)
+            assert payload == (value.encode() if is_text else value)
+        assert sqlite_blob__pickle_header__parse(pickle.dumps({'a': 42})) is None
+        assert sqlite_blob__pickle_header__parse(b''                    ) is None
+
+    def test_sqlite_blob__pickle_header(self):
+        header = sqlite_blob__pickle_header(3)
+        assert header                                           == b'\x80\x04\x8e\x03\x00\x00\x00\x00\x00\x00\x00'
+        assert pickle.loads(header + b'abc' + PICKLE__OPCODE__STOP) == b'abc'
+        assert sqlite_blob__pickle_header__parse(header)        == (11, 3, False)
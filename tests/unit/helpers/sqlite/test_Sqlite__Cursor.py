@@ -16,6 +16,13 @@ class test_Sqlite__Cursor(TestCase):
         result = self.cursor.execute__fetch_all(sql_query)
         assert result == []
 
+    def test_execute__fetch_iter(self):
+        sql_query = "WITH RECURSIVE numbers(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM numbers WHERE n < 5) SELECT n FROM numbers"
+        rows      = self.cursor.execute__fetch_iter(sql_query, batch_size=2)
+        assert next(rows)                                   == {'n': 1}
+        assert self.cursor.execute__fetch_one('select 42 as a') == {'a': 42}          # other queries can run while rows are being consumed
+        assert list(rows)                                   == [{'n': 2}, {'n': 3}, {'n': 4}, {'n': 5}]
+
     def test_table_create(self):
         table_name = 'test_table'
         fields     = ['id INTEGER PRIMARY KEY', 'name TEXT NOT NULL','email TEXT UNIQUE NOT NULL']
@@ -19,12 +19,15 @@ class test_Sqlite__Database(TestCase):
         self.database = Sqlite__Database()
 
     def test__init(self):
-        expected_vars = { 'auto_schema_row': False ,
-                          'db_path'        : None  ,
-                          'closed'         : False ,
-                          'connected'      : False ,
-                          'deleted'        : False ,
-                          'in_memory'      : True  }
+        expected_vars = { 'auto_schema_row'  : False ,
+                          'check_same_thread': True  ,
+                          'db_path'          : None  ,
+                          'closed'           : False ,
+                          'connected'        : False ,
+                          'deleted'          : False ,
+                          'in_memory'        : True  ,
+                          'snapshot_interval': 0.0   ,
+                          'snapshot_path'    : None  }
         assert self.database.__locals__() == expected_vars
 
     @pytest.mark.skip('todo: fix bug caused by side effect of closing the db')
@@ -88,22 +91,28 @@ class test_Sqlite__Database(TestCase):
             assert file_exists(db_path)    is True                                      # confirm file exists
 
             assert db.__locals__() == { 'auto_schema_row'        : False          ,
+                                        'check_same_thread'      : True           ,
                                         'closed'                 : False          ,     # check the current values of the db config
                                         'connected'              : True           ,
                                         'db_path'                : db_path        ,
                                         'deleted'                : False          ,
-                                        'in_memory'              : False          }
+                                        'in_memory'              : False          ,
+                                        'snapshot_interval'      : 0.0            ,
+                                        'snapshot_path'          : None           }
 
             assert db.delete() is True                                                  # confirm we can delete the file
             assert db.delete() is False                                                 # confirm we can't delete it twice
 
             assert file_exists(db_path)    is False                                     # after deletion confirm the file doesn't exist
             assert db.__locals__() == { 'auto_schema_row'        : False          ,
+                                        'check_same_thread'      : True           ,
                                         'closed'                 : True           ,     # was False
                                         'connected'              : False          ,     # was True
                                         'db_path'                : db_path        ,
                                         'deleted'                : True           ,     # was False
-                                        'in_memory'              : False          }
+                                        'in_memory'              : False          ,
+                                        'snapshot_interval'      : 0.0            ,
+                                        'snapshot_path'          : None           }
 
     def test_exists(self):
         assert self.database.exists()
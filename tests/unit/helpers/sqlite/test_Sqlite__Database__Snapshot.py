@@ -0,0 +1,101 @@
+from unittest                                               import TestCase
+from osbot_utils.helpers.sqlite.Sqlite__Database            import Sqlite__Database
+from osbot_utils.helpers.sqlite.Sqlite__Database__Snapshot  import Sqlite__Database__Snapshot
+from osbot_utils.helpers.sqlite.domains.Sqlite__DB__Local   import Sqlite__DB__Local
+from osbot_utils.utils.Files                                import file_exists, file_delete
+
+
+class test_Sqlite__Database__Snapshot(TestCase):
+
+    def setUp(self):
+        self.snapshot_path = Sqlite__Database().path_temp_database()
+        self.database      = Sqlite__Database(snapshot_path=self.snapshot_path)
+
+    def tearDown(self):
+        self.database.delete()
+        file_delete(self.snapshot_path)
+
+    def add_rows(self, database, count):
+        cursor = database.cursor()
+        cursor.execute('CREATE TABLE IF NOT EXISTS an_table (an_value INTEGER)')
+        for i in range(count):
+            cursor.execute('INSERT INTO an_table (an_value) VALUES (?)', [i])
+        cursor.commit()
+
+    def test__init__(self):
+        with self.database.snapshot() as _:
+            assert type(_)              is Sqlite__Database__Snapshot
+            assert _.database           is self.database
+            assert _.interval()         == 0
+            assert _.saves              == 0
+            assert _.snapshot_path()    == self.snapshot_path
+            assert _.exists()           is False
+        assert self.database.in_memory  is True
+
+    def test_save__restore(self):
+        self.add_rows(self.database, 10)
+        with self.database.snapshot() as _:
+            assert _.is_dirty()         is True
+            assert _.save()             is True
+            assert _.is_dirty()         is False
+            assert _.save()             is False                        # nothing changed since the last save
+            assert _.save(force=True)   is True
+            assert _.saves              == 2
+            assert _.exists()           is True
+
+        database = Sqlite__Database(snapshot_path=self.snapshot_path)   # a new in-memory database restored from the snapshot
+        assert database.table('an_table').size()         == 10
+        assert database.snapshot().is_dirty()            is False
+        self.add_rows(database, 5)
+        database.close()                                                 # close saves the latest data
+        assert Sqlite__Database(snapshot_path=self.snapshot_path).table('an_table').size() == 15
+
+    def test_save__restore__schema_changes(self):                      # DDL is not counted by total_changes, but must still be saved
+        self.add_rows(self.database, 1)
+        self.database.close()
+
+        database = Sqlite__Database(snapshot_path=self.snapshot_path)
+        assert database.snapshot().is_dirty() is False
+        database.cursor().execute('CREATE TABLE table_b (an_value INTEGER)')
+        database.cursor().execute('DROP TABLE an_table')
+        assert database.snapshot().is_dirty() is True
+        database.close()
+
+        database = Sqlite__Database(snapshot_path=self.snapshot_path)
+        assert database.tables_names() == ['table_b']
+        database.close()
+
+    def test_start__stop(self):
+        database = Sqlite__Database(snapshot_path=self.snapshot_path, snapshot_interval=0.01)
+        snapshot = database.snapshot()
+        self.add_rows(database, 3)
+        assert snapshot.thread is not None
+        assert snapshot.thread.is_alive() is True
+        snapshot.stop_event.wait(0.1)
+        assert snapshot.saves > 0                                        # background thread saved the data
+        assert snapshot.exists() is True
+        database.close()
+        assert snapshot.thread is None
+
+    def test_delete(self):
+        self.add_rows(self.database, 1)
+        self.database.snapshot().save()
+        assert file_exists(self.snapshot_path) is True
+        assert self.database.exists()          is True
+        assert self.database.delete()          is True
+        assert self.database.delete()          is False
+        assert self.database.exists()          is False
+        assert file_exists(self.snapshot_path) is False
+
+    def test__Sqlite__DB__Local(self):
+        db_local = Sqlite__DB__Local(db_path=self.snapshot_path, snapshot=True)
+        assert db_local.in_memory     is True
+        assert db_local.db_path       is None
+        assert db_local.snapshot_path == self.snapshot_path
+        self.add_rows(db_local, 2)
+        db_local.close()
+        assert Sqlite__DB__Local(db_path=self.snapshot_path, snapshot=True).table('an_table').size() == 2
+
+        with self.assertRaises(ValueError) as context:
+            Sqlite__DB__Local(in_memory=True, snapshot=True)
+        assert context.exception.args[0] == "in Sqlite__DB__Local, snapshot=True needs a db_path or db_name (an in_memory database has no file to save the snapshots to)"
@@ -0,0 +1,37 @@
+from unittest                                       import TestCase
+from osbot_utils.helpers.sqlite.Sqlite__Row__Lazy   import Sqlite__Row__Lazy
+from osbot_utils.utils.Objects                      import obj_to_bytes
+
+
+class test_Sqlite__Row__Lazy(TestCase):
+
+    def test_lazy_decode(self):
+        pickled = obj_to_bytes({'a': 42})
+        row     = Sqlite__Row__Lazy(dict(id=1, data=pickled), ['data', 'not_in_row'])
+        assert row.lazy_fields        == {'data'}
+        assert row.raw('data')        == pickled                    # not decoded yet
+        assert row.get('id')          == 1
+        assert row.lazy_fields        == {'data'}
+        assert row['data']            == {'a': 42}                  # decoded on access
+        assert row.lazy_fields        == set()
+        assert row.raw('data')        == {'a': 42}                  # and the decoded value is kept
+        assert row.get('aaa', 'xyz')  == 'xyz'
+
+    def test_decoded(self):
+        row = Sqlite__Row__Lazy(dict(id=1, data=obj_to_bytes('abc')), ['data'])
+        assert row                    == {'id': 1, 'data': 'abc'}
+        assert row.decoded()          == {'id': 1, 'data': 'abc'}
+        assert type(row.decoded())    is dict
+        assert list(row.values())     == [1, 'abc']
+        assert row.pop('data')        == 'abc'
+        assert row                    == {'id': 1}
+
+    def test_dict_copies(self):
+        def new_row():
+            return Sqlite__Row__Lazy(dict(id=1, data=obj_to_bytes('abc')), ['data'])
+        assert dict(new_row())        == {'id': 1, 'data': 'abc'}
+        assert {**new_row()}          == {'id': 1, 'data': 'abc'}
+        assert new_row().copy()       == {'id': 1, 'data': 'abc'}
+        assert type(new_row().copy()) is dict
+        assert list(new_row())        == ['id', 'data']
+        assert list(new_row().keys()) == ['id', 'data']
@@ -37,6 +37,7 @@ class test_Sqlite__Table(TestCase):
     def test__init__(self):
         expected_vars = dict(auto_pickle_blob = False                ,
                              database         = self.table.database  ,
+                             lazy_pickle_blob = False                ,
                              table_name       = TEST_TABLE_NAME      ,
                              row_schema       = self.table.row_schema)
         assert self.table.__locals__() == expected_vars
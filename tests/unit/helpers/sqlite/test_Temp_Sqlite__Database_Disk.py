@@ -20,3 +20,13 @@ class test_Temp_Sqlite__Table(TestCase):
             assert db.tables() == []
         assert db.exists() is False
         assert file_exists(db.db_path) is False
+
+    def test__enter__exit____snapshot(self):
+        with Temp_Sqlite__Database__Disk(snapshot=True) as db:
+            assert db.in_memory is True
+            assert db.exists()  is True
+            db.table('an_table').create()
+            assert db.snapshot().save() is True
+            assert file_exists(db.snapshot_path) is True
+        assert db.exists() is False
+        assert file_exists(db.snapshot_path) is False
@@ -0,0 +1,42 @@
+from unittest                                                                       import TestCase
+from osbot_utils.helpers.timestamp_capture.Timestamp_Collector                      import Timestamp_Collector
+from osbot_utils.helpers.timestamp_capture.actions.Timestamp_Collector__Snapshots   import Timestamp_Collector__Snapshots
+from osbot_utils.helpers.timestamp_capture.timestamp_capture__config                import SNAPSHOT_INTERVAL
+
+
+class test_Timestamp_Collector__Snapshots(TestCase):
+
+    def test__init__(self):
+        with Timestamp_Collector__Snapshots(collector=Timestamp_Collector(histograms=True)) as _:
+            assert _.interval         == SNAPSHOT_INTERVAL
+            assert _.thread.daemon    is True
+        assert _.thread is None
+
+    def test__init____invalid_interval(self):
+        with self.assertRaises(ValueError) as context:
+            Timestamp_Collector__Snapshots(interval=0)
+        assert context.exception.args[0] == 'in Timestamp_Collector__Snapshots, interval must be bigger than 0, and it was: 0'
+
+    def test_snapshot(self):                                                       # Test each snapshot covers one interval
+        collector = Timestamp_Collector(histograms=True)
+        snapshots = []
+        with collector:
+            with Timestamp_Collector__Snapshots(collector=collector, interval=0.005, on_snapshot=snapshots.append):
+                collector.enter('a')
+                collector.exit ('a')
+                collector.enter('a')
+                collector.exit ('a')
+        assert len(snapshots) > 0                                                  # the final snapshot is taken on stop
+        assert all(snapshot.reset for snapshot in snapshots)
+        assert sum(h.count for snapshot in snapshots for h in snapshot.histograms) == 2
+
+    def test_snapshot__kept(self):                                                 # Test snapshots are kept when there is no on_snapshot
+        collector = Timestamp_Collector(histograms=True)
+        with collector:
+            collector.enter('a')
+            collector.exit ('a')
+        with Timestamp_Collector__Snapshots(collector=collector) as _:
+            snapshot = _.snapshot()
+        assert list(_.snapshots)               == [snapshot, _.snapshots[1]]
+        assert snapshot.histograms[0].name     == 'a'
+        assert _.snapshots[1].histograms       == []
@@ -0,0 +1,13 @@
+import asyncio
+from unittest                                                                       import TestCase
+from osbot_utils.helpers.timestamp_capture.static_methods.asyncio__running_loop    import asyncio__running_loop, asyncio__running_loop__fallback
+
+
+class test_asyncio__running_loop(TestCase):
+
+    def test_asyncio__running_loop(self):                                          # Test None is returned (instead of raising) when there is no loop
+        for running_loop in (asyncio__running_loop, asyncio__running_loop__fallback):
+            assert running_loop() is None
+            async def an_coroutine():
+                return running_loop() is asyncio.get_running_loop()
+            assert asyncio.run(an_coroutine()) is True
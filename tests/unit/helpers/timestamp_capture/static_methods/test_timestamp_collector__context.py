@@ -0,0 +1,82 @@
+import asyncio
+import contextvars
+from concurrent.futures                                                                 import ThreadPoolExecutor
+from unittest                                                                           import TestCase
+from unittest.mock                                                                      import patch
+from osbot_utils.helpers.timestamp_capture.Timestamp_Collector                          import Timestamp_Collector
+from osbot_utils.helpers.timestamp_capture.decorators.timestamp                         import timestamp
+from osbot_utils.helpers.timestamp_capture.static_methods                               import find_timestamp_collector as find_timestamp_collector__module
+from osbot_utils.helpers.timestamp_capture.static_methods.find_timestamp_collector      import find_timestamp_collector, find_timestamp_collector__fallback
+from osbot_utils.helpers.timestamp_capture.static_methods.timestamp_collector__context import timestamp_collector__context, timestamp_collectors__active, timestamp_collectors__generation
+from osbot_utils.utils.Threads                                                          import invoke_async_function
+
+
+@timestamp
+def an_tracked_function():
+    return 42
+
+
+class test_timestamp_collector__context(TestCase):
+
+    def test__enter__exit(self):                                                   # Test the collector is published in the ContextVar
+        collector = Timestamp_Collector(name='context_test')                       # Not using the magic variable name
+        assert timestamp_collector__context.get() is None
+        assert timestamp_collectors__active()     == 0
+        with collector:
+            assert timestamp_collector__context.get() is collector
+            assert timestamp_collectors__active()     == 1
+            assert find_timestamp_collector()         is collector                 # Found without the stack walk
+            assert an_tracked_function()              == 42
+        assert timestamp_collector__context.get() is None
+        assert timestamp_collectors__active()     == 0
+        assert [entry.event for entry in collector.entries] == ['enter', 'exit']
+
+    def test__enter__nested(self):                                                 # Test the previous collector is restored on exit
+        outer = Timestamp_Collector(name='outer')
+        inner = Timestamp_Collector(name='inner')
+        with outer:
+            with inner:
+                assert find_timestamp_collector() is inner
+                an_tracked_function()
+            assert find_timestamp_collector() is outer
+            an_tracked_function()
+        assert inner.entry_count() == 2
+        assert outer.entry_count() == 2
+
+    def test__async_tasks(self):                                                   # Test the tasks created inside the collector see it
+        collector = Timestamp_Collector()
+        async def run():
+            with collector:
+                await asyncio.gather(asyncio.create_task(asyncio.to_thread(an_tracked_function)),
+                                     asyncio.create_task(self.async_tracked()))
+        invoke_async_function(run())
+        assert collector.entry_count() == 4
+
+    async def async_tracked(self):
+        return an_tracked_function()
+
+    def test_find_timestamp_collector__fallback(self):                             # Test the stack walk is only used when a collector is active
+        _timestamp_collector_ = Timestamp_Collector(name='not_entered')
+        assert find_timestamp_collector__fallback() is None                        # no collector is active
+        assert find_timestamp_collector()           is _timestamp_collector_       # the public function still walks the stack
+        with _timestamp_collector_:
+            result = contextvars.Context().run(find_timestamp_collector__fallback) # a context where the ContextVar is not set
+        assert result is _timestamp_collector_
+
+    def test_find_timestamp_collector__fallback__thread_cache(self):               # Test the stack is only walked once per thread (until a collector is entered or exited)
+        collector  = Timestamp_Collector(all_threads=True)                         # pool workers don't see the ContextVar
+        generation = timestamp_collectors__generation()
+        with patch.object(find_timestamp_collector__module, 'find_timestamp_collector__in_stack',
+                          wraps=find_timestamp_collector__module.find_timestamp_collector__in_stack) as in_stack:
+            with collector:
+                assert timestamp_collectors__generation() == generation + 1
+                with ThreadPoolExecutor(max_workers=1) as pool:
+                    assert pool.submit(lambda: [an_tracked_function() for _ in range(10)]).result() == [42] * 10
+                    assert in_stack.call_count == 1
+                    with Timestamp_Collector(name='other'):                       # entering (and exiting) a collector invalidates the cached result
+                        pool.submit(an_tracked_function).result()
+                        assert in_stack.call_count == 2
+                    pool.submit(an_tracked_function).result()
+                    assert in_stack.call_count == 3
+            assert timestamp_collectors__generation() == generation + 4
+        assert collector.entry_count() == 24                                        # all 12 calls (the other collector is not used by all threads)
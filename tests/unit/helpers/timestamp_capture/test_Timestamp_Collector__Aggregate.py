@@ -0,0 +1,84 @@
+import time
+from unittest                                                                      import TestCase
+from osbot_utils.helpers.timestamp_capture.Timestamp_Collector                     import Timestamp_Collector
+from osbot_utils.helpers.timestamp_capture.Timestamp_Collector__Aggregate          import Timestamp_Collector__Aggregate
+from osbot_utils.helpers.timestamp_capture.actions.Timestamp_Collector__Analysis   import Timestamp_Collector__Analysis
+from osbot_utils.helpers.timestamp_capture.actions.Timestamp_Collector__Export     import Timestamp_Collector__Export
+from osbot_utils.helpers.timestamp_capture.timestamp_capture__config               import EVENT_ENTER, EVENT_EXIT
+
+
+class test_Timestamp_Collector__Aggregate(TestCase):
+
+    def test_aggregate(self):                                                      # Test timings, call tree and folded stacks from one pass
+        events = [('a', EVENT_ENTER,     0, 0),
+                  ('b', EVENT_ENTER, 1_000, 1),
+                  ('b', EVENT_EXIT , 4_000, 1),
+                  ('b', EVENT_ENTER, 5_000, 1),
+                  ('b', EVENT_EXIT , 7_000, 1),
+                  ('a', EVENT_EXIT , 9_000, 0)]
+        with Timestamp_Collector__Aggregate().aggregate(events, events_count=6) as _:
+            assert _.events_count       == 6
+            assert _.flame_graph_stacks == ['a;b 3', 'a;b 2', 'a 4']
+            timing_a = _.method_timings['a']
+            timing_b = _.method_timings['b']
+            assert (timing_a.call_count, timing_a.total_ns, timing_a.self_ns                  ) == (1, 9_000, 4_000)
+            assert (timing_b.call_count, timing_b.total_ns, timing_b.self_ns, timing_b.min_ns, timing_b.max_ns) == (2, 5_000, 5_000, 2_000, 3_000)
+
+            call_tree = _.call_tree()
+            assert call_tree is _.call_tree()                                      # cached
+            assert len(call_tree)                             == 1
+            assert call_tree[0].name                          == 'a'
+            assert call_tree[0].self_ns                       == 4_000
+            assert call_tree[0].duration_ms                   == 0.009
+            assert [c.call_index for c in call_tree[0].children] == [1, 2]
+            assert [c.depth      for c in call_tree[0].children] == [1, 1]
+
+    def test_aggregate__unbalanced(self):                                          # Test unmatched exits are skipped, and enters without exit are closed by their parent's exit
+        events = [('x', EVENT_EXIT ,     0, 0),                                   # exit without enter
+                  ('a', EVENT_ENTER, 1_000, 0),
+                  ('b', EVENT_ENTER, 2_000, 1),                                   # never exits
+                  ('a', EVENT_EXIT , 5_000, 0),
+                  ('b', EVENT_EXIT , 6_000, 0)]                                   # 'b' is no longer open
+        with Timestamp_Collector__Aggregate().aggregate(events) as _:
+            assert list(_.method_timings)       == ['a']
+            assert _.method_timings['a'].self_ns == 4_000
+            assert _.flame_graph_stacks          == ['a 4']
+            node_b = _.call_tree()[0].children[0]
+            assert (node_b.name, node_b.end_ns, node_b.duration_ns) == ('b', 0, 0)
+
+    def test_aggregate__deep_unbalanced(self):                                     # Test the time is linear on traces with many unmatched enters
+        size   = 20_000
+        events = [(f'm_{i}', EVENT_ENTER, i, i) for i in range(size)]
+        events += [('m_0', EVENT_EXIT, size, 0)] + [('m_1', EVENT_EXIT, size, 0)] * size
+        start  = time.perf_counter()
+        with Timestamp_Collector__Aggregate().aggregate(events) as _:
+            assert _.method_timings['m_0'].call_count == 1
+            assert len(_.method_timings)              == 1
+        assert time.perf_counter() - start < 1                                     # the reverse stack search was quadratic here
+
+    def test__collector__shared(self):                                             # Test the analysis and exports share the collector's cached aggregate
+        _timestamp_collector_ = Timestamp_Collector()
+        with _timestamp_collector_:
+            _timestamp_collector_.enter('a')
+            _timestamp_collector_.enter('b')
+            _timestamp_collector_.exit ('b')
+            _timestamp_collector_.exit ('a')
+        aggregate = _timestamp_collector_.aggregate()
+        assert aggregate is _timestamp_collector_.aggregate()
+        assert Timestamp_Collector__Export  (collector=_timestamp_collector_).build_call_tree() is aggregate.call_tree()
+        assert Timestamp_Collector__Analysis(collector=_timestamp_collector_).get_method_timings()['b'] is aggregate.method_timings['b']
+
+        with _timestamp_collector_:                                                # new events invalidate the cache
+            _timestamp_collector_.enter('c')
+            _timestamp_collector_.exit ('c')
+        assert _timestamp_collector_.aggregate()  is not aggregate
+        assert list(_timestamp_collector_.aggregate().method_timings) == ['b', 'a', 'c']
+
+    def test__collector__columnar(self):                                           # Test the buffer's events are aggregated without creating entries
+        _timestamp_collector_ = Timestamp_Collector(columnar=True)
+        with _timestamp_collector_:
+            _timestamp_collector_.enter('a')
+            _timestamp_collector_.exit ('a')
+        assert [event[:2] for event in _timestamp_collector_.iter_events()] == [('a', EVENT_ENTER), ('a', EVENT_EXIT)]
+        assert _timestamp_collector_.aggregate().method_timings['a'].call_count == 1
+        assert Timestamp_Collector__Export(collector=_timestamp_collector_).to_flame_graph_stacks()[0].startswith('a ')
@@ -0,0 +1,91 @@
+import threading
+import time
+from unittest                                                                      import TestCase
+from osbot_utils.helpers.timestamp_capture.Timestamp_Collector                     import Timestamp_Collector
+from osbot_utils.helpers.timestamp_capture.Timestamp_Collector__Buffer             import Timestamp_Collector__Buffer
+from osbot_utils.helpers.timestamp_capture.actions.Timestamp_Collector__Analysis   import Timestamp_Collector__Analysis
+from osbot_utils.helpers.timestamp_capture.decorators.timestamp                    import timestamp
+from osbot_utils.helpers.timestamp_capture.timestamp_capture__config               import BUFFER_CAPACITY, EVENT_ENTER, EVENT_EXIT
+
+
+@timestamp(name='outer')
+def outer():
+    return inner() + 1
+
+@timestamp(name='inner')
+def inner():
+    return 41
+
+
+class test_Timestamp_Collector__Buffer(TestCase):
+
+    def test__init__(self):                                                        # Test columns are preallocated
+        with Timestamp_Collector__Buffer() as _:
+            assert _.capacity            == BUFFER_CAPACITY
+            assert _.count               == 0
+            assert len(_.timestamps)     == BUFFER_CAPACITY
+            assert _.timestamps.typecode == 'q'
+            assert _.names               == []
+
+    def test__init____invalid_capacity(self):
+        with self.assertRaises(ValueError) as context:
+            Timestamp_Collector__Buffer(capacity=0)
+        assert context.exception.args[0] == 'in Timestamp_Collector__Buffer, capacity must be bigger than 0, and it was: 0'
+
+    def test_enter__exit(self):                                                    # Test events, depths and interned names
+        with Timestamp_Collector__Buffer().start() as _:
+            _.enter('a')
+            _.enter('b')
+            _.exit ('b')
+            _.exit ('a')
+            assert _.count                 == 4
+            assert _.names                 == ['a', 'b']
+            assert list(_.name_ids  [:4])  == [0, 1, 1, 0]
+            assert list(_.events    [:4])  == [EVENT_ENTER, EVENT_ENTER, EVENT_EXIT, EVENT_EXIT]
+            assert list(_.depths    [:4])  == [0, 1, 1, 0]                         # same depth semantics as Timestamp_Collector
+            assert _.method_count()        == 2
+            entries = _.to_entries(thread_id=123)
+            assert [(e.name, e.event, e.depth) for e in entries] == [('a', 'enter', 0), ('b', 'enter', 1), ('b', 'exit', 1), ('a', 'exit', 0)]
+            assert entries[0].thread_id    == 123
+            assert abs(entries[0].clock_ns - time.time_ns()) < 1_000_000_000      # wall clock derived from the offset captured on start
+
+    def test_grow(self):                                                           # Test capacity doubles when not in ring buffer mode
+        with Timestamp_Collector__Buffer(capacity=2) as _:
+            for i in range(5):
+                _.enter(f'm_{i}')
+            assert _.capacity          == 8
+            assert _.size()            == 5
+            assert _.events_dropped()  == 0
+            assert [e.name for e in _.to_entries()] == ['m_0', 'm_1', 'm_2', 'm_3', 'm_4']
+
+    def test_ring_buffer(self):                                                    # Test oldest events are overwritten
+        with Timestamp_Collector__Buffer(capacity=3, ring_buffer=True) as _:
+            for i in range(5):
+                _.enter(f'm_{i}')
+            assert _.capacity          == 3
+            assert _.count             == 5
+            assert _.size()            == 3
+            assert _.events_dropped()  == 2
+            assert [e.name for e in _.to_entries()] == ['m_2', 'm_3', 'm_4']      # in recording order
+
+    def test__collector__columnar(self):                                           # Test the collector, reports and analysis in columnar mode
+        _timestamp_collector_ = Timestamp_Collector(columnar=True)
+        with _timestamp_collector_:
+            assert outer() == 42
+            assert outer() == 42
+        with _timestamp_collector_ as _:
+            assert type(_.buffer)       is Timestamp_Collector__Buffer
+            assert _.entries            == []                                      # entries are not used
+            assert _.entry_count()      == 8
+            assert _.method_count()     == 2
+            assert [e.name for e in _.get_entries()[:4]] == ['outer', 'inner', 'inner', 'outer']
+            assert _.get_entries()[0].thread_id == threading.get_ident()
+        timings = Timestamp_Collector__Analysis(collector=_timestamp_collector_).get_method_timings()
+        assert timings['outer'].call_count == 2
+        assert timings['inner'].call_count == 2
+
+    def test__collector__not_active(self):                                         # Test nothing is recorded outside the context manager
+        collector = Timestamp_Collector(buffer=Timestamp_Collector__Buffer(capacity=4, ring_buffer=True))
+        collector.enter('a')
+        collector.exit ('a')
+        assert collector.entry_count() == 0
@@ -0,0 +1,92 @@
+import threading
+from unittest                                                                      import TestCase
+from osbot_utils.helpers.timestamp_capture.Timestamp_Collector                     import Timestamp_Collector
+from osbot_utils.helpers.timestamp_capture.Timestamp_Collector__Histogram          import Timestamp_Collector__Histogram, histogram__bucket_index, histogram__bucket_lowest, histogram__bucket_highest, BUCKETS_COUNT, SUB_BUCKET_COUNT
+from osbot_utils.helpers.timestamp_capture.actions.Timestamp_Collector__Analysis   import Timestamp_Collector__Analysis
+from osbot_utils.helpers.timestamp_capture.actions.Timestamp_Collector__Export     import Timestamp_Collector__Export
+from osbot_utils.helpers.timestamp_capture.decorators.timestamp                    import timestamp
+from osbot_utils.helpers.timestamp_capture.timestamp_capture__config               import NS_TO_MS
+from osbot_utils.utils.Json                                                        import str_to_json
+
+
+@timestamp(name='outer')
+def outer():
+    return inner() + 1
+
+@timestamp(name='inner')
+def inner():
+    return 41
+
+
+class test_Timestamp_Collector__Histogram(TestCase):
+
+    def test_histogram__bucket_index(self):                                        # Test buckets are contiguous and the relative error is bounded
+        assert histogram__bucket_index(-1)               == 0
+        assert histogram__bucket_index(SUB_BUCKET_COUNT - 1) == SUB_BUCKET_COUNT - 1  # linear part
+        assert BUCKETS_COUNT                             < 2000                    # fixed memory
+        for index in range(BUCKETS_COUNT - 1):
+            lowest  = histogram__bucket_lowest (index)
+            highest = histogram__bucket_highest(index)
+            assert histogram__bucket_index(lowest )      == index
+            assert histogram__bucket_index(highest)      == index
+            assert histogram__bucket_lowest(index + 1)   == highest + 1
+            assert (highest - lowest) / max(lowest, 1)   < 0.032
+
+    def test_record__percentile(self):
+        with Timestamp_Collector__Histogram(name='an_method') as _:
+            assert _.percentile(50) == 0
+            for value in range(1, 10_001):                                         # 1μs ... 10ms
+                _.record(value * 1000)
+            assert _.count              == 10_000
+            assert _.min_ns             == 1_000
+            assert _.max_ns             == 10_000_000
+            assert _.self_ns            == _.total_ns
+            assert _.mean_ns()          == 5_000_500
+            for percentile, expected in ((50, 5_000_000), (95, 9_500_000), (99, 9_900_000)):
+                assert abs(_.percentile(percentile) - expected) / expected < 0.032
+            assert _.percentile(100)    == 10_000_000
+            assert list(_.percentiles()) == [50, 95, 99]
+            assert sum(_.sparse_buckets().values()) == 10_000
+
+    def test_merge(self):
+        histogram_1 = Timestamp_Collector__Histogram(name='a')
+        histogram_2 = Timestamp_Collector__Histogram(name='a')
+        histogram_1.record(100)
+        histogram_2.record(50)
+        histogram_2.record(200, self_ns=20)
+        with Timestamp_Collector__Histogram(name='a').merge(histogram_1).merge(histogram_2) as _:
+            assert (_.count, _.min_ns, _.max_ns, _.total_ns, _.self_ns) == (3, 50, 200, 350, 170)
+            assert _.sparse_buckets() == histogram_1.sparse_buckets() | histogram_2.sparse_buckets()
+
+    def test__collector__histograms(self):                                         # Test no events are stored, and the timings and reports still work
+        threads_count         = 4
+        _timestamp_collector_ = Timestamp_Collector(histograms=True, all_threads=True)
+        with _timestamp_collector_:
+            for _ in range(10):
+                outer()
+            threads = [threading.Thread(target=outer) for _ in range(threads_count)]
+            for thread in threads: thread.start()
+            for thread in threads: thread.join()
+        with _timestamp_collector_ as _:
+            assert _.entries            == []
+            assert _.entry_count()      == 0
+            assert _.method_count()     == 2
+            assert len(_._histograms)   > 1                                        # one set of histograms per thread (idents can be reused by new threads)
+            assert len(_.lanes())       == 1                                       # lanes are not kept in histograms mode
+            histograms = _.histograms_merged()
+            assert histograms['outer'].count == 10 + threads_count
+            assert histograms['outer'].self_ns == histograms['outer'].total_ns - histograms['inner'].total_ns
+
+        timings = Timestamp_Collector__Analysis(collector=_timestamp_collector_).get_method_timings()
+        assert timings['inner'].call_count == 10 + threads_count
+
+        export   = Timestamp_Collector__Export(collector=_timestamp_collector_)
+        snapshot = export.to_histograms()
+        assert [h.name for h in snapshot.histograms]  == ['outer', 'inner']
+        assert snapshot.histograms[0].count           == 10 + threads_count
+        assert snapshot.histograms[0].max_ms          == histograms['outer'].max_ns / NS_TO_MS
+        assert snapshot.histograms[0].p50_ms          <= snapshot.histograms[0].p99_ms
+        assert str_to_json(export.to_histograms_json())['name'] == 'default'
+
+        assert export.to_histograms(reset=True).reset is True                       # the values are cleared after a reset snapshot
+        assert export.to_histograms().histograms    == []
@@ -0,0 +1,100 @@
+import asyncio
+import threading
+from concurrent.futures                                                            import ThreadPoolExecutor
+from unittest                                                                      import TestCase
+from osbot_utils.helpers.timestamp_capture.Timestamp_Collector                     import Timestamp_Collector
+from osbot_utils.helpers.timestamp_capture.Timestamp_Collector__Buffer             import Timestamp_Collector__Buffer
+from osbot_utils.helpers.timestamp_capture.Timestamp_Collector__Lane               import Timestamp_Collector__Lane
+from osbot_utils.helpers.timestamp_capture.actions.Timestamp_Collector__Analysis   import Timestamp_Collector__Analysis
+from osbot_utils.helpers.timestamp_capture.actions.Timestamp_Collector__Export     import Timestamp_Collector__Export
+from osbot_utils.helpers.timestamp_capture.decorators.timestamp                    import timestamp
+from osbot_utils.utils.Threads                                                     import invoke_async_function
+
+
+@timestamp(name='outer')
+def outer(barrier: threading.Barrier = None):
+    if barrier:
+        barrier.wait()                                                              # makes sure the calls from the threads overlap
+    return inner() + 1
+
+@timestamp(name='inner')
+def inner():
+    return 41
+
+
+class test_Timestamp_Collector__Lane(TestCase):
+
+    def test__init__(self):
+        with Timestamp_Collector__Lane(name='an-lane') as _:
+            assert _.name       == 'an-lane'
+            assert _.entries    == []
+            assert _.call_stack == []
+            assert _.depth      == 0
+            _.enter('a')
+            assert _.depth      == 1
+            _.exit ('a')
+            assert [(e.name, e.event, e.depth) for e in _.get_entries()] == [('a', 'enter', 0), ('a', 'exit', 0)]
+            assert _.names()    == {'a'}
+
+    def test__collector__threads(self):                                            # Test each pool thread gets its own lane (with correct depths)
+        threads_count         = 4
+        barrier               = threading.Barrier(threads_count)
+        _timestamp_collector_ = Timestamp_Collector(all_threads=True)     # pool workers don't see the ContextVar
+        with _timestamp_collector_:
+            outer()
+            with ThreadPoolExecutor(max_workers=threads_count) as executor:
+                results = list(executor.map(lambda _: outer(barrier), range(threads_count)))
+        assert results == [42] * threads_count
+        with _timestamp_collector_ as _:
+            lanes = _.lanes()
+            assert len(lanes)                          == threads_count + 1
+            assert lanes[0].entries                    is _.entries                # main lane
+            assert len(_.entries)                      == 4
+            assert _.entry_count()                     == 4 * (threads_count + 1)
+            assert _.method_count()                    == 2
+            for lane in lanes[1:]:
+                assert lane.name.startswith('Thread: ')
+                assert [(e.name, e.depth) for e in lane.entries] == [('outer', 0), ('inner', 1), ('inner', 1), ('outer', 0)]
+                assert {e.thread_id for e in lane.entries}       == {lane.thread_id}
+            entries = _.get_entries()
+            assert [e.timestamp_ns for e in entries]   == sorted(e.timestamp_ns for e in entries)   # merged by timestamp
+
+        timings = Timestamp_Collector__Analysis(collector=_timestamp_collector_).get_method_timings()
+        assert timings['outer'].call_count == threads_count + 1
+        assert timings['inner'].call_count == threads_count + 1
+        assert timings['outer'].self_ns    == timings['outer'].total_ns - timings['inner'].total_ns  # self-time not corrupted by the other threads
+
+        speedscope = Timestamp_Collector__Export(collector=_timestamp_collector_).to_speedscope()
+        assert len(speedscope.profiles)         == threads_count + 1                # one profile per thread
+        assert len(speedscope.shared.frames)    == 2
+        assert speedscope.profiles[1].name      == f'default | {lanes[1].name}'
+        assert [e.type for e in speedscope.profiles[1].events] == ['O', 'O', 'C', 'C']
+
+    def test__collector__async_tasks(self):                                        # Test each asyncio task gets its own lane
+        _timestamp_collector_ = Timestamp_Collector(columnar=True)
+        async def an_task():
+            await asyncio.sleep(0)
+            return outer()
+        async def run():
+            with _timestamp_collector_:
+                outer()                                                             # the task that entered the collector uses the main lane
+                return await asyncio.gather(an_task(), an_task())
+        assert invoke_async_function(run()) == [42, 42]
+
+        lanes = _timestamp_collector_.lanes()
+        assert [lane.name.startswith('Task: ') for lane in lanes]   == [False, True, True]
+        assert [type(lane.buffer)               for lane in lanes]   == [Timestamp_Collector__Buffer] * 3
+        assert lanes[0].buffer                                       is _timestamp_collector_.buffer
+        assert [lane.entry_count()              for lane in lanes]   == [4, 4, 4]
+        assert [e.depth for e in lanes[1].get_entries()]             == [0, 1, 1, 0]
+        assert _timestamp_collector_.aggregate().method_timings['outer'].call_count == 3
+        assert len(_timestamp_collector_.aggregate().call_tree())    == 3            # one root per lane
+
+    def test__collector__not_active(self):                                         # Test other threads don't record after __exit__
+        collector = Timestamp_Collector()
+        with collector:
+            pass
+        thread = threading.Thread(target=lambda: (collector.enter('a'), collector.exit('a')))
+        thread.start()
+        thread.join()
+        assert collector.entry_count() == 0
@@ -1,6 +1,9 @@
+import asyncio
 import io
 import sys
+import threading
 from contextlib import redirect_stdout
+from time                                           import sleep
 from pprint                                         import pprint
 from unittest                                       import TestCase
 from unittest.mock                                  import patch, call
@@ -26,9 +29,35 @@ def dummy_function():
     a=12
     pass
 
+def slow_function():
+    sleep(0.002)
+
 def another_function():
     dummy_function()
 
+def yielding_function():
+    for i in range(2):
+        dummy_function()
+        yield i
+
+def consume_generator():
+    for _ in yielding_function():
+        another_function()
+
+async def awaiting_function():
+    dummy_function()
+    await asyncio.sleep(0)
+    dummy_function()
+
+def drive_coroutine():
+    coroutine = awaiting_function()
+    try:
+        while True:
+            coroutine.send(None)
+            another_function()
+    except StopIteration:
+        pass
+
 class test_Trace_Call(TestCase):
 
 
@@ -47,10 +76,15 @@ class test_Trace_Call(TestCase):
         assert Kwargs_To_Self in base_classes(Trace_Call)
 
         assert self.trace_call.__locals__() == { 'config'                 : self.trace_call.config                 ,
+                                                 'monitoring_tool_id'     : None                                   ,
+                                                 'prev_profile_function'  : None                                   ,
+                                                 'prev_thread_function'   : None                                   ,
                                                  'prev_trace_function'    : None                                   ,
                                                  'stack'                  : []                                     ,
                                                  'started'                : False                                  ,
+                                                 'trace_backend'          : ''                                     ,
                                                  'trace_call_handler'     : self.trace_call.trace_call_handler     ,
+                                                 'trace_call_sampler'     : None                                   ,
                                                  'trace_call_view_model'  : self.trace_call.trace_call_view_model  ,
                                                  'trace_call_print_traces': self.trace_call.trace_call_print_traces,
                                                  'trace_on_thread__data'  : {}                                     }
@@ -259,6 +293,105 @@ class test_Trace_Call(TestCase):
                                       call('├─────┼──────┼────────┼────┼──┼───────┤   '),
                                       call('└─────┴──────┴────────┴────┴──┴───────┘')]
 
+    def test_start__trace_backend__setprofile(self):
+        self.config.backend('setprofile').capture(starts_with=__name__)
+        handler = self.trace_call.trace_call_handler
+        with self.trace_call as _:
+            assert _.trace_backend  == 'setprofile'
+            assert sys.getprofile() == handler.trace_profile
+            another_function()
+            another_function()
+        assert sys.getprofile() is None
+        view_model = self.trace_call.view_data()
+        assert [item.get('method_name') for item in view_model] == ['Trace Session', 'another_function', 'dummy_function', 'another_function', 'dummy_function']
+        assert handler.capture_decisions.get(another_function.__code__) is True       # the capture decision was made once per code object
+        assert handler.capture_decisions.get(dummy_function  .__code__) is True
+        assert handler.stats.returns                                     == 4
+
+    def test_start__trace_backend__monitoring(self):
+        self.config.backend('monitoring').capture(starts_with=__name__)
+        with self.trace_call as _:
+            another_function()
+            if hasattr(sys, 'monitoring'):
+                assert _.trace_backend == 'monitoring'
+            else:
+                assert _.trace_backend == 'setprofile'                                 # fallback when sys.monitoring is not available
+        view_model = self.trace_call.view_data()
+        assert [item.get('method_name') for item in view_model] == ['Trace Session', 'another_function', 'dummy_function']
+
+    def test_start__trace_backend__monitoring__other_threads(self):                     # the sys.monitoring callbacks fire for all threads
+        handler = self.trace_call.trace_call_handler
+        handler.thread_id = threading.get_ident()
+        thread = threading.Thread(target=handler.monitoring__py_start, args=(another_function.__code__, 0))
+        thread.start()
+        thread.join()
+        assert handler.stats.calls       == 0                                           # the event from the other thread was ignored
+        assert handler.capture_decisions == {}
+        if hasattr(sys, 'monitoring'):
+            self.config.backend('monitoring').capture(starts_with=__name__)
+            with self.trace_call:
+                another_function()
+                thread = threading.Thread(target=another_function)
+                thread.start()
+                thread.join()
+            view_model = self.trace_call.view_data()
+            assert [item.get('method_name') for item in view_model] == ['Trace Session', 'another_function', 'dummy_function']
+
+    def test_start__trace_backend__monitoring__generators(self):                        # generators and coroutines that yield (or await) must not stay in the stack
+        def trace_tree(backend, target):
+            trace_call = Trace_Call(config=Trace_Call__Config().backend(backend).capture(starts_with=__name__))
+            trace_call.config.print_traces_on_exit = False
+            with trace_call:
+                target()
+            return [(item.get('prefix'), item.get('method_name')) for item in trace_call.view_data()]
+
+        for target in (consume_generator, drive_coroutine):
+            assert trace_tree('monitoring', target) == trace_tree('settrace', target)
+        assert [method_name for _, method_name in trace_tree('monitoring', consume_generator)] == ['Trace Session'   , 'consume_generator',
+                                                                                                  'yielding_function', 'dummy_function'  , 'another_function', 'dummy_function',
+                                                                                                  'yielding_function', 'dummy_function'  , 'another_function', 'dummy_function',
+                                                                                                  'yielding_function']
+
+    def test_start__trace_backend__monitoring__tool_id_in_use(self):
+        if not hasattr(sys, 'monitoring'):
+            pytest.skip("sys.monitoring is only available in 3.12+")
+        monitoring = sys.monitoring
+        tool_ids   = [monitoring.PROFILER_ID, 3, 4]
+        in_use     = [tool_id for tool_id in tool_ids if monitoring.get_tool(tool_id) is None]
+        monitoring.use_tool_id(monitoring.PROFILER_ID, 'cProfile')                      # like when running under cProfile
+        try:
+            self.config.backend('monitoring').capture(starts_with=__name__)
+            with self.trace_call as _:
+                another_function()
+                assert _.monitoring_tool_id == 3                                        # the first free tool id was used
+            assert _.monitoring_tool_id is None
+            view_model = self.trace_call.view_data()
+            assert [item.get('method_name') for item in view_model] == ['Trace Session', 'another_function', 'dummy_function']
+
+            monitoring.use_tool_id(3, 'tool_3')
+            monitoring.use_tool_id(4, 'tool_4')
+            trace_call = Trace_Call(config=Trace_Call__Config().backend('monitoring'))
+            with pytest.raises(ValueError, match="in Trace_Call, there are no free sys.monitoring tool ids"):
+                trace_call.start()
+            assert trace_call.started is False
+        finally:
+            for tool_id in in_use:
+                if monitoring.get_tool(tool_id) is not None:
+                    monitoring.free_tool_id(tool_id)
+
+    def test_start__trace_backend__sampling(self):
+        self.config.backend('sampling').capture(starts_with=__name__)
+        self.config.sampling_interval = 0.001
+        with self.trace_call as _:
+            assert sys.gettrace() is None                                               # the sampler doesn't use a trace function
+            sampler = _.trace_call_sampler
+            while sampler.samples < 5:
+                slow_function()
+        assert sampler.thread is None
+        view_model = self.trace_call.view_data()
+        assert view_model[0].get('method_name') == 'Trace Session'
+        assert 'slow_function' in [item.get('method_name') for item in view_model]
+
     def test__trace_up_to_a_level(self):
         if sys.version_info < (3, 8):
             pytest.skip("Skipping test that need FIXING on 3.7 or lower")
@@ -0,0 +1,91 @@
+from unittest                                               import TestCase
+from osbot_utils.helpers.trace.Trace_Call__Capture_Filter   import Trace_Call__Capture_Filter, regex__any_of
+from osbot_utils.helpers.trace.Trace_Call__Config           import Trace_Call__Config
+from osbot_utils.helpers.trace.Trace_Call__Handler          import Trace_Call__Handler
+
+
+class An_Frame:                                                         # minimal frame like object (only the fields used by should_capture__frame)
+    def __init__(self, module, func_name):
+        self.f_code    = type('code', (), {'co_name': func_name})()
+        self.f_globals = {'__name__': module}
+
+
+class test_Trace_Call__Capture_Filter(TestCase):
+
+    def setUp(self):
+        self.config         = Trace_Call__Config()
+        self.capture_filter = Trace_Call__Capture_Filter()
+
+    def test_regex__any_of(self):
+        assert regex__any_of([])                                    is None
+        assert regex__any_of(['a.b', 'c'], prefix='^').pattern      == '^(?:a\\.b|c)'
+        assert regex__any_of(['a.b']).search('xa.bx')               is not None
+        assert regex__any_of(['a.b']).search('xaxbx')               is None             # items are escaped
+
+    def test_compile__should_capture(self):
+        self.config.trace_capture_start_with = ['osbot_utils.helpers', '']
+        self.config.trace_capture_contains   = ['json']
+        self.config.trace_ignore_start_with  = ['osbot_utils.helpers.trace', 'skip_']
+        self.config.trace_ignore_contains    = ['Dev']
+        with self.capture_filter.compile(self.config) as _:
+            assert _.should_capture('osbot_utils.helpers.sqlite'  , 'an_method'  ) is True
+            assert _.should_capture('osbot_utils.helpers.sqlite'  , '_private'   ) is False
+            assert _.should_capture('osbot_utils.helpers.sqlite'  , 'skip_this'  ) is False
+            assert _.should_capture('osbot_utils.helpers.trace.a' , 'an_method'  ) is False
+            assert _.should_capture('osbot_utils.utils.Dev'       , 'json_dumps' ) is False
+            assert _.should_capture('osbot_utils.utils.json_tools', 'an_method'  ) is True
+            assert _.should_capture('other_module'                , 'to_json'    ) is True
+            assert _.should_capture('other_module'                , 'an_method'  ) is False
+            assert _.should_capture(''                            , 'an_method'  ) is False
+
+    def test_capture_decision(self):                                    # the compiled rules are memoised once per code object (in the handler)
+        self.config.trace_capture_start_with = ['an_module']
+        handler = Trace_Call__Handler(config=self.config)
+        frame   = An_Frame('an_module', 'an_method')
+        handler.capture_filter__compile()
+        assert handler.should_capture__frame(frame)                         is True
+        assert handler.capture_decisions                                    == {frame.f_code: True}
+        self.config.trace_ignore_start_with.append('an_module')            # changes to the capture rules are only checked for new code objects
+        assert handler.should_capture__frame(frame)                         is True
+        other_frame = An_Frame('an_module', 'other_method')
+        assert handler.should_capture__frame(other_frame)                   is False    # which recompiles the filter
+        assert handler.capture_decisions                                    == {other_frame.f_code: False}
+        assert handler.should_capture__frame(frame)                         is False
+        self.config.trace_ignore_start_with = []
+        handler.add_trace_ignore('an_')                                     # changes made via the handler are applied straight away
+        assert handler.capture_decisions                                    == {}
+        assert handler.should_capture__frame(frame)                         is False
+        handler.capture_filter__reset()
+        assert handler.capture_filter                                       is None
+        assert 'on_capture_rules_change' not in self.config.__dict__       # the config has no references to the handler
+        assert self.config.json().get('on_capture_rules_change')            is None
+
+    def test_is_stale(self):
+        self.config.trace_capture_start_with = ['an_module']
+        with self.capture_filter.compile(self.config) as _:
+            assert _.capture_rules                   == (False, ('an_module',), (), (), (), False)
+            assert _.is_stale(self.config)           is False
+            self.config.trace_capture_contains.append('json')                  # in place changes are detected
+            assert _.is_stale(self.config)           is True
+            _.compile(self.config)
+            assert _.is_stale(self.config)           is False
+            self.config.trace_show_internals = True
+            assert _.is_stale(self.config)           is True
+
+    def test_should_capture__matches_handler_rules(self):               # the compiled filter must give the same results as the (uncompiled) Trace_Call__Handler checks
+        configs = [dict(trace_capture_start_with=['osbot_utils']                                                  ),
+                   dict(trace_capture_start_with=['*'], trace_ignore_start_with=['osbot_utils.utils']             ),
+                   dict(trace_capture_contains  =['Files', 'json'], trace_ignore_contains=['Misc']                ),
+                   dict(trace_capture_all       =True , trace_show_internals=True, trace_ignore_start_with=['_a'] ),
+                   dict(trace_capture_all       =True , trace_ignore_start_with=['']                              )]
+        names   = [('osbot_utils.utils.Files', 'file_exists' ), ('osbot_utils.utils.Misc', 'json_dumps' ), ('osbot_utils.helpers.Json', '_an_private'),
+                   ('an_module'              , 'json_loads'  ), ('an_module'             , '_a_method'  ), ('an_module'               , 'an_method'  ),
+                   ('osbot_utils'            , 'an_method'   ), (''                      , 'an_method'  ), ('codecs'                  , 'decode'     )]
+        for config_kwargs in configs:
+            handler = Trace_Call__Handler(config=Trace_Call__Config(**config_kwargs))
+            for module, func_name in names:
+                frame    = An_Frame(module, func_name)
+                expected = handler.should_capture(frame)
+                handler.capture_filter__compile()
+                assert handler.should_capture(frame) == expected, (config_kwargs, module, func_name)
+                handler.capture_filter__reset()
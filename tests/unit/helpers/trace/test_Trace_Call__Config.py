@@ -27,11 +27,15 @@ class test_Trace_Call__Config(TestCase):
                           'print_lines_on_exit'        : False ,
                           'print_traces_on_exit'       : False ,
                           'print_duration'             : False ,
+                          'sampling_all_threads'       : False ,
+                          'sampling_interval'          : 0.01  ,
                           'show_caller'                : False ,
                           'show_method_class'          : True  ,      # recently changed
                           'show_parent_info'           : False ,      # recently changed
                           'show_source_code_path'      : False ,
                           'title'                      : ''    ,
+                          'trace_async_tasks'          : False ,
+                          'trace_backend'              : 'settrace',
                           'trace_capture_all'          : False ,
                           'trace_capture_lines'        : False ,
                           'trace_capture_source_code'  : False ,
@@ -41,6 +45,9 @@ class test_Trace_Call__Config(TestCase):
                           'trace_ignore_contains'      : []    ,
                           'trace_ignore_start_with'    : []    ,
                           'trace_show_internals'       : False ,
+                          'trace_sink_max_events'      : 0     ,
+                          'trace_sink_path'            : ''    ,
+                          'trace_threads'              : False ,
                           'trace_up_to_depth'          : 0     ,
                           'with_duration_bigger_than'  : 0.0   }
         assert Trace_Call__Config.__cls_kwargs__      () == expected_data
@@ -52,6 +59,14 @@ class test_Trace_Call__Config(TestCase):
             assert _.__kwargs__         () == expected_data
             assert _.__locals__         () == expected_data
 
+    def test_backend(self):
+        with self.trace_call_config as _:
+            assert _.backend('setprofile')  is _
+            assert _.trace_backend          == 'setprofile'
+            with self.assertRaises(ValueError) as context:
+                _.backend('an-backend')
+            assert context.exception.args[0] == "in Trace_Call__Config.backend, invalid trace_backend 'an-backend', it must be one of: ['settrace', 'setprofile', 'monitoring', 'sampling']"
+
     def test_all(self):
         with self.trace_call_config as _:
             _.all(up_to_depth=5, print_traces=True)
@@ -120,6 +135,15 @@ class test_Trace_Call__Config(TestCase):
         mock_pprint.assert_called_once()
         assert mock_pprint.call_args_list == [call(self.trace_call_config.__locals__())]
 
+    def test_sink(self):
+        with self.trace_call_config as _:
+            assert _.sink()                 is _
+            assert _.trace_sink_path        == ''
+            assert _.trace_sink_max_events  == 100000
+            _.sink(path='/tmp/trace.jsonl', max_events=10)
+            assert _.trace_sink_path        == '/tmp/trace.jsonl'
+            assert _.trace_sink_max_events  == 10
+
     def test_up_to_depth(self):
         config = self.trace_call_config
         assert config.trace_up_to_depth == 0
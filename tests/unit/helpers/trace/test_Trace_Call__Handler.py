@@ -29,7 +29,7 @@ class test_Trace_Call__Handler(TestCase):
 
     def test___default_kwargs(self):
         default_kwargs = Trace_Call__Handler().__default_kwargs__()
-        assert list_set(default_kwargs) == ['config', 'stack', 'stats']
+        assert list_set(default_kwargs) == ['capture_decisions', 'capture_filter', 'config', 'stack', 'stacks', 'stats', 'thread_id']
         assert type(default_kwargs.get('config')) is Trace_Call__Config
         assert type(default_kwargs.get('stack' )) is Trace_Call__Stack
         assert type(default_kwargs.get('stats' )) is Trace_Call__Stats
@@ -0,0 +1,79 @@
+import sys
+import threading
+from unittest                                               import TestCase
+from osbot_utils.helpers.trace.Trace_Call__Config           import Trace_Call__Config
+from osbot_utils.helpers.trace.Trace_Call__Sampler          import Trace_Call__Sampler, EXTRA_DATA__SAMPLES
+from osbot_utils.helpers.trace.Trace_Call__Stack            import Trace_Call__Stack
+from osbot_utils.helpers.trace.Trace_Call__View_Model       import Trace_Call__View_Model
+
+
+def an_function(event):
+    return an_inner_function(event)
+
+def an_inner_function(event):
+    event.wait()
+
+
+class test_Trace_Call__Sampler(TestCase):
+
+    def setUp(self):
+        self.config  = Trace_Call__Config(title='Sampler', sampling_interval=0.001).capture(starts_with=__name__)
+        self.sampler = Trace_Call__Sampler(config=self.config)
+
+    def test_sample(self):
+        with self.sampler as _:
+            _.thread_ids = [threading.get_ident()]
+            _.start()                                                                   # compiles the capture filter and starts the sampler thread
+            _.stop()
+            _.sample()
+            _.sample()
+            root_node = _.root_node
+            assert root_node.name                        == 'Sampler'
+            assert root_node.extra_data[EXTRA_DATA__SAMPLES] >= 2
+            node = root_node.children[0]
+            assert node.name                             == f'{__name__}.test_Trace_Call__Sampler.test_sample'        # co_qualname is used for the class name
+            assert node.func_name                        == 'test_sample'
+            assert node.extra_data[EXTRA_DATA__SAMPLES]  >= 2
+            assert node.call_duration                    == node.extra_data[EXTRA_DATA__SAMPLES] * 0.001
+            assert len(root_node.children)               == 1                          # the samples were merged into the same node
+            assert self.test_sample.__code__ in _.code_names
+
+    def test_sample__other_thread(self):
+        event  = threading.Event()
+        thread = threading.Thread(target=an_function, args=(event,), name='an_thread')
+        thread.start()
+        try:
+            with self.sampler as _:
+                _.start()
+                while _.samples < 3:
+                    event.wait(0.001)
+                _.stop()
+        finally:
+            event.set()
+            thread.join()
+        thread_node = [node for node in self.sampler.root_node.children if node.name.startswith('Thread: an_thread')][0]
+        assert [node.func_name for node in thread_node.children            ] == ['an_function'      ]
+        assert [node.func_name for node in thread_node.children[0].children] == ['an_inner_function']
+        assert thread_node.extra_data[EXTRA_DATA__SAMPLES] >= 3
+        sampler_thread_id = [node for node in self.sampler.root_node.children if 'Trace_Call__Sampler' in node.name]
+        assert sampler_thread_id == []                                                  # the sampler doesn't sample itself
+
+    def test_sample__view_model(self):
+        with self.sampler as _:
+            _.thread_ids = [threading.get_ident()]
+            _.start().stop()
+            _.sample()
+        stack      = Trace_Call__Stack(config=self.config, root_node=self.sampler.root_node)
+        view_model = Trace_Call__View_Model().create(stack)
+        assert [item.get('method_name') for item in view_model] == ['Sampler', 'test_sample__view_model']
+
+    def test_start__stop(self):
+        with self.sampler as _:
+            assert _.start()          is _
+            assert _.thread.name      == 'Trace_Call__Sampler'
+            assert _.thread.is_alive() is True
+            thread = _.thread
+            assert _.stop()           is _
+            assert _.thread           is None
+            assert thread.is_alive()  is False
+            assert sys.gettrace()     is None
@@ -0,0 +1,106 @@
+import sys
+import threading
+from unittest                                               import TestCase
+from osbot_utils.helpers.trace.Trace_Call                   import Trace_Call
+from osbot_utils.helpers.trace.Trace_Call__Config           import Trace_Call__Config
+from osbot_utils.helpers.trace.Trace_Call__Sink             import Trace_Call__Sink
+from osbot_utils.helpers.trace.Trace_Call__Sink__Json_Lines import Trace_Call__Sink__Json_Lines
+from osbot_utils.helpers.trace.Trace_Call__Sink__Tree       import Trace_Call__Sink__Tree
+from osbot_utils.helpers.trace.Trace_Call__Stack            import Trace_Call__Stack
+from osbot_utils.testing.Temp_File                          import Temp_File
+
+
+def an_function(value):
+    return an_inner_function(value) + 1
+
+def an_inner_function(value):
+    return value * 2
+
+def an_thread_function():
+    for i in range(200):
+        an_function(i)
+
+
+class test_Trace_Call__Sink(TestCase):
+
+    def setUp(self):
+        self.config = Trace_Call__Config().capture(starts_with=__name__)
+        self.config.capture_extra_data = True
+        self.config.print_traces_on_exit = False
+
+    def test_ring_buffer(self):
+        self.config.sink(max_events=5)
+        with Trace_Call(config=self.config) as trace_call:
+            an_function(1)
+            an_function(2)
+        sink = trace_call.stack.sink
+        assert type(sink)                                   is Trace_Call__Sink
+        assert sink.events_written                          == 10                   # root node plus 2 x (an_function and an_inner_function), each with a call and return event
+        assert len(sink.events())                           == 5                    # only the last 5 events were kept
+        assert sink.live_ids                                == {}                   # all nodes were closed
+        assert trace_call.stack.root_node.children          == []                   # the children are not kept in memory
+        view_model = trace_call.view_data()                                         # the parents of the last events were evicted, so they are added to the sink tree root
+        assert [item.get('method_name') for item in view_model] == ['Trace Sink', 'an_function', 'an_inner_function']
+
+    def test_json_lines(self):
+        with Temp_File(extension='.jsonl') as temp_file:
+            self.config.sink(path=temp_file.file_path)
+            with Trace_Call(config=self.config) as trace_call:
+                an_function(1)
+            sink = trace_call.stack.sink
+            assert type(sink)           is Trace_Call__Sink__Json_Lines
+            assert sink.file            is None                                     # closed on stop
+            events = list(Trace_Call__Sink__Json_Lines.read_events(temp_file.file_path))
+            assert [(event.get('event'), event.get('id'), event.get('parent')) for event in events] == [('call'  , 1, None),
+                                                                                                      ('call'  , 2, 1   ),
+                                                                                                      ('call'  , 3, 2   ),
+                                                                                                      ('return', 3, None),
+                                                                                                      ('return', 2, None),
+                                                                                                      ('return', 1, None)]
+            assert events[3].get('extra_data') == {'(return_value)': 2}
+            sink_tree = Trace_Call__Sink__Tree(config=self.config).load(temp_file.file_path)
+            assert sink_tree.root_node.name                                                == 'Trace Session'
+            assert [item.get('method_name') for item in sink_tree.view_data()]             == ['Trace Session', 'an_function', 'an_inner_function']
+            assert sink_tree.root_node.children[0].children[0].extra_data                  == {'(return_value)': 2}
+            assert [item.get('method_name') for item in trace_call.view_data()]            == ['Trace Session', 'an_function', 'an_inner_function']
+
+    def test_threads(self):                                             # the sink is shared by the stacks of all threads, so the ids must still be unique
+        self.config.threads()
+        self.config.sink(max_events=100000)
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(0.000001)                                 # force frequent thread switches
+        try:
+            with Trace_Call(config=self.config) as trace_call:
+                threads = [threading.Thread(target=an_thread_function) for _ in range(8)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+        finally:
+            sys.setswitchinterval(switch_interval)
+        sink         = trace_call.stack.sink
+        events       = sink.events()
+        call_ids     = [event.get('id') for event in events if event.get('event') == 'call'  ]
+        return_ids   = [event.get('id') for event in events if event.get('event') == 'return']
+        func_names   = [event.get('func_name') for event in events if event.get('event') == 'call']
+        assert func_names.count('an_function'      ) == 8 * 200
+        assert func_names.count('an_inner_function') == 8 * 200
+        assert len(set(call_ids))   == len(call_ids)
+        assert sorted(return_ids)   == sorted(call_ids)
+        assert sink.events_written  == len(events)
+        assert sink.live_ids        == {}
+
+    def test_value(self):
+        with Trace_Call__Sink(config=Trace_Call__Config(print_max_string_length=10)) as _:
+            assert _.value(None         ) is None
+            assert _.value(12           ) == 12
+            assert _.value('a' * 20     ) == 'a' * 10
+            assert _.value(list(range(100))).startswith('[0, 1, 2')
+            assert _.values({'a': {'b': 1}}) == {'a': "{'b': 1}"}
+
+    def test_stack__without_sink(self):
+        stack = Trace_Call__Stack()
+        assert stack.sink is None
+        root  = stack.add_node('root')
+        child = stack.add_node('child')
+        assert root.children == [child]
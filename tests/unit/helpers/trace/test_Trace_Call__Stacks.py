@@ -0,0 +1,99 @@
+import asyncio
+import threading
+from unittest                                           import TestCase
+from osbot_utils.helpers.trace.Trace_Call               import Trace_Call
+from osbot_utils.helpers.trace.Trace_Call__Config       import Trace_Call__Config
+from osbot_utils.helpers.trace.Trace_Call__Stack        import Trace_Call__Stack
+from osbot_utils.helpers.trace.Trace_Call__Stacks       import Trace_Call__Stacks
+from osbot_utils.utils.Threads                          import invoke_async_function
+
+
+def an_function():
+    return an_inner_function()
+
+def an_inner_function():
+    return 42
+
+async def an_async_function(delay):
+    await asyncio.sleep(delay)
+    return an_function()
+
+
+class test_Trace_Call__Stacks(TestCase):
+
+    def setUp(self):
+        self.config     = Trace_Call__Config().capture(starts_with=__name__)
+        self.config.print_traces_on_exit = False
+        self.main_stack = Trace_Call__Stack(config=self.config)
+        self.main_stack.add_node('main')
+        self.stacks     = Trace_Call__Stacks(config=self.config, main_stack=self.main_stack)
+
+    def test_current(self):
+        with self.stacks as _:
+            assert _.current() is self.main_stack                               # by default everything goes to the main stack
+            self.config.trace_threads = True
+            stacks = []
+            thread = threading.Thread(target=lambda: stacks.append(_.current()), name='an_thread')
+            thread.start()
+            thread.join()
+            assert _.current()                  is self.main_stack
+            assert stacks[0]                    is not self.main_stack
+            assert _.stacks                     == stacks
+            assert stacks[0].root_node.name.startswith('Thread: an_thread')
+
+    def test_current__async_tasks(self):
+        self.config.trace_async_tasks = True
+        async def task_stack(name):
+            stack = self.stacks.current()
+            await asyncio.sleep(0)
+            assert self.stacks.current() is stack                               # same stack after the task is resumed
+            return stack
+        async def run():
+            main_task_stack = self.stacks.current()
+            return main_task_stack, await asyncio.gather(asyncio.create_task(task_stack('a'), name='task_a'),
+                                                          asyncio.create_task(task_stack('b'), name='task_b'))
+        main_task_stack, (stack_a, stack_b) = invoke_async_function(run())
+        assert len({id(main_task_stack), id(stack_a), id(stack_b)})  == 3
+        assert stack_a.root_node.name                                == 'Task: task_a'
+        assert stack_b.root_node.name                                == 'Task: task_b'
+        assert self.stacks.current()                                 is self.main_stack             # outside the event loop
+
+    def test_merge(self):
+        self.config.trace_threads = True
+        thread = threading.Thread(target=self.stacks.current)
+        thread.start()
+        thread.join()
+        merged = self.stacks.merge()
+        assert len(merged)                           == 1
+        assert self.stacks.stacks                    == []
+        assert self.main_stack.root_node.children    == [merged[0].root_node]
+
+    def test__trace_call__threads(self):
+        self.config.threads()
+        with Trace_Call(config=self.config) as trace_call:
+            thread = threading.Thread(target=an_function, name='an_thread')     # threads started during the trace are traced in all python versions
+            thread.start()
+            thread.join()
+            an_function()
+        assert threading.gettrace()      is None
+        assert trace_call.trace_call_handler.stacks is None
+        method_names = [item.get('method_name') for item in trace_call.view_data()]
+        assert method_names[:3]                  == ['Trace Session', 'an_function', 'an_inner_function']
+        assert method_names[3].startswith('Thread: an_thread')
+        assert method_names[4:]                  == ['an_function', 'an_inner_function']
+
+    def test__trace_call__async_tasks(self):
+        self.config.threads(all_threads=False, async_tasks=True)
+        async def run():
+            with Trace_Call(config=self.config) as trace_call:
+                await asyncio.gather(asyncio.create_task(an_async_function(0.002), name='task_a'),
+                                     asyncio.create_task(an_async_function(0.001), name='task_b'))
+            return trace_call
+        trace_call  = invoke_async_function(run())
+        root_node   = trace_call.stack.root_node
+        task_nodes  = {node.name: node for node in root_node.children if node.name.startswith('Task: ')}
+        assert sorted(task_nodes) == ['Task: task_a', 'Task: task_b']
+        for task_node in task_nodes.values():                                   # each task has its own (not interleaved) calls
+            names = [node.func_name for node in task_node.all_children()]
+            assert names.count('an_function'      ) == 1
+            assert names.count('an_inner_function') == 1
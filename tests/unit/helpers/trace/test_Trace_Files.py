@@ -18,9 +18,14 @@ class test_Trace_Files(TestCase):
 
         assert trace_files.__locals__() == { **trace_files.__kwargs__()                                                                 ,
                                             'prev_trace_function'       : None                                                          ,
+                                            'monitoring_tool_id'        : None                               ,
+                                            'prev_profile_function'     : None                               ,
+                                            'prev_thread_function'      : None                               ,
                                             'stack'                     : trace_files.stack                  ,
+                                            'trace_backend'             : ''                                 ,
                                             'trace_call_handler'        : trace_files.trace_call_handler     ,
                                             'trace_call_print_traces'   : trace_files.trace_call_print_traces,
+                                            'trace_call_sampler'        : None                               ,
                                             'trace_call_view_model'     : trace_files.trace_call_view_model  ,
                                             'trace_on_thread__data'     : {}                                 }
 